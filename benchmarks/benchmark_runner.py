@@ -10,14 +10,23 @@ Usage
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
+import importlib.util
 import json
+import linecache
 import platform
 import socket
 import statistics
+import subprocess
+import sys
+import tempfile
+import threading
 import time
-from collections.abc import Callable, Iterable, Sequence
-from dataclasses import asdict, dataclass
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 
@@ -26,26 +35,56 @@ from doeff_core_effects import (
     Await,
     Gather,
     Get,
+    HttpRequest,
     Put,
     Spawn,
+    Wait,
     await_handler,
+    http_production_handler,
     reader,
     scheduled,
+    slog_discard_handler,
     state,
 )
+from doeff_core_effects import handlers as handlers_module
+from doeff_core_effects.cache_effects import CacheGet, CachePut
+from doeff_core_effects.cache_handlers import cache_handler
+from doeff_core_effects.scheduler import _SchedulerIntrospection
+from doeff_core_effects.storage import InMemoryStorage, SQLiteStorage
+from doeff_events import Publish, WaitForEvent, event_handler
+from doeff_time._internals import HeapTimeQueue, TimeQueue
+from doeff_traverse import Traverse, sequential
 from doeff_vm import Callable as VmCallable
-from doeff_vm import EffectBase
+from doeff_vm import EffectBase, IRStream
 
-from doeff import Apply, Pass, Pure, Resume, do, run
+from doeff import Apply, Expand, Pass, Pure, Resume, do, resume_cache, run, run_many
+from doeff.do import _RESUME_ANALYSIS_CACHE, _RESUME_ANALYSIS_CACHE_KEEPALIVE
 from doeff.program import (
     WithHandlerType as VMWithHandler,
 )
+from doeff.program import (
+    handler as install_handler,
+)
 
 DEFAULT_RUNS = 20
 DEFAULT_LOOP_ITERATIONS = 100
 DEFAULT_AWAIT_ITERATIONS = 100
 DEFAULT_BOUNDARY_ITERATIONS = 1_000
-DEFAULT_SPAWN_SIZES = (100, 1_000)
+DEFAULT_SPAWN_SIZES = (100, 1_000, 10_000, 100_000)
+DEFAULT_FOOTPRINT_SIZES = (1_000, 10_000)
+DEFAULT_TRAVERSE_ITEMS = (10_000,)
+DEFAULT_TRAVERSE_STAGES = 10
+DEFAULT_EVENT_LISTENERS = (10, 1_000, 10_000)
+DEFAULT_TIMER_COUNTS = (10_000,)
+DEFAULT_STATE_OPS = (10_000,)
+DEFAULT_DO_CALLS = (10_000,)
+DEFAULT_DO_IMPORT_FUNCTIONS = (1_000,)
+DEFAULT_HANDLER_DEPTHS = (1, 16, 64)
+DEFAULT_RUN_MANY_THREADS = (1, 4)
+DEFAULT_RUN_MANY_PROGRAMS = 32
+DEFAULT_SQLITE_PUT_COUNTS = (1_000, 10_000, 100_000)
+DEFAULT_HTTP_BODY_SIZES = (1_024, 1_048_576, 16_777_216)
+DEFAULT_HTTP_REQUESTS = 16
 RESULTS_DIR = Path("benchmarks/results")
 
 
@@ -56,6 +95,20 @@ class BenchmarkConfig:
     await_iterations: int
     boundary_iterations: int
     spawn_sizes: tuple[int, ...]
+    state_ops: tuple[int, ...] = DEFAULT_STATE_OPS
+    do_calls: tuple[int, ...] = DEFAULT_DO_CALLS
+    do_import_functions: tuple[int, ...] = DEFAULT_DO_IMPORT_FUNCTIONS
+    handler_depths: tuple[int, ...] = DEFAULT_HANDLER_DEPTHS
+    run_many_threads: tuple[int, ...] = DEFAULT_RUN_MANY_THREADS
+    run_many_programs: int = DEFAULT_RUN_MANY_PROGRAMS
+    footprint_sizes: tuple[int, ...] = DEFAULT_FOOTPRINT_SIZES
+    traverse_items: tuple[int, ...] = DEFAULT_TRAVERSE_ITEMS
+    traverse_stages: int = DEFAULT_TRAVERSE_STAGES
+    event_listeners: tuple[int, ...] = DEFAULT_EVENT_LISTENERS
+    timer_counts: tuple[int, ...] = DEFAULT_TIMER_COUNTS
+    sqlite_put_counts: tuple[int, ...] = DEFAULT_SQLITE_PUT_COUNTS
+    http_body_sizes: tuple[int, ...] = DEFAULT_HTTP_BODY_SIZES
+    http_requests: int = DEFAULT_HTTP_REQUESTS
     smoke: bool = False
 
     @classmethod
@@ -66,6 +119,20 @@ class BenchmarkConfig:
             await_iterations=1,
             boundary_iterations=1,
             spawn_sizes=(1,),
+            state_ops=(1,),
+            do_calls=(1,),
+            do_import_functions=(1,),
+            handler_depths=(1,),
+            run_many_threads=(1,),
+            run_many_programs=1,
+            footprint_sizes=(1,),
+            traverse_items=(1,),
+            traverse_stages=2,
+            event_listeners=(1,),
+            timer_counts=(1,),
+            sqlite_put_counts=(1,),
+            http_body_sizes=(1,),
+            http_requests=1,
             smoke=True,
         )
 
@@ -83,6 +150,7 @@ class BenchmarkStats:
     max_ms: float
     mean_unit_us: float
     throughput_per_s: float
+    bytes_per_unit: float | None = None
 
 
 class PythonCallableEffect(EffectBase):
@@ -111,6 +179,36 @@ def _reader_ask_loop(iterations: int) -> Any:
     return total
 
 
+def _trivial_increment(value: int) -> Any:
+    if False:  # pragma: no cover
+        yield
+    return value + 1
+
+
+def _expand_call(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Build the Expand(Apply(Pure(Callable(thunk)), [])) tree @do used before DoCall."""
+
+    def wrapper(*args: Any) -> Any:
+        def thunk() -> Any:
+            return IRStream(fn(*args))
+
+        return Expand(Apply(Pure(VmCallable(thunk)), []))
+
+    return wrapper
+
+
+_do_increment = do(_trivial_increment)
+_expand_increment = _expand_call(_trivial_increment)
+
+
+@do
+def _call_loop(calls: int, call: Callable[[int], Any]) -> Any:
+    total = 0
+    for index in range(calls):
+        total += yield call(index)
+    return total
+
+
 @do
 def _spawn_gather_program(task_count: int) -> Any:
     tasks = []
@@ -125,6 +223,18 @@ def _noop_task() -> None:
     return None
 
 
+@do
+def _spawn_footprint_program(task_count: int) -> Any:
+    """Spawn task_count tasks, sample scheduler memory while all are queued."""
+    tasks = []
+    for _index in range(task_count):
+        task = yield Spawn(_noop_task())
+        tasks.append(task)
+    counts = yield _SchedulerIntrospection()
+    results = yield Gather(*tasks)
+    return len(results), counts["state_bytes"]
+
+
 @do
 def _await_loop(iterations: int) -> Any:
     import asyncio
@@ -134,6 +244,74 @@ def _await_loop(iterations: int) -> Any:
     return iterations
 
 
+class _BridgedInMemoryStorage(InMemoryStorage):
+    """InMemoryStorage forced onto the Await bridge path, for comparison."""
+
+    synchronous_reads = False
+    synchronous_writes = False
+
+
+@do
+def _cache_hit_loop(iterations: int) -> Any:
+    yield CachePut("bench-key", 1)
+    hits = 0
+    for _index in range(iterations):
+        hits += yield CacheGet("bench-key")
+    return hits
+
+
+@do
+def _http_get(url: str, stream_to: Path | None) -> Any:
+    response = yield HttpRequest("GET", url, stream_to=stream_to)
+    return response
+
+
+@do
+def _http_download_batch(url: str, requests: int, directory: Path | None) -> Any:
+    tasks = []
+    for index in range(requests):
+        stream_to = None if directory is None else directory / f"body-{index}"
+        tasks.append((yield Spawn(_http_get(url, stream_to))))
+    responses = yield Gather(*tasks)
+    return sum(
+        len(response.content) if response.body_path is None else response.body_path.stat().st_size
+        for response in responses
+    )
+
+
+class _PayloadRequestHandler(BaseHTTPRequestHandler):
+    """Answer GET /<n> with n bytes: a local stand-in for a remote endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    _chunk = memoryview(b"\0" * 65_536)
+
+    def do_GET(self) -> None:
+        remaining = int(self.path.lstrip("/"))
+        self.send_response(200)
+        self.send_header("Content-Length", str(remaining))
+        self.end_headers()
+        while remaining:
+            written = min(remaining, len(self._chunk))
+            self.wfile.write(self._chunk[:written])
+            remaining -= written
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        return
+
+
+@contextlib.contextmanager
+def _local_http_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PayloadRequestHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 @do
 def _python_callable_effect_handler(effect: Any, k: Any) -> Any:
     if isinstance(effect, PythonCallableEffect):
@@ -150,6 +328,80 @@ def _python_callable_effect_loop(iterations: int, callback: VmCallable) -> Any:
     return total
 
 
+class DepthProbe(EffectBase):
+    """Effect handled only by the outermost handler of a deep stack."""
+
+
+class DepthNoise(EffectBase):
+    """Effect type claimed by the intermediate handlers of a deep stack."""
+
+
+@do
+def _depth_probe_handler(effect: Any, k: Any) -> Any:
+    if isinstance(effect, DepthProbe):
+        return (yield Resume(k, 1))
+    yield Pass(effect, k)
+
+
+@do
+def _depth_noise_handler(effect: Any, k: Any) -> Any:
+    if isinstance(effect, DepthNoise):
+        return (yield Resume(k, 0))
+    yield Pass(effect, k)
+
+
+@do
+def _depth_probe_loop(iterations: int) -> Any:
+    total = 0
+    for _index in range(iterations):
+        total += yield DepthProbe()
+    return total
+
+
+@do
+def _traverse_stage(value: int) -> Any:
+    return value + 1
+
+
+@do
+def _traverse_pipeline_program(items: int, stages: int) -> Any:
+    collection: Any = range(items)
+    for stage in range(stages):
+        collection = yield Traverse(_traverse_stage, collection, label=f"stage{stage}")
+    return collection.valid_values[-1] if items else None
+
+
+@dataclass(frozen=True)
+class _ParkedEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class _PingEvent:
+    index: int
+
+
+@do
+def _wait_for_event(event_type: type) -> Any:
+    return (yield WaitForEvent(event_type))
+
+
+@do
+def _event_publish_program(parked: int, rounds: int) -> Any:
+    """Publish ``rounds`` single-listener events while ``parked`` listeners wait."""
+    parked_tasks = []
+    for _index in range(parked):
+        parked_tasks.append((yield Spawn(_wait_for_event(_ParkedEvent))))
+    delivered = 0
+    for index in range(rounds):
+        listener = yield Spawn(_wait_for_event(_PingEvent))
+        yield Publish(_PingEvent(index))
+        delivered += (yield Wait(listener)).index == index
+    yield Publish(_ParkedEvent())
+    yield Gather(*parked_tasks)
+    return delivered
+
+
 def _increment(value: int) -> int:
     return value + 1
 
@@ -204,14 +456,321 @@ def _run_reader_ask_loop(iterations: int) -> Any:
     return run(reader({"value": 1})(_reader_ask_loop(iterations)))
 
 
+def _run_state_get_put_generator(iterations: int) -> Any:
+    """Get+Put loop on the Python generator state handler, for comparison."""
+    native_handler = handlers_module._NativeHandler
+    handlers_module._NativeHandler = None
+    try:
+        return _run_state_get_put_loop(iterations)
+    finally:
+        handlers_module._NativeHandler = native_handler
+
+
+def _measure_state_handlers(config: BenchmarkConfig) -> list[BenchmarkStats]:
+    """Get+Put throughput of the native state handler against the generator one."""
+    results: list[BenchmarkStats] = []
+    for op_count in config.state_ops:
+        for mode, state_loop in (
+            ("native", _run_state_get_put_loop),
+            ("generator", _run_state_get_put_generator),
+        ):
+            results.append(
+                _measure(
+                    f"state_get_put_{op_count}_{mode}",
+                    runs=config.runs,
+                    unit="iteration",
+                    units_per_run=op_count,
+                    parameters={"iterations": op_count, "handler": mode},
+                    workload=lambda op_count=op_count, state_loop=state_loop: state_loop(op_count),
+                    validate=lambda result, op_count=op_count: _assert_equal(result, op_count),
+                )
+            )
+    return results
+
+
+def _measure_do_calls(config: BenchmarkConfig) -> list[BenchmarkStats]:
+    """Calls per second of a trivial @do function: DoCall node vs the Expand tree."""
+    results: list[BenchmarkStats] = []
+    for calls in config.do_calls:
+        for mode, call in (("docall", _do_increment), ("expand", _expand_increment)):
+            results.append(
+                _measure(
+                    f"do_call_{calls}_{mode}",
+                    runs=config.runs,
+                    unit="call",
+                    units_per_run=calls,
+                    parameters={"calls": calls, "node": mode},
+                    workload=lambda calls=calls, call=call: run(_call_loop(calls, call)),
+                    validate=lambda result, calls=calls: _assert_equal(
+                        result, calls * (calls + 1) // 2
+                    ),
+                )
+            )
+    return results
+
+
+def _write_handler_module(directory: Path, functions: int) -> Path:
+    source = ["from doeff import Resume, do", ""]
+    for index in range(functions):
+        source.extend(
+            [
+                "",
+                "@do",
+                f"def handler_{index}(effect, k):",
+                "    return (yield Resume(k, effect))",
+                "",
+            ]
+        )
+    path = directory / f"do_import_{functions}.py"
+    path.write_text("\n".join(source), encoding="utf-8")
+    return path
+
+
+def _import_handler_module(path: Path) -> int:
+    """Execute ``path`` as a fresh module with no in-process resume analysis."""
+    _RESUME_ANALYSIS_CACHE.clear()
+    _RESUME_ANALYSIS_CACHE_KEEPALIVE.clear()
+    resume_cache.clear()
+    linecache.clearcache()
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return sum(1 for name in vars(module) if name.startswith("handler_"))
+
+
+def _run_do_import(path: Path, *, warm: bool) -> int:
+    cache_path = resume_cache._cache_path(str(path))
+    if not warm and cache_path is not None:
+        Path(cache_path).unlink(missing_ok=True)
+    return _import_handler_module(path)
+
+
+def _measure_do_imports(config: BenchmarkConfig) -> list[BenchmarkStats]:
+    """Import time of a module of @do handlers, with a cold and a warm resume cache."""
+    results: list[BenchmarkStats] = []
+    dont_write_bytecode = sys.dont_write_bytecode
+    sys.dont_write_bytecode = False
+    try:
+        with tempfile.TemporaryDirectory(prefix="doeff-do-import-") as tmpdir:
+            for functions in config.do_import_functions:
+                path = _write_handler_module(Path(tmpdir), functions)
+                for mode in ("cold", "warm"):
+                    if mode == "warm":
+                        _import_handler_module(path)
+                        resume_cache.flush()
+                    results.append(
+                        _measure(
+                            f"do_import_{functions}_{mode}",
+                            runs=config.runs,
+                            unit="function",
+                            units_per_run=functions,
+                            parameters={"functions": functions, "cache": mode},
+                            workload=lambda path=path, warm=mode == "warm": _run_do_import(
+                                path, warm=warm
+                            ),
+                            validate=lambda result, functions=functions: _assert_equal(
+                                result, functions
+                            ),
+                        )
+                    )
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
+    return results
+
+
+def _doeff_import_time_us(statement: str) -> int:
+    """Cumulative ``-X importtime`` microseconds of ``doeff`` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() == "doeff":
+            return int(fields[1])
+    raise AssertionError(f"doeff missing from -X importtime output of {statement!r}")
+
+
+def _measure_doeff_import(config: BenchmarkConfig) -> list[BenchmarkStats]:
+    """Cold ``import doeff`` in a subprocess, bare and with every lazy export loaded.
+
+    Timings are the subprocess wall clock; ``mean_unit_us`` is the cumulative
+    ``-X importtime`` figure for the ``doeff`` package itself.
+    """
+    results: list[BenchmarkStats] = []
+    for mode, statement in (
+        ("lazy", "import doeff"),
+        ("full", "import doeff; [getattr(doeff, name) for name in doeff._LAZY_EXPORTS]"),
+    ):
+        samples: list[int] = []
+        stats = _measure(
+            f"import_doeff_{mode}",
+            runs=config.runs,
+            unit="import",
+            units_per_run=1,
+            parameters={"statement": statement},
+            workload=lambda statement=statement: _doeff_import_time_us(statement),
+            validate=samples.append,
+        )
+        results.append(replace(stats, mean_unit_us=statistics.mean(samples)))
+    return results
+
+
 def _run_spawn_gather(task_count: int) -> Any:
     return run(scheduled(_spawn_gather_program(task_count)))
 
 
+def _measure_spawn_footprint(task_count: int, *, runs: int) -> BenchmarkStats:
+    """Time a spawn fan-out and report scheduler bookkeeping bytes per task."""
+    sampled_bytes: list[int] = []
+
+    def validate(result: Any) -> None:
+        completed, state_bytes = result
+        _assert_equal(completed, task_count)
+        sampled_bytes.append(state_bytes)
+
+    stats = _measure(
+        f"scheduler_bytes_per_task_{task_count}",
+        runs=runs,
+        unit="task",
+        units_per_run=task_count,
+        parameters={"tasks": task_count},
+        workload=lambda: run(scheduled(_spawn_footprint_program(task_count))),
+        validate=validate,
+    )
+    return replace(stats, bytes_per_unit=statistics.mean(sampled_bytes) / task_count)
+
+
+def _run_traverse_pipeline(items: int, stages: int) -> Any:
+    return run(sequential()(_traverse_pipeline_program(items, stages)))
+
+
+def _measure_traverse_pipeline(items: int, stages: int, *, runs: int) -> BenchmarkStats:
+    """Time an items x stages Traverse pipeline; report traced peak bytes per item."""
+    expected = items - 1 + stages if items else None
+    stats = _measure(
+        f"traverse_pipeline_{items}x{stages}",
+        runs=runs,
+        unit="item",
+        units_per_run=items,
+        parameters={"items": items, "stages": stages},
+        workload=lambda: _run_traverse_pipeline(items, stages),
+        validate=lambda result: _assert_equal(result, expected),
+    )
+    # Separate, untimed run: tracemalloc slows allocation-heavy code a lot.
+    tracemalloc.start()
+    try:
+        _run_traverse_pipeline(items, stages)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return replace(stats, bytes_per_unit=peak / max(items, 1))
+
+
+def _run_event_publish(parked: int, rounds: int) -> Any:
+    return run(scheduled(event_handler()(_event_publish_program(parked, rounds))))
+
+
+def _sim_timer_times(timer_count: int) -> list[dt.datetime]:
+    """Scattered due times, about four timers per instant, like bar-aligned Delays."""
+    start = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+    instants = max(timer_count // 4, 1)
+    return [
+        start + dt.timedelta(microseconds=(index * 7919) % instants) for index in range(timer_count)
+    ]
+
+
+def _drain_time_queue(queue_type: type[Any], times: Sequence[dt.datetime]) -> int:
+    queue = queue_type()
+    for promise, due in enumerate(times):
+        queue.push(due, promise)
+    released = 0
+    while not queue.empty():
+        released += len(queue.pop_batch().promises)
+    return released
+
+
 def _run_await_round_trip(iterations: int, handler: Callable[..., Any]) -> Any:
     return run(scheduled(handler(_await_loop(iterations))))
 
 
+def _run_cache_hits(iterations: int, *, sync: bool, handler: Callable[..., Any]) -> Any:
+    storage = InMemoryStorage() if sync else _BridgedInMemoryStorage()
+    return run(scheduled(handler(cache_handler(storage)(_cache_hit_loop(iterations)))))
+
+
+def _run_sqlite_puts(count: int, *, write_behind: bool) -> int:
+    """Put `count` values into a fresh database file and return the committed row count."""
+    with tempfile.TemporaryDirectory() as directory:
+        storage = SQLiteStorage(Path(directory) / "puts.db", write_behind=write_behind)
+        for index in range(count):
+            storage.put_sync(f"key-{index}", index)
+        storage.flush_sync()
+        committed = len(storage)
+        storage.close()
+        return committed
+
+
+def _run_http_downloads(
+    base_url: str,
+    body_bytes: int,
+    requests: int,
+    *,
+    to_file: bool,
+    handler: Callable[..., Any],
+) -> Any:
+    """Fetch `requests` bodies concurrently through one pooled production handler."""
+    with tempfile.TemporaryDirectory() as directory:
+        program = _http_download_batch(
+            f"{base_url}/{body_bytes}",
+            requests,
+            Path(directory) if to_file else None,
+        )
+        return run(
+            scheduled(handler(slog_discard_handler(http_production_handler()(program))))
+        ).value
+
+
+def _measure_http_downloads(
+    config: BenchmarkConfig,
+    handler: Callable[..., Any],
+) -> list[BenchmarkStats]:
+    results: list[BenchmarkStats] = []
+    with _local_http_server() as base_url:
+        for body_bytes in config.http_body_sizes:
+            for to_file in (False, True):
+                mode = "stream_to_file" if to_file else "buffered"
+                total_bytes = body_bytes * config.http_requests
+                results.append(
+                    _measure(
+                        f"http_get_{body_bytes}_{mode}",
+                        runs=config.runs,
+                        unit="byte",
+                        units_per_run=total_bytes,
+                        parameters={
+                            "body_bytes": body_bytes,
+                            "requests": config.http_requests,
+                            "stream_to_file": to_file,
+                        },
+                        workload=lambda body_bytes=body_bytes, to_file=to_file: _run_http_downloads(
+                            base_url,
+                            body_bytes,
+                            config.http_requests,
+                            to_file=to_file,
+                            handler=handler,
+                        ),
+                        validate=lambda result, total_bytes=total_bytes: _assert_equal(
+                            result, total_bytes
+                        ),
+                    )
+                )
+    return results
+
+
 def _run_python_callable_boundary(iterations: int, callback: VmCallable) -> Any:
     program = VMWithHandler(
         _python_callable_effect_handler,
@@ -220,6 +779,25 @@ def _run_python_callable_boundary(iterations: int, callback: VmCallable) -> Any:
     return run(program)
 
 
+def _run_handler_depth(iterations: int, depth: int, *, typed: bool) -> Any:
+    """Dispatch DepthProbe through `depth` intermediate DepthNoise handlers.
+
+    Untyped intermediates are entered and Pass; typed ones are skipped by the VM.
+    """
+    noise = install_handler(_depth_noise_handler, types=DepthNoise if typed else None)
+    program = _depth_probe_loop(iterations)
+    for _index in range(depth):
+        program = noise(program)
+    return run(VMWithHandler(_depth_probe_handler, program))
+
+
+def _run_many_state_loops(program_count: int, iterations: int, threads: int) -> Any:
+    programs = [
+        state({"counter": 0})(_state_get_put_loop(iterations)) for _index in range(program_count)
+    ]
+    return [result.value for result in run_many(programs, threads=threads)]
+
+
 def run_benchmarks(config: BenchmarkConfig) -> list[BenchmarkStats]:
     await_effect_handler = await_handler()
     boundary_callback = VmCallable(_increment)
@@ -258,6 +836,10 @@ def run_benchmarks(config: BenchmarkConfig) -> list[BenchmarkStats]:
             validate=lambda result: _assert_equal(result, config.loop_iterations),
         )
     )
+    results.extend(_measure_state_handlers(config))
+    results.extend(_measure_do_calls(config))
+    results.extend(_measure_do_imports(config))
+    results.extend(_measure_doeff_import(config))
 
     for task_count in config.spawn_sizes:
         results.append(
@@ -275,6 +857,47 @@ def run_benchmarks(config: BenchmarkConfig) -> list[BenchmarkStats]:
             )
         )
 
+    results.extend(
+        _measure_spawn_footprint(task_count, runs=config.runs)
+        for task_count in config.footprint_sizes
+    )
+    results.extend(
+        _measure_traverse_pipeline(items, config.traverse_stages, runs=config.runs)
+        for items in config.traverse_items
+    )
+
+    for timer_count in config.timer_counts:
+        times = _sim_timer_times(timer_count)
+        for queue_name, queue_type in (("wheel", TimeQueue), ("heap", HeapTimeQueue)):
+            results.append(
+                _measure(
+                    f"sim_time_queue_{timer_count}_{queue_name}",
+                    runs=config.runs,
+                    unit="timer",
+                    units_per_run=timer_count,
+                    parameters={"timers": timer_count, "queue": queue_name},
+                    workload=lambda times=times, queue_type=queue_type: _drain_time_queue(
+                        queue_type, times
+                    ),
+                    validate=lambda result, timer_count=timer_count: _assert_equal(
+                        result, timer_count
+                    ),
+                )
+            )
+
+    for parked in config.event_listeners:
+        results.append(
+            _measure(
+                f"events_publish_{parked}_parked",
+                runs=config.runs,
+                unit="publish",
+                units_per_run=config.loop_iterations,
+                parameters={"parked": parked, "publishes": config.loop_iterations},
+                workload=lambda parked=parked: _run_event_publish(parked, config.loop_iterations),
+                validate=lambda result: _assert_equal(result, config.loop_iterations),
+            )
+        )
+
     results.append(
         _measure(
             "await_sleep_0_round_trip",
@@ -286,6 +909,40 @@ def run_benchmarks(config: BenchmarkConfig) -> list[BenchmarkStats]:
             validate=lambda result: _assert_equal(result, config.await_iterations),
         )
     )
+    for path in ("sync", "bridged"):
+        results.append(
+            _measure(
+                f"cache_hit_{path}",
+                runs=config.runs,
+                unit="hit",
+                units_per_run=config.await_iterations,
+                parameters={"iterations": config.await_iterations, "path": path},
+                workload=lambda path=path: _run_cache_hits(
+                    config.await_iterations,
+                    sync=path == "sync",
+                    handler=await_effect_handler,
+                ),
+                validate=lambda result: _assert_equal(result, config.await_iterations),
+            )
+        )
+    for count in config.sqlite_put_counts:
+        for write_behind in (False, True):
+            mode = "write_behind" if write_behind else "commit"
+            results.append(
+                _measure(
+                    f"sqlite_put_{count}_{mode}",
+                    runs=config.runs,
+                    unit="put",
+                    units_per_run=count,
+                    parameters={"puts": count, "write_behind": write_behind},
+                    workload=lambda count=count, write_behind=write_behind: _run_sqlite_puts(
+                        count,
+                        write_behind=write_behind,
+                    ),
+                    validate=lambda result, count=count: _assert_equal(result, count),
+                )
+            )
+    results.extend(_measure_http_downloads(config, await_effect_handler))
     results.append(
         _measure(
             "python_callable_boundary",
@@ -304,6 +961,53 @@ def run_benchmarks(config: BenchmarkConfig) -> list[BenchmarkStats]:
         )
     )
 
+    for depth in config.handler_depths:
+        for typed in (False, True):
+            mode = "typed" if typed else "pass"
+            results.append(
+                _measure(
+                    f"handler_depth_{depth}_{mode}",
+                    runs=config.runs,
+                    unit="perform",
+                    units_per_run=config.loop_iterations,
+                    parameters={
+                        "depth": depth,
+                        "iterations": config.loop_iterations,
+                        "typed": typed,
+                    },
+                    workload=lambda depth=depth, typed=typed: _run_handler_depth(
+                        config.loop_iterations,
+                        depth,
+                        typed=typed,
+                    ),
+                    validate=lambda result: _assert_equal(result, config.loop_iterations),
+                )
+            )
+
+    for threads in config.run_many_threads:
+        results.append(
+            _measure(
+                f"run_many_threads_{threads}",
+                runs=config.runs,
+                unit="program",
+                units_per_run=config.run_many_programs,
+                parameters={
+                    "threads": threads,
+                    "programs": config.run_many_programs,
+                    "iterations": config.loop_iterations,
+                },
+                workload=lambda threads=threads: _run_many_state_loops(
+                    config.run_many_programs,
+                    config.loop_iterations,
+                    threads,
+                ),
+                validate=lambda result: _assert_equal(
+                    result,
+                    [config.loop_iterations] * config.run_many_programs,
+                ),
+            )
+        )
+
     return results
 
 
@@ -371,6 +1075,11 @@ def format_report(results: Iterable[BenchmarkStats | tuple[str, dict[str, float]
                 f"mean={item.mean_ms:.2f}ms max={item.max_ms:.2f}ms "
                 f"mean_unit={item.mean_unit_us:.2f}us "
                 f"throughput={item.throughput_per_s:.1f}/s"
+                + (
+                    f" bytes/{item.unit}={item.bytes_per_unit:.0f}"
+                    if item.bytes_per_unit is not None
+                    else ""
+                )
             )
         else:
             label, stats = item
@@ -417,6 +1126,83 @@ def _parse_spawn_sizes(raw_value: str) -> tuple[int, ...]:
     return values
 
 
+def _parse_footprint_sizes(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one footprint size is required")
+    return values
+
+
+def _parse_traverse_items(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one traverse item count is required")
+    return values
+
+
+def _parse_event_listeners(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one parked listener count is required")
+    return values
+
+
+def _parse_timer_counts(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one timer count is required")
+    return values
+
+
+def _parse_state_ops(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one Get+Put iteration count is required")
+    return values
+
+
+def _parse_do_calls(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one @do call count is required")
+    return values
+
+
+def _parse_do_import_functions(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one @do handler count is required")
+    return values
+
+
+def _parse_handler_depths(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one handler depth is required")
+    return values
+
+
+def _parse_run_many_threads(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one thread count is required")
+    return values
+
+
+def _parse_sqlite_put_counts(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one put count is required")
+    return values
+
+
+def _parse_http_body_sizes(raw_value: str) -> tuple[int, ...]:
+    values = tuple(int(part.strip()) for part in raw_value.split(",") if part.strip())
+    if not values:
+        raise argparse.ArgumentTypeError("at least one body size is required")
+    return values
+
+
 def _config_from_args(args: argparse.Namespace) -> BenchmarkConfig:
     if args.smoke:
         return BenchmarkConfig.smoke_config()
@@ -426,6 +1212,20 @@ def _config_from_args(args: argparse.Namespace) -> BenchmarkConfig:
         await_iterations=args.await_iterations,
         boundary_iterations=args.boundary_iterations,
         spawn_sizes=args.spawn_sizes,
+        state_ops=args.state_ops,
+        do_calls=args.do_calls,
+        do_import_functions=args.do_import_functions,
+        handler_depths=args.handler_depths,
+        run_many_threads=args.run_many_threads,
+        run_many_programs=args.run_many_programs,
+        footprint_sizes=args.footprint_sizes,
+        traverse_items=args.traverse_items,
+        traverse_stages=args.traverse_stages,
+        event_listeners=args.event_listeners,
+        timer_counts=args.timer_counts,
+        sqlite_put_counts=args.sqlite_put_counts,
+        http_body_sizes=args.http_body_sizes,
+        http_requests=args.http_requests,
         smoke=False,
     )
 
@@ -457,6 +1257,90 @@ def main() -> None:
         default=DEFAULT_SPAWN_SIZES,
         help="Comma-separated Spawn+Gather task counts",
     )
+    parser.add_argument(
+        "--footprint-sizes",
+        type=_parse_footprint_sizes,
+        default=DEFAULT_FOOTPRINT_SIZES,
+        help="Comma-separated Spawn counts for the scheduler bytes-per-task case (e.g. 1000000)",
+    )
+    parser.add_argument(
+        "--traverse-items",
+        type=_parse_traverse_items,
+        default=DEFAULT_TRAVERSE_ITEMS,
+        help="Comma-separated item counts for the multi-stage Traverse pipeline case (e.g. 1000000)",
+    )
+    parser.add_argument(
+        "--traverse-stages",
+        type=int,
+        default=DEFAULT_TRAVERSE_STAGES,
+        help="Chained Traverse stages per pipeline run",
+    )
+    parser.add_argument(
+        "--event-listeners",
+        type=_parse_event_listeners,
+        default=DEFAULT_EVENT_LISTENERS,
+        help="Comma-separated parked WaitForEvent listener counts for the publish case",
+    )
+    parser.add_argument(
+        "--timer-counts",
+        type=_parse_timer_counts,
+        default=DEFAULT_TIMER_COUNTS,
+        help="Comma-separated scheduled-delay counts for the sim-time queue cases (e.g. 1000000)",
+    )
+    parser.add_argument(
+        "--state-ops",
+        type=_parse_state_ops,
+        default=DEFAULT_STATE_OPS,
+        help="Comma-separated Get+Put iteration counts, native vs generator state handler (e.g. 1000000)",
+    )
+    parser.add_argument(
+        "--do-calls",
+        type=_parse_do_calls,
+        default=DEFAULT_DO_CALLS,
+        help="Comma-separated trivial @do call counts, DoCall node vs Expand tree (e.g. 1000000)",
+    )
+    parser.add_argument(
+        "--do-import-functions",
+        type=_parse_do_import_functions,
+        default=DEFAULT_DO_IMPORT_FUNCTIONS,
+        help="Comma-separated @do handler counts per module for cold/warm import timing",
+    )
+    parser.add_argument(
+        "--handler-depths",
+        type=_parse_handler_depths,
+        default=DEFAULT_HANDLER_DEPTHS,
+        help="Comma-separated intermediate handler-stack depths for dispatch cost",
+    )
+    parser.add_argument(
+        "--run-many-threads",
+        type=_parse_run_many_threads,
+        default=DEFAULT_RUN_MANY_THREADS,
+        help="Comma-separated worker-thread counts for run_many scaling",
+    )
+    parser.add_argument(
+        "--run-many-programs",
+        type=int,
+        default=DEFAULT_RUN_MANY_PROGRAMS,
+        help="Independent state-loop programs per run_many call",
+    )
+    parser.add_argument(
+        "--sqlite-put-counts",
+        type=_parse_sqlite_put_counts,
+        default=DEFAULT_SQLITE_PUT_COUNTS,
+        help="Comma-separated SQLiteStorage put counts, per-put commit vs write-behind",
+    )
+    parser.add_argument(
+        "--http-body-sizes",
+        type=_parse_http_body_sizes,
+        default=DEFAULT_HTTP_BODY_SIZES,
+        help="Comma-separated response sizes in bytes for the local HttpRequest throughput case",
+    )
+    parser.add_argument(
+        "--http-requests",
+        type=int,
+        default=DEFAULT_HTTP_REQUESTS,
+        help="Concurrent HttpRequest downloads per run, buffered vs stream_to file",
+    )
     parser.add_argument(
         "--smoke",
         action="store_true",
@@ -6,7 +6,8 @@ Backed by a Rust VM with OCaml 5-aligned effect handler architecture.
 
 # ruff: noqa: I001 - import order avoids doeff_core_effects circular imports.
 from collections.abc import Generator
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from doeff_vm import Callable as Callable
 from doeff_vm import Callable as _VmCallable
@@ -15,11 +16,9 @@ from doeff_vm import K as K
 from doeff_vm import PyVM as PyVM
 from doeff_vm import UnhandledEffect as UnhandledEffect
 
-from doeff.cli.run_services import DoeffRunContext as DoeffRunContext
 from doeff.do import do as do
-from doeff.mcp import McpParamSchema as McpParamSchema
-from doeff.mcp import McpToolDef as McpToolDef
 from doeff.program import Apply as Apply
+from doeff.program import DoCall as DoCall
 from doeff.program import Expand as Expand
 from doeff.program import GetBoundaries as GetBoundaries
 from doeff.program import GetExecutionContext as GetExecutionContext
@@ -46,40 +45,113 @@ from doeff.result import Nothing as Nothing
 from doeff.result import Ok as Ok
 from doeff.result import Some as Some
 from doeff.run import run as run
+from doeff.run import run_many as run_many
 
-from doeff_core_effects.effects import Ask as Ask
-from doeff_core_effects.effects import Await as Await
-from doeff_core_effects.effects import Get as Get
-from doeff_core_effects.effects import Listen as Listen
-from doeff_core_effects.effects import Local as Local
-from doeff_core_effects.effects import Put as Put
-from doeff_core_effects.effects import Slog as Slog
-from doeff_core_effects.effects import SlogEffect as SlogEffect
-from doeff_core_effects.effects import Tell as Tell
-from doeff_core_effects.effects import Try as Try
-from doeff_core_effects.effects import WriterTellEffect as WriterTellEffect
-from doeff_core_effects.effects import slog as slog
-from doeff_core_effects.scheduler import PRIORITY_HIGH as PRIORITY_HIGH
-from doeff_core_effects.scheduler import PRIORITY_IDLE as PRIORITY_IDLE
-from doeff_core_effects.scheduler import PRIORITY_NORMAL as PRIORITY_NORMAL
-from doeff_core_effects.scheduler import AcquireSemaphore as AcquireSemaphore
-from doeff_core_effects.scheduler import Cancel as Cancel
-from doeff_core_effects.scheduler import CompletePromise as CompletePromise
-from doeff_core_effects.scheduler import CreateExternalPromise as CreateExternalPromise
-from doeff_core_effects.scheduler import CreatePromise as CreatePromise
-from doeff_core_effects.scheduler import CreateSemaphore as CreateSemaphore
-from doeff_core_effects.scheduler import FailPromise as FailPromise
-from doeff_core_effects.scheduler import Future as Future
-from doeff_core_effects.scheduler import Gather as Gather
-from doeff_core_effects.scheduler import Promise as Promise
-from doeff_core_effects.scheduler import Race as Race
-from doeff_core_effects.scheduler import ReleaseSemaphore as ReleaseSemaphore
-from doeff_core_effects.scheduler import SchedulerDeadlockError as SchedulerDeadlockError
-from doeff_core_effects.scheduler import Semaphore as Semaphore
-from doeff_core_effects.scheduler import Spawn as Spawn
-from doeff_core_effects.scheduler import Task as Task
-from doeff_core_effects.scheduler import TaskCancelledError as TaskCancelledError
-from doeff_core_effects.scheduler import Wait as Wait
+if TYPE_CHECKING:
+    from doeff.cli.run_services import DoeffRunContext as DoeffRunContext
+    from doeff.mcp import McpParamSchema as McpParamSchema
+    from doeff.mcp import McpToolDef as McpToolDef
+    from doeff_core_effects.effects import Ask as Ask
+    from doeff_core_effects.effects import Await as Await
+    from doeff_core_effects.effects import Get as Get
+    from doeff_core_effects.effects import Listen as Listen
+    from doeff_core_effects.effects import Local as Local
+    from doeff_core_effects.effects import Put as Put
+    from doeff_core_effects.effects import Slog as Slog
+    from doeff_core_effects.effects import SlogEffect as SlogEffect
+    from doeff_core_effects.effects import Tell as Tell
+    from doeff_core_effects.effects import Try as Try
+    from doeff_core_effects.effects import WriterTellEffect as WriterTellEffect
+    from doeff_core_effects.effects import slog as slog
+    from doeff_core_effects.scheduler import PRIORITY_HIGH as PRIORITY_HIGH
+    from doeff_core_effects.scheduler import PRIORITY_IDLE as PRIORITY_IDLE
+    from doeff_core_effects.scheduler import PRIORITY_NORMAL as PRIORITY_NORMAL
+    from doeff_core_effects.scheduler import AcquireSemaphore as AcquireSemaphore
+    from doeff_core_effects.scheduler import Cancel as Cancel
+    from doeff_core_effects.scheduler import ClaimAbandonedError as ClaimAbandonedError
+    from doeff_core_effects.scheduler import ClaimPromise as ClaimPromise
+    from doeff_core_effects.scheduler import CompletePromise as CompletePromise
+    from doeff_core_effects.scheduler import CompletePromises as CompletePromises
+    from doeff_core_effects.scheduler import CreateExternalPromise as CreateExternalPromise
+    from doeff_core_effects.scheduler import CreatePromise as CreatePromise
+    from doeff_core_effects.scheduler import CreateSemaphore as CreateSemaphore
+    from doeff_core_effects.scheduler import FailPromise as FailPromise
+    from doeff_core_effects.scheduler import Future as Future
+    from doeff_core_effects.scheduler import Gather as Gather
+    from doeff_core_effects.scheduler import Promise as Promise
+    from doeff_core_effects.scheduler import Race as Race
+    from doeff_core_effects.scheduler import ReleaseSemaphore as ReleaseSemaphore
+    from doeff_core_effects.scheduler import SchedulerDeadlockError as SchedulerDeadlockError
+    from doeff_core_effects.scheduler import Semaphore as Semaphore
+    from doeff_core_effects.scheduler import Spawn as Spawn
+    from doeff_core_effects.scheduler import Task as Task
+    from doeff_core_effects.scheduler import TaskCancelledError as TaskCancelledError
+    from doeff_core_effects.scheduler import Wait as Wait
+
+# Public names whose modules are imported on first access. doeff_core_effects
+# pulls in the scheduler and the whole handler graph, and run_services pulls in
+# the Hy importer and the CLI; short-lived workers that only build and run
+# programs should not pay for either at `import doeff`.
+_LAZY_EXPORTS = {
+    "DoeffRunContext": "doeff.cli.run_services",
+    "McpParamSchema": "doeff.mcp",
+    "McpToolDef": "doeff.mcp",
+    "Ask": "doeff_core_effects.effects",
+    "Await": "doeff_core_effects.effects",
+    "Get": "doeff_core_effects.effects",
+    "Listen": "doeff_core_effects.effects",
+    "Local": "doeff_core_effects.effects",
+    "Put": "doeff_core_effects.effects",
+    "Slog": "doeff_core_effects.effects",
+    "SlogEffect": "doeff_core_effects.effects",
+    "Tell": "doeff_core_effects.effects",
+    "Try": "doeff_core_effects.effects",
+    "WriterTellEffect": "doeff_core_effects.effects",
+    "slog": "doeff_core_effects.effects",
+    "PRIORITY_HIGH": "doeff_core_effects.scheduler",
+    "PRIORITY_IDLE": "doeff_core_effects.scheduler",
+    "PRIORITY_NORMAL": "doeff_core_effects.scheduler",
+    "AcquireSemaphore": "doeff_core_effects.scheduler",
+    "Cancel": "doeff_core_effects.scheduler",
+    "ClaimAbandonedError": "doeff_core_effects.scheduler",
+    "ClaimPromise": "doeff_core_effects.scheduler",
+    "CompletePromise": "doeff_core_effects.scheduler",
+    "CompletePromises": "doeff_core_effects.scheduler",
+    "CreateExternalPromise": "doeff_core_effects.scheduler",
+    "CreatePromise": "doeff_core_effects.scheduler",
+    "CreateSemaphore": "doeff_core_effects.scheduler",
+    "FailPromise": "doeff_core_effects.scheduler",
+    "Future": "doeff_core_effects.scheduler",
+    "Gather": "doeff_core_effects.scheduler",
+    "Promise": "doeff_core_effects.scheduler",
+    "Race": "doeff_core_effects.scheduler",
+    "ReleaseSemaphore": "doeff_core_effects.scheduler",
+    "SchedulerDeadlockError": "doeff_core_effects.scheduler",
+    "Semaphore": "doeff_core_effects.scheduler",
+    "Spawn": "doeff_core_effects.scheduler",
+    "Task": "doeff_core_effects.scheduler",
+    "TaskCancelledError": "doeff_core_effects.scheduler",
+    "Wait": "doeff_core_effects.scheduler",
+}
+_LAZY_ALIASES = {
+    "AskEffect": "Ask",
+    "race": "Race",
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_ALIASES.get(name, name)
+    module_name = _LAZY_EXPORTS.get(target)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), target)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS, *_LAZY_ALIASES])
 
 
 def WithObserve(observer, body):  # noqa: N802 - public compatibility constructor
@@ -93,19 +165,31 @@ def WithObserve(observer, body):  # noqa: N802 - public compatibility constructo
     if isinstance(observer, _VmCallable):
         return WithObserveRaw(observer, body)
     if not callable(observer):
-        raise TypeError(
-            f"WithObserve: observer must be callable, got {type(observer).__name__}"
-        )
+        raise TypeError(f"WithObserve: observer must be callable, got {type(observer).__name__}")
     return WithObserveRaw(_VmCallable(observer), body)
 
+
 Effect = EffectBase
 
 # DoExpr — virtual base type for all program nodes.
 # Enables isinstance(x, DoExpr) to check if a value is any program node.
 _DOEXPR_TYPES = (
-    Pure, Perform, Resume, Transfer, Apply, Expand, Pass,
-    WithHandlerType, WithObserveRaw, ResumeThrow, TransferThrow,
-    GetTraceback, GetExecutionContext, GetHandlers, GetBoundaries, GetOuterHandlers,
+    Pure,
+    Perform,
+    Resume,
+    Transfer,
+    Apply,
+    Expand,
+    Pass,
+    WithHandlerType,
+    WithObserveRaw,
+    ResumeThrow,
+    TransferThrow,
+    GetTraceback,
+    GetExecutionContext,
+    GetHandlers,
+    GetBoundaries,
+    GetOuterHandlers,
 )
 
 
@@ -127,7 +211,6 @@ class DoExpr(metaclass=_DoExprMeta):
 
 Program = DoExpr
 ProgramBase = DoExpr
-AskEffect = Ask
 
 
 @do
@@ -147,20 +230,26 @@ def merge_dicts(*sources) -> Generator[Any, Any, dict]:
         elif isinstance(source, dict):
             d = source
         else:
-            raise TypeError(f"merge_dicts: expected Program[dict] or dict, got {type(source).__name__}")
+            raise TypeError(
+                f"merge_dicts: expected Program[dict] or dict, got {type(source).__name__}"
+            )
         merged.update(d)
     return merged
 
+
 # Removed concepts — raise clear error on use
 class _Removed:
     def __init__(self, name, reason):
         self._name = name
         self._reason = reason
+
     def __call__(self, *a, **kw):
         raise RuntimeError(f"{self._name} was removed: {self._reason}")
+
     def __getattr__(self, attr):
         raise RuntimeError(f"{self._name} was removed: {self._reason}")
 
+
 Delegate = _Removed("Delegate", "use 'yield effect' to re-perform in handler body")
 EffectGenerator = Generator  # Generator[Any, Any, T] — return type for @do function bodies
 WithIntercept = _Removed("WithIntercept", "use WithObserve")
@@ -178,7 +267,6 @@ CacheExists = _Removed("CacheExists", "renamed to MemoExists in doeff_core_effec
 cache = _Removed("cache", "cache module removed")
 presets = _Removed("presets", "presets module removed")
 rust_vm = _Removed("rust_vm", "use PyVM directly")
-race = Race  # lowercase alias
 
 default_handlers = _Removed("default_handlers", "compose handlers by calling handler(program)")
 async_run = _Removed("async_run", "use run() with scheduled()")
@@ -18,7 +18,8 @@ from functools import wraps
 from textwrap import dedent
 from typing import Any, ParamSpec, overload
 
-from doeff.program import Apply, Expand, Pure
+from doeff import resume_cache
+from doeff.program import DoCall, Expand
 
 P = ParamSpec("P")
 
@@ -192,9 +193,11 @@ def _analyze_resume_yields(fn: Callable[..., Any], *, non_tail: bool) -> tuple[i
         if cached is not None:
             return cached
         # Hy (and any non-.py) sources can never satisfy ast.parse — skip
-        # before paying for the file read and the parse attempt.
+        # before paying for the file read and the parse attempt. A code object
+        # that never names Resume/ResumeThrow has nothing to find either; that
+        # is most @do functions, so they skip the source entirely.
         filename = getattr(code, "co_filename", "")
-        if not filename.endswith(".py"):
+        if not filename.endswith(".py") or not resume_cache.references_resume(code):
             _RESUME_ANALYSIS_CACHE[cache_key] = ()
             _RESUME_ANALYSIS_CACHE_KEEPALIVE.append(code)
             return ()
@@ -207,43 +210,68 @@ def _analyze_resume_yields(fn: Callable[..., Any], *, non_tail: bool) -> tuple[i
             _RESUME_ANALYSIS_CACHE_KEEPALIVE.append(code)
         return result
 
+    lines = resume_cache.lookup(code) if code is not None else None
+    if lines is None:
+        lines = _resume_yields_from_source(fn)
+        if lines is None:
+            return _remember(())
+        if code is not None:
+            resume_cache.store(code, lines)
+    tail_lines, non_tail_lines = lines
+    if non_tail_lines and not non_tail:
+        _warn_non_tail_resume(fn, non_tail_lines)
+    return _remember(tail_lines)
+
+
+def _resume_yield_lines(
+    function_node: ast.FunctionDef | ast.AsyncFunctionDef,
+    source_start_line: int,
+) -> resume_cache.ResumeLines:
+    """(tail, non-tail) Resume/ResumeThrow yield lines of one function node."""
+    visitor = _ResumeYieldAnalysis(source_start_line)
+    visitor.visit(function_node)
+    return (
+        tuple(sorted(visitor.tail_resume_lines)),
+        tuple(sorted(visitor.non_tail_resume_lines)),
+    )
+
+
+def _resume_yields_from_source(fn: Callable[..., Any]) -> resume_cache.ResumeLines | None:
     try:
         source_lines, start_line = inspect.getsourcelines(fn)
     except (OSError, TypeError, tokenize.TokenError, SyntaxError):
-        return _remember(())
+        return None
 
     try:
         module = ast.parse(dedent("".join(source_lines)))
     except (SyntaxError, ValueError):
-        return _remember(())
+        return None
 
     function_node = next(
         (
             node
             for node in ast.walk(module)
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == fn.__name__
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == fn.__name__
         ),
         None,
     )
     if function_node is None:
-        return _remember(())
-
-    visitor = _ResumeYieldAnalysis(start_line)
-    visitor.visit(function_node)
-    if visitor.non_tail_resume_lines and not non_tail:
-        sorted_lines = sorted(visitor.non_tail_resume_lines)
-        lines = ", ".join(str(line) for line in sorted_lines)
-        warnings.warn_explicit(
-            "non-tail Resume/ResumeThrow in @do handler keeps the handler generator "
-            "frame and its locals live until the resumed continuation returns; use "
-            "@do(non_tail=True) to acknowledge this, or Transfer/TransferThrow when "
-            f"the handler is done after resuming (line(s): {lines})",
-            RuntimeWarning,
-            fn.__code__.co_filename,
-            sorted_lines[0],
-        )
-
-    return _remember(tuple(sorted(visitor.tail_resume_lines)))
+        return None
+    return _resume_yield_lines(function_node, start_line)
+
+
+def _warn_non_tail_resume(fn: Callable[..., Any], sorted_lines: tuple[int, ...]) -> None:
+    lines = ", ".join(str(line) for line in sorted_lines)
+    warnings.warn_explicit(
+        "non-tail Resume/ResumeThrow in @do handler keeps the handler generator "
+        "frame and its locals live until the resumed continuation returns; use "
+        "@do(non_tail=True) to acknowledge this, or Transfer/TransferThrow when "
+        f"the handler is done after resuming (line(s): {lines})",
+        RuntimeWarning,
+        fn.__code__.co_filename,
+        sorted_lines[0],
+    )
 
 
 @overload
@@ -263,31 +291,32 @@ def do(
     *,
     non_tail: bool = False,
 ) -> Callable[P, Expand] | Callable[[Callable[P, Generator[Any, Any, Any]]], Callable[P, Expand]]:
-    """Wrap a generator function so calling it returns a DoExpr tree."""
+    """Wrap a generator function so calling it returns a DoCall program node.
 
-    def decorate(fn: Callable[P, Generator[Any, Any, Any]]) -> Callable[P, Expand]:
-        tail_resume_lines = _analyze_resume_yields(fn, non_tail=non_tail)
+    The call is deferred: ``fn(*args, **kwargs)`` runs when the VM evaluates
+    the node, and a non-generator return value becomes the program's result.
+    """
 
-        from doeff_vm import Callable as VMCallable
-        from doeff_vm import IRStream
+    def decorate(fn: Callable[P, Generator[Any, Any, Any]]) -> Callable[P, Expand]:
+        if non_tail:
+            # Acknowledged non-tail handlers never warn, so nothing needs the
+            # analysis at decoration time; run it on the first call instead.
+            tail_resume_lines: tuple[int, ...] | None = None
 
-        def _make_stream(result):
-            if inspect.isgenerator(result):
-                return IRStream(result, tail_resume_lines)
+            @wraps(fn)
+            def lazy_wrapper(*args: P.args, **kwargs: P.kwargs) -> Expand:
+                nonlocal tail_resume_lines
+                if tail_resume_lines is None:
+                    tail_resume_lines = _analyze_resume_yields(fn, non_tail=True)
+                return DoCall(fn, args, kwargs, tail_resume_lines)
 
-            def value_gen():
-                if False:
-                    yield
-                return result
+            return lazy_wrapper
 
-            return IRStream(value_gen())
+        analysed_lines = _analyze_resume_yields(fn, non_tail=False)
 
         @wraps(fn)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Expand:
-            def thunk():
-                return _make_stream(fn(*args, **kwargs))
-
-            return Expand(Apply(Pure(VMCallable(thunk)), []))
+            return DoCall(fn, args, kwargs, analysed_lines)
 
         return wrapper
 
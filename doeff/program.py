@@ -8,6 +8,7 @@ from collections.abc import Callable, Iterable
 from typing import Any, cast
 
 from doeff_vm import Apply as Apply
+from doeff_vm import DoCall as DoCall
 from doeff_vm import Expand as Expand
 from doeff_vm import GetBoundaries as GetBoundaries
 from doeff_vm import GetExecutionContext as GetExecutionContext
@@ -25,8 +26,16 @@ from doeff_vm import WithHandler as WithHandlerType
 from doeff_vm import WithObserve as WithObserve
 
 
-def handler(raw_handler):
-    """Wrap a raw effect dispatcher as a Program -> Program handler."""
+def handler(raw_handler, *, types=None):
+    """Wrap a raw effect dispatcher as a Program -> Program handler.
+
+    ``types`` optionally names the effect classes the dispatcher handles (a
+    class or an iterable of classes). The VM then skips this boundary for other
+    effects without calling the dispatcher. The filter is a dispatch shortcut,
+    not a contract: handlers reinstalled from ``GetHandlers`` (Spawn, Try,
+    Local, ...) are untyped, so the dispatcher must still ``Pass`` effects it
+    does not handle.
+    """
     if not callable(raw_handler):
         raise TypeError(
             f"handler: raw_handler must be callable, got {type(raw_handler).__name__}"
@@ -37,10 +46,23 @@ def handler(raw_handler):
     except AttributeError:
         is_handler_fn = False
     if is_handler_fn is True:
+        if types is not None:
+            raise TypeError(
+                "handler: types= applies to raw effect dispatchers, "
+                f"{raw_handler_meta.__name__} is already a Program -> Program handler"
+            )
         return raw_handler
 
-    def install(body):
-        return WithHandlerType(raw_handler, body)
+    if types is None:
+
+        def install(body):
+            return WithHandlerType(raw_handler, body)
+
+    else:
+        effect_types = tuple(types) if not isinstance(types, type) else (types,)
+
+        def install(body):
+            return WithHandlerType(raw_handler, body, effect_types)
 
     install.__name__ = raw_handler_meta.__name__
     install.__qualname__ = raw_handler_meta.__qualname__
@@ -79,15 +101,8 @@ def with_handlers(handlers: Iterable[ProgramHandler], program: object) -> object
 
 
 def program(gen_fn, *args):
-    """Wrap a generator function as Expand(Apply(Callable(factory), args)).
+    """Wrap a generator function call as a DoCall node.
 
-    The factory calls gen_fn and wraps the generator as IRStream explicitly.
+    ``gen_fn(*args)`` runs when the VM evaluates the node.
     """
-    from doeff_vm import Callable as VmCallable
-    from doeff_vm import IRStream
-
-    def factory(*inner_args):
-        gen = gen_fn(*inner_args)
-        return IRStream(gen)
-
-    return Expand(Apply(Pure(VmCallable(factory)), [Pure(a) for a in args]))
+    return DoCall(gen_fn, args)
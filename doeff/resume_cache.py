@@ -0,0 +1,253 @@
+"""
+On-disk cache of the ``@do`` resume-yield analysis.
+
+``@do`` reads and parses a handler's source to find its tail
+``Resume``/``ResumeThrow`` yields (see ``doeff.do``). The result depends only
+on the source file, so, like bytecode, it is kept in ``__pycache__``: one
+``<module>.<cache_tag>.doeff-resume.json`` per source file, valid while the
+source's mtime and size are unchanged. Entries are keyed by the function's
+qualified name, first line and a hash of its bytecode.
+
+Results recorded during a run are written at interpreter exit (or by
+``flush()``). ``precompute_resume_cache(root)`` fills the cache ahead of time
+without importing anything. Set ``DOEFF_RESUME_CACHE=0`` to disable the cache;
+like ``.pyc`` files, nothing is written under ``PYTHONDONTWRITEBYTECODE``.
+"""
+
+from __future__ import annotations
+
+import ast
+import atexit
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import CodeType
+
+_FORMAT_VERSION = 1
+_SUFFIX = ".doeff-resume.json"
+RESUME_NAMES = frozenset({"Resume", "ResumeThrow"})
+
+# (tail_resume_lines, non_tail_resume_lines), absolute source lines.
+ResumeLines = tuple[tuple[int, ...], tuple[int, ...]]
+
+
+class _FileRecord:
+    __slots__ = ("cache_path", "dirty", "functions", "mtime_ns", "size")
+
+    def __init__(self, cache_path: str, mtime_ns: int, size: int) -> None:
+        self.cache_path = cache_path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.functions: dict[str, list[list[int]]] = {}
+        self.dirty = False
+
+
+# Source path -> record, or None when the file cannot be cached.
+_RECORDS: dict[str, _FileRecord | None] = {}
+_LOCK = threading.Lock()
+
+
+def enabled() -> bool:
+    return os.environ.get("DOEFF_RESUME_CACHE", "1") != "0"
+
+
+def references_resume(code: CodeType) -> bool:
+    """Whether ``code`` can contain a ``Resume``/``ResumeThrow`` call at all.
+
+    A call by bare name or attribute puts the name in ``co_names`` (global or
+    attribute), ``co_varnames`` (local import) or the closure variables. A code
+    object naming neither has no resume yield to analyse.
+    """
+    return not (
+        RESUME_NAMES.isdisjoint(code.co_names)
+        and RESUME_NAMES.isdisjoint(code.co_varnames)
+        and RESUME_NAMES.isdisjoint(code.co_freevars)
+        and RESUME_NAMES.isdisjoint(code.co_cellvars)
+    )
+
+
+def _function_key(code: CodeType) -> str:
+    qualname = getattr(code, "co_qualname", code.co_name)
+    digest = hashlib.blake2b(code.co_code, digest_size=8).hexdigest()
+    return f"{qualname}:{code.co_firstlineno}:{digest}"
+
+
+def _cache_path(source_path: str) -> str | None:
+    try:
+        bytecode_path = importlib.util.cache_from_source(source_path)
+    except (NotImplementedError, ValueError):
+        return None
+    return bytecode_path.removesuffix(".pyc") + _SUFFIX
+
+
+def _read_functions(cache_path: str, mtime_ns: int, size: int) -> dict[str, list[list[int]]]:
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _FORMAT_VERSION
+        or payload.get("mtime_ns") != mtime_ns
+        or payload.get("size") != size
+    ):
+        return {}
+    functions = payload.get("functions")
+    return functions if isinstance(functions, dict) else {}
+
+
+def _record(source_path: str) -> _FileRecord | None:
+    try:
+        return _RECORDS[source_path]
+    except KeyError:
+        pass
+    record = None
+    cache_path = _cache_path(source_path)
+    if cache_path is not None:
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            stat = None
+        if stat is not None:
+            record = _FileRecord(cache_path, stat.st_mtime_ns, stat.st_size)
+            record.functions = _read_functions(cache_path, stat.st_mtime_ns, stat.st_size)
+    _RECORDS[source_path] = record
+    return record
+
+
+def lookup(code: CodeType) -> ResumeLines | None:
+    """Cached analysis of ``code``, or None on a miss."""
+    if not enabled():
+        return None
+    with _LOCK:
+        record = _record(code.co_filename)
+        if record is None:
+            return None
+        entry = record.functions.get(_function_key(code))
+    if entry is None:
+        return None
+    tail, non_tail = entry
+    return tuple(tail), tuple(non_tail)
+
+
+def store(code: CodeType, lines: ResumeLines) -> None:
+    """Record the analysis of ``code``; written at exit or by ``flush()``."""
+    if not enabled():
+        return
+    with _LOCK:
+        record = _record(code.co_filename)
+        if record is None:
+            return
+        record.functions[_function_key(code)] = [list(lines[0]), list(lines[1])]
+        record.dirty = True
+
+
+def _write(record: _FileRecord) -> None:
+    # Keep entries another process wrote for the same source version.
+    functions = _read_functions(record.cache_path, record.mtime_ns, record.size)
+    functions.update(record.functions)
+    payload = {
+        "version": _FORMAT_VERSION,
+        "mtime_ns": record.mtime_ns,
+        "size": record.size,
+        "functions": functions,
+    }
+    directory = os.path.dirname(record.cache_path)
+    tmp_path = f"{record.cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, separators=(",", ":"))
+        os.replace(tmp_path, record.cache_path)
+    except OSError:
+        # Read-only install or full disk: the cache is only an optimisation.
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+
+
+def flush() -> None:
+    """Write the results recorded since the last flush."""
+    if sys.dont_write_bytecode or not enabled():
+        return
+    with _LOCK:
+        dirty = [record for record in _RECORDS.values() if record is not None and record.dirty]
+        for record in dirty:
+            _write(record)
+            record.dirty = False
+
+
+atexit.register(flush)
+
+
+def clear() -> None:
+    """Forget the records loaded in this process (the files are kept)."""
+    with _LOCK:
+        _RECORDS.clear()
+
+
+def precompute_resume_cache(*roots: str | os.PathLike[str]) -> int:
+    """Analyse and cache every handler under ``roots`` without importing it.
+
+    ``doeff_indexer`` narrows the scan to files that define ``@do`` functions
+    when it is installed; otherwise every ``.py`` file is read. Returns the
+    number of functions analysed.
+    """
+    analysed = 0
+    for root in roots or (".",):
+        for source_path in _source_files(Path(root)):
+            analysed += _precompute_file(os.path.abspath(source_path))
+    flush()
+    return analysed
+
+
+def _source_files(root: Path) -> list[str]:
+    if root.is_file():
+        return [str(root)]
+    try:
+        from doeff_indexer import Indexer
+
+        return Indexer.for_root(str(root)).do_function_files()
+    except (ImportError, AttributeError):
+        # No indexer, or one built before do_function_files existed.
+        return sorted(str(path) for path in root.rglob("*.py"))
+
+
+def _precompute_file(source_path: str) -> int:
+    from doeff.do import _resume_yield_lines
+
+    try:
+        source = Path(source_path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return 0
+    if "Resume" not in source:
+        return 0
+    try:
+        module_node = ast.parse(source)
+        module_code = compile(module_node, source_path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError):
+        return 0
+
+    function_nodes = {}
+    for node in ast.walk(module_node):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            first_line = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+            function_nodes[(node.name, first_line)] = node
+
+    analysed = 0
+    pending = [module_code]
+    while pending:
+        code = pending.pop()
+        pending.extend(const for const in code.co_consts if isinstance(const, CodeType))
+        node = function_nodes.get((code.co_name, code.co_firstlineno))
+        if node is None or not references_resume(code):
+            continue
+        # Whole-file line numbers are already absolute.
+        store(code, _resume_yield_lines(node, 1))
+        analysed += 1
+    return analysed
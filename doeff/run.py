@@ -1,11 +1,14 @@
 """
 run(doexpr) — execute a DoExpr program to completion.
+run_many(programs, threads=N) — execute independent programs on a thread pool.
 """
 
 import sys
 
 from doeff_vm import PyVM
 
+from doeff.result import Err, Ok
+
 
 def run(doexpr):
     """Run a DoExpr program to completion and return the result.
@@ -21,6 +24,54 @@ def run(doexpr):
         raise
 
 
+def run_many(programs, *, threads=None):
+    """Run independent DoExpr programs concurrently and return their results.
+
+    Each program runs on its own PyVM with ``release_gil=True``, so the VM's
+    internal transitions do not hold the GIL and programs on other worker
+    threads interleave with them. On a free-threaded (no-GIL) interpreter the
+    programs run in parallel. Programs must not share mutable Python state.
+
+    Returns a list of ``Ok(value)`` / ``Err(exception)`` in input order; one
+    failing program does not abort the others. ``threads`` defaults to
+    ``os.cpu_count()``.
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    programs = list(programs)
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if threads < 1:
+        raise ValueError(f"run_many: threads must be >= 1, got {threads}")
+    if not programs:
+        return []
+
+    def run_one(doexpr):
+        vm = PyVM()
+        try:
+            return Ok(vm.run(doexpr, release_gil=True))
+        except Exception as e:
+            _enrich_exception(e)
+            return Err(e)
+
+    if threads == 1:
+        return [run_one(doexpr) for doexpr in programs]
+    with ThreadPoolExecutor(max_workers=min(threads, len(programs))) as pool:
+        return list(pool.map(run_one, programs))
+
+
+def _enrich_exception(exception):
+    """Attach doeff traceback frames without printing (batch runs)."""
+    try:
+        if hasattr(exception, "__doeff_traceback__"):
+            _merge_python_frames(exception)
+        else:
+            _enrich_exception_traceback(exception)
+    except Exception:
+        pass  # don't mask the original error
+
+
 def _enrich_and_print(exception):
     """Enrich exception with doeff traceback and print to stderr."""
     try:
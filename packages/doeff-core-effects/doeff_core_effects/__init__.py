@@ -25,7 +25,9 @@ from doeff_core_effects.effects import (  # noqa: F401
     slog,
 )
 from doeff_core_effects.handlers import (  # noqa: F401
+    await_bridge_metrics,
     await_handler,
+    configure_await_bridge,
     env_var_ask,
     lazy_ask,
     listen_handler,
@@ -41,6 +43,7 @@ from doeff_core_effects.handlers import (  # noqa: F401
 from doeff_core_effects.http_handlers import (  # noqa: F401
     http_fixture_handler,
     http_production_handler,
+    migrate_http_fixtures,
 )
 from doeff_core_effects.scheduler import (  # noqa: F401
     PRIORITY_HIGH,
@@ -48,7 +51,10 @@ from doeff_core_effects.scheduler import (  # noqa: F401
     PRIORITY_NORMAL,
     AcquireSemaphore,
     Cancel,
+    ClaimAbandonedError,
+    ClaimPromise,
     CompletePromise,
+    CompletePromises,
     CreateExternalPromise,
     CreatePromise,
     CreateSemaphore,
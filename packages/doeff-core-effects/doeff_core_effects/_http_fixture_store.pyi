@@ -0,0 +1,24 @@
+from pathlib import Path
+from typing import Any
+
+class HttpFixtureStore:
+    path: Path
+    index_path: Path
+    offsets: dict[str, tuple[int, int]]
+
+    def __init__(self, path: str | Path) -> None: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __len__(self) -> int: ...
+    def get(self, key: str, default: Any = ...) -> dict[str, Any] | Any: ...
+    def append(self, key: str, record: dict[str, Any]) -> None: ...
+    def mapped(self, end: int) -> Any: ...
+    def close(self) -> None: ...
+
+
+def migrate_http_fixtures(fixture_path: str | Path) -> int: ...
+
+
+def legacy_fixture_file(path: Path) -> bool: ...
+
+
+def load_legacy_fixtures(path: Path) -> dict[str, dict[str, Any]]: ...
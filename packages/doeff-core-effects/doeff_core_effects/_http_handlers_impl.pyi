@@ -2,8 +2,11 @@ from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, Literal, Protocol
 
+from doeff_core_effects._http_fixture_store import HttpFixtureStore
+
 FixtureMode = Literal["record", "replay"]
 SleepFn = Callable[[float], Awaitable[None]]
+JitterFn = Callable[[float], float]
 
 
 class HttpAsyncClient(Protocol):
@@ -19,6 +22,26 @@ class HttpAsyncClient(Protocol):
         follow_redirects: bool = ...,
     ) -> Awaitable[Any]: ...
 
+    # Used only by streamed requests (stream=True / stream_to=...).
+    def build_request(
+        self,
+        method: str,
+        url: Any,
+        *,
+        params: Any = ...,
+        content: Any = ...,
+        headers: Any = ...,
+        timeout: Any = ...,
+    ) -> Any: ...
+
+    def send(
+        self,
+        request: Any,
+        *,
+        stream: bool = ...,
+        follow_redirects: bool = ...,
+    ) -> Awaitable[Any]: ...
+
     def aclose(self) -> Awaitable[None]: ...
 
 
@@ -27,8 +50,13 @@ AsyncClientFactory = Callable[[], HttpAsyncClient]
 
 def http_production_handler(
     *,
-    client_factory: AsyncClientFactory = ...,
+    client_factory: AsyncClientFactory | None = ...,
     sleep: SleepFn = ...,
+    jitter: JitterFn = ...,
+    max_connections: int | None = ...,
+    max_keepalive_connections: int | None = ...,
+    keepalive_expiry: float | None = ...,
+    per_host_limit: int | None = ...,
 ) -> Any: ...
 
 
@@ -36,18 +64,20 @@ def http_fixture_handler(
     fixture_path: str | Path,
     *,
     mode: FixtureMode,
-    client_factory: AsyncClientFactory = ...,
+    client_factory: AsyncClientFactory | None = ...,
     sleep: SleepFn = ...,
 ) -> Any: ...
 
 
-def _http_production_handler(client: Any, sleep: Any) -> Any: ...
+def _http_production_handler(transport: Any) -> Any: ...
 
 
-def _http_fixture_record_handler(
-    path: Path,
-    fixtures: dict[str, dict[str, Any]],
-) -> Any: ...
+def migrate_http_fixtures(fixture_path: str | Path) -> int: ...
+
 
+def _http_fixture_record_handler(store: HttpFixtureStore) -> Any: ...
 
-def _http_fixture_replay_handler(fixtures: dict[str, dict[str, Any]]) -> Any: ...
+
+def _http_fixture_replay_handler(
+    store: HttpFixtureStore | dict[str, dict[str, Any]],
+) -> Any: ...
@@ -21,7 +21,8 @@ from frozendict import (
 )
 
 from doeff import UnhandledEffect, do
-from doeff_core_effects.memo_effects import MemoExists, MemoGet, MemoPut
+from doeff_core_effects.memo_effects import MEMO_MISS, MemoLookup, MemoPut
+from doeff_core_effects.memo_handlers import _memo_single_flight
 from doeff_core_effects.memo_policy import Lifecycle, MemoPolicy, ensure_memo_policy
 
 T = TypeVar("T")
@@ -89,6 +90,8 @@ def cache(
 
     The cache key defaults to ``(func_name, args, FrozenDict(kwargs))`` where
     ``func_name`` is the fully qualified module path of the wrapped callable.
+    Concurrent misses on one key (e.g. spawned tasks) run the function once
+    and share its result.
 
     Args:
         ttl: Expiry in seconds. None means no expiry.
@@ -116,26 +119,30 @@ def cache(
                 else (func_name, args, frozen_kwargs)
             )
 
-            # Memo handler is optional. If absent (UnhandledEffect on MemoExists/Get)
-            # or storage misses (KeyError), fall through to compute. The
+            # Memo handler is optional. If absent (UnhandledEffect on MemoLookup)
+            # or storage misses (MEMO_MISS), fall through to compute. The
             # yield func(...) below is NOT wrapped: its failures must propagate.
             try:
-                if (yield MemoExists(cache_key_obj)):
-                    try:
-                        cached_value = yield MemoGet(cache_key_obj)
-                        return cached_value
-                    except KeyError:
-                        pass
+                found = yield MemoLookup(cache_key_obj)
             except UnhandledEffect:
-                pass
-
-            # Memo miss — run the function
-            result = yield func(*args, **kwargs)
+                found = MEMO_MISS
+            if found is not MEMO_MISS:
+                return found.value
 
+            # Memo miss — run the function once for all concurrent callers.
             # Best-effort store: if no memo handler is installed, swallow. The
-            # compute result returned above is authoritative.
-            with contextlib.suppress(UnhandledEffect):
-                yield MemoPut(cache_key_obj, result, policy=memo_policy)
+            # compute result is authoritative.
+            @do
+            def persist(value):
+                with contextlib.suppress(UnhandledEffect):
+                    yield MemoPut(cache_key_obj, value, policy=memo_policy)
+
+            result = yield _memo_single_flight(
+                cache_key_obj,
+                memo_policy.recompute_cost,
+                lambda: func(*args, **kwargs),
+                persist,
+            )
             return result
 
         # Preserve metadata
@@ -1,15 +1,12 @@
 """Cache effect handlers and memoization helpers."""
 
-import dataclasses
-import hashlib
-import json
-from collections.abc import Callable, Mapping, Set
+from collections.abc import Callable
 from pathlib import Path
 from typing import TypeAlias
 
 from doeff import do
 from doeff import handler as _program_handler
-from doeff.program import Pass, Resume
+from doeff.program import Pass, Pure, Resume
 from doeff_core_effects.cache_effects import (
     CacheDeleteEffect,
     CacheExists,
@@ -19,65 +16,41 @@ from doeff_core_effects.cache_effects import (
     CachePut,
     CachePutEffect,
 )
-from doeff_core_effects.storage import DurableStorage, InMemoryStorage, SQLiteStorage
+from doeff_core_effects.keying import content_address
+from doeff_core_effects.keying import storage_key as _storage_key
+from doeff_core_effects.storage import (
+    DurableStorage,
+    InMemoryStorage,
+    SQLiteStorage,
+    reads_inline,
+    writes_inline,
+)
 
 MemoKeyFn: TypeAlias = Callable[[object], str]
 
 
-def _dumps(value: object) -> bytes:
-    try:
-        import cloudpickle as serializer
-    except ModuleNotFoundError:
-        import pickle as serializer
-
-    return serializer.dumps(value)
-
-
-def _normalize_for_hash(value: object) -> object:  # noqa: PLR0911 - baseline cleanup keeps existing control flow unchanged
-    if dataclasses.is_dataclass(value) and not isinstance(value, type):
-        return {
-            "__type__": f"{type(value).__module__}.{type(value).__qualname__}",
-            **{
-                field.name: _normalize_for_hash(getattr(value, field.name))
-                for field in dataclasses.fields(value)
-            },
-        }
-    if isinstance(value, Mapping):
-        return {
-            str(key): _normalize_for_hash(item)
-            for key, item in sorted(value.items(), key=lambda item: str(item[0]))
-        }
-    if isinstance(value, tuple):
-        return {"__tuple__": [_normalize_for_hash(item) for item in value]}
-    if isinstance(value, list):
-        return [_normalize_for_hash(item) for item in value]
-    if isinstance(value, Set) and not isinstance(value, (str, bytes, bytearray)):
-        normalized = [_normalize_for_hash(item) for item in value]
-        return {
-            "__set__": sorted(normalized, key=lambda item: json.dumps(item, sort_keys=True))
-        }
-    if isinstance(value, Path):
-        return {"__path__": str(value)}
-    if isinstance(value, bytes):
-        return {"__bytes__": value.hex()}
-    if isinstance(value, type):
-        return f"{value.__module__}.{value.__qualname__}"
-    if hasattr(value, "__dict__") and not isinstance(value, type):
-        # Generic object with __dict__ (e.g. EffectBase subclasses)
-        return {
-            "__type__": f"{type(value).__module__}.{type(value).__qualname__}",
-            **{
-                k: _normalize_for_hash(v)
-                for k, v in sorted(value.__dict__.items())
-            },
-        }
-    return value
-
-
-def _storage_key(key: object) -> str:
-    if isinstance(key, str):
-        return key
-    return f"sha256:{content_address(key)}"
+def _storage_exists(storage: DurableStorage, key: str):
+    if reads_inline(storage):
+        return Pure(storage.exists_sync(key))
+    return storage.exists(key)
+
+
+def _storage_get(storage: DurableStorage, key: str):
+    if reads_inline(storage):
+        return Pure(storage.get_sync(key))
+    return storage.get(key)
+
+
+def _storage_put(storage: DurableStorage, key: str, value: object):
+    if writes_inline(storage):
+        return Pure(storage.put_sync(key, value))
+    return storage.put(key, value)
+
+
+def _storage_delete(storage: DurableStorage, key: str):
+    if writes_inline(storage):
+        return Pure(storage.delete_sync(key))
+    return storage.delete(key)
 
 
 def _persist_value(
@@ -95,22 +68,14 @@ def _persist_value(
         ) from exc
 
 
-def content_address(effect: object) -> str:
-    """Return a SHA-256 content address for an effect payload."""
-    try:
-        payload = _dumps(effect)
-    except Exception:
-        payload = json.dumps(_normalize_for_hash(effect), sort_keys=True, default=repr).encode(
-            "utf-8"
-        )
-    return hashlib.sha256(payload).hexdigest()
-
-
 def cache_handler(storage: DurableStorage):
     """Interpret CacheGet/CachePut/CacheExists against a pluggable storage backend.
 
     Storage methods return Programs (DoExpr). The handler yields them to get values.
     This makes the handler transparent to sync (Pure) and async (Await) storage alike.
+    Backends reporting synchronous reads/writes (see DurableStorage) are called
+    through their ``*_sync`` methods and wrapped in Pure instead, so e.g. an
+    InMemoryStorage hit resumes inline without a trip through the await bridge.
     """
 
     @do
@@ -125,14 +90,14 @@ def cache_handler(storage: DurableStorage):
         key = _storage_key(effect.key)
 
         if isinstance(effect, CacheExistsEffect):
-            exists = yield storage.exists(key)
+            exists = yield _storage_exists(storage, key)
             result = yield Resume(k, exists)
             return result
 
         if isinstance(effect, CacheGetEffect):
-            value = yield storage.get(key)
+            value = yield _storage_get(storage, key)
             if value is None:
-                exists = yield storage.exists(key)
+                exists = yield _storage_exists(storage, key)
                 if not exists:
                     from doeff.program import ResumeThrow
                     return (yield ResumeThrow(k, KeyError(effect.key)))
@@ -141,12 +106,12 @@ def cache_handler(storage: DurableStorage):
 
         if isinstance(effect, CacheDeleteEffect):
             # Missing-key delete is an idempotent no-op; resume None like Put.
-            yield storage.delete(key)
+            yield _storage_delete(storage, key)
             result = yield Resume(k, None)
             return result
 
         # CachePutEffect
-        yield storage.put(key, effect.value)
+        yield _storage_put(storage, key, effect.value)
         result = yield Resume(k, None)
         return result
 
@@ -158,9 +123,12 @@ def in_memory_cache_handler():
     return cache_handler(InMemoryStorage())
 
 
-def sqlite_cache_handler(db_path: str | Path):
-    """Return a cache handler backed by SQLite storage."""
-    return cache_handler(SQLiteStorage(db_path))
+def sqlite_cache_handler(db_path: str | Path, *, sync_reads: bool = False):
+    """Return a cache handler backed by SQLite storage.
+
+    sync_reads=True serves CacheGet/CacheExists on the calling thread.
+    """
+    return cache_handler(SQLiteStorage(db_path, sync_reads=sync_reads))
 
 
 def make_memo_rewriter(
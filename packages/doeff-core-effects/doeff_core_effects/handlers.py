@@ -13,13 +13,22 @@ Compose them by calling each handler with the program to wrap:
 writer and slog_handler use lazy state init via Get/Put + Some
 (same pattern as Hy defhandler's ``lazy`` clause). They require
 the ``state`` handler to be installed as an outer handler.
+
+reader, state and writer are ``doeff_vm.NativeHandler``s: the VM resolves
+Ask/Get/Put/Tell in its step loop without calling into Python. The writer
+log lives in the store of the state handler its Get reaches; when that is
+not a native state handler, the generator writer handles the Tell. The
+generator reader and state remain for comparison with the native ones.
 """
 
 import threading as _threading
 
+import doeff_vm as _doeff_vm
+
 from doeff import do
 from doeff.program import Pass, Transfer, TransferThrow
 from doeff.program import handler as _program_handler
+from doeff.result import Some
 from doeff_core_effects.effects import (
     Ask,
     Await,
@@ -32,6 +41,9 @@ from doeff_core_effects.effects import (
     WriterTellEffect,
 )
 
+# Native reader/state/writer, resolved inside the VM step loop.
+_NativeHandler = _doeff_vm.NativeHandler
+
 
 def reader(env=None):
     """Reader handler: resolves Ask(key) from env dict.
@@ -41,13 +53,16 @@ def reader(env=None):
     """
     if env is None:
         env = {}
+    if _NativeHandler is not None:
+        native = _NativeHandler.reader(Ask, env, _missing_key_error)
+        return _program_handler(native, types=(Ask,))
 
     @do
     def handler(effect, k):
         if isinstance(effect, Ask):
             if effect.key in env:
                 return (yield Transfer(k, env[effect.key]))
-            return (yield TransferThrow(k, KeyError(_missing_key_message(effect.key))))
+            return (yield TransferThrow(k, _missing_key_error(effect.key)))
         yield Pass(effect, k)
 
     return _program_handler(handler)
@@ -60,6 +75,9 @@ def state(initial=None):
         initial: dict of initial state. Default empty.
     """
     store = dict(initial) if initial else {}
+    if _NativeHandler is not None:
+        native = _NativeHandler.state(Get, Put, store)
+        return _program_handler(native, types=(Get, Put))
 
     @do
     def handler(effect, k):
@@ -87,8 +105,6 @@ def _writer_handler(effect, k):
     Retrieve the collected log with ``yield writer_log()``.
     """
     if isinstance(effect, WriterTellEffect):
-        from doeff.result import Some
-
         cached = yield Get(_WRITER_LOG_KEY)
         if isinstance(cached, Some):
             log = cached.value
@@ -100,9 +116,13 @@ def _writer_handler(effect, k):
     yield Pass(effect, k)
 
 
-writer = _program_handler(_writer_handler)
+writer = _program_handler(
+    _NativeHandler.writer(WriterTellEffect, Get(_WRITER_LOG_KEY), Some, _writer_handler),
+    types=(WriterTellEffect,),
+)
 writer.__name__ = "writer"
 writer.__qualname__ = "writer"
+writer.__doc__ = _writer_handler.__doc__
 
 
 @do
@@ -113,8 +133,6 @@ def writer_log():
     been issued yet.  The returned list is a copy — mutations do not
     affect the handler's internal log.
     """
-    from doeff.result import Some
-
     cached = yield Get(_WRITER_LOG_KEY)
     if isinstance(cached, Some):
         return list(cached.value)
@@ -296,68 +314,139 @@ listen_handler.__name__ = "listen_handler"
 listen_handler.__qualname__ = "listen_handler"
 
 
-# --- Shared Await bridge loop (process-global singleton, issues #494/#498) ---
+# --- Shared Await bridge loops (process-global pool, issues #494/#498) ---
 #
-# One background asyncio loop + daemon thread for ALL await_handler instances,
-# instead of one per instance (which leaked a thread + loop + fds per run).
+# A process-global pool of background asyncio loops, each on its own daemon
+# thread, shared by ALL await_handler instances instead of one loop per
+# instance (which leaked a thread + loop + fds per run). The pool holds one
+# loop unless configure_await_bridge() asks for more; each await_handler
+# instance is pinned to one loop so a run's coroutines always share a loop.
 
 _await_bridge_lock = _threading.Lock()
 _await_bridge_state = {
-    # (loop, thread) once created; replaced atomically under the lock.
-    "bridge": None,
-    # BaseException that killed the loop thread's run_forever, if any.
-    "thread_error": None,
+    # Slot index -> _AwaitBridgeLoop once created; replaced under the lock.
+    "bridges": {},
+    # Number of loops new await_handler instances are spread over.
+    "size": 1,
     "atexit_registered": False,
 }
 
 
-def _await_bridge_thread_main(loop):
-    """Run the shared bridge loop, capturing whatever kills run_forever."""
+class _AwaitBridgeLoop:
+    """One bridge loop + thread and its load/lag counters.
+
+    Counters are written from both the scheduler threads (submit, cancel)
+    and the loop thread (start, finish), so they are guarded by ``lock``.
+    """
+
+    __slots__ = (
+        "cancelled", "completed", "index", "lag_last", "lag_max", "lag_total",
+        "lock", "loop", "started", "submitted", "thread", "thread_error",
+    )
+
+    def __init__(self, index, loop):
+        self.index = index
+        self.loop = loop
+        self.thread = None
+        self.thread_error = None
+        self.lock = _threading.Lock()
+        self.submitted = 0
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_total = 0.0
+
+    def usable(self):
+        return not self.loop.is_closed() and self.thread.is_alive()
+
+    def in_flight(self):
+        return self.submitted - self.completed
+
+    def record_submit(self):
+        with self.lock:
+            self.submitted += 1
+
+    def record_start(self, lag):
+        with self.lock:
+            self.started += 1
+            self.lag_last = lag
+            self.lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+
+    def record_cancel(self):
+        with self.lock:
+            self.cancelled += 1
+
+    def record_finish(self, _future):
+        with self.lock:
+            self.completed += 1
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "index": self.index,
+                "alive": self.usable(),
+                "in_flight": self.submitted - self.completed,
+                "queued": self.submitted - self.started,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "lag_last_ms": self.lag_last * 1000.0,
+                "lag_max_ms": self.lag_max * 1000.0,
+                "lag_mean_ms": self.lag_total / self.started * 1000.0 if self.started else 0.0,
+            }
+
+
+def _await_bridge_thread_main(bridge):
+    """Run one bridge loop, capturing whatever kills run_forever."""
     import asyncio
 
-    asyncio.set_event_loop(loop)
+    asyncio.set_event_loop(bridge.loop)
     try:
-        loop.run_forever()
+        bridge.loop.run_forever()
     except BaseException as e:
-        _await_bridge_state["thread_error"] = e
+        bridge.thread_error = e
         raise
 
 
 def _shutdown_await_bridge():
-    """atexit hook: best-effort drain, stop and close the shared bridge loop.
+    """atexit hook: best-effort drain, stop and close every bridge loop.
 
     Cancels in-flight bridge coroutines (their ``ep.fail(CancelledError)``
-    lands in an already-dead run queue and is ignored), stops the loop, joins
-    the thread briefly, and closes the loop once run_forever has returned.
+    lands in an already-dead run queue and is ignored), stops each loop,
+    joins its thread briefly, and closes the loop once run_forever has
+    returned.
     """
     import asyncio
 
     with _await_bridge_lock:
-        bridge = _await_bridge_state["bridge"]
-        _await_bridge_state["bridge"] = None
-    if bridge is None:
-        return
-    loop, thread = bridge
-    if thread.is_alive() and not loop.is_closed():
+        bridges = list(_await_bridge_state["bridges"].values())
+        _await_bridge_state["bridges"] = {}
+    for bridge in bridges:
+        loop, thread = bridge.loop, bridge.thread
+        if thread.is_alive() and not loop.is_closed():
 
-        def _drain_and_stop():
-            for task in asyncio.all_tasks():
-                task.cancel()
-            # Stop in the NEXT callback batch so the cancellations above get
-            # one loop iteration to actually propagate into the coroutines.
-            loop.call_soon(loop.stop)
+            def _drain_and_stop(loop=loop):
+                for task in asyncio.all_tasks(loop):
+                    task.cancel()
+                # Stop in the NEXT callback batch so the cancellations above
+                # get one loop iteration to propagate into the coroutines.
+                loop.call_soon(loop.stop)
 
-        loop.call_soon_threadsafe(_drain_and_stop)
-        thread.join(timeout=1.0)
-    if not thread.is_alive() and not loop.is_closed():
-        loop.close()
+            loop.call_soon_threadsafe(_drain_and_stop)
+    for bridge in bridges:
+        bridge.thread.join(timeout=1.0)
+        if not bridge.thread.is_alive() and not bridge.loop.is_closed():
+            bridge.loop.close()
 
 
-def _get_await_bridge_loop():
-    """Return the process-global bridge loop, (re)creating it if needed.
+def _get_await_bridge(index=0):
+    """Return bridge loop ``index`` of the pool, (re)creating it if needed.
 
     Double-checked locking. The bridge coroutine never lets an exception
-    escape onto the loop, so the loop is expected to outlive the process;
+    escape onto the loop, so a loop is expected to outlive the process;
     this replacement path is a backstop for external kills only (e.g. user
     code scheduled its own task on the loop and raised SystemExit, or a
     forked child inherited a bridge whose thread does not exist). It warns
@@ -367,42 +456,77 @@ def _get_await_bridge_loop():
     import atexit
     import warnings
 
-    bridge = _await_bridge_state["bridge"]
-    if bridge is not None:
-        loop, thread = bridge
-        if not loop.is_closed() and thread.is_alive():
-            return loop
+    bridge = _await_bridge_state["bridges"].get(index)
+    if bridge is not None and bridge.usable():
+        return bridge
     with _await_bridge_lock:
-        bridge = _await_bridge_state["bridge"]
+        bridge = _await_bridge_state["bridges"].get(index)
         if bridge is not None:
-            loop, thread = bridge
-            if not loop.is_closed() and thread.is_alive():
-                return loop
+            if bridge.usable():
+                return bridge
             # Previous loop is unusable — report loudly and replace it.
-            killer = _await_bridge_state["thread_error"]
+            loop, thread = bridge.loop, bridge.thread
             warnings.warn(
-                "doeff await bridge loop was unusable "
+                f"doeff await bridge loop {index} was unusable "
                 f"(closed={loop.is_closed()}, thread_alive={thread.is_alive()}, "
-                f"killed_by={killer!r}); starting a replacement loop",
+                f"killed_by={bridge.thread_error!r}); starting a replacement loop",
                 RuntimeWarning,
                 stacklevel=2,
             )
             if not thread.is_alive() and not loop.is_closed():
                 loop.close()  # reclaim the dead loop's fds
-        new_loop = asyncio.new_event_loop()
-        t = _threading.Thread(
+        bridge = _AwaitBridgeLoop(index, asyncio.new_event_loop())
+        bridge.thread = _threading.Thread(
             target=_await_bridge_thread_main,
-            args=(new_loop,),
-            name="doeff-await-bridge",
+            args=(bridge,),
+            name="doeff-await-bridge" if index == 0 else f"doeff-await-bridge-{index}",
             daemon=True,
         )
-        t.start()
-        _await_bridge_state["bridge"] = (new_loop, t)
-        _await_bridge_state["thread_error"] = None
+        bridge.thread.start()
+        _await_bridge_state["bridges"][index] = bridge
         if not _await_bridge_state["atexit_registered"]:
             atexit.register(_shutdown_await_bridge)
             _await_bridge_state["atexit_registered"] = True
-        return new_loop
+        return bridge
+
+
+def _pick_await_bridge_index():
+    """Least-loaded slot among the configured pool (lowest index on ties)."""
+    bridges = _await_bridge_state["bridges"]
+    best, best_load = 0, None
+    for index in range(_await_bridge_state["size"]):
+        bridge = bridges.get(index)
+        load = bridge.in_flight() if bridge is not None else 0
+        if best_load is None or load < best_load:
+            best, best_load = index, load
+    return best
+
+
+def configure_await_bridge(loops):
+    """Set how many shared event loops new await_handler instances spread over.
+
+    Each await_handler() instance is pinned, at its first Await, to the
+    least-loaded of the first ``loops`` loops, so one run's coroutines keep
+    sharing a loop while a coroutine that blocks its loop only stalls the
+    runs pinned there. Loops are created lazily; lowering ``loops`` never
+    stops a loop that instances are already pinned to.
+    """
+    if loops < 1:
+        raise ValueError(f"configure_await_bridge: loops must be >= 1, got {loops}")
+    with _await_bridge_lock:
+        _await_bridge_state["size"] = loops
+
+
+def await_bridge_metrics():
+    """Per-loop load and lag counters of the shared Await bridge pool.
+
+    ``in_flight`` counts coroutines submitted but not finished, ``queued``
+    those not yet started by their loop, and ``lag_*_ms`` the delay between
+    submission and the coroutine's first step on the loop thread — a
+    direct measure of how busy (or blocked) the loop is.
+    """
+    bridges = _await_bridge_state["bridges"]
+    return [bridges[index].metrics() for index in sorted(bridges)]
 
 
 def _observe_await_bridge_future(future):
@@ -425,43 +549,61 @@ def _observe_await_bridge_future(future):
 
 
 def await_handler():
-    """Await handler: runs async coroutines via a background thread with asyncio.
+    """Await handler: runs async coroutines on a shared background asyncio loop.
 
     Uses ExternalPromise to bridge async into the scheduler.
     Requires scheduler to be installed.
 
-    All instances share one process-global event loop + daemon thread
-    (#498); the loop is stopped/closed by an atexit hook. The bridge
-    coroutine resolves its promise on EVERY exit, including BaseException
-    such as asyncio.CancelledError (#494). ``ep.fail`` is the ONLY
-    propagation channel: the scheduler's task wrapper catches only
+    Instances share a process-global pool of event loops, each on its own
+    daemon thread (#498), stopped/closed by an atexit hook. The pool has one
+    loop unless configure_await_bridge(loops=N) raises it; each instance is
+    pinned to one loop at its first Await (the least-loaded one), so a
+    run's coroutines — and any loop-bound objects they share — stay on one
+    loop. A bridged coroutine that blocks its loop (e.g. a synchronous call
+    inside async code) stalls every Await pinned to that loop;
+    await_bridge_metrics() reports per-loop queue depth and lag.
+
+    The bridge coroutine resolves its promise on EVERY exit, including
+    BaseException such as asyncio.CancelledError (#494). ``ep.fail`` is the
+    ONLY propagation channel: the scheduler's task wrapper catches only
     ``Exception``, so KeyboardInterrupt/SystemExit failed into the promise
     escape the scheduler and reach the ``run()`` caller's thread. They are
     deliberately NOT re-raised on the loop thread — that would kill the
     shared loop (asyncio re-raises them out of ``run_forever``), silently
-    orphaning every other in-flight Await in the process, while gaining
-    nothing: ``threading`` swallows SystemExit on daemon threads.
-
-    Known limitation (#498): cancelling a doeff task does NOT cancel the
-    in-flight bridged coroutine — it keeps running on the shared loop and
-    its late completion is ignored. Fixing that requires scheduler-side
-    cancel propagation to the run_coroutine_threadsafe future.
+    orphaning every other in-flight Await on it, while gaining nothing:
+    ``threading`` swallows SystemExit on daemon threads.
 
-    Isolation trade-off of the shared loop: a bridged coroutine that blocks
-    the loop (e.g. a synchronous call inside async code) now stalls every
-    run's Awaits process-wide, not just its own run's.
+    Cancelling the doeff task parked on an Await cancels the bridged
+    coroutine: the scheduler runs the promise's cancel hook, which cancels
+    the asyncio task behind the run_coroutine_threadsafe future on its loop
+    (or, if it has not started yet, closes the coroutine unstarted).
     """
     import asyncio
+    import time
 
     from doeff_core_effects.scheduler import CreateExternalPromise, Wait
 
+    pinned = []
+
     @do
     def handler(effect, k):
         if isinstance(effect, Await):
             ep = yield CreateExternalPromise()
-            loop = _get_await_bridge_loop()
+            if not pinned:
+                pinned.append(_pick_await_bridge_index())
+            bridge = _get_await_bridge(pinned[0])
+            submitted_at = time.perf_counter()
+            # Touched only on the loop thread: the asyncio task running
+            # run_coro, and whether cancellation was requested first.
+            cancel_state = {"task": None, "cancelled": False}
 
             async def run_coro():
+                bridge.record_start(time.perf_counter() - submitted_at)
+                cancel_state["task"] = asyncio.current_task()
+                if cancel_state["cancelled"]:
+                    effect.coroutine.close()
+                    ep.fail(asyncio.CancelledError())
+                    return
                 try:
                     result = await effect.coroutine
                 except BaseException as e:
@@ -471,14 +613,26 @@ def await_handler():
                     # Never re-raise here, not even KeyboardInterrupt or
                     # SystemExit: asyncio would propagate it out of
                     # run_forever and kill the SHARED loop thread, silently
-                    # hanging every other in-flight Await in the process.
+                    # hanging every other in-flight Await on it.
                     # ep.fail already delivers it to the run() caller.
                     ep.fail(e)
                 else:
                     ep.complete(result)
 
-            fut = asyncio.run_coroutine_threadsafe(run_coro(), loop)
+            def cancel_coro():
+                cancel_state["cancelled"] = True
+                if cancel_state["task"] is not None:
+                    cancel_state["task"].cancel()
+
+            def on_cancel():
+                bridge.record_cancel()
+                bridge.loop.call_soon_threadsafe(cancel_coro)
+
+            bridge.record_submit()
+            fut = asyncio.run_coroutine_threadsafe(run_coro(), bridge.loop)
+            fut.add_done_callback(bridge.record_finish)
             fut.add_done_callback(_observe_await_bridge_future)
+            ep.on_cancel(on_cancel)
             value = yield Wait(ep.future)
             return (yield Transfer(k, value))
         yield Pass(effect, k)
@@ -486,6 +640,10 @@ def await_handler():
     return _program_handler(handler)
 
 
+def _missing_key_error(key):
+    return KeyError(_missing_key_message(key))
+
+
 def _missing_key_message(key):
     """Build an actionable error message for a missing Ask key."""
     return (
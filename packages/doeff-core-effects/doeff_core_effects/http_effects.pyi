@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any
 
 from doeff_vm import EffectBase
@@ -11,6 +13,8 @@ class HttpRequest(EffectBase):
     timeout_seconds: float
     max_retries: int
     follow_redirects: bool
+    stream: bool
+    stream_to: str | Path | None
 
     def __init__(
         self,
@@ -23,6 +27,8 @@ class HttpRequest(EffectBase):
         timeout_seconds: float = ...,
         max_retries: int = ...,
         follow_redirects: bool = ...,
+        stream: bool = ...,
+        stream_to: str | Path | None = ...,
     ) -> None: ...
 
     def __repr__(self) -> str: ...
@@ -31,19 +37,24 @@ class HttpRequest(EffectBase):
 class HttpResponse:
     status: int
     headers: dict[str, str]
-    content: bytes
-    text: str
+    content: bytes | None
+    text: str | None
     url: str
     elapsed_seconds: float
+    body_path: Path | None
+    body_stream: AsyncIterator[bytes] | None
 
     def __init__(
         self,
         status: int,
         headers: dict[str, str],
-        content: bytes,
-        text: str,
+        content: bytes | None,
+        text: str | None,
         url: str,
         elapsed_seconds: float,
+        *,
+        body_path: Path | None = ...,
+        body_stream: AsyncIterator[bytes] | None = ...,
     ) -> None: ...
 
     def raise_for_status(self) -> None: ...
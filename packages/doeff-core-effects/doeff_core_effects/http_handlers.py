@@ -5,6 +5,7 @@ import doeff_hy as _doeff_hy  # noqa: F401  # registers Hy import hooks
 from doeff_core_effects._http_handlers_impl import (
     http_fixture_handler,
     http_production_handler,
+    migrate_http_fixtures,
 )
 
-__all__ = ["http_fixture_handler", "http_production_handler"]
+__all__ = ["http_fixture_handler", "http_production_handler", "migrate_http_fixtures"]
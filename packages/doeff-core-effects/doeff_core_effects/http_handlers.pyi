@@ -4,6 +4,7 @@ from typing import Any, Literal, Protocol
 
 FixtureMode = Literal["record", "replay"]
 SleepFn = Callable[[float], Awaitable[None]]
+JitterFn = Callable[[float], float]
 
 
 class HttpAsyncClient(Protocol):
@@ -19,6 +20,26 @@ class HttpAsyncClient(Protocol):
         follow_redirects: bool = ...,
     ) -> Awaitable[Any]: ...
 
+    # Used only by streamed requests (stream=True / stream_to=...).
+    def build_request(
+        self,
+        method: str,
+        url: Any,
+        *,
+        params: Any = ...,
+        content: Any = ...,
+        headers: Any = ...,
+        timeout: Any = ...,
+    ) -> Any: ...
+
+    def send(
+        self,
+        request: Any,
+        *,
+        stream: bool = ...,
+        follow_redirects: bool = ...,
+    ) -> Awaitable[Any]: ...
+
     def aclose(self) -> Awaitable[None]: ...
 
 
@@ -27,8 +48,13 @@ AsyncClientFactory = Callable[[], HttpAsyncClient]
 
 def http_production_handler(
     *,
-    client_factory: AsyncClientFactory = ...,
+    client_factory: AsyncClientFactory | None = ...,
     sleep: SleepFn = ...,
+    jitter: JitterFn = ...,
+    max_connections: int | None = ...,
+    max_keepalive_connections: int | None = ...,
+    keepalive_expiry: float | None = ...,
+    per_host_limit: int | None = ...,
 ) -> Any: ...
 
 
@@ -36,6 +62,9 @@ def http_fixture_handler(
     fixture_path: str | Path,
     *,
     mode: FixtureMode,
-    client_factory: AsyncClientFactory = ...,
+    client_factory: AsyncClientFactory | None = ...,
     sleep: SleepFn = ...,
 ) -> Any: ...
+
+
+def migrate_http_fixtures(fixture_path: str | Path) -> int: ...
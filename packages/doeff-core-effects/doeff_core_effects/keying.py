@@ -0,0 +1,251 @@
+"""Content-addressed keys for cache and memo storage.
+
+content_address() feeds a value's structure straight into a hash: primitives,
+containers, dataclasses, pydantic models, enums, paths and plain objects
+(effects included) are written as tagged, length-prefixed records, without
+pickling or building a normalized copy first. Dict keys and set members are
+ordered by content, so the address is stable across processes regardless of
+PYTHONHASHSEED. Values the walker does not understand are pickled (falling
+back to repr) and hashed as opaque bytes.
+
+Frozen dataclasses, frozen pydantic models and classes that set
+``__doeff_immutable__ = True`` are treated as immutable: their address is
+computed once per instance and cached until the instance is garbage collected.
+Effects are ordinary mutable objects and are hashed on every call unless their
+class opts in.
+"""
+
+import dataclasses
+import enum
+import hashlib
+import struct
+import weakref
+from collections.abc import Callable, Mapping, Set
+from operator import itemgetter
+from pathlib import PurePath
+from typing import Any
+
+from doeff import EffectBase
+
+HASH_ALGORITHMS = ("sha256", "blake2b")
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+_pack_length = struct.Struct("<Q").pack
+_pack_float = struct.Struct("<d").pack
+
+# object.__getstate__ exists from Python 3.11; None before that.
+_OBJECT_GETSTATE = getattr(object, "__getstate__", None)
+
+# (id(value), algorithm) -> (weakref to value, hex digest)
+_address_cache: dict[tuple[int, str], tuple[weakref.ref, str]] = {}
+
+
+def _dumps(value: object) -> bytes:
+    try:
+        import cloudpickle as serializer
+    except ModuleNotFoundError:
+        import pickle as serializer
+
+    return serializer.dumps(value)
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    raise ValueError(
+        f"unknown content_address algorithm {algorithm!r}; expected one of {HASH_ALGORITHMS}"
+    )
+
+
+def _type_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _feed_bytes(update: Callable[[bytes], object], tag: bytes, data: bytes) -> None:
+    update(tag)
+    update(_pack_length(len(data)))
+    update(data)
+
+
+def _feed_str(update: Callable[[bytes], object], tag: bytes, text: str) -> None:
+    _feed_bytes(update, tag, text.encode("utf-8", "surrogatepass"))
+
+
+def _member_digest(value: object) -> bytes:
+    """Digest of one dict key or set member, used only to order them."""
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed(hasher.update, value)
+    return hasher.digest()
+
+
+def _walks_dict(value: object) -> bool:
+    """True if value pickles as its __dict__, so the dict is its content."""
+    cls = type(value)
+    if isinstance(value, EffectBase):
+        return True
+    return (
+        hasattr(value, "__dict__")
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and getattr(cls, "__getstate__", None) is _OBJECT_GETSTATE
+        and not callable(value)
+    )
+
+
+def _pydantic_fields(cls: type) -> Mapping[str, Any] | None:
+    fields = getattr(cls, "model_fields", None)
+    if isinstance(fields, Mapping) and hasattr(cls, "model_dump"):
+        return fields
+    return None
+
+
+def _feed(update: Callable[[bytes], object], value: object) -> None:  # noqa: PLR0911, PLR0912, PLR0915 - one branch per encoded kind
+    cls = type(value)
+    # Exact-type fast paths for the common leaves.
+    if value is None:
+        update(b"N")
+        return
+    if cls is str:
+        _feed_str(update, b"s", value)
+        return
+    if cls is bool:
+        update(b"T" if value else b"F")
+        return
+    if cls is int:
+        _feed_str(update, b"i", repr(value))
+        return
+    if cls is float:
+        update(b"f")
+        update(_pack_float(value))
+        return
+    if isinstance(value, enum.Enum):
+        _feed_str(update, b"e", _type_name(cls))
+        _feed(update, value.value)
+        return
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        _feed_bytes(update, b"b", bytes(value))
+        return
+    if isinstance(value, str):
+        _feed_str(update, b"s", str(value))
+        return
+    if isinstance(value, (tuple, list)):
+        update(b"(" if isinstance(value, tuple) else b"[")
+        update(_pack_length(len(value)))
+        for item in value:
+            _feed(update, item)
+        return
+    if isinstance(value, Mapping):
+        items = list(value.items())
+        if all(type(key) is str for key, _ in items):
+            items.sort(key=itemgetter(0))
+            update(b"{")
+            update(_pack_length(len(items)))
+            for key, item in items:
+                _feed_str(update, b"s", key)
+                _feed(update, item)
+        else:
+            keyed = sorted(((_member_digest(key), item) for key, item in items), key=itemgetter(0))
+            update(b"<")
+            update(_pack_length(len(keyed)))
+            for key_digest, item in keyed:
+                update(key_digest)
+                _feed(update, item)
+        return
+    if isinstance(value, Set):
+        update(b"S")
+        update(_pack_length(len(value)))
+        for member_digest in sorted(_member_digest(member) for member in value):
+            update(member_digest)
+        return
+    if isinstance(value, (int, float)):
+        _feed_str(update, b"n", repr(value))
+        return
+    if isinstance(value, type):
+        _feed_str(update, b"t", _type_name(value))
+        return
+    if dataclasses.is_dataclass(value):
+        _feed_str(update, b"D", _type_name(cls))
+        for field in dataclasses.fields(value):
+            _feed_str(update, b"s", field.name)
+            _feed(update, getattr(value, field.name))
+        return
+    fields = _pydantic_fields(cls)
+    if fields is not None:
+        _feed_str(update, b"M", _type_name(cls))
+        for name in fields:
+            _feed_str(update, b"s", name)
+            _feed(update, getattr(value, name))
+        return
+    if isinstance(value, PurePath):
+        _feed_str(update, b"p", str(value))
+        return
+    if _walks_dict(value):
+        _feed_str(update, b"O", _type_name(cls))
+        _feed(update, vars(value))
+        return
+    try:
+        _feed_bytes(update, b"P", _dumps(value))
+    except Exception:
+        _feed_str(update, b"R", repr(value))
+
+
+def _is_immutable(value: object) -> bool:
+    cls = type(value)
+    if getattr(cls, "__doeff_immutable__", False):
+        return True
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is not None:
+        return bool(params.frozen)
+    if _pydantic_fields(cls) is not None:
+        return bool(getattr(cls, "model_config", {}).get("frozen", False))
+    return False
+
+
+def _compute_address(value: object, algorithm: str) -> str:
+    hasher = _new_hasher(algorithm)
+    try:
+        _feed(hasher.update, value)
+    except RecursionError:
+        # Self-referencing structures: hash their pickle instead.
+        hasher = _new_hasher(algorithm)
+        _feed_bytes(hasher.update, b"P", _dumps(value))
+    return hasher.hexdigest()
+
+
+def content_address(value: object, *, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+    """Return a hex content address for value.
+
+    algorithm is "sha256" (default) or "blake2b", which is faster on most
+    64-bit CPUs without SHA extensions. Pass it through a key function, e.g.
+    ``make_memo_rewriter(E, key_fn=partial(content_address, algorithm="blake2b"))``.
+    """
+    if not _is_immutable(value):
+        return _compute_address(value, algorithm)
+    cache_key = (id(value), algorithm)
+    cached = _address_cache.get(cache_key)
+    if cached is not None and cached[0]() is value:
+        return cached[1]
+    address = _compute_address(value, algorithm)
+    try:
+        ref = weakref.ref(value, lambda _ref: _address_cache.pop(cache_key, None))
+    except TypeError:
+        return address
+    _address_cache[cache_key] = (ref, address)
+    return address
+
+
+def storage_key(key: object) -> str:
+    """Storage key for a memo/cache key: strings as-is, anything else hashed."""
+    if isinstance(key, str):
+        return key
+    return f"{DEFAULT_HASH_ALGORITHM}:{content_address(key)}"
+
+
+__all__ = [
+    "DEFAULT_HASH_ALGORITHM",
+    "HASH_ALGORITHMS",
+    "content_address",
+    "storage_key",
+]
@@ -5,6 +5,7 @@ The recompute_cost field drives routing: cheap→ephemeral storage, expensive→
 """
 
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Any
 
 from doeff_vm import EffectBase
@@ -18,11 +19,17 @@ from doeff_core_effects.memo_policy import (
 
 
 class MemoGetEffect(EffectBase):
-    """Requests the memoized value for the key."""
+    """Requests the memoized value for the key.
+
+    ttl is set by the memo layer that serves the value: the seconds it had
+    left there (None = no expiry), so inner layers writing it through keep
+    the same expiry.
+    """
     def __init__(self, key, recompute_cost=RecomputeCost.CHEAP):
         super().__init__()
         self.key = key
         self.recompute_cost = recompute_cost
+        self.ttl = None
 
     def __repr__(self):
         return f"MemoGet({self.key!r}, cost={self.recompute_cost.value})"
@@ -65,6 +72,82 @@ class MemoExistsEffect(EffectBase):
         return f"MemoExists({self.key!r}, cost={self.recompute_cost.value})"
 
 
+class MemoLookupEffect(EffectBase):
+    """Looks up the key in one round trip; resumes with MemoHit or MEMO_MISS.
+
+    promote: when the value is found in an outer layer, write it into every
+    inner layer the lookup passed through (same write-through as MemoGet).
+    """
+    def __init__(self, key, recompute_cost=RecomputeCost.CHEAP, promote=True):
+        super().__init__()
+        self.key = key
+        self.recompute_cost = recompute_cost
+        self.promote = promote
+
+    def __repr__(self):
+        return f"MemoLookup({self.key!r}, cost={self.recompute_cost.value})"
+
+
+class MemoAcquireLeaseEffect(EffectBase):
+    """Takes the advisory lease on a missed key before computing it.
+
+    Resumes True when the caller holds the lease (or no storage layer supports
+    leases), False after waiting out another holder — look the key up again.
+    """
+    def __init__(self, key, recompute_cost=RecomputeCost.CHEAP, ttl=None):
+        super().__init__()
+        self.key = key
+        self.recompute_cost = recompute_cost
+        self.ttl = ttl
+
+    def __repr__(self):
+        return f"MemoAcquireLease({self.key!r}, cost={self.recompute_cost.value})"
+
+
+class MemoReleaseLeaseEffect(EffectBase):
+    """Releases a lease taken with MemoAcquireLease without storing a value."""
+    def __init__(self, key, recompute_cost=RecomputeCost.CHEAP):
+        super().__init__()
+        self.key = key
+        self.recompute_cost = recompute_cost
+
+    def __repr__(self):
+        return f"MemoReleaseLease({self.key!r}, cost={self.recompute_cost.value})"
+
+
+@dataclass(frozen=True, slots=True)
+class MemoHit:
+    """Result of a MemoLookup that found the key.
+
+    layer is the label of the memo layer that held the value; ttl is the
+    seconds the value had left there (None = no expiry), which promotion
+    carries over to the inner layers.
+    """
+    value: Any
+    layer: str | None = None
+    ttl: float | None = None
+
+    hit = True
+
+
+class _MemoMiss:
+    """Type of MEMO_MISS, the result of a MemoLookup that found nothing."""
+    __slots__ = ()
+    hit = False
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "MEMO_MISS"
+
+    def __reduce__(self):
+        return "MEMO_MISS"
+
+
+MEMO_MISS = _MemoMiss()
+
+
 # Convenience constructors
 
 def MemoGet(key: Any, *, recompute_cost: RecomputeCost | str = RecomputeCost.CHEAP) -> MemoGetEffect:  # noqa: N802 - public or spec test name is intentionally stable
@@ -104,3 +187,31 @@ def MemoExists(key: Any, *, recompute_cost: RecomputeCost | str = RecomputeCost.
     if isinstance(recompute_cost, str):
         recompute_cost = RecomputeCost(recompute_cost)
     return MemoExistsEffect(key=key, recompute_cost=recompute_cost)
+
+
+def MemoLookup(  # noqa: N802 - public or spec test name is intentionally stable
+    key: Any,
+    *,
+    recompute_cost: RecomputeCost | str = RecomputeCost.CHEAP,
+    promote: bool = True,
+) -> MemoLookupEffect:
+    if isinstance(recompute_cost, str):
+        recompute_cost = RecomputeCost(recompute_cost)
+    return MemoLookupEffect(key=key, recompute_cost=recompute_cost, promote=promote)
+
+
+def MemoAcquireLease(  # noqa: N802 - public or spec test name is intentionally stable
+    key: Any,
+    *,
+    recompute_cost: RecomputeCost | str = RecomputeCost.CHEAP,
+    ttl: float | None = None,
+) -> MemoAcquireLeaseEffect:
+    if isinstance(recompute_cost, str):
+        recompute_cost = RecomputeCost(recompute_cost)
+    return MemoAcquireLeaseEffect(key=key, recompute_cost=recompute_cost, ttl=ttl)
+
+
+def MemoReleaseLease(key: Any, *, recompute_cost: RecomputeCost | str = RecomputeCost.CHEAP) -> MemoReleaseLeaseEffect:  # noqa: N802 - public or spec test name is intentionally stable
+    if isinstance(recompute_cost, str):
+        recompute_cost = RecomputeCost(recompute_cost)
+    return MemoReleaseLeaseEffect(key=key, recompute_cost=recompute_cost)
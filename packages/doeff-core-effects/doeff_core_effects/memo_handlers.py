@@ -6,28 +6,100 @@ Replaces the old cache_handlers module with cost-aware routing:
 """
 
 
-import dataclasses
-import hashlib
+import contextlib
 import json
-from collections.abc import Callable, Mapping, Set
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypeAlias
 
 from doeff import UnhandledEffect, do
 from doeff import handler as _program_handler
 from doeff.program import Pass, Resume
+from doeff_core_effects.keying import content_address
+from doeff_core_effects.keying import storage_key as _storage_key
 from doeff_core_effects.memo_effects import (
-    MemoExists,
-    MemoGet,
+    MEMO_MISS,
+    MemoAcquireLease,
+    MemoLookup,
     MemoPut,
     MemoPutEffect,
+    MemoReleaseLease,
 )
 from doeff_core_effects.memo_policy import RecomputeCost
-from doeff_core_effects.storage import DurableStorage, InMemoryStorage, SQLiteStorage
+from doeff_core_effects.scheduler import (
+    ClaimAbandonedError,
+    ClaimPromise,
+    CompletePromise,
+    FailPromise,
+    Wait,
+)
+from doeff_core_effects.storage import BoundedMemoryStorage, DurableStorage, SQLiteStorage
 
 MemoKeyFn: TypeAlias = Callable[[object], str]
 
 
+@dataclass(frozen=True)
+class MemoLayer:
+    """One storage layer of a tiered_memo_handler.
+
+    storage, cost and name mean what they do for memo_handler.
+    """
+
+    storage: Any
+    cost: RecomputeCost | str | None = None
+    name: str | None = None
+
+
+class TieredMemoStats:
+    """Per-cost-tier lookup counters of a tiered_memo_handler.
+
+    Counts MemoGet / MemoLookup outcomes: a hit is credited to the layer
+    that answered, a miss means no layer of the tier held the key.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: dict[RecomputeCost, dict[str, int]] = {}
+        self._misses: dict[RecomputeCost, int] = {}
+
+    def record(self, cost: RecomputeCost, label: str | None) -> None:
+        with self._lock:
+            if label is None:
+                self._misses[cost] = self._misses.get(cost, 0) + 1
+            else:
+                hits = self._hits.setdefault(cost, {})
+                hits[label] = hits.get(label, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return {tier: {"lookups", "hits", "misses", "hit_ratio", "layers"}}.
+
+        layers maps each answering layer's name to its hit count.
+        """
+        with self._lock:
+            result = {}
+            for cost in RecomputeCost:
+                layers = dict(self._hits.get(cost, {}))
+                hits = sum(layers.values())
+                misses = self._misses.get(cost, 0)
+                lookups = hits + misses
+                if not lookups:
+                    continue
+                result[cost.value] = {
+                    "lookups": lookups,
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": hits / lookups,
+                    "layers": layers,
+                }
+            return result
+
+    def hit_ratios(self) -> dict[str, float]:
+        """Return the hit ratio of every tier that has seen a lookup."""
+        return {tier: counts["hit_ratio"] for tier, counts in self.snapshot().items()}
+
+
 def json_gzip_serialize(value: Any) -> bytes:
     """Serialize value to gzip JSON. Returns bytes (pure, not effectful)."""
     import gzip
@@ -49,72 +121,6 @@ def json_gzip_deserialize(data: bytes) -> Any:
     return json.loads(gzip.decompress(data))["response"]
 
 
-def _dumps(value: object) -> bytes:
-    try:
-        import cloudpickle as serializer
-    except ModuleNotFoundError:
-        import pickle as serializer
-
-    return serializer.dumps(value)
-
-
-def _normalize_for_hash(value: object) -> object:  # noqa: PLR0911 - baseline cleanup keeps existing control flow unchanged
-    if dataclasses.is_dataclass(value) and not isinstance(value, type):
-        return {
-            "__type__": f"{type(value).__module__}.{type(value).__qualname__}",
-            **{
-                field.name: _normalize_for_hash(getattr(value, field.name))
-                for field in dataclasses.fields(value)
-            },
-        }
-    if isinstance(value, Mapping):
-        return {
-            str(key): _normalize_for_hash(item)
-            for key, item in sorted(value.items(), key=lambda item: str(item[0]))
-        }
-    if isinstance(value, tuple):
-        return {"__tuple__": [_normalize_for_hash(item) for item in value]}
-    if isinstance(value, list):
-        return [_normalize_for_hash(item) for item in value]
-    if isinstance(value, Set) and not isinstance(value, (str, bytes, bytearray)):
-        normalized = [_normalize_for_hash(item) for item in value]
-        return {
-            "__set__": sorted(normalized, key=lambda item: json.dumps(item, sort_keys=True))
-        }
-    if isinstance(value, Path):
-        return {"__path__": str(value)}
-    if isinstance(value, bytes):
-        return {"__bytes__": value.hex()}
-    if isinstance(value, type):
-        return f"{value.__module__}.{value.__qualname__}"
-    if hasattr(value, "__dict__") and not isinstance(value, type):
-        return {
-            "__type__": f"{type(value).__module__}.{type(value).__qualname__}",
-            **{
-                k: _normalize_for_hash(v)
-                for k, v in sorted(value.__dict__.items())
-            },
-        }
-    return value
-
-
-def _storage_key(key: object) -> str:
-    if isinstance(key, str):
-        return key
-    return f"sha256:{content_address(key)}"
-
-
-def content_address(effect: object) -> str:
-    """Return a SHA-256 content address for an effect payload."""
-    try:
-        payload = _dumps(effect)
-    except Exception:
-        payload = json.dumps(_normalize_for_hash(effect), sort_keys=True, default=repr).encode(
-            "utf-8"
-        )
-    return hashlib.sha256(payload).hexdigest()
-
-
 def _matches_cost(effect_cost: RecomputeCost, handler_cost: RecomputeCost | None) -> bool:
     """Check if an effect's cost matches the handler's cost filter."""
     if handler_cost is None:
@@ -131,6 +137,101 @@ def _effect_cost(effect) -> RecomputeCost:
     return effect.recompute_cost
 
 
+@do
+def _release_memo_lease(key, recompute_cost):
+    with contextlib.suppress(UnhandledEffect):
+        yield MemoReleaseLease(key, recompute_cost=recompute_cost)
+
+
+@do
+def _release_held_lease(key, recompute_cost, lease):
+    """Release the lease only if this requester acquired and still holds it."""
+    if lease["held"]:
+        lease["held"] = False
+        yield _release_memo_lease(key, recompute_cost)
+
+
+@do
+def _leased_compute(key, recompute_cost, compute, persist, lease):
+    """Compute a missed key while holding its storage lease.
+
+    Re-checks the memo after every acquire: a holder that finished between
+    our miss and the acquire has already stored the value. ``lease["held"]``
+    is True exactly while this requester holds the lease.
+    """
+    while True:
+        try:
+            acquired = yield MemoAcquireLease(key, recompute_cost=recompute_cost)
+        except UnhandledEffect:
+            acquired = True
+        try:
+            found = yield MemoLookup(key, recompute_cost=recompute_cost, promote=False)
+        except UnhandledEffect:
+            found = MEMO_MISS
+        if found is not MEMO_MISS:
+            if acquired:
+                yield _release_memo_lease(key, recompute_cost)
+            return found.value
+        if acquired:
+            break
+
+    lease["held"] = True
+    try:
+        value = yield compute()
+        # Storing the value also clears the lease in lease-capable storage.
+        yield persist(value)
+    except Exception:
+        yield _release_held_lease(key, recompute_cost, lease)
+        raise
+    lease["held"] = False
+    return value
+
+
+@do
+def _memo_single_flight(key, recompute_cost, compute, persist):
+    """Compute a missed memo key once for all concurrent requesters.
+
+    Within one scheduled() run, the first miss claims a scheduler promise
+    for the key and computes; later misses Wait on that promise and receive
+    the same value (or error). Across threads and processes, the computing
+    task also holds the storage lease (MemoAcquireLease) until the value is
+    stored. ``compute()`` returns the Program producing the value and
+    ``persist(value)`` the Program storing it.
+
+    If the computing task is cancelled, the scheduler fails its claim with
+    ClaimAbandonedError and runs the claim's on_abandon program, which
+    releases the lease if the task had acquired it (a task still waiting on
+    another holder's lease leaves that lease alone); a waiter then claims
+    the key and computes it itself.
+    """
+    flight_key = ("memo", recompute_cost, _storage_key(key))
+    lease = {"held": False}
+    while True:
+        try:
+            claim, owner = yield ClaimPromise(
+                flight_key, on_abandon=_release_held_lease(key, recompute_cost, lease)
+            )
+        except UnhandledEffect:
+            claim, owner = None, True
+        if owner:
+            break
+        try:
+            value = yield Wait(claim)
+        except ClaimAbandonedError:
+            continue
+        return value
+
+    try:
+        value = yield _leased_compute(key, recompute_cost, compute, persist, lease)
+    except Exception as exc:
+        if claim is not None:
+            yield FailPromise(claim, exc)
+        raise
+    if claim is not None:
+        yield CompletePromise(claim, value)
+    return value
+
+
 def memo_handler(
     storage: DurableStorage,
     *,
@@ -151,6 +252,10 @@ def memo_handler(
     Each handler is a caching proxy. Position determines terminal behavior:
     the outermost handler's miss re-perform is unhandled → memo_rewriter treats as miss.
 
+    Storage reporting synchronous reads/writes (see DurableStorage) is accessed
+    inline and resumed with Pure, so an in-memory L1 hit never touches the
+    await bridge.
+
     Args:
         storage: The storage backend for this handler.
         cost: Only handle effects matching this cost tier. None = handle all.
@@ -164,14 +269,59 @@ def memo_handler(
     return _hy_memo_handler(storage, cost=cost, name=name)
 
 
-def in_memory_memo_handler():
-    """Return a memo handler backed by in-memory storage (handles all costs)."""
-    return memo_handler(InMemoryStorage())
+def tiered_memo_handler(layers: Sequence[MemoLayer | DurableStorage]):
+    """Handle memo effects for several storage layers in one handler.
 
+    Equivalent to stacking one memo_handler per layer with layers[0]
+    innermost, but each effect is routed through a table from cost tier to
+    the layers matching it, so a CHEAP effect never enters the EXPENSIVE
+    layers and lookup, promotion and broadcast put happen in one frame:
 
-def sqlite_memo_handler(db_path: str | Path):
-    """Return a memo handler backed by SQLite storage (handles all costs)."""
-    return memo_handler(SQLiteStorage(db_path))
+        tiered_memo_handler([
+            MemoLayer(memory, name="L1"),
+            MemoLayer(redis, cost=CHEAP, name="redis"),
+            MemoLayer(minio, cost=EXPENSIVE, name="minio"),
+        ])(program)
+
+    The returned handler's ``stats`` attribute is a TieredMemoStats with
+    per-tier hit ratios.
+    """
+    from doeff_core_effects._memo_handlers_impl import (
+        tiered_memo_handler as _hy_tiered_memo_handler,
+    )
+
+    return _hy_tiered_memo_handler(list(layers))
+
+
+def in_memory_memo_handler(
+    *,
+    max_entries: int | None = None,
+    max_bytes: int | None = None,
+):
+    """Return a memo handler backed by in-memory storage (handles all costs).
+
+    Entries expire per MemoPolicy.ttl. Pass max_entries / max_bytes to bound
+    the storage for long-running processes; least recently used entries are
+    evicted first.
+    """
+    return memo_handler(BoundedMemoryStorage(max_entries=max_entries, max_bytes=max_bytes))
+
+
+def sqlite_memo_handler(
+    db_path: str | Path,
+    *,
+    sync_reads: bool = False,
+    write_behind: bool = False,
+):
+    """Return a memo handler backed by SQLite storage (handles all costs).
+
+    sync_reads=True serves MemoGet/MemoExists lookups on the calling thread.
+    write_behind=True buffers MemoPut writes and commits them in batches; the
+    handler flushes the buffer when its program exits (see SQLiteStorage).
+    """
+    return memo_handler(
+        SQLiteStorage(db_path, sync_reads=sync_reads, write_behind=write_behind)
+    )
 
 
 
@@ -184,6 +334,8 @@ def make_memo_rewriter(
 
     On memo hit: Resume with stored value (outer handler not called).
     On memo miss: re-perform effect -> outer handler handles it -> store result.
+    Concurrent misses on one key are single-flighted: the effect is delegated
+    once and every requester resumes with its result.
 
     Serialization is NOT handled here — use a separate pydantic_serialize_handler
     in the handler stack for that.
@@ -208,41 +360,38 @@ def make_memo_rewriter(
         key = key_fn(effect)
         yield Slog(f"[memo] checking {effect_type.__name__} key={key[:16]}...")
 
-        miss_sentinel = object()
-        cached = miss_sentinel
         # Memo storage absent or reports miss -> fall through to compute. The
         # yield effect compute path below is intentionally NOT wrapped: an
         # UnhandledEffect there is a real bug (no handler can produce the
         # value) and must propagate fail-fast.
         try:
-            if (yield MemoExists(key, recompute_cost=recompute_cost)):
-                try:
-                    cached = yield MemoGet(key, recompute_cost=recompute_cost)
-                except KeyError:
-                    cached = miss_sentinel
+            found = yield MemoLookup(key, recompute_cost=recompute_cost)
         except UnhandledEffect:
-            cached = miss_sentinel
+            found = MEMO_MISS
 
-        if cached is not miss_sentinel:
+        if found is not MEMO_MISS:
             yield Slog(f"[memo] HIT {effect_type.__name__} key={key[:16]}...")
-            result = yield Resume(k, cached)
+            result = yield Resume(k, found.value)
             return result
 
         yield Slog(f"[memo] MISS {effect_type.__name__} key={key[:16]}... -> delegating")
-        delegated = yield effect
 
-        try:
-            yield MemoPut(
-                key,
-                delegated,
-                policy=MemoPolicy(recompute_cost=recompute_cost),
-                source_effect=effect,
-            )
-        except UnhandledEffect:
-            pass
-        else:
+        @do
+        def persist(value):
+            try:
+                yield MemoPut(
+                    key,
+                    value,
+                    policy=MemoPolicy(recompute_cost=recompute_cost),
+                    source_effect=effect,
+                )
+            except UnhandledEffect:
+                return
             yield Slog(f"[memo] STORED {effect_type.__name__} key={key[:16]}...")
 
+        # Concurrent misses on the same key share one delegated computation.
+        delegated = yield _memo_single_flight(key, recompute_cost, lambda: effect, persist)
+
         result = yield Resume(k, delegated)
         return result
 
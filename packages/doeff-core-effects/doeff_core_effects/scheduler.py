@@ -21,7 +21,9 @@ Usage:
     run(scheduled(main()))
 """
 
+import collections
 import logging
+import sys
 import warnings
 import weakref
 
@@ -52,6 +54,72 @@ HANDLE_SWEEP_INTERVAL = 1024
 # `.future` repeatedly must not accumulate dead refs until terminality.
 HANDLE_REFS_PRUNE_MIN = 8
 
+# Ready-heap tombstones (entries whose owner task was cancelled) are deleted
+# lazily on pop. Once they make up more than half of a heap at least this
+# large, the heap is compacted in one pass so cancelled fan-outs do not keep
+# the heap (and every pop's log factor) inflated.
+READY_COMPACT_MIN = 64
+
+# Ready-entry kinds that represent runnable work owned by a task (entry[1] is
+# the owner tid; None is the root). "wait_external" placeholders are not work.
+_WORK_ENTRY_KINDS = frozenset(("new", "resume", "raise", "sem_resume"))
+
+
+class _TaskRecord:
+    """Per-task scheduler state; slotted to keep million-task runs compact.
+
+    ``program``, ``inner_boundaries`` and ``spawn_site`` are cleared once the
+    task starts or terminates (only status/result stay observable).
+    ``parked_on`` is the external-promise key of the task's last
+    ``Wait``; it is only meaningful while that promise is pending.
+    """
+
+    __slots__ = (
+        "daemon", "inner_boundaries", "parked_on", "priority", "program",
+        "result", "spawn_site", "status",
+    )
+
+    def __init__(self, program, priority, inner_boundaries, daemon):
+        self.status = "pending"
+        self.result = None
+        self.program = program
+        self.priority = priority
+        self.daemon = daemon
+        self.inner_boundaries = inner_boundaries
+        self.spawn_site = None
+        self.parked_on = None
+
+
+class _PromiseRecord:
+    """Per-promise scheduler state (slotted, see _TaskRecord)."""
+
+    __slots__ = ("cancel_hooks", "external", "result", "status")
+
+    def __init__(self, external=False):
+        self.status = "pending"
+        self.result = None
+        self.external = external
+        self.cancel_hooks = None
+
+
+class _HandleRef(weakref.ref):
+    """Weakref to a scheduler handle that remembers its waitable key (#502).
+
+    The death callback only appends the ref to a deque — it never touches
+    the scheduler's dicts — so it is safe from any GC point or thread. The
+    sweep consumes the deque inside the scheduler's own dispatch path.
+    """
+
+    __slots__ = ("key",)
+
+    def __new__(cls, handle, callback, key):
+        self = super().__new__(cls, handle, callback)
+        self.key = key
+        return self
+
+    def __init__(self, handle, callback, key):
+        super().__init__(handle, callback)
+
 
 def _reinstall_boundary(prog, kind, boundary_callable):
     """Re-wrap prog with one boundary captured at the spawn site."""
@@ -171,6 +239,18 @@ class TaskCancelledError(Exception):
     """Raised when waiting on a cancelled task."""
 
 
+class ClaimAbandonedError(TaskCancelledError):
+    """Raised in ClaimPromise waiters when the owning task ended unresolved.
+
+    The owner was cancelled (or finished) without completing or failing its
+    claim. The key is free again, so a waiter may claim it and take over.
+    """
+
+    def __init__(self, key):
+        super().__init__(f"ClaimPromise owner abandoned key {key!r}")
+        self.key = key
+
+
 class SchedulerDeadlockError(RuntimeError):
     """Raised when the scheduler has parked work that cannot make progress."""
 
@@ -212,6 +292,27 @@ class CreatePromise(EffectBase):
         super().__init__()
 
 
+class ClaimPromise(EffectBase):
+    """Single-flight claim on a keyed promise within this scheduler run.
+
+    Resumes with ``(promise, True)`` for the first claimant of ``key``: a
+    fresh Promise the caller owns and must complete or fail. While that
+    promise is pending, later claims of the same key resume with
+    ``(future, False)``: a Future to Wait on for the owner's result. Once the
+    promise is resolved the key is free and the next claim owns a new one.
+
+    If the owning task is cancelled, or ends, with the promise still pending,
+    the promise fails with ClaimAbandonedError and the key is freed. The
+    owner's ``on_abandon`` program, if given, then runs as a new task under
+    the handlers the owner had at claim time, e.g. to release a lock.
+    """
+
+    def __init__(self, key, on_abandon=None):
+        super().__init__()
+        self.key = key
+        self.on_abandon = on_abandon
+
+
 class CompletePromise(EffectBase):
     def __init__(self, promise, value):
         super().__init__()
@@ -219,6 +320,15 @@ class CompletePromise(EffectBase):
         self.value = value
 
 
+class CompletePromises(EffectBase):
+    """Complete several promises with the same value in one scheduler step."""
+
+    def __init__(self, promises, value=None):
+        super().__init__()
+        self.promises = tuple(promises)
+        self.value = value
+
+
 class FailPromise(EffectBase):
     def __init__(self, promise, error):
         super().__init__()
@@ -253,7 +363,9 @@ class _SchedulerIntrospection(EffectBase):
     """Test-only hook: resume with the sizes of the scheduler state dicts.
 
     Not public API — exists so the #502 sweep can be asserted on without
-    exposing the closure state.
+    exposing the closure state. ``state_bytes`` is the shallow memory
+    footprint of the scheduler bookkeeping (used by the bytes-per-task
+    benchmark).
     """
 
     def __init__(self):
@@ -318,10 +430,11 @@ class ExternalPromise:
     shield, #505). Minting ``.future`` must happen on the scheduler thread:
     handle registration (#502) is scheduler-thread-confined.
     """
-    def __init__(self, promise_id, queue, _register=None):
+    def __init__(self, promise_id, queue, _register=None, _add_cancel_hook=None):
         self.promise_id = promise_id
         self._queue = queue
         self._register = _register
+        self._add_cancel_hook = _add_cancel_hook
 
     @property
     def future(self):
@@ -338,6 +451,15 @@ class ExternalPromise:
         """Fail the promise with an error. Thread-safe, wakes scheduler via Queue."""
         self._queue.put(("fail", self.promise_id, error))
 
+    def on_cancel(self, hook):
+        """Call ``hook()`` if every task parked in ``Wait`` on this promise is
+        cancelled while it is still pending — e.g. to cancel the foreign work
+        that would complete it. Scheduler-thread-confined like ``.future``;
+        the hook runs on the scheduler thread and must not block.
+        """
+        if self._add_cancel_hook is not None:
+            self._add_cancel_hook(self.promise_id, hook)
+
     def __repr__(self):
         return f"ExternalPromise({self.promise_id})"
 
@@ -354,14 +476,29 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
     # --- State ---
     next_id = [0]
     insertion_seq = [0]  # tie-breaker for priority queue (FIFO within same priority)
-    tasks = {}           # tid → {status, result, program, priority}
-    promises = {}        # pid → {status, result}
+    tasks = {}           # tid → _TaskRecord
+    promises = {}        # pid → _PromiseRecord
     semaphores = {}      # sid → {permits, max_permits, waiters: deque of (owner_tid, k)}
     waiters = {}         # waitable_key → [(type, owner_tid, k/state, ...)]
     ready = []           # heapq: (-priority, seq, entry)
     external_queue = queue_mod.Queue()  # thread-safe, blocking get()
-    handle_refs = {}     # waitable_key → [weakref.ref(Task/Promise/Future/…)]
+    handle_refs = {}     # waitable_key → [_HandleRef(Task/Promise/Future/…)]
     handle_prune_at = {}  # waitable_key → refs length that triggers a dead-ref prune
+    # Ready-heap bookkeeping, maintained on every push/pop so liveness
+    # questions about the heap are O(1) instead of scans.
+    ready_live = [0, 0]  # live work entries in `ready`: [non-daemon, daemon]
+    ready_dead = [0]     # tombstones: work entries whose owner was cancelled
+    ready_by_owner = {}  # owner tid → work entries in `ready` (for Cancel)
+    # Sweep index (#502): keys whose sweepability may have changed since the
+    # last sweep — terminal transitions, released Gather/Race protection, and
+    # keys whose handles died (delivered through dead_handle_refs).
+    sweep_candidates = set()
+    dead_handle_refs = collections.deque()
+    protected_keys = {}  # waitable_key → live Gather/Race states reading it
+    claims = {}          # ClaimPromise key → pid of its pending promise
+    claim_keys = {}      # pid → ClaimPromise key (reverse index of `claims`)
+    claim_owner = {}     # pid → (owner tid, on_abandon cleanup or None)
+    claim_owners = {}    # owner tid → set of its pending claim pids
 
     def register_handle(key, handle):
         """Track handle liveness for the terminal-entry sweep (#502).
@@ -381,9 +518,73 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         if len(refs) >= handle_prune_at.get(key, HANDLE_REFS_PRUNE_MIN):
             refs[:] = [ref for ref in refs if ref() is not None]
             handle_prune_at[key] = max(HANDLE_REFS_PRUNE_MIN, 2 * len(refs))
-        refs.append(weakref.ref(handle))
+        refs.append(_HandleRef(handle, dead_handle_refs.append, key))
         return handle
 
+    def mark_terminal(key):
+        """Record a completed/failed transition for the sweep index.
+
+        A resolved promise also releases its ClaimPromise key, if any.
+        """
+        sweep_candidates.add(key)
+        if claim_keys and key[0] == "promise" and key[1] in claim_keys:
+            release_claim(key[1])
+
+    def release_claim(pid):
+        """Free a resolved promise's ClaimPromise key and owner entry."""
+        del claims[claim_keys.pop(pid)]
+        owner = claim_owner.pop(pid, None)
+        if owner is None:
+            return
+        owned = claim_owners.get(owner[0])
+        if owned is not None:
+            owned.discard(pid)
+            if not owned:
+                del claim_owners[owner[0]]
+
+    def abandon_claims(tid):
+        """Fail the claims a cancelled or finished task left pending.
+
+        Waiters wake with ClaimAbandonedError instead of parking forever, and
+        each claim's on_abandon program is spawned to clean up after it.
+        """
+        for pid in list(claim_owners.pop(tid, ())):
+            key = claim_keys[pid]
+            cleanup = claim_owner[pid][1]
+            promise = promises[pid]
+            promise.status = "failed"
+            promise.result = ClaimAbandonedError(key)
+            mark_terminal(("promise", pid))
+            wake_waiters(("promise", pid))
+            if cleanup is not None:
+                program, inner_boundaries = cleanup
+                priority = task_priority(tid)
+                cleanup_tid = alloc_task(program, priority,
+                                         inner_boundaries=inner_boundaries)
+                enqueue(("new", cleanup_tid), priority)
+
+    def protect_keys(keys):
+        """Pin keys a Gather/Race will re-read at resolution against the sweep."""
+        for key in keys:
+            protected_keys[key] = protected_keys.get(key, 0) + 1
+
+    def release_waiter_entry(state):
+        """One of a Gather/Race state's waiter entries left `waiters`.
+
+        When the last one leaves, nothing re-reads the state's keys anymore:
+        drop their protection and let the next sweep reconsider them.
+        """
+        state["entries"] -= 1
+        if state["entries"]:
+            return
+        for key in state["protected"]:
+            remaining = protected_keys[key] - 1
+            if remaining:
+                protected_keys[key] = remaining
+            else:
+                del protected_keys[key]
+                sweep_candidates.add(key)
+
     def sweep_terminal_unobserved_entries():
         """Delete task/promise entries nothing can ever observe again (#502).
 
@@ -394,38 +595,56 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         its TaskCompleted and a cancelled parked waiter is still woken through
         task_priority — both re-read tasks[tid]. Semaphores are never swept:
         "no permits outstanding" is not trackable from handle liveness.
+
+        Only candidate keys are examined: every event that can make an entry
+        sweepable (terminal transition, last handle death, Gather/Race
+        protection release) files its key, and a key that is still blocked
+        is re-filed by the event that unblocks it. The sweep therefore costs
+        O(events since the last sweep), not O(entries).
         """
-        protected = set()
-        for entries in waiters.values():
-            for entry in entries:
-                if entry[0] == "gather":
-                    # Gather re-reads waitable_status for EVERY key (including
-                    # already-terminal ones) at final resolution.
-                    protected.update(entry[2]["keys"])
-                elif entry[0] == "race":
-                    protected.update(entry[2]["pending_keys"])
-        for kind, store in (("task", tasks), ("promise", promises)):
-            dead = []
-            for wid, meta in store.items():
-                if meta["status"] not in ("completed", "failed"):
-                    continue
-                key = (kind, wid)
-                if key in waiters or key in protected:
-                    continue
-                refs = handle_refs.get(key)
-                if refs is None:
-                    continue
-                # register_handle prunes dead refs amortized; here the whole
-                # list is dropped once every handle is dead, at which point
-                # no new registration for this key can happen (a Future is
-                # only minted from a live parent handle).
-                if any(ref() is not None for ref in refs):
-                    continue
-                dead.append(wid)
-            for wid in dead:
-                del store[wid]
-                del handle_refs[(kind, wid)]
-                handle_prune_at.pop((kind, wid), None)
+        while dead_handle_refs:
+            sweep_candidates.add(dead_handle_refs.popleft().key)
+        candidates = list(sweep_candidates)
+        sweep_candidates.clear()
+        for key in candidates:
+            kind, wid = key
+            store = tasks if kind == "task" else promises
+            meta = store.get(wid)
+            if meta is None or meta.status not in ("completed", "failed"):
+                continue
+            if key in waiters or key in protected_keys:
+                continue
+            refs = handle_refs.get(key)
+            if refs is None:
+                continue
+            # register_handle prunes dead refs amortized; here the whole
+            # list is dropped once every handle is dead, at which point
+            # no new registration for this key can happen (a Future is
+            # only minted from a live parent handle).
+            if any(ref() is not None for ref in refs):
+                continue
+            del store[wid]
+            del handle_refs[key]
+            handle_prune_at.pop(key, None)
+
+    def state_bytes():
+        """Shallow byte footprint of the scheduler's own bookkeeping.
+
+        Counts the containers and the records/tuples/refs they hold — not
+        the user programs, continuations, or results they point to — so it
+        measures per-task overhead of the scheduler itself.
+        """
+        size = sys.getsizeof
+        total = size(tasks) + size(promises) + size(ready) + size(waiters)
+        total += size(handle_refs) + size(handle_prune_at) + size(ready_by_owner)
+        total += sum(size(record) for record in tasks.values())
+        total += sum(size(record) for record in promises.values())
+        total += sum(size(item) + size(item[2]) for item in ready)
+        for key, entries in waiters.items():
+            total += size(key) + size(entries) + sum(size(entry) for entry in entries)
+        for key, refs in handle_refs.items():
+            total += size(key) + size(refs) + sum(size(ref) for ref in refs)
+        return total
 
     def fresh_id():
         i = next_id[0]
@@ -458,13 +677,78 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                 "handle and no registered waiter (#502). Keep a handle alive "
                 "to Wait/Gather/Race on it later."
             )
-        return entry["status"], entry.get("result")
+        return entry.status, entry.result
 
     def enqueue(entry, priority=PRIORITY_NORMAL):
         """Add entry to priority queue. Higher priority = served first."""
         seq = insertion_seq[0]
         insertion_seq[0] += 1
-        heapq.heappush(ready, (-priority, seq, entry))
+        push_ready((-priority, seq, entry))
+
+    def count_ready_entry(entry, delta):
+        """Apply one work entry entering (+1) or leaving (-1) the heap."""
+        if entry[0] not in _WORK_ENTRY_KINDS:
+            return
+        owner_tid = entry[1]
+        if owner_tid is not None:
+            owned = ready_by_owner.get(owner_tid, 0) + delta
+            if owned:
+                ready_by_owner[owner_tid] = owned
+            else:
+                del ready_by_owner[owner_tid]
+        if is_owner_cancelled(owner_tid):
+            ready_dead[0] += delta
+        else:
+            ready_live[1 if is_daemon(owner_tid) else 0] += delta
+
+    def push_ready(heap_item):
+        heapq.heappush(ready, heap_item)
+        count_ready_entry(heap_item[2], 1)
+
+    def pop_ready():
+        heap_item = heapq.heappop(ready)
+        count_ready_entry(heap_item[2], -1)
+        return heap_item
+
+    def retire_ready_entries_of(tid):
+        """Turn a just-cancelled task's queued work into tombstones.
+
+        Must run right after the status flips to "cancelled": the entries
+        were counted live, and pops from here on classify them as dead.
+        Compacts the heap once tombstones dominate it.
+        """
+        owned = ready_by_owner.get(tid, 0)
+        if owned:
+            ready_live[1 if is_daemon(tid) else 0] -= owned
+            ready_dead[0] += owned
+        if ready_dead[0] >= READY_COMPACT_MIN and 2 * ready_dead[0] > len(ready):
+            compact_ready()
+
+    def compact_ready():
+        """Drop tombstones from the heap in one pass (lazy deletion).
+
+        "sem_resume" tombstones are kept: popping one returns the permit it
+        carries (#496), which must happen at its heap position. Claimed or
+        cancelled-owner "wait_external" placeholders are dropped too — a pop
+        would discard them anyway.
+        """
+        kept = []
+        for heap_item in ready:
+            entry = heap_item[2]
+            kind = entry[0]
+            if kind == "sem_resume":
+                kept.append(heap_item)
+            elif kind == "wait_external":
+                if not entry[4][0] and not is_owner_cancelled(entry[1]):
+                    kept.append(heap_item)
+            elif not is_owner_cancelled(entry[1]):
+                kept.append(heap_item)
+        ready[:] = kept
+        heapq.heapify(ready)
+        ready_live[0] = ready_live[1] = ready_dead[0] = 0
+        ready_by_owner.clear()
+        for heap_item in ready:
+            count_ready_entry(heap_item[2], 1)
 
     def has_live_ready_entry(include_daemons):
         """True when the ready heap holds an entry that can still run.
@@ -472,47 +756,31 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         ``include_daemons=False`` asks the narrower question the
         external-wait shield needs: is there real (non-daemon) work below
         the shield? Placeholders are never "work"; cancelled owners are
-        dead entries.
+        dead entries. O(1): answered from the push/pop counters.
         """
-        for _neg_prio, _seq, entry in ready:
-            kind = entry[0]
-            if kind == "new":
-                tid = entry[1]
-                if tasks[tid]["status"] == "cancelled":
-                    continue
-                if include_daemons or not is_daemon(tid):
-                    return True
-            elif kind in ("resume", "raise", "sem_resume"):
-                owner_tid = entry[1]
-                if is_owner_cancelled(owner_tid):
-                    continue
-                if include_daemons or not is_daemon(owner_tid):
-                    return True
-        return False
+        if ready_live[0]:
+            return True
+        return include_daemons and ready_live[1] > 0
 
     def is_live_daemon_entry(entry):
         """True for a runnable entry owned by a live daemon task."""
-        kind = entry[0]
-        if kind == "new":
-            tid = entry[1]
-            return tasks[tid]["status"] != "cancelled" and is_daemon(tid)
-        if kind in ("resume", "raise", "sem_resume"):
-            owner_tid = entry[1]
-            return not is_owner_cancelled(owner_tid) and is_daemon(owner_tid)
-        return False
+        if entry[0] not in _WORK_ENTRY_KINDS:
+            return False
+        owner_tid = entry[1]
+        return not is_owner_cancelled(owner_tid) and is_daemon(owner_tid)
 
     def is_owner_cancelled(owner_tid):
-        return (
-            owner_tid is not None
-            and tasks.get(owner_tid, {}).get("status") == "cancelled"
-        )
+        if owner_tid is None:
+            return False
+        task = tasks.get(owner_tid)
+        return task is not None and task.status == "cancelled"
 
     def is_daemon(owner_tid):
         """True when the owner was spawned with daemon=True (root is not)."""
-        return (
-            owner_tid is not None
-            and tasks.get(owner_tid, {}).get("daemon", False)
-        )
+        if owner_tid is None:
+            return False
+        task = tasks.get(owner_tid)
+        return task is not None and task.daemon
 
     def task_priority(owner_tid):
         """Stored spawn priority of the owner task; the root (None) is NORMAL.
@@ -523,7 +791,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         """
         if owner_tid is None:
             return PRIORITY_NORMAL
-        return tasks[owner_tid]["priority"]
+        return tasks[owner_tid].priority
 
     def enqueue_resume(owner_tid, cont, value, priority=None):
         """Queue a resume; returns the effective priority used (#493)."""
@@ -542,17 +810,12 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
     def alloc_task(program, priority=PRIORITY_NORMAL, inner_boundaries=None,
                    daemon=False):
         tid = fresh_id()
-        tasks[tid] = {
-            "status": "pending", "result": None,
-            "program": program, "priority": priority,
-            "daemon": daemon,
-            "inner_boundaries": inner_boundaries or [],
-        }
+        tasks[tid] = _TaskRecord(program, priority, inner_boundaries or (), daemon)
         return tid
 
-    def alloc_promise():
+    def alloc_promise(external=False):
         pid = fresh_id()
-        promises[pid] = {"status": "pending", "result": None}
+        promises[pid] = _PromiseRecord(external)
         return pid
 
     def wrap_task(tid, prog):
@@ -567,7 +830,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     # GetExecutionContext returns the error-site context
                     # (captured by VM before unwinding), not the except-site.
                     ctx = yield _GetExecCtx()
-                    task_meta = tasks.get(tid, {})
+                    task_meta = tasks.get(tid)
                     _enrich_exception_traceback(e, task_meta, ctx)
                 except Exception:
                     pass
@@ -582,9 +845,11 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                 # BaseExceptions are deliberately not intercepted: close() of
                 # an abandoned task must stay a plain close, without waking
                 # anything.
-                if tasks[tid]["status"] not in terminal_statuses:
-                    tasks[tid]["status"] = "failed"
-                    tasks[tid]["result"] = e
+                task = tasks[tid]
+                if task.status not in terminal_statuses:
+                    task.status = "failed"
+                    task.result = e
+                    mark_terminal(("task", tid))
                     wake_waiters(("task", tid))
                 _release_task_refs(tid)
                 raise
@@ -613,9 +878,11 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     live_parked_waiter_summary() or "none",
                     live_semaphore_waiters() or "none",
                 )
-        if pid in promises and promises[pid]["status"] == "pending":
-            promises[pid]["status"] = "completed" if action == "complete" else "failed"
-            promises[pid]["result"] = value
+        promise = promises.get(pid)
+        if promise is not None and promise.status == "pending":
+            promise.status = "completed" if action == "complete" else "failed"
+            promise.result = value
+            mark_terminal(("promise", pid))
             wake_waiters(("promise", pid))
 
     def live_parked_waiter_summary(include_daemons=True):
@@ -647,11 +914,13 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         daemon work at root return is that flag's declared contract.
         """
         abandoned = []
+        if not ready_live[0]:
+            return abandoned
         for _neg_prio, _seq, entry in ready:
             kind = entry[0]
             if kind == "new":
                 tid = entry[1]
-                if tasks[tid]["status"] != "cancelled" and not is_daemon(tid):
+                if tasks[tid].status != "cancelled" and not is_daemon(tid):
                     abandoned.append(f"unstarted task {tid}")
             elif kind in ("resume", "raise"):
                 owner_tid = entry[1]
@@ -766,8 +1035,8 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             kind, wid = key
             if kind != "promise":
                 continue
-            promise = promises.get(wid, {})
-            if not promise.get("external") or promise.get("status") in terminal_statuses:
+            promise = promises.get(wid)
+            if promise is None or not promise.external or promise.status in terminal_statuses:
                 continue
             for entry in entries:
                 if len(entry) >= 2 and not is_owner_cancelled(entry[1]):
@@ -787,7 +1056,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             while True:
                 drain()
                 while ready:
-                    heap_item = heapq.heappop(ready)
+                    heap_item = pop_ready()
                     entry = heap_item[2]
                     if (
                         shield_deferred
@@ -802,14 +1071,17 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                         continue
                     if entry[0] == "new":
                         _, tid = entry
-                        if tasks[tid]["status"] == "cancelled":
+                        task = tasks[tid]
+                        if task.status == "cancelled":
                             continue  # skip cancelled tasks
-                        tasks[tid]["status"] = "running"
-                        prog = tasks[tid].pop("program")
+                        task.status = "running"
+                        prog = task.program
+                        boundaries = task.inner_boundaries
+                        task.program = task.inner_boundaries = None
                         # Re-wrap task with the boundary stack (handlers AND
                         # observers) captured at the spawn site, innermost first —
                         # preserves handler/observer nesting order.
-                        for kind, boundary_callable in tasks[tid].pop("inner_boundaries", []):
+                        for kind, boundary_callable in boundaries or ():
                             prog = _reinstall_boundary(prog, kind, boundary_callable)
                         return make_handler(tid)(wrap_task(tid, prog))
                     if entry[0] == "resume":
@@ -895,7 +1167,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             # Restore every held tuple with its original (priority, seq) so
             # the heap looks exactly as if the deferral never happened.
             for heap_item in held:
-                heapq.heappush(ready, heap_item)
+                push_ready(heap_item)
 
     terminal_statuses = ("completed", "failed", "cancelled")
 
@@ -909,9 +1181,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         t = tasks.get(tid)
         if t is None:
             return
-        t.pop("program", None)
-        t.pop("inner_boundaries", None)
-        t.pop("spawn_site", None)
+        t.program = t.inner_boundaries = t.spawn_site = None
 
     def resume_with_waitable_result(owner_tid, waiter_k, key, priority=None):
         """Add a ready entry that resumes waiter with the waitable's result.
@@ -942,7 +1212,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         """
         claimed = None
         kind, wid = wk
-        if kind == "promise" and promises[wid].get("external"):
+        if kind == "promise" and promises[wid].external:
             claimed = [False]
             enqueue(
                 ("wait_external", owner_tid, None, wk, claimed),
@@ -964,6 +1234,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                         # it cannot block the run on a completion nobody
                         # observes anymore.
                         entry[3][0] = True
+                    release_waiter_entry(gather_state)
                     continue
                 remaining_entries.append(entry)
             if remaining_entries:
@@ -1017,6 +1288,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                         # the losing external promise may never complete and
                         # must not keep blocking the drain loop.
                         entry[3][0] = True
+                    release_waiter_entry(race_state)
                     continue
                 remaining_entries.append(entry)
             if remaining_entries:
@@ -1075,11 +1347,13 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     # ready-heap placeholder now that the completion is in.
                     claimed[0] = True
                 queued_at = wake_gather_waiter(gather_state, completed_key)
+                release_waiter_entry(gather_state)
             elif w[0] == "race":
                 _, _owner_tid, race_state, claimed = w
                 if claimed is not None:
                     claimed[0] = True
                 queued_at = wake_race_waiter(race_state, completed_key)
+                release_waiter_entry(race_state)
             if queued_at is not None and (woken_min is None or queued_at < woken_min):
                 woken_min = queued_at
         return woken_min
@@ -1088,11 +1362,42 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         """Drain all pending external completions into promise state."""
         while not external_queue.empty():
             action, pid, value = external_queue.get()
-            if pid in promises and promises[pid]["status"] == "pending":
-                promises[pid]["status"] = "completed" if action == "complete" else "failed"
-                promises[pid]["result"] = value
+            promise = promises.get(pid)
+            if promise is not None and promise.status == "pending":
+                promise.status = "completed" if action == "complete" else "failed"
+                promise.result = value
+                promise.cancel_hooks = None
+                mark_terminal(("promise", pid))
                 wake_waiters(("promise", pid))
 
+    def add_cancel_hook(pid, hook):
+        promise = promises.get(pid)
+        if promise is None or promise.status != "pending":
+            return
+        if promise.cancel_hooks is None:
+            promise.cancel_hooks = []
+        promise.cancel_hooks.append(hook)
+
+    def run_cancel_hooks(wk):
+        """Fire an external promise's cancel hooks once no live task waits on it."""
+        promise = promises.get(wk[1])
+        if promise is None or promise.status != "pending" or not promise.cancel_hooks:
+            return
+        for entry in waiters.get(wk, ()):
+            if not is_owner_cancelled(entry[1]):
+                return
+        hooks = promise.cancel_hooks
+        promise.cancel_hooks = None
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                warnings.warn(
+                    f"cancel hook of external promise {wk[1]} raised {e!r}",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
     def pop_live_semaphore_waiter(sem):
         while sem["waiters"]:
             owner_tid, waiter_k = sem["waiters"].popleft()
@@ -1165,7 +1470,7 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             tid = alloc_task(effect.program, effect.priority,
                              inner_boundaries=inner_boundaries,
                              daemon=effect.daemon)
-            tasks[tid]["spawn_site"] = spawn_site
+            tasks[tid].spawn_site = spawn_site
             enqueue(("new", tid), effect.priority)
             # Spawner resumes at its OWN task priority (#504): a hard-coded
             # NORMAL here would promote an IDLE spawner above the
@@ -1176,25 +1481,29 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         elif isinstance(effect, TaskCompleted):
             tid = effect.task_id
             r = effect.result
-            if tasks[tid]["status"] == "cancelled":
+            task = tasks[tid]
+            if task.status == "cancelled":
                 _release_task_refs(tid)
             else:
                 if hasattr(r, "is_ok") and r.is_ok():
-                    tasks[tid]["status"] = "completed"
-                    tasks[tid]["result"] = r.value
+                    task.status = "completed"
+                    task.result = r.value
                 else:
-                    tasks[tid]["status"] = "failed"
+                    task.status = "failed"
                     error = r.error if hasattr(r, "error") else r
                     # Add spawn boundary to traceback
                     if isinstance(error, BaseException) and hasattr(error, "__doeff_traceback__"):
                         error.__doeff_traceback__.insert(0, {
                             "kind": "spawn_boundary",
                             "task_id": tid,
-                            "spawn_site": tasks[tid].get("spawn_site", ""),
+                            "spawn_site": task.spawn_site or "",
                         })
-                    tasks[tid]["result"] = error
+                    task.result = error
+                mark_terminal(("task", tid))
                 wake_waiters(("task", tid))
                 _release_task_refs(tid)
+            if tid in claim_owners:
+                abandon_claims(tid)
             yield TailEval(pick_next())
 
         elif isinstance(effect, Wait):
@@ -1211,7 +1520,8 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                 return (yield ResumeThrow(k, TaskCancelledError()))
             else:
                 kind, wid = wk
-                if kind == "promise" and promises.get(wid, {}).get("external"):
+                promise = promises.get(wid) if kind == "promise" else None
+                if promise is not None and promise.external:
                     # External promise: by default hold a ready-heap
                     # placeholder that shields DAEMON tasks (the sim clock
                     # driver) from running past the pending completion.
@@ -1229,6 +1539,8 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                         waiters.setdefault(wk, []).append(
                             ("wait", current_tid, k, None)
                         )
+                        if current_tid is not None:
+                            tasks[current_tid].parked_on = wk
                     else:
                         # Register in `waiters` too so the resume is enqueued
                         # by wake_waiters the moment the completion is drained
@@ -1241,6 +1553,8 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                         waiters.setdefault(wk, []).append(
                             ("wait_external", current_tid, k, claimed, effect.priority)
                         )
+                        if current_tid is not None:
+                            tasks[current_tid].parked_on = wk
                         enqueue(
                             ("wait_external", current_tid, k, wk, claimed),
                             PRIORITY_EXTERNAL_WAIT,
@@ -1282,7 +1596,12 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                 "remaining": len(pending_wks),
                 "failure": None,
                 "resolved": False,
+                # Gather re-reads waitable_status for EVERY key (including
+                # already-terminal ones) at final resolution (#502).
+                "protected": wks,
+                "entries": len(pending_wks),
             }
+            protect_keys(wks)
             for wk in pending_wks:
                 register_pending_waiter(wk, "gather", current_tid, gather_state)
             yield TailEval(pick_next())
@@ -1318,7 +1637,10 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     "waiter_k": k,
                     "pending_keys": pending_wks,
                     "resolved": False,
+                    "protected": pending_wks,
+                    "entries": len(pending_wks),
                 }
+                protect_keys(pending_wks)
                 for wk in pending_wks:
                     register_pending_waiter(wk, "race", current_tid, race_state)
             yield TailEval(pick_next())
@@ -1326,11 +1648,17 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
         elif isinstance(effect, Cancel):
             tid = effect.task.task_id
             task = tasks.get(tid)
-            if task and task["status"] in ("pending", "running", "suspended"):
-                task["status"] = "cancelled"
-                task["result"] = TaskCancelledError()
+            if task and task.status in ("pending", "running", "suspended"):
+                task.status = "cancelled"
+                task.result = TaskCancelledError()
+                retire_ready_entries_of(tid)
                 wake_waiters(("task", tid))
                 _release_task_refs(tid)
+                if tid in claim_owners:
+                    abandon_claims(tid)
+                if task.parked_on is not None:
+                    run_cancel_hooks(task.parked_on)
+                    task.parked_on = None
             r = yield Resume(k, None)
             return r
 
@@ -1342,10 +1670,32 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             r = yield Resume(k, promise_handle)
             return r
 
+        elif isinstance(effect, ClaimPromise):
+            pid = claims.get(effect.key)
+            if pid is None:
+                pid = alloc_promise()
+                claims[effect.key] = pid
+                claim_keys[pid] = effect.key
+                if current_tid is not None:
+                    # The root cannot be cancelled and its end is the run's.
+                    cleanup = None
+                    if effect.on_abandon is not None:
+                        cleanup = (effect.on_abandon,
+                                   (yield get_inner_boundaries(k)))
+                    claim_owner[pid] = (current_tid, cleanup)
+                    claim_owners.setdefault(current_tid, set()).add(pid)
+                claim = (register_handle(
+                    ("promise", pid), Promise(pid, _register=register_handle)
+                ), True)
+            else:
+                claim = (register_handle(("promise", pid), Future(pid)), False)
+            r = yield Resume(k, claim)
+            return r
+
         elif isinstance(effect, CompletePromise):
             pid = effect.promise.promise_id
             promise = promises[pid]
-            if promise.get("external"):
+            if promise.external:
                 # #507: external promises are resolved through
                 # ExternalPromise.complete()/fail(); an internal resolution
                 # would silently discard the foreign thread's completion.
@@ -1354,17 +1704,18 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     f"CompletePromise on external promise {pid}: resolve it "
                     "through ExternalPromise.complete() instead"
                 )))
-            if promise["status"] != "pending":
+            if promise.status != "pending":
                 # #507: same guard the drain path has — a double resolution
                 # would silently rewrite the result after waiters were woken
                 # with the old value.
                 from doeff.program import ResumeThrow
                 return (yield ResumeThrow(k, RuntimeError(
                     f"CompletePromise on promise {pid} which is already "
-                    f"{promise['status']}"
+                    f"{promise.status}"
                 )))
-            promise["status"] = "completed"
-            promise["result"] = effect.value
+            promise.status = "completed"
+            promise.result = effect.value
+            mark_terminal(("promise", pid))
             woken_min = wake_waiters(("promise", pid))
             # Re-queue the completer at min(its OWN task priority, the
             # lowest wake priority it just caused): the tasks a resolution
@@ -1384,10 +1735,45 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             enqueue_resume(current_tid, k, None, completer_priority)
             yield TailEval(pick_next())
 
+        elif isinstance(effect, CompletePromises):
+            # Batch CompletePromise (e.g. every sim-time timer due at one
+            # instant): a single completer re-queue and pick_next for the
+            # whole batch. Every promise is validated before any resolves,
+            # so a rejected batch leaves all of them pending.
+            from doeff.program import ResumeThrow
+            batch = {}
+            for promise_handle in effect.promises:
+                pid = promise_handle.promise_id
+                promise = promises[pid]
+                if promise.external:
+                    return (yield ResumeThrow(k, RuntimeError(
+                        f"CompletePromises on external promise {pid}: resolve it "
+                        "through ExternalPromise.complete() instead"
+                    )))
+                if promise.status != "pending" or pid in batch:
+                    return (yield ResumeThrow(k, RuntimeError(
+                        f"CompletePromises on promise {pid} which is already "
+                        f"{'listed in the batch' if pid in batch else promise.status}"
+                    )))
+                batch[pid] = promise
+            woken_min = None
+            for pid, promise in batch.items():
+                promise.status = "completed"
+                promise.result = effect.value
+                mark_terminal(("promise", pid))
+                woken = wake_waiters(("promise", pid))
+                if woken is not None and (woken_min is None or woken < woken_min):
+                    woken_min = woken
+            # Same completer ordering as CompletePromise (#493).
+            own = task_priority(current_tid)
+            completer_priority = own if woken_min is None else min(own, woken_min)
+            enqueue_resume(current_tid, k, None, completer_priority)
+            yield TailEval(pick_next())
+
         elif isinstance(effect, FailPromise):
             pid = effect.promise.promise_id
             promise = promises[pid]
-            if promise.get("external"):
+            if promise.external:
                 # #507: see CompletePromise — external promises are resolved
                 # through the thread-safe ExternalPromise handle only.
                 from doeff.program import ResumeThrow
@@ -1395,14 +1781,15 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                     f"FailPromise on external promise {pid}: resolve it "
                     "through ExternalPromise.fail() instead"
                 )))
-            if promise["status"] != "pending":
+            if promise.status != "pending":
                 from doeff.program import ResumeThrow
                 return (yield ResumeThrow(k, RuntimeError(
                     f"FailPromise on promise {pid} which is already "
-                    f"{promise['status']}"
+                    f"{promise.status}"
                 )))
-            promise["status"] = "failed"
-            promise["result"] = effect.error
+            promise.status = "failed"
+            promise.result = effect.error
+            mark_terminal(("promise", pid))
             woken_min = wake_waiters(("promise", pid))
             # Same as CompletePromise: the completer resumes only after the
             # tasks its resolution woke (#493 + pub/sub ordering guarantee).
@@ -1412,11 +1799,13 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
             yield TailEval(pick_next())
 
         elif isinstance(effect, CreateExternalPromise):
-            pid = alloc_promise()
-            promises[pid]["external"] = True
+            pid = alloc_promise(external=True)
             ep = register_handle(
                 ("promise", pid),
-                ExternalPromise(pid, external_queue, _register=register_handle),
+                ExternalPromise(
+                    pid, external_queue,
+                    _register=register_handle, _add_cancel_hook=add_cancel_hook,
+                ),
             )
             r = yield Resume(k, ep)
             return r
@@ -1430,6 +1819,10 @@ def scheduled(body_program):  # noqa: PLR0915 - baseline cleanup keeps existing
                 "ready": len(ready),
                 "handle_refs": len(handle_refs),
                 "handle_ref_total": sum(len(refs) for refs in handle_refs.values()),
+                "ready_live": ready_live[0] + ready_live[1],
+                "ready_tombstones": ready_dead[0],
+                "protected_keys": len(protected_keys),
+                "state_bytes": state_bytes(),
             })
             return r
 
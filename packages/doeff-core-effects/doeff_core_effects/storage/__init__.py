@@ -9,6 +9,10 @@ Public API:
 - DurableStorage: Protocol for storage backends
 - InMemoryStorage: In-memory storage (for testing, not durable)
 - SQLiteStorage: SQLite-backed persistent storage
+- BoundedMemoryStorage: In-memory storage with LRU size limits and TTLs
+- BlobStorage: Content-addressed files with mmap reads, for large values
+- reads_inline / writes_inline: whether a backend serves operations synchronously
+- accepts_ttl: whether a backend's put takes a ttl
 
 Example usage:
     from doeff.storage import SQLiteStorage
@@ -32,8 +36,36 @@ class DurableStorage(Protocol):
 
     All methods return Program[T] — the cache handler yields them.
     This makes storage I/O composable with doeff's effect system:
-    - Local storage (SQLite, memory): return Pure(value)
-    - Network storage (Redis): return Await(asyncio.to_thread(...))
+    - Blocking storage (SQLite, memory, Redis): return Await(asyncio.to_thread(...))
+    - Storage that is already a value: return Pure(value)
+
+    Optional synchronous capability: a backend whose operations are cheap
+    enough to run on the scheduler thread sets ``synchronous_reads = True``
+    (and provides ``get_sync``/``exists_sync``) and/or
+    ``synchronous_writes = True`` (``put_sync``/``delete_sync``). The sync
+    methods take the same arguments and return plain values. Handlers check
+    the flags with reads_inline/writes_inline and resume inline instead of
+    round-tripping through the await bridge. Backends without the flags are
+    always driven through the Program-returning methods.
+
+    Optional single-round-trip lookup: ``lookup(key)`` returns Program[value
+    or MEMO_MISS] (and ``lookup_sync`` for synchronous reads), so a stored
+    None is distinguishable from an absent key without a separate exists call.
+    Backends without it are looked up with exists followed by get.
+
+    Optional advisory leases: ``acquire_lease(key, ttl)`` returns Program[bool]
+    (True = caller holds the lease, False = another holder finished and the
+    key should be looked up again) and ``release_lease(key)``; storing the key
+    clears its lease. Memo handlers use them to deduplicate misses across
+    threads and processes sharing the backend.
+
+    Optional expiry: a backend setting ``supports_ttl = True`` accepts
+    ``put(key, value, ttl=seconds)`` (and ``put_sync``) and never serves the
+    entry after it expires. Memo handlers pass ``MemoPolicy.ttl`` through
+    only to such backends. Such a backend may also provide
+    ``lookup_with_ttl(key)`` (and ``lookup_with_ttl_sync``) returning
+    Program[(value, seconds left or None) or MEMO_MISS]; memo handlers use it
+    so write-through and promotion copies expire with the original.
 
     Implementations must be thread-safe for concurrent access.
     Values are opaque - the storage layer handles serialization.
@@ -68,7 +100,28 @@ class DurableStorage(Protocol):
         ...
 
 
+def reads_inline(storage: object) -> bool:
+    """Return True if storage serves get/exists via get_sync/exists_sync."""
+    return getattr(storage, "synchronous_reads", False) is True
+
+
+def writes_inline(storage: object) -> bool:
+    """Return True if storage serves put/delete via put_sync/delete_sync."""
+    return getattr(storage, "synchronous_writes", False) is True
+
+
+def accepts_ttl(storage: object) -> bool:
+    """Return True if storage's put/put_sync take a ttl keyword."""
+    return getattr(storage, "supports_ttl", False) is True
+
+
 # Import implementations for convenience
+from doeff_core_effects.storage.blob import (  # noqa: E402 - late import preserves existing import/setup order
+    BlobStorage,
+)
+from doeff_core_effects.storage.bounded import (  # noqa: E402 - late import preserves existing import/setup order
+    BoundedMemoryStorage,
+)
 from doeff_core_effects.storage.memory import (  # noqa: E402 - late import preserves existing import/setup order
     InMemoryStorage,
 )
@@ -77,8 +130,13 @@ from doeff_core_effects.storage.sqlite import (  # noqa: E402 - late import pres
 )
 
 __all__ = [
+    "BlobStorage",
+    "BoundedMemoryStorage",
     "DurableStorage",
     "InMemoryStorage",
     "SQLiteStorage",
+    "accepts_ttl",
     "is_program",
+    "reads_inline",
+    "writes_inline",
 ]
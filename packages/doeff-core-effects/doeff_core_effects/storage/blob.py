@@ -0,0 +1,388 @@
+"""
+Content-addressed blob storage for large memoized values.
+
+Values are pickled with protocol 5, keeping out-of-band buffers (NumPy
+arrays, PickleBuffer payloads) as raw byte ranges in a file named by the
+hash of its contents. A SQLite index maps keys to blobs. Reads memory-map
+the file and hand the buffer ranges to pickle, so a large array comes back
+as a read-only view of the mapped file instead of a copy.
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from doeff_core_effects.effects import Await
+from doeff_core_effects.memo_effects import MEMO_MISS
+from doeff_core_effects.storage.sqlite import _connect
+
+# File layout: magic, pickle length, buffer count, (offset, length) per
+# buffer, the pickle stream, then each buffer aligned to BUFFER_ALIGNMENT.
+_MAGIC = b"DOEFFBL1"
+_COUNTS = struct.Struct("<QQ")
+_SPAN = struct.Struct("<QQ")
+BUFFER_ALIGNMENT = 64
+
+# A hit refreshes its blob's last_access (the GC's LRU order) at most this often.
+ACCESS_RESOLUTION_SECONDS = 60.0
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BUFFER_ALIGNMENT) * BUFFER_ALIGNMENT
+
+
+def _encode(value: Any) -> tuple[bytes, bytes, list[memoryview]]:
+    """Return (header, pickle stream, raw out-of-band buffers) for value."""
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    header_size = len(_MAGIC) + _COUNTS.size + _SPAN.size * len(raws)
+    spans = []
+    offset = header_size + len(payload)
+    for raw in raws:
+        offset = _aligned(offset)
+        spans.append((offset, raw.nbytes))
+        offset += raw.nbytes
+    header = b"".join(
+        [_MAGIC, _COUNTS.pack(len(payload), len(raws))] + [_SPAN.pack(*span) for span in spans]
+    )
+    return header, payload, raws
+
+
+def _decode(path: Path) -> Any:
+    """Load a blob file, passing its buffers to pickle as views of the mapping."""
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if view[: len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"not a doeff blob file: {path}")
+    offset = len(_MAGIC)
+    payload_size, buffer_count = _COUNTS.unpack_from(mapped, offset)
+    offset += _COUNTS.size
+    buffers = []
+    for _index in range(buffer_count):
+        start, length = _SPAN.unpack_from(mapped, offset)
+        offset += _SPAN.size
+        buffers.append(view[start : start + length])
+    return pickle.loads(view[offset : offset + payload_size], buffers=buffers)
+
+
+class BlobStorage:
+    """
+    Content-addressed file storage with a SQLite key index.
+
+    Each distinct value is written once, to blobs/<aa>/<digest>, where digest
+    is the BLAKE2b hash of the encoded file; keys storing identical values
+    share the file. Out-of-band buffers are read back through mmap without
+    copying, so values such as NumPy arrays are returned read-only.
+
+    Unreferenced blobs (left by overwritten or deleted keys) are removed by
+    collect_garbage(). With max_bytes set it also runs after any put that
+    takes the blob total over the limit, evicting the least recently read
+    blobs, and the keys pointing at them, until the total fits.
+
+    Example:
+        storage = BlobStorage("memo-blobs", max_bytes=50 << 30)
+        storage.put_sync("frame", numpy_array)
+        storage.get_sync("frame")  # read-only view of the mapped blob file
+
+    Attributes:
+        root: Directory holding index.db and the blobs/ tree.
+    """
+
+    synchronous_writes = False
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_bytes: int | None = None,
+        sync_reads: bool = False,
+    ) -> None:
+        """
+        Initialize blob storage.
+
+        Args:
+            root: Directory for the index and blob files (created if missing).
+            max_bytes: Bound on the total blob size. None = unbounded.
+            sync_reads: Report reads as synchronous so handlers run them inline.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self.root = Path(root)
+        self._blob_dir = self.root / "blobs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = str(self.root / "index.db")
+        self._max_bytes = max_bytes
+        self.synchronous_reads = sync_reads
+        self._local = threading.local()
+        self._init_schema()
+
+    def _get_conn(self):
+        """Get thread-local connection."""
+        if not hasattr(self._local, "conn"):
+            self._local.conn = _connect(self._db_path)
+        return self._local.conn
+
+    def _init_schema(self) -> None:
+        """Create tables if not exists."""
+        conn = self._get_conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        conn.commit()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / digest[:2] / digest
+
+    def _read(self, key: str) -> Any:
+        """Stored value for key, or MEMO_MISS (also when its file has gone)."""
+        conn = self._get_conn()
+        row = conn.execute(
+            """
+            SELECT entries.digest, blobs.last_access FROM entries
+            JOIN blobs ON blobs.digest = entries.digest
+            WHERE entries.key = ?
+            """,
+            (key,),
+        ).fetchone()
+        if row is None:
+            return MEMO_MISS
+        digest, last_access = row
+        try:
+            value = _decode(self._blob_path(digest))
+        except FileNotFoundError:
+            return MEMO_MISS
+        now = time.time()
+        if now - last_access > ACCESS_RESOLUTION_SECONDS:
+            conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (now, digest))
+            conn.commit()
+        return value
+
+    def get_sync(self, key: str) -> Any | None:
+        """Get value by key on the calling thread."""
+        value = self._read(key)
+        return None if value is MEMO_MISS else value
+
+    def lookup_sync(self, key: str) -> Any:
+        """Get value by key on the calling thread, or MEMO_MISS if absent."""
+        return self._read(key)
+
+    def exists_sync(self, key: str) -> bool:
+        """Check if key exists on the calling thread."""
+        cursor = self._get_conn().execute("SELECT 1 FROM entries WHERE key = ? LIMIT 1", (key,))
+        return cursor.fetchone() is not None
+
+    def put_sync(self, key: str, value: Any) -> None:
+        """Store value with key on the calling thread, reusing an identical blob."""
+        header, payload, raws = _encode(value)
+        hasher = hashlib.blake2b(digest_size=32)
+        hasher.update(header)
+        hasher.update(payload)
+        for raw in raws:
+            hasher.update(raw)
+        digest = hasher.hexdigest()
+        path = self._blob_path(digest)
+        conn = self._get_conn()
+        # A blobs row whose file has gone (deleted by hand, lost with a disk)
+        # counts as unknown, so the put writes the file again.
+        if not self._has_blob(conn, digest, path):
+            staged = self._stage(path, header, payload, raws)
+        else:
+            staged = None
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Under the write lock: the blob may have been added (or collected)
+            # since the check above, so decide again before touching its path.
+            if self._has_blob(conn, digest, path):
+                conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (now, digest))
+            else:
+                if staged is None:
+                    staged = self._stage(path, header, payload, raws)
+                os.replace(staged, path)
+                staged = None
+                size = path.stat().st_size
+                conn.execute(
+                    """
+                    INSERT INTO blobs (digest, size, last_access) VALUES (?, ?, ?)
+                    ON CONFLICT(digest) DO UPDATE SET
+                        size = excluded.size, last_access = excluded.last_access
+                    """,
+                    (digest, size, now),
+                )
+            conn.execute(
+                """
+                INSERT INTO entries (key, digest, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    digest = excluded.digest, updated_at = excluded.updated_at
+                """,
+                (key, digest, now),
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            if staged is not None:
+                os.unlink(staged)
+        if self._max_bytes is not None and self.total_bytes() > self._max_bytes:
+            self.collect_garbage()
+
+    @staticmethod
+    def _has_blob(conn, digest: str, path: Path) -> bool:
+        """True if digest is indexed and its file is on disk."""
+        row = conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        return row is not None and path.exists()
+
+    def _stage(self, path: Path, header: bytes, payload: bytes, raws: list[memoryview]) -> Path:
+        """Write the blob to a temporary file beside path; return its path."""
+        path.parent.mkdir(exist_ok=True)
+        fd, staged = tempfile.mkstemp(dir=path.parent, prefix=".staged-")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header)
+            handle.write(payload)
+            for raw in raws:
+                handle.write(b"\0" * (_aligned(handle.tell()) - handle.tell()))
+                handle.write(raw)
+            handle.flush()
+            os.fsync(handle.fileno())
+        return Path(staged)
+
+    def delete_sync(self, key: str) -> bool:
+        """Delete key on the calling thread. Its blob is freed by collect_garbage()."""
+        cursor = self._get_conn().execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._get_conn().commit()
+        return cursor.rowcount > 0
+
+    def total_bytes(self) -> int:
+        """Return the total size of stored blob files."""
+        cursor = self._get_conn().execute("SELECT COALESCE(SUM(size), 0) FROM blobs")
+        return cursor.fetchone()[0]
+
+    def collect_garbage(self, max_bytes: int | None = None) -> int:
+        """
+        Remove unreferenced blobs, then evict least recently read blobs (and
+        their keys) until the total is within max_bytes.
+
+        Args:
+            max_bytes: Size bound for this collection; defaults to the
+                storage's max_bytes (None = only remove unreferenced blobs).
+
+        Returns:
+            Number of bytes freed.
+        """
+        limit = self._max_bytes if max_bytes is None else max_bytes
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            doomed = conn.execute(
+                """
+                SELECT digest, size FROM blobs
+                WHERE digest NOT IN (SELECT digest FROM entries)
+                """
+            ).fetchall()
+            if limit is not None:
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[
+                    0
+                ] - sum(size for _, size in doomed)
+                orphans = {digest for digest, _ in doomed}
+                for digest, size in conn.execute(
+                    "SELECT digest, size FROM blobs ORDER BY last_access"
+                ):
+                    if total <= limit:
+                        break
+                    if digest not in orphans:
+                        doomed.append((digest, size))
+                        total -= size
+            digests = [(digest,) for digest, _ in doomed]
+            conn.executemany("DELETE FROM entries WHERE digest = ?", digests)
+            conn.executemany("DELETE FROM blobs WHERE digest = ?", digests)
+            # Unlink while holding the write lock so a concurrent put cannot
+            # re-register a digest whose file is about to disappear.
+            for digest, _ in doomed:
+                self._blob_path(digest).unlink(missing_ok=True)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return sum(size for _, size in doomed)
+
+    def get(self, key: str):
+        """Get value by key. Returns Program[Any | None] via Await."""
+        return Await(asyncio.to_thread(self.get_sync, key))
+
+    def put(self, key: str, value: Any):
+        """Store value with key. Returns Program[None] via Await."""
+        return Await(asyncio.to_thread(self.put_sync, key, value))
+
+    def delete(self, key: str):
+        """Delete key. Returns Program[bool] via Await."""
+        return Await(asyncio.to_thread(self.delete_sync, key))
+
+    def exists(self, key: str):
+        """Check if key exists. Returns Program[bool] via Await."""
+        return Await(asyncio.to_thread(self.exists_sync, key))
+
+    def lookup(self, key: str):
+        """Get value or MEMO_MISS in one call. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_sync, key))
+
+    def keys(self) -> Iterable[str]:
+        """Return list of all keys."""
+        cursor = self._get_conn().execute("SELECT key FROM entries")
+        return [row[0] for row in cursor.fetchall()]
+
+    def items(self) -> Iterable[tuple[str, Any]]:
+        """Return list of all (key, value) pairs whose blob is readable."""
+        pairs = []
+        for key in self.keys():
+            value = self._read(key)
+            if value is not MEMO_MISS:
+                pairs.append((key, value))
+        return pairs
+
+    def clear(self) -> None:
+        """Delete all entries and blob files."""
+        self._get_conn().execute("DELETE FROM entries")
+        self._get_conn().commit()
+        self.collect_garbage(max_bytes=None)
+
+    def close(self) -> None:
+        """Close the thread-local connection if open."""
+        if hasattr(self._local, "conn"):
+            self._local.conn.close()
+            del self._local.conn
+
+    def __len__(self) -> int:
+        """Return number of keys."""
+        cursor = self._get_conn().execute("SELECT COUNT(*) FROM entries")
+        return cursor.fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"BlobStorage({str(self.root)!r}, max_bytes={self._max_bytes})"
@@ -0,0 +1,249 @@
+"""
+Bounded in-memory storage with LRU eviction and TTL enforcement.
+
+Like InMemoryStorage this is NOT durable across process restarts, but it is
+safe to leave running in a long-lived process: entry-count and byte limits
+evict the least recently used entries, and expired entries are never served.
+"""
+
+import asyncio
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from doeff_core_effects.effects import Await
+from doeff_core_effects.memo_effects import MEMO_MISS
+
+
+def approximate_size(value: Any) -> int:
+    """Byte size of value's pickle, or its shallow size if it cannot be pickled."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class BoundedMemoryStorage:
+    """
+    In-memory storage bounded by entry count and/or bytes, with per-entry TTL.
+
+    Eviction is least-recently-used: a read moves the entry to the most recent
+    end, and every write evicts from the least recent end until both limits
+    hold. A value larger than max_bytes on its own is not stored. TTLs are
+    enforced on read; an expired entry is dropped when it is next touched.
+
+    Counters (see stats()): hits/misses count get/lookup calls, evictions
+    count entries dropped for size, expirations count entries dropped for TTL.
+
+    Example:
+        storage = BoundedMemoryStorage(max_entries=10_000, max_bytes=64 << 20)
+        storage.put_sync("key", {"data": 123}, ttl=60)
+        storage.get_sync("key")  # {"data": 123} for the next minute
+    """
+
+    synchronous_reads = True
+    synchronous_writes = True
+    supports_ttl = True
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        default_ttl: float | None = None,
+        sizeof: Callable[[Any], int] = approximate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize bounded storage.
+
+        Args:
+            max_entries: Maximum number of entries. None = unbounded.
+            max_bytes: Maximum total of sizeof(value) over entries. None = unbounded.
+            default_ttl: TTL in seconds for puts that do not pass one. None = no expiry.
+            sizeof: Size estimate for a value; only called when max_bytes is set.
+            clock: Monotonic time source (seconds), injectable for tests.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (value, expires_at or None, size)
+        self._data: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.RLock()
+
+    def _live_entry(self, key: str) -> tuple[Any, float | None, int] | None:
+        """Entry for key unless absent or expired (expired entries are dropped)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and expires_at <= self._clock():
+            self._remove(key)
+            self._expirations += 1
+            return None
+        return entry
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def _evict_to_limits(self) -> None:
+        data = self._data
+        max_entries = self._max_entries
+        max_bytes = self._max_bytes
+        while data and (
+            (max_entries is not None and len(data) > max_entries)
+            or (max_bytes is not None and self._bytes > max_bytes)
+        ):
+            _, (_, _, size) = data.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def _purge_expired(self) -> None:
+        now = self._clock()
+        expired = [
+            key
+            for key, (_, expires_at, _) in self._data.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+
+    def get_sync(self, key: str) -> Any | None:
+        """Get value by key on the calling thread."""
+        value = self.lookup_sync(key)
+        return None if value is MEMO_MISS else value
+
+    def lookup_sync(self, key: str) -> Any:
+        """Get value by key on the calling thread, or MEMO_MISS if absent."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._misses += 1
+                return MEMO_MISS
+            self._data.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def lookup_with_ttl_sync(self, key: str) -> Any:
+        """(value, seconds left or None) on the calling thread, or MEMO_MISS."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._misses += 1
+                return MEMO_MISS
+            self._data.move_to_end(key)
+            self._hits += 1
+            expires_at = entry[1]
+            return entry[0], None if expires_at is None else expires_at - self._clock()
+
+    def put_sync(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store value with key on the calling thread; ttl overrides default_ttl."""
+        ttl = self._default_ttl if ttl is None else ttl
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                self._evictions += 1
+                return
+            expires_at = None if ttl is None else self._clock() + ttl
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict_to_limits()
+
+    def delete_sync(self, key: str) -> bool:
+        """Delete key on the calling thread."""
+        with self._lock:
+            if self._live_entry(key) is None:
+                return False
+            self._remove(key)
+            return True
+
+    def exists_sync(self, key: str) -> bool:
+        """Check if key exists (and has not expired) on the calling thread."""
+        with self._lock:
+            return self._live_entry(key) is not None
+
+    def get(self, key: str):
+        """Get value by key. Returns Program[Any | None] via Await."""
+        return Await(asyncio.to_thread(self.get_sync, key))
+
+    def put(self, key: str, value: Any, ttl: float | None = None):
+        """Store value with key. Returns Program[None] via Await."""
+        return Await(asyncio.to_thread(self.put_sync, key, value, ttl))
+
+    def delete(self, key: str):
+        """Delete key. Returns Program[bool] via Await."""
+        return Await(asyncio.to_thread(self.delete_sync, key))
+
+    def exists(self, key: str):
+        """Check if key exists. Returns Program[bool] via Await."""
+        return Await(asyncio.to_thread(self.exists_sync, key))
+
+    def lookup(self, key: str):
+        """Get value or MEMO_MISS in one call. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_sync, key))
+
+    def lookup_with_ttl(self, key: str):
+        """(value, seconds left) or MEMO_MISS. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_with_ttl_sync, key))
+
+    def keys(self) -> Iterable[str]:
+        """Return list of all unexpired keys, least recently used first."""
+        with self._lock:
+            self._purge_expired()
+            return list(self._data.keys())
+
+    def items(self) -> Iterable[tuple[str, Any]]:
+        """Return list of all unexpired (key, value) pairs."""
+        with self._lock:
+            self._purge_expired()
+            return [(key, entry[0]) for key, entry in self._data.items()]
+
+    def clear(self) -> None:
+        """Delete all entries. Counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return entry/byte totals and hit/miss/eviction/expiration counters."""
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def __len__(self) -> int:
+        """Return number of unexpired entries."""
+        with self._lock:
+            self._purge_expired()
+            return len(self._data)
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return (
+                f"BoundedMemoryStorage({len(self._data)} entries, "
+                f"max_entries={self._max_entries}, max_bytes={self._max_bytes})"
+            )
@@ -12,13 +12,17 @@ from collections.abc import Iterable
 from typing import Any
 
 from doeff_core_effects.effects import Await
+from doeff_core_effects.memo_effects import MEMO_MISS
 
 
 class InMemoryStorage:
     """
     In-memory storage for testing. Not durable across restarts.
 
-    Thread-safe via a reentrant lock for concurrent access.
+    Thread-safe via a reentrant lock for concurrent access. Every operation is
+    a dict access under the lock, so the storage reports both reads and writes
+    as synchronous: handlers call the ``*_sync`` methods inline instead of
+    hopping through the await bridge.
 
     Example:
         storage = InMemoryStorage()
@@ -26,45 +30,61 @@ class InMemoryStorage:
         value = storage.get("key")  # {"data": 123}
     """
 
+    synchronous_reads = True
+    synchronous_writes = True
+
     def __init__(self) -> None:
         """Initialize in-memory storage with empty dict."""
         self._data: dict[str, Any] = {}
         self._lock = threading.RLock()
 
-    def _sync_get(self, key: str) -> Any | None:
+    def get_sync(self, key: str) -> Any | None:
+        """Get value by key on the calling thread."""
         with self._lock:
             return self._data.get(key)
 
-    def _sync_put(self, key: str, value: Any) -> None:
+    def put_sync(self, key: str, value: Any) -> None:
+        """Store value with key on the calling thread."""
         with self._lock:
             self._data[key] = value
 
-    def _sync_delete(self, key: str) -> bool:
+    def delete_sync(self, key: str) -> bool:
+        """Delete key on the calling thread."""
         with self._lock:
             if key in self._data:
                 del self._data[key]
                 return True
             return False
 
-    def _sync_exists(self, key: str) -> bool:
+    def exists_sync(self, key: str) -> bool:
+        """Check if key exists on the calling thread."""
         with self._lock:
             return key in self._data
 
+    def lookup_sync(self, key: str) -> Any:
+        """Get value by key on the calling thread, or MEMO_MISS if absent."""
+        with self._lock:
+            return self._data.get(key, MEMO_MISS)
+
     def get(self, key: str):
         """Get value by key. Returns Program[Any | None] via Await."""
-        return Await(asyncio.to_thread(self._sync_get, key))
+        return Await(asyncio.to_thread(self.get_sync, key))
 
     def put(self, key: str, value: Any):
         """Store value with key. Returns Program[None] via Await."""
-        return Await(asyncio.to_thread(self._sync_put, key, value))
+        return Await(asyncio.to_thread(self.put_sync, key, value))
 
     def delete(self, key: str):
         """Delete key. Returns Program[bool] via Await."""
-        return Await(asyncio.to_thread(self._sync_delete, key))
+        return Await(asyncio.to_thread(self.delete_sync, key))
 
     def exists(self, key: str):
         """Check if key exists. Returns Program[bool] via Await."""
-        return Await(asyncio.to_thread(self._sync_exists, key))
+        return Await(asyncio.to_thread(self.exists_sync, key))
+
+    def lookup(self, key: str):
+        """Get value or MEMO_MISS in one call. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_sync, key))
 
     def keys(self) -> Iterable[str]:
         """Return list of all keys."""
@@ -7,15 +7,78 @@ Thread-safe via connection-per-thread pattern.
 
 
 import asyncio
+import atexit
+import logging
 import pickle
 import sqlite3
 import threading
 import time
+import weakref
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from doeff_core_effects.effects import Await
+from doeff_core_effects.memo_effects import MEMO_MISS
+
+# How long a memo lease stays valid if its holder never stores or releases
+# (e.g. the process died mid-computation), and how often a waiter re-checks.
+DEFAULT_LEASE_TTL_SECONDS = 300.0
+LEASE_POLL_INTERVAL_SECONDS = 0.05
+
+# Expired rows are never served; writes delete them in bulk at most this often.
+EXPIRY_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Row filter shared by every read: entries without a TTL, or not yet expired.
+_LIVE = "(expires_at IS NULL OR expires_at > ?)"
+
+# Write-behind: a batch is committed once this many writes are buffered, or
+# this long after the first buffered write, whichever comes first.
+DEFAULT_WRITE_BATCH_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.05
+
+_UPSERT = """
+    INSERT INTO cache (key, value, created_at, updated_at, expires_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = excluded.updated_at,
+        expires_at = excluded.expires_at
+"""
+
+# Buffer markers: a buffered delete, and "no buffered write for this key".
+_DELETED = object()
+_NOT_BUFFERED = object()
+
+_WRITE_BEHIND_STORAGES: "weakref.WeakSet[SQLiteStorage]" = weakref.WeakSet()
+
+
+def _flush_write_behind_storages() -> None:
+    """Commit buffered writes of every live write-behind storage at exit."""
+    for storage in list(_WRITE_BEHIND_STORAGES):
+        try:
+            storage.flush_sync()
+        except Exception as e:
+            logging.warning(f"SQLiteStorage flush at exit failed: {e}")
+
+
+atexit.register(_flush_write_behind_storages)
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection configured for storage use (WAL where available)."""
+    conn = sqlite3.connect(db_path)
+    # Cache writes happen one entry at a time, so prefer WAL + NORMAL sync to avoid
+    # paying a full fsync per commit while preserving crash-safe durability. Some
+    # environments reject WAL, so fall back to FULL sync unless WAL is confirmed.
+    journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+    if journal_mode and str(journal_mode[0]).lower() == "wal":
+        conn.execute("PRAGMA synchronous=NORMAL")
+    else:
+        conn.execute("PRAGMA synchronous=FULL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
 
 
 class SQLiteStorage:
@@ -24,6 +87,40 @@ class SQLiteStorage:
 
     Values are serialized using pickle. Thread-safe via connection-per-thread.
 
+    By default every operation runs on a worker thread via Await. Pass
+    ``sync_reads=True`` to serve get/exists on the calling thread instead:
+    handlers then read inline through ``get_sync``/``exists_sync`` on that
+    thread's own connection. Writes always stay off the calling thread, since
+    a commit can block on fsync or on another writer's lock.
+
+    Leases: acquire_lease(key) grants an advisory lease row so threads and
+    processes sharing the database compute a missed key once. A waiter blocks
+    (off the scheduler thread) until the holder stores the key — put clears
+    the key's lease in the same transaction — releases it, or the lease
+    expires.
+
+    Write-behind: with ``write_behind=True`` puts and deletes go into an
+    in-memory buffer that reads consult first, so a put is visible
+    immediately. A background thread commits the buffer in one executemany
+    transaction when batch_size writes are pending or flush_interval seconds
+    after the first one. Writes are then cheap enough to run inline
+    (synchronous_writes is True). Durability guarantees:
+
+    - A write is durable once flush_sync() / flush() returns, once a memo
+      handler over this storage exits (it flushes on the way out), or once
+      the background writer commits it, at most flush_interval later.
+    - Each batch is one transaction: a crash loses whole batches of the most
+      recent writes, never part of one, and never corrupts older rows.
+    - Buffered writes are committed at normal interpreter exit (atexit);
+      a hard kill (SIGKILL, os._exit, power loss) loses what was buffered.
+    - A put's lease is cleared in the same transaction as its row, so other
+      processes waiting on the lease see the committed value.
+
+    TTL: put(key, value, ttl=seconds) stores an expiry time. Reads treat
+    expired rows as absent; the rows themselves are deleted lazily by a sweep
+    that runs with a write at most every EXPIRY_SWEEP_INTERVAL_SECONDS (or
+    explicitly via purge_expired()), using an index on the expiry column.
+
     Example:
         storage = SQLiteStorage("workflow.db")
         storage.put("step1_result", {"computed": 42})
@@ -35,32 +132,59 @@ class SQLiteStorage:
         db_path: Path to the SQLite database file.
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    synchronous_writes = False
+    supports_ttl = True
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        sync_reads: bool = False,
+        write_behind: bool = False,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
         """
         Initialize SQLite storage.
 
         Args:
             db_path: Path to SQLite database file. Use ":memory:" for in-memory.
+            sync_reads: Report reads as synchronous so handlers run them inline.
+            write_behind: Buffer puts/deletes and commit them in batches.
+            batch_size: Buffered writes that trigger an immediate batch commit.
+            flush_interval: Longest a buffered write waits for its commit (seconds).
         """
         self._db_path = str(db_path)
+        if write_behind and self._db_path == ":memory:":
+            raise ValueError(
+                "write_behind requires a database file: each thread's "
+                "':memory:' connection is a separate database"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.synchronous_reads = sync_reads
+        self.write_behind = write_behind
+        if write_behind:
+            self.synchronous_writes = True
+            _WRITE_BEHIND_STORAGES.add(self)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
         self._local = threading.local()
+        self._next_sweep = 0.0
+        # key -> (blob, updated_at, expires_at) or _DELETED. _pending collects
+        # new writes; _flushing holds the batch being committed so it stays
+        # readable until the commit lands.
+        self._pending: dict[str, Any] = {}
+        self._flushing: dict[str, Any] = {}
+        self._buffer_lock = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
         self._init_schema()
 
     def _get_conn(self) -> sqlite3.Connection:
         """Get thread-local connection."""
         if not hasattr(self._local, "conn"):
-            conn = sqlite3.connect(self._db_path)
-            # Cache writes happen one entry at a time, so prefer WAL + NORMAL sync to avoid
-            # paying a full fsync per commit while preserving crash-safe durability. Some
-            # environments reject WAL, so fall back to FULL sync unless WAL is confirmed.
-            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()
-            if journal_mode and str(journal_mode[0]).lower() == "wal":
-                conn.execute("PRAGMA synchronous=NORMAL")
-            else:
-                conn.execute("PRAGMA synchronous=FULL")
-            conn.execute("PRAGMA temp_store=MEMORY")
-            conn.execute("PRAGMA busy_timeout=5000")
-            self._local.conn = conn
+            self._local.conn = _connect(self._db_path)
         return self._local.conn
 
     def _init_schema(self) -> None:
@@ -72,94 +196,347 @@ class SQLiteStorage:
                 key TEXT PRIMARY KEY,
                 value BLOB NOT NULL,
                 created_at REAL NOT NULL,
-                updated_at REAL NOT NULL
+                updated_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if "expires_at" not in columns:
+            # Databases created before TTL support.
+            conn.execute("ALTER TABLE cache ADD COLUMN expires_at REAL")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS cache_expires_at
+            ON cache (expires_at) WHERE expires_at IS NOT NULL
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL
             )
             """
         )
         conn.commit()
 
-    def _sync_get(self, key: str) -> Any | None:
-        cursor = self._get_conn().execute(
-            "SELECT value FROM cache WHERE key = ?", (key,)
+    def _purge_expired_rows(self, conn: sqlite3.Connection, now: float) -> int:
+        self._next_sweep = now + EXPIRY_SWEEP_INTERVAL_SECONDS
+        cursor = conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
         )
-        row = cursor.fetchone()
-        return pickle.loads(row[0]) if row else None
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Delete expired rows now. Returns the number of rows deleted."""
+        conn = self._get_conn()
+        deleted = self._purge_expired_rows(conn, time.time())
+        conn.commit()
+        return deleted
+
+    def _write_rows(
+        self,
+        conn: sqlite3.Connection,
+        rows: list[tuple[str, bytes, float, float, float | None]],
+        deleted: list[str],
+        now: float,
+    ) -> None:
+        """Upsert rows (clearing their leases) and delete keys, uncommitted."""
+        if rows:
+            conn.executemany(_UPSERT, rows)
+            conn.executemany(
+                "DELETE FROM leases WHERE key = ?", [(row[0],) for row in rows]
+            )
+        if deleted:
+            conn.executemany(
+                "DELETE FROM cache WHERE key = ?", [(key,) for key in deleted]
+            )
+        if now >= self._next_sweep:
+            self._purge_expired_rows(conn, now)
+
+    def _lookup_buffer(self, key: str, now: float) -> Any:
+        """Buffered (value, expires_at) for key, MEMO_MISS if buffered as gone,
+        else _NOT_BUFFERED."""
+        if not self.write_behind:
+            return _NOT_BUFFERED
+        with self._buffer_lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._flushing.get(key)
+        if entry is None:
+            return _NOT_BUFFERED
+        if entry is _DELETED:
+            return MEMO_MISS
+        blob, _, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            return MEMO_MISS
+        return pickle.loads(blob), expires_at
+
+    def _enqueue(self, key: str, entry: Any) -> None:
+        with self._buffer_lock:
+            self._pending[key] = entry
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_behind_loop,
+                    name="doeff-sqlite-write-behind",
+                    daemon=True,
+                )
+                self._writer.start()
+            elif len(self._pending) >= self._batch_size:
+                self._buffer_lock.notify()
+
+    def _write_behind_loop(self) -> None:
+        """Commit buffered writes until the buffer drains, then exit."""
+        while True:
+            with self._buffer_lock:
+                if not self._pending:
+                    self._writer = None
+                    return
+                if len(self._pending) < self._batch_size:
+                    self._buffer_lock.wait(self._flush_interval)
+            try:
+                self.flush_sync()
+            except Exception as e:
+                # The batch stays buffered; retry after the next interval.
+                logging.warning(f"SQLiteStorage write-behind flush failed: {e}")
+                time.sleep(self._flush_interval)
+
+    def flush_sync(self) -> None:
+        """Commit every buffered write-behind put/delete before returning."""
+        if not self.write_behind:
+            return
+        with self._flush_lock:
+            with self._buffer_lock:
+                if not self._pending:
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._flushing = batch
+            rows = []
+            deleted = []
+            for key, entry in batch.items():
+                if entry is _DELETED:
+                    deleted.append(key)
+                else:
+                    blob, updated_at, expires_at = entry
+                    rows.append((key, blob, updated_at, updated_at, expires_at))
+            conn = self._get_conn()
+            try:
+                self._write_rows(conn, rows, deleted, time.time())
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                with self._buffer_lock:
+                    # Writes buffered during the failed commit are newer.
+                    batch.update(self._pending)
+                    self._pending = batch
+                raise
+            finally:
+                with self._buffer_lock:
+                    self._flushing = {}
+
+    def get_sync(self, key: str) -> Any | None:
+        """Get value by key on the calling thread."""
+        value = self.lookup_sync(key)
+        return None if value is MEMO_MISS else value
 
-    def _sync_put(self, key: str, value: Any) -> None:
+    def put_sync(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store value with key on the calling thread; ttl in seconds, None = no expiry.
+
+        In write-behind mode this only buffers the write.
+        """
         now = time.time()
         blob = pickle.dumps(value)
-        self._get_conn().execute(
-            """
-            INSERT INTO cache (key, value, created_at, updated_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = ?
-            """,
-            (key, blob, now, now, blob, now),
-        )
-        self._get_conn().commit()
+        expires_at = None if ttl is None else now + ttl
+        if self.write_behind:
+            self._enqueue(key, (blob, now, expires_at))
+            return
+        conn = self._get_conn()
+        self._write_rows(conn, [(key, blob, now, now, expires_at)], [], now)
+        conn.commit()
 
-    def _sync_delete(self, key: str) -> bool:
+    def delete_sync(self, key: str) -> bool:
+        """Delete key on the calling thread."""
+        if self.write_behind:
+            existed = self.exists_sync(key)
+            self._enqueue(key, _DELETED)
+            return existed
         cursor = self._get_conn().execute(
             "DELETE FROM cache WHERE key = ?", (key,)
         )
         self._get_conn().commit()
         return cursor.rowcount > 0
 
-    def _sync_exists(self, key: str) -> bool:
+    def exists_sync(self, key: str) -> bool:
+        """Check if key exists on the calling thread."""
+        now = time.time()
+        buffered = self._lookup_buffer(key, now)
+        if buffered is not _NOT_BUFFERED:
+            return buffered is not MEMO_MISS
         cursor = self._get_conn().execute(
-            "SELECT 1 FROM cache WHERE key = ? LIMIT 1", (key,)
+            f"SELECT 1 FROM cache WHERE key = ? AND {_LIVE} LIMIT 1", (key, now)
         )
         return cursor.fetchone() is not None
 
+    def _lookup_entry(self, key: str, now: float) -> Any:
+        """(value, expires_at) for a live key, else MEMO_MISS."""
+        buffered = self._lookup_buffer(key, now)
+        if buffered is not _NOT_BUFFERED:
+            return buffered
+        cursor = self._get_conn().execute(
+            f"SELECT value, expires_at FROM cache WHERE key = ? AND {_LIVE}", (key, now)
+        )
+        row = cursor.fetchone()
+        return (pickle.loads(row[0]), row[1]) if row else MEMO_MISS
+
+    def lookup_sync(self, key: str) -> Any:
+        """Get value by key on the calling thread, or MEMO_MISS if absent."""
+        found = self._lookup_entry(key, time.time())
+        return found if found is MEMO_MISS else found[0]
+
+    def lookup_with_ttl_sync(self, key: str) -> Any:
+        """(value, seconds left or None) on the calling thread, or MEMO_MISS."""
+        now = time.time()
+        found = self._lookup_entry(key, now)
+        if found is MEMO_MISS:
+            return found
+        value, expires_at = found
+        return value, None if expires_at is None else expires_at - now
+
+    def try_acquire_lease_sync(
+        self, key: str, ttl: float | None = None
+    ) -> bool:
+        """Take the lease on key unless another holder's lease is still live."""
+        now = time.time()
+        expires_at = now + (DEFAULT_LEASE_TTL_SECONDS if ttl is None else ttl)
+        cursor = self._get_conn().execute(
+            """
+            INSERT INTO leases (key, expires_at) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET expires_at = excluded.expires_at
+            WHERE leases.expires_at <= ?
+            """,
+            (key, expires_at, now),
+        )
+        self._get_conn().commit()
+        return cursor.rowcount > 0
+
+    def wait_for_lease_sync(self, key: str) -> None:
+        """Block until key has no live lease (released, stored, or expired)."""
+        while True:
+            cursor = self._get_conn().execute(
+                "SELECT 1 FROM leases WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            if cursor.fetchone() is None:
+                return
+            time.sleep(LEASE_POLL_INTERVAL_SECONDS)
+
+    def acquire_lease_sync(self, key: str, ttl: float | None = None) -> bool:
+        """Take the lease on key, or wait out the current holder.
+
+        Returns True when the caller now holds the lease, False after another
+        holder finished — the caller should look the key up again.
+        """
+        if self.try_acquire_lease_sync(key, ttl):
+            return True
+        self.wait_for_lease_sync(key)
+        return False
+
+    def release_lease_sync(self, key: str) -> None:
+        """Drop the lease on key without storing a value."""
+        self._get_conn().execute("DELETE FROM leases WHERE key = ?", (key,))
+        self._get_conn().commit()
+
     def get(self, key: str):
         """Get value by key. Returns Program[Any | None] via Await."""
-        return Await(asyncio.to_thread(self._sync_get, key))
+        return Await(asyncio.to_thread(self.get_sync, key))
 
-    def put(self, key: str, value: Any):
+    def put(self, key: str, value: Any, ttl: float | None = None):
         """Store value with key. Returns Program[None] via Await."""
-        return Await(asyncio.to_thread(self._sync_put, key, value))
+        return Await(asyncio.to_thread(self.put_sync, key, value, ttl))
 
     def delete(self, key: str):
         """Delete key. Returns Program[bool] via Await."""
-        return Await(asyncio.to_thread(self._sync_delete, key))
+        return Await(asyncio.to_thread(self.delete_sync, key))
 
     def exists(self, key: str):
         """Check if key exists. Returns Program[bool] via Await."""
-        return Await(asyncio.to_thread(self._sync_exists, key))
+        return Await(asyncio.to_thread(self.exists_sync, key))
+
+    def lookup(self, key: str):
+        """Get value or MEMO_MISS in one query. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_sync, key))
+
+    def lookup_with_ttl(self, key: str):
+        """(value, seconds left) or MEMO_MISS. Returns Program[Any] via Await."""
+        return Await(asyncio.to_thread(self.lookup_with_ttl_sync, key))
+
+    def flush(self):
+        """Commit buffered writes. Returns Program[None] via Await."""
+        return Await(asyncio.to_thread(self.flush_sync))
+
+    def acquire_lease(self, key: str, ttl: float | None = None):
+        """Acquire or wait out the lease on key. Returns Program[bool] via Await."""
+        return Await(asyncio.to_thread(self.acquire_lease_sync, key, ttl))
+
+    def release_lease(self, key: str):
+        """Release the lease on key. Returns Program[None] via Await."""
+        return Await(asyncio.to_thread(self.release_lease_sync, key))
 
     def keys(self) -> Iterable[str]:
-        """Return list of all keys."""
-        cursor = self._get_conn().execute("SELECT key FROM cache")
+        """Return list of all unexpired keys."""
+        self.flush_sync()
+        cursor = self._get_conn().execute(
+            f"SELECT key FROM cache WHERE {_LIVE}", (time.time(),)
+        )
         return [row[0] for row in cursor.fetchall()]
 
     def items(self) -> Iterable[tuple[str, Any]]:
-        """Return list of all (key, value) pairs."""
-        cursor = self._get_conn().execute("SELECT key, value FROM cache")
+        """Return list of all unexpired (key, value) pairs."""
+        self.flush_sync()
+        cursor = self._get_conn().execute(
+            f"SELECT key, value FROM cache WHERE {_LIVE}", (time.time(),)
+        )
         return [(row[0], pickle.loads(row[1])) for row in cursor.fetchall()]
 
     def clear(self) -> None:
-        """Delete all entries."""
+        """Delete all entries, including buffered writes."""
+        with self._flush_lock, self._buffer_lock:
+            self._pending.clear()
         self._get_conn().execute("DELETE FROM cache")
+        self._get_conn().execute("DELETE FROM leases")
         self._get_conn().commit()
 
     def close(self) -> None:
-        """Close the thread-local connection if open."""
+        """Commit buffered writes and close the thread-local connection if open."""
+        self.flush_sync()
         if hasattr(self._local, "conn"):
             self._local.conn.close()
             del self._local.conn
 
     def __len__(self) -> int:
-        """Return number of entries."""
-        cursor = self._get_conn().execute("SELECT COUNT(*) FROM cache")
+        """Return number of unexpired entries."""
+        self.flush_sync()
+        cursor = self._get_conn().execute(
+            f"SELECT COUNT(*) FROM cache WHERE {_LIVE}", (time.time(),)
+        )
         return cursor.fetchone()[0]
 
     def __repr__(self) -> str:
-        return f"SQLiteStorage({self._db_path!r})"
+        options = "".join(
+            f", {name}=True"
+            for name, enabled in (
+                ("sync_reads", self.synchronous_reads),
+                ("write_behind", self.write_behind),
+            )
+            if enabled
+        )
+        return f"SQLiteStorage({self._db_path!r}{options})"
 
     def __del__(self) -> None:
         """Close connection on garbage collection."""
-        import logging
-
         try:
             self.close()
         except Exception as e:
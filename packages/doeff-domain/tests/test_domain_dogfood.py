@@ -14,10 +14,13 @@ from doeff_core_effects.cache_effects import CacheDeleteEffect
 from doeff_core_effects.effects import Ask, Get, Local, Put
 from doeff_core_effects.http_effects import HttpRequest
 from doeff_core_effects.memo_effects import (
+    MemoAcquireLeaseEffect,
     MemoDeleteEffect,
     MemoExistsEffect,
     MemoGetEffect,
+    MemoLookupEffect,
     MemoPutEffect,
+    MemoReleaseLeaseEffect,
 )
 from doeff_domain import (
     DomainCheckError,
@@ -82,9 +85,17 @@ def test_http_and_memo_domains_use_defhandler_derivation():
     (memo_handler,) = memo.handlers
     assert not hasattr(memo_handler, "__doeff_handles__")
     derived = handled_effects(memo_handler, vocabulary=memo.effects)
-    # MemoDeleteEffect 節の追加は構造導出に自動反映される(D6)
+    # MemoDeleteEffect / MemoLookupEffect / lease 節の追加は構造導出に自動反映される(D6)
     assert derived == frozenset(
-        {MemoExistsEffect, MemoGetEffect, MemoPutEffect, MemoDeleteEffect}
+        {
+            MemoExistsEffect,
+            MemoGetEffect,
+            MemoPutEffect,
+            MemoDeleteEffect,
+            MemoLookupEffect,
+            MemoAcquireLeaseEffect,
+            MemoReleaseLeaseEffect,
+        }
     )
 
 
@@ -3,9 +3,12 @@
 from .effects import (
     Publish,
     PublishEffect,
+    PublishMany,
+    PublishManyEffect,
     WaitForEvent,
     WaitForEventEffect,
     publish,
+    publish_many,
     wait_for_event,
 )
 from .handlers import event_handler
@@ -13,9 +16,12 @@ from .handlers import event_handler
 __all__ = [
     "Publish",
     "PublishEffect",
+    "PublishMany",
+    "PublishManyEffect",
     "WaitForEvent",
     "WaitForEventEffect",
     "event_handler",
     "publish",
+    "publish_many",
     "wait_for_event",
 ]
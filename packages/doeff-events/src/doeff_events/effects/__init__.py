@@ -3,17 +3,23 @@
 from .events import (
     Publish,
     PublishEffect,
+    PublishMany,
+    PublishManyEffect,
     WaitForEvent,
     WaitForEventEffect,
     publish,
+    publish_many,
     wait_for_event,
 )
 
 __all__ = [
     "Publish",
     "PublishEffect",
+    "PublishMany",
+    "PublishManyEffect",
     "WaitForEvent",
     "WaitForEventEffect",
     "publish",
+    "publish_many",
     "wait_for_event",
 ]
@@ -1,5 +1,6 @@
 """Publish/subscribe effects for event-driven doeff programs."""
 
+from collections.abc import Iterable
 from typing import Any
 
 from doeff import EffectBase
@@ -32,6 +33,22 @@ class PublishEffect(EffectBase):
         return f"Publish({self.event!r})"
 
 
+class PublishManyEffect(EffectBase):
+    """Publish several events, in order, with a single handler dispatch.
+
+    Behaves like back-to-back ``Publish`` calls: listeners woken by one
+    event run before the next is published, so one that waits again can
+    receive later events too.
+    """
+
+    def __init__(self, events: Iterable[Any]):
+        super().__init__()
+        self.events = tuple(events)
+
+    def __repr__(self):
+        return f"PublishMany({len(self.events)} events)"
+
+
 class WaitForEventEffect(EffectBase):
     """Wait for the next event matching any of the configured event types."""
 
@@ -48,20 +65,28 @@ def publish(event: Any) -> PublishEffect:
     return PublishEffect(event=event)
 
 
+def publish_many(events: Iterable[Any]) -> PublishManyEffect:
+    return PublishManyEffect(events=events)
+
+
 def wait_for_event(*event_types: type[Any]) -> WaitForEventEffect:
     return WaitForEventEffect(event_types=tuple(event_types))
 
 
 # Capitalized aliases
 Publish = publish
+PublishMany = publish_many
 WaitForEvent = wait_for_event
 
 
 __all__ = [
     "Publish",
     "PublishEffect",
+    "PublishMany",
+    "PublishManyEffect",
     "WaitForEvent",
     "WaitForEventEffect",
     "publish",
+    "publish_many",
     "wait_for_event",
 ]
@@ -5,28 +5,56 @@ from doeff_core_effects.scheduler import CompletePromise, CreatePromise, Wait
 
 from doeff import Pass, Resume, do
 from doeff import handler as _program_handler
-from doeff_events.effects import PublishEffect, WaitForEventEffect
+from doeff_events.effects import PublishEffect, PublishManyEffect, WaitForEventEffect
 
 
-def _matching_promises(listeners, event):
-    matched = {}
-    for event_type, queued in listeners.items():
-        if not isinstance(event, event_type):
-            continue
-        for promise in queued:
-            matched.setdefault(id(promise), promise)
-    return matched
+class _ListenerRegistry:
+    """Parked listener promises indexed by the event types they wait for.
 
+    ``_by_type`` maps each registered event type to an insertion-ordered
+    ``{id(promise): promise}`` bucket and ``_registered`` maps a promise id
+    back to the types it was filed under, so removing one listener touches
+    only its own buckets. Empty buckets are dropped, so ``take`` checks
+    ``isinstance`` only against types some listener is waiting for.
+    """
 
-def _remove_promises(listeners, promise_ids):
-    if not promise_ids:
-        return
-    for event_type, queued in list(listeners.items()):
-        remaining = [p for p in queued if id(p) not in promise_ids]
-        if remaining:
-            listeners[event_type] = remaining
-        else:
-            listeners.pop(event_type, None)
+    __slots__ = ("_by_type", "_registered")
+
+    def __init__(self):
+        self._by_type: dict[type, dict[int, object]] = {}
+        self._registered: dict[int, tuple[type, ...]] = {}
+
+    def __len__(self):
+        return len(self._registered)
+
+    def add(self, promise, event_types):
+        key = id(promise)
+        self._registered[key] = event_types
+        for event_type in event_types:
+            self._by_type.setdefault(event_type, {})[key] = promise
+
+    def discard(self, promise):
+        key = id(promise)
+        event_types = self._registered.pop(key, None)
+        if event_types is None:
+            return
+        for event_type in event_types:
+            bucket = self._by_type[event_type]
+            del bucket[key]
+            if not bucket:
+                del self._by_type[event_type]
+
+    def take(self, event):
+        """Remove and return the listeners matching ``event``, oldest type first."""
+        if not self._registered:
+            return []
+        matched = {}
+        for event_type, bucket in self._by_type.items():
+            if isinstance(event, event_type):
+                matched.update(bucket)
+        for promise in matched.values():
+            self.discard(promise)
+        return list(matched.values())
 
 
 def event_handler():
@@ -34,28 +62,32 @@ def event_handler():
 
     WaitForEvent creates a Promise and blocks via Wait(promise.future).
     Publish resolves promises for listeners whose registered type matches.
+    PublishMany publishes its events in order within one dispatch: each
+    event's listeners are woken, and run, before the next event is matched,
+    so a listener that waits again receives later events like it would
+    from back-to-back Publish calls.
     """
-    listeners: dict[type, list] = {}
+    listeners = _ListenerRegistry()
 
     @do
     def handler(effect, k):
         if isinstance(effect, WaitForEventEffect):
             promise = yield CreatePromise()
-            for event_type in effect.event_types:
-                listeners.setdefault(event_type, []).append(promise)
+            listeners.add(promise, effect.event_types)
             try:
                 event = yield Wait(promise.future)
             finally:
-                _remove_promises(listeners, {id(promise)})
+                listeners.discard(promise)
             result = yield Resume(k, event)
             return result
 
-        if isinstance(effect, PublishEffect):
-            event = effect.event
-            matched = _matching_promises(listeners, event)
-            _remove_promises(listeners, set(matched))
-            for promise in matched.values():
-                yield CompletePromise(promise, event)
+        if isinstance(effect, (PublishEffect, PublishManyEffect)):
+            events = effect.events if isinstance(effect, PublishManyEffect) else (effect.event,)
+            for event in events:
+                # CompletePromise runs the woken listeners before it returns,
+                # so they can wait again before the next event is matched.
+                for promise in listeners.take(event):
+                    yield CompletePromise(promise, event)
             result = yield Resume(k, None)
             return result
 
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+
+from doeff_core_effects.scheduler import Gather, Spawn, scheduled
+from doeff_events.effects import PublishMany, WaitForEvent
+from doeff_events.handlers import event_handler
+from doeff_events.handlers.memory import _ListenerRegistry
+
+from doeff import do, run
+
+
+@dataclass(frozen=True)
+class MarketEvent:
+    symbol: str
+
+
+@dataclass(frozen=True)
+class PriceUpdated(MarketEvent):
+    price_cents: int
+
+
+@dataclass(frozen=True)
+class OrderFilled(MarketEvent):
+    quantity: int
+
+
+def test_take_matches_registered_base_types_once_per_listener() -> None:
+    registry = _ListenerRegistry()
+    base, fills, both = object(), object(), object()
+    registry.add(base, (MarketEvent,))
+    registry.add(fills, (OrderFilled,))
+    registry.add(both, (PriceUpdated, MarketEvent))
+
+    taken = registry.take(PriceUpdated(symbol="AAPL", price_cents=1))
+
+    assert taken == [base, both]
+    assert len(registry) == 1
+    assert registry.take(OrderFilled(symbol="AAPL", quantity=1)) == [fills]
+    assert len(registry) == 0
+
+
+def test_discard_removes_listener_from_every_type() -> None:
+    registry = _ListenerRegistry()
+    parked = [object() for _ in range(3)]
+    for promise in parked:
+        registry.add(promise, (OrderFilled, MarketEvent))
+
+    registry.discard(parked[1])
+    registry.discard(parked[1])
+
+    assert len(registry) == 2
+    assert registry.take(OrderFilled(symbol="AAPL", quantity=1)) == [parked[0], parked[2]]
+
+
+def test_types_registered_after_a_take_are_matched() -> None:
+    registry = _ListenerRegistry()
+    assert registry.take(OrderFilled(symbol="AAPL", quantity=1)) == []
+    registry.add(fills := object(), (OrderFilled,))
+    registry.take(PriceUpdated(symbol="AAPL", price_cents=1))
+    registry.add(base := object(), (MarketEvent,))
+
+    assert registry.take(OrderFilled(symbol="AAPL", quantity=1)) == [fills, base]
+
+
+def test_publish_many_delivers_first_matching_event_to_each_listener() -> None:
+    price = PriceUpdated(symbol="AAPL", price_cents=10100)
+    fill = OrderFilled(symbol="AAPL", quantity=5)
+
+    @do
+    def wait_for(*event_types):
+        return (yield WaitForEvent(*event_types))
+
+    @do
+    def program():
+        fills = yield Spawn(wait_for(OrderFilled))
+        market = yield Spawn(wait_for(MarketEvent))
+        yield PublishMany([price, fill])
+        return (yield Gather(fills, market))
+
+    assert run(scheduled(event_handler()(program()))) == [fill, price]
+
+
+def test_take_uses_isinstance_checks() -> None:
+    class _Always(type):
+        def __instancecheck__(cls, instance):
+            return True
+
+    class AnyEvent(metaclass=_Always):
+        pass
+
+    registry = _ListenerRegistry()
+    registry.add(listener := object(), (AnyEvent,))
+
+    assert registry.take(OrderFilled(symbol="AAPL", quantity=1)) == [listener]
+
+
+def test_publish_many_delivers_later_events_to_listeners_that_wait_again() -> None:
+    events = [PriceUpdated(symbol="AAPL", price_cents=p) for p in (10100, 10200, 10300)]
+
+    @do
+    def collect(count):
+        received = []
+        for _ in range(count):
+            received.append((yield WaitForEvent(PriceUpdated)))
+        return received
+
+    @do
+    def program():
+        collector = yield Spawn(collect(len(events)))
+        yield PublishMany(events)
+        return (yield Gather(collector))
+
+    assert run(scheduled(event_handler()(program()))) == [events]
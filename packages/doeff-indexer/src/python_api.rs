@@ -6,7 +6,7 @@
 use pyo3::prelude::*;
 use std::path::PathBuf;
 
-use crate::indexer::{build_index, Index, IndexEntry, ItemKind};
+use crate::indexer::{build_index, EntryCategory, Index, IndexEntry, ItemKind};
 
 /// Information about a discovered symbol (function or variable)
 #[pyclass]
@@ -101,6 +101,45 @@ impl Indexer {
         Ok(Indexer { index })
     }
 
+    /// Create an indexer for every Python file under a directory
+    ///
+    /// Args:
+    ///     root: Directory to scan
+    ///
+    /// Returns:
+    ///     Indexer instance
+    ///
+    /// Example:
+    ///     >>> indexer = Indexer.for_root("src")
+    #[staticmethod]
+    fn for_root(root: &str) -> PyResult<Self> {
+        let index = build_index(root)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+        Ok(Indexer { index })
+    }
+
+    /// Source files that define at least one `@do` function
+    ///
+    /// Returns:
+    ///     Sorted, de-duplicated file paths
+    ///
+    /// Example:
+    ///     >>> Indexer.for_root("src").do_function_files()
+    ///     ['/repo/src/app/handlers.py', '/repo/src/app/workflows.py']
+    fn do_function_files(&self) -> Vec<String> {
+        let mut files: Vec<String> = self
+            .index
+            .entries
+            .iter()
+            .filter(|entry| entry.categories.contains(&EntryCategory::DoFunction))
+            .map(|entry| entry.file_path.clone())
+            .collect();
+        files.sort();
+        files.dedup();
+        files
+    }
+
     /// Find symbols matching the given tags/markers
     ///
     /// Args:
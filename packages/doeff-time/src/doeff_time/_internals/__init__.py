@@ -1,10 +1,15 @@
 """Internal helpers for simulated time."""
 
 from .sim_clock import SimClock
-from .time_queue import TimeQueue, TimeQueueEntry
+from .time_queue import HeapTimeQueue, TimeQueue, TimeQueueBatch, TimeQueueEntry, time_key
+from .timer_wheel import TimerWheel
 
 __all__ = [
+    "HeapTimeQueue",
     "SimClock",
     "TimeQueue",
+    "TimeQueueBatch",
     "TimeQueueEntry",
+    "TimerWheel",
+    "time_key",
 ]
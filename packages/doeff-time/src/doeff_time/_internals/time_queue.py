@@ -1,25 +1,80 @@
-"""Min-heap queue of time-ordered promises."""
+"""Time-ordered queues of promises for the simulated clock."""
 
 import heapq
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from doeff_core_effects.scheduler import Promise
 
+from .timer_wheel import TimerWheel
 from .validation import ensure_aware_datetime
 
 # ``Promise`` is generic to the type checker but not subscriptable at runtime.
 
+_KEY_ORIGIN = datetime.min.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 @dataclass(frozen=True)
 class TimeQueueEntry:
     time: datetime
-    sequence: int
     promise: "Promise[Any]"
 
 
+@dataclass(frozen=True)
+class TimeQueueBatch:
+    """Every promise due at one instant, in push order."""
+
+    time: datetime
+    promises: "list[Promise[Any]]"
+
+
+def time_key(time: datetime) -> int:
+    """Integer nanoseconds from 0001-01-01 UTC to the timezone-aware ``time``."""
+    try:
+        return (time - _KEY_ORIGIN) // _MICROSECOND * 1000
+    except TypeError:
+        ensure_aware_datetime(time, name="time")
+        raise
+
+
 class TimeQueue:
+    """Promises ordered by due time on a TimerWheel of nanosecond keys.
+
+    The datetime first pushed for an instant is the one reported back, so
+    callers keep their timezone.
+    """
+
+    def __init__(self) -> None:
+        self._wheel = TimerWheel()
+        self._times: dict[int, datetime] = {}
+
+    def push(self, time: datetime, promise: "Promise[Any]") -> None:
+        key = time_key(time)
+        if key not in self._wheel:
+            self._times[key] = time
+        self._wheel.push(key, promise)
+
+    def pop_batch(self) -> TimeQueueBatch:
+        key, promises = self._wheel.pop_batch()
+        return TimeQueueBatch(time=self._times.pop(key), promises=promises)
+
+    def pop(self) -> TimeQueueEntry:
+        key, promise = self._wheel.pop()
+        time = self._times[key] if key in self._wheel else self._times.pop(key)
+        return TimeQueueEntry(time=time, promise=promise)
+
+    def empty(self) -> bool:
+        return not self._wheel
+
+    def __len__(self) -> int:
+        return len(self._wheel)
+
+
+class HeapTimeQueue:
+    """Min-heap of ``(datetime, sequence, promise)``; the pre-wheel TimeQueue."""
+
     def __init__(self) -> None:
         self._sequence = 0
         self._items: "list[tuple[datetime, int, Promise[Any]]]" = []  # noqa: UP037
@@ -29,9 +84,16 @@ class TimeQueue:
         self._sequence += 1
         heapq.heappush(self._items, (target_time, self._sequence, promise))
 
+    def pop_batch(self) -> TimeQueueBatch:
+        time, _sequence, promise = heapq.heappop(self._items)
+        promises = [promise]
+        while self._items and self._items[0][0] == time:
+            promises.append(heapq.heappop(self._items)[2])
+        return TimeQueueBatch(time=time, promises=promises)
+
     def pop(self) -> TimeQueueEntry:
-        time, sequence, promise = heapq.heappop(self._items)
-        return TimeQueueEntry(time=time, sequence=sequence, promise=promise)
+        time, _sequence, promise = heapq.heappop(self._items)
+        return TimeQueueEntry(time=time, promise=promise)
 
     def empty(self) -> bool:
         return not self._items
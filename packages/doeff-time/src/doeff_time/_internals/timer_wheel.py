@@ -0,0 +1,127 @@
+"""Hierarchical timer wheel over integer keys."""
+
+import heapq
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+
+
+class TimerWheel:
+    """Hierarchical timer wheel keyed by non-negative integers (nanoseconds).
+
+    Items pushed with the same key share one FIFO bucket and are released
+    together by ``pop_batch``. Level ``n`` has 64 slots, each ``64**n`` keys
+    wide; a key is filed at the lowest level whose span separates it from
+    the cursor (the last released key) and cascades one level down when the
+    cursor enters its slot. Per-level occupancy bitmaps locate the next
+    non-empty slot without scanning, so finding the next instant costs
+    O(levels) however far the clock jumps.
+
+    Keys below the cursor (timers set in the past) go to a small overdue
+    heap that is always drained first.
+    """
+
+    __slots__ = ("_buckets", "_cursor", "_len", "_levels", "_occupied", "_overdue")
+
+    def __init__(self) -> None:
+        self._cursor = 0
+        self._len = 0
+        self._buckets: dict[int, list] = {}
+        self._levels: list[list[list[int] | None]] = []
+        self._occupied: list[int] = []
+        self._overdue: list[int] = []
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._buckets
+
+    def push(self, key: int, item) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.append(item)
+            self._len += 1
+            return
+        if not self._buckets:
+            # Nothing is filed, so the cursor can jump straight to this key.
+            self._cursor = key
+        self._buckets[key] = [item]
+        self._len += 1
+        if key < self._cursor:
+            heapq.heappush(self._overdue, key)
+        else:
+            self._file(key)
+
+    def _file(self, key: int) -> None:
+        diff = key ^ self._cursor
+        level = 0 if diff < _SLOTS else (diff.bit_length() - 1) // _SLOT_BITS
+        while len(self._levels) <= level:
+            self._levels.append([None] * _SLOTS)
+            self._occupied.append(0)
+        slot = (key >> (level * _SLOT_BITS)) & _SLOT_MASK
+        slots = self._levels[level]
+        keys = slots[slot]
+        if keys is None:
+            slots[slot] = [key]
+            self._occupied[level] |= 1 << slot
+        else:
+            keys.append(key)
+
+    def peek_key(self) -> int | None:
+        """Smallest filed key, cascading higher levels down as needed."""
+        if self._overdue:
+            return self._overdue[0]
+        occupied = self._occupied
+        levels = self._levels
+        while True:
+            level = next((n for n, bits in enumerate(occupied) if bits), None)
+            if level is None:
+                return None
+            bits = occupied[level]
+            slot = (bits & -bits).bit_length() - 1
+            if level == 0:
+                return levels[0][slot][0]
+            keys = levels[level][slot]
+            levels[level][slot] = None
+            occupied[level] = bits & ~(1 << slot)
+            # Move the cursor to the start of that slot; every key in it is
+            # at or after the new cursor and lands on a lower level.
+            shift = level * _SLOT_BITS
+            span = shift + _SLOT_BITS
+            self._cursor = ((self._cursor >> span) << span) | (slot << shift)
+            for key in keys:
+                self._file(key)
+
+    def _release(self, key: int) -> None:
+        if self._overdue and self._overdue[0] == key:
+            heapq.heappop(self._overdue)
+            return
+        slot = key & _SLOT_MASK
+        self._levels[0][slot] = None
+        self._occupied[0] &= ~(1 << slot)
+        self._cursor = key
+
+    def pop_batch(self) -> tuple[int, list]:
+        """Remove and return ``(key, items)`` for the smallest key."""
+        key = self.peek_key()
+        if key is None:
+            raise IndexError("pop from empty TimerWheel")
+        self._release(key)
+        items = self._buckets.pop(key)
+        self._len -= len(items)
+        return key, items
+
+    def pop(self) -> tuple[int, object]:
+        """Remove and return ``(key, item)`` for the oldest item at the smallest key."""
+        key = self.peek_key()
+        if key is None:
+            raise IndexError("pop from empty TimerWheel")
+        bucket = self._buckets[key]
+        item = bucket.pop(0)
+        self._len -= 1
+        if not bucket:
+            self._release(key)
+            del self._buckets[key]
+        return key, item
@@ -8,7 +8,7 @@ from typing import Any
 from doeff_core_effects import WriterTellEffect
 from doeff_core_effects.scheduler import (
     PRIORITY_IDLE,
-    CompletePromise,
+    CompletePromises,
     CreatePromise,
     Spawn,
     Wait,
@@ -48,13 +48,17 @@ class SimTimeRuntime:
 
     @do
     def _clock_driver(self):
-        """Idle-priority daemon that advances time when normal tasks are parked."""
+        """Idle-priority daemon that advances time when normal tasks are parked.
+
+        Every timer due at the same instant is released as one batch: one
+        clock advance and one scheduler step for the whole instant.
+        """
 
         try:
             while not self._time_queue.empty():
-                entry = self._time_queue.pop()
-                self._clock.advance_to(entry.time)
-                yield CompletePromise(entry.promise, None)
+                batch = self._time_queue.pop_batch()
+                self._clock.advance_to(batch.time)
+                yield CompletePromises(batch.promises)
         finally:
             self._driver_running = False
 
@@ -65,7 +69,7 @@ class SimTimeRuntime:
         self._driver_running = True
         # daemon=True carries two contracts:
         # - #501: the driver's final IDLE resume (queued right after its
-        #   last CompletePromise) is routinely abandoned when the root body
+        #   last CompletePromises) is routinely abandoned when the root body
         #   returns first — that is this daemon's lifecycle, not lost work,
         #   so it must not trip the root close-out diagnostic.
         # - #505: daemon tasks are the only tasks the scheduler's
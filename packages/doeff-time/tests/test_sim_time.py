@@ -137,6 +137,33 @@ def test_concurrent_delays_resolve_in_time_order() -> None:
     assert result == (sim_time(1.0), sim_time(3.0))
 
 
+def test_timers_due_at_one_instant_wake_together_in_order() -> None:
+    woken: list[tuple[int, datetime]] = []
+
+    @do
+    def _sleeper(index: int, delay_seconds: float):
+        yield Delay(delay_seconds)
+        woken.append((index, (yield GetTime())))
+
+    @do
+    def _program():
+        tasks = []
+        for index in range(6):
+            tasks.append((yield Spawn(_sleeper(index, 1.0 + index % 2))))
+        yield Gather(*tasks)
+        return woken
+
+    result = _run_with_sim(_program(), start_time=sim_time(0.0))
+    assert result == [
+        (0, sim_time(1.0)),
+        (2, sim_time(1.0)),
+        (4, sim_time(1.0)),
+        (1, sim_time(2.0)),
+        (3, sim_time(2.0)),
+        (5, sim_time(2.0)),
+    ]
+
+
 def test_clock_driver_only_runs_at_idle_priority() -> None:
     @do
     def _high_priority_worker():
@@ -1,8 +1,10 @@
+import heapq
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from doeff_core_effects.scheduler import Promise
-from doeff_time._internals import TimeQueue
+from doeff_time._internals import HeapTimeQueue, TimeQueue, TimerWheel
 
 
 def _promise(promise_id: int) -> Promise:
@@ -38,3 +40,72 @@ def test_time_queue_rejects_naive_datetime() -> None:
     naive = datetime(2024, 1, 1, tzinfo=timezone.utc).replace(tzinfo=None)
     with pytest.raises(ValueError, match="time must be timezone-aware datetime"):
         queue.push(naive, _promise(1))
+
+
+@pytest.mark.parametrize("queue_type", [TimeQueue, HeapTimeQueue])
+def test_pop_batch_releases_same_instant_in_push_order(queue_type) -> None:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    queue = queue_type()
+    promises = [_promise(i) for i in range(5)]
+
+    queue.push(base + timedelta(seconds=2), promises[0])
+    queue.push(base + timedelta(seconds=1), promises[1])
+    queue.push(base + timedelta(seconds=2), promises[2])
+    queue.push(base + timedelta(seconds=1), promises[3])
+    queue.push(base + timedelta(seconds=2), promises[4])
+
+    first = queue.pop_batch()
+    second = queue.pop_batch()
+
+    assert first.time == base + timedelta(seconds=1)
+    assert first.promises == [promises[1], promises[3]]
+    assert second.time == base + timedelta(seconds=2)
+    assert second.promises == [promises[0], promises[2], promises[4]]
+    assert queue.empty()
+
+
+def test_time_queue_keeps_caller_timezone() -> None:
+    tokyo = timezone(timedelta(hours=9))
+    queue = TimeQueue()
+    local = datetime(2024, 1, 1, 9, tzinfo=tokyo)
+    queue.push(local, _promise(1))
+    queue.push(local.astimezone(timezone.utc), _promise(2))
+
+    batch = queue.pop_batch()
+
+    assert batch.time.tzinfo is tokyo
+    assert len(batch.promises) == 2
+
+
+def test_time_queue_pops_timers_set_in_the_past_first() -> None:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    queue = TimeQueue()
+    queue.push(base + timedelta(days=365), _promise(1))
+    queue.push(base, _promise(2))
+    assert queue.pop().time == base
+    queue.push(base - timedelta(microseconds=1), _promise(3))
+    queue.push(base + timedelta(microseconds=1), _promise(4))
+
+    times = [queue.pop().time for _ in range(3)]
+
+    assert times == [
+        base - timedelta(microseconds=1),
+        base + timedelta(microseconds=1),
+        base + timedelta(days=365),
+    ]
+
+
+def test_timer_wheel_matches_heap_order() -> None:
+    rng = random.Random(7)
+    wheel = TimerWheel()
+    reference: list[tuple[int, int]] = []
+    for sequence in range(5000):
+        key = rng.choice([0, 1, rng.randrange(64), rng.randrange(1 << 20), rng.randrange(1 << 50)])
+        wheel.push(key, sequence)
+        heapq.heappush(reference, (key, sequence))
+        if sequence % 7 == 0:
+            assert wheel.pop() == heapq.heappop(reference)
+    while wheel:
+        key, items = wheel.pop_batch()
+        assert [heapq.heappop(reference) for _ in items] == [(key, item) for item in items]
+    assert not reference
@@ -2,10 +2,21 @@
 Opaque collection — the result of Traverse.
 
 Users should NOT access items directly. Use Traverse, Reduce, Zip, Inspect.
+
+Storage is columnar: parallel index/value columns, a failed mask, and one
+history node per item. Histories live in a _HistoryLog shared by every
+Collection derived from the same source: recording a stage event appends a
+single node pointing at the item's previous node, so a stage never copies
+earlier history. ItemResult objects (with plain history lists) are only
+materialized for the public views (all_items, valid_items, failed_items).
 """
 
+from array import array
 from dataclasses import dataclass, field
 
+# History node id meaning "no history".
+_NO_HISTORY = -1
+
 
 @dataclass
 class ItemResult:
@@ -25,6 +36,101 @@ class HistoryEntry:
     attempt: int = 1
 
 
+class _HistoryLog:
+    """Append-only history store shared by derived Collections.
+
+    Node ``n`` records one event for one item at one stage: ``parents[n]``
+    is the item's previous node (or _NO_HISTORY) and ``events[n]`` indexes
+    an interned ``(stage, event, detail, attempt)`` tuple, so the thousands
+    of identical "ok" events a stage produces share one tuple.
+    """
+
+    __slots__ = ("_event_ids", "_events", "events", "parents")
+
+    def __init__(self):
+        self.parents = array("q")
+        self.events = array("L")
+        self._events = []
+        self._event_ids = {}
+
+    def __len__(self):
+        return len(self.parents)
+
+    def append(self, parent, stage=None, event="", detail=None, attempt=1):
+        """Record one event after node ``parent``; returns the new node id."""
+        key = (stage, event, detail, attempt)
+        event_id = self._event_ids.get(key)
+        if event_id is None:
+            event_id = len(self._events)
+            self._events.append(key)
+            self._event_ids[key] = event_id
+        self.parents.append(parent)
+        self.events.append(event_id)
+        return len(self.parents) - 1
+
+    def extend(self, parent, entries):
+        """Append HistoryEntry objects in order after ``parent``."""
+        node = parent
+        for entry in entries:
+            node = self.append(node, entry.stage, entry.event, entry.detail, entry.attempt)
+        return node
+
+    def event_keys(self, node):
+        """Event tuples of the chain ending at ``node``, oldest first."""
+        keys = []
+        parents = self.parents
+        events = self._events
+        event_ids = self.events
+        while node != _NO_HISTORY:
+            keys.append(events[event_ids[node]])
+            node = parents[node]
+        keys.reverse()
+        return keys
+
+    def entries(self, node):
+        """Materialize the chain ending at ``node`` as fresh HistoryEntry objects."""
+        return [
+            HistoryEntry(stage=stage, event=event, detail=detail, attempt=attempt)
+            for stage, event, detail, attempt in self.event_keys(node)
+        ]
+
+    def graft(self, parent, source_log, node):
+        """Append the chain ending at ``node`` in ``source_log`` after ``parent``."""
+        if node == _NO_HISTORY:
+            return parent
+        for key in source_log.event_keys(node):
+            parent = self.append(parent, *key)
+        return parent
+
+
+class _CollectionBuilder:
+    """Accumulates rows ``(index, value, failed, node)`` into a Collection."""
+
+    __slots__ = ("failed", "indices", "log", "nodes", "values")
+
+    def __init__(self, log):
+        self.log = log
+        self.indices = []
+        self.values = []
+        self.failed = bytearray()
+        self.nodes = array("q")
+
+    def add(self, index, value, failed, node):
+        self.indices.append(index)
+        self.values.append(value)
+        self.failed.append(1 if failed else 0)
+        self.nodes.append(node)
+
+    def add_event(self, index, value, failed, parent, event, *, stage=None, detail=None):
+        """Add a row whose history is ``parent`` plus one new event."""
+        self.add(index, value, failed, self.log.append(parent, stage, event, detail))
+
+    def build(self):
+        return Collection._from_columns(
+            self.indices, self.values, self.failed, self.nodes, self.log
+        )
+
+
 class Collection:
     """Opaque item-indexed collection.
 
@@ -33,54 +139,107 @@ class Collection:
     """
 
     def __init__(self, items: list[ItemResult], source_keys: list | None = None):
-        self._items = items
+        log = _HistoryLog()
+        builder = _CollectionBuilder(log)
+        for item in items:
+            builder.add(
+                item.index,
+                item.value,
+                item.failed,
+                log.extend(_NO_HISTORY, item.history),
+            )
+        self._init_columns(builder.indices, builder.values, builder.failed, builder.nodes, log)
         self._source_keys = source_keys or list(range(len(items)))
 
+    def _init_columns(self, indices, values, failed, nodes, log):
+        self._indices = indices
+        self._values = values
+        self._failed = failed
+        self._nodes = nodes
+        self._log = log
+        # Cached views; columns never change after construction.
+        self._item_views = None
+        self._valid_positions = None
+        self._valid_values = None
+
+    @classmethod
+    def _from_columns(cls, indices, values, failed, nodes, log) -> "Collection":
+        col = cls.__new__(cls)
+        col._init_columns(indices, values, failed, nodes, log)
+        col._source_keys = list(range(len(indices)))
+        return col
+
+    @classmethod
+    def _builder(cls, log=None) -> _CollectionBuilder:
+        return _CollectionBuilder(_HistoryLog() if log is None else log)
+
     @classmethod
     def from_values(cls, values: list, stage: str | None = None) -> "Collection":
         """Create a Collection from a plain list of values."""
-        items = [
-            ItemResult(
-                index=i,
-                value=v,
-                history=[HistoryEntry(stage=stage, event="ok")],
-            )
-            for i, v in enumerate(values)
-        ]
-        return cls(items)
+        builder = cls._builder()
+        for i, v in enumerate(values):
+            builder.add_event(i, v, False, _NO_HISTORY, "ok", stage=stage)
+        return builder.build()
 
     @classmethod
     def from_iterable(cls, iterable) -> "Collection":
         """Wrap a plain iterable as a Collection (no history)."""
         if isinstance(iterable, Collection):
             return iterable
-        values = list(iterable)
-        return cls([ItemResult(index=i, value=v) for i, v in enumerate(values)])
+        builder = cls._builder()
+        for i, v in enumerate(iterable):
+            builder.add(i, v, False, _NO_HISTORY)
+        return builder.build()
+
+    def _rows(self):
+        """Iterate ``(index, value, failed, history_node)`` in item order."""
+        return zip(self._indices, self._values, self._failed, self._nodes, strict=True)
+
+    def _views(self) -> list[ItemResult]:
+        if self._item_views is None:
+            log = self._log
+            self._item_views = [
+                ItemResult(index=index, value=value, failed=bool(failed), history=log.entries(node))
+                for index, value, failed, node in self._rows()
+            ]
+        return self._item_views
+
+    def _valid(self) -> list[int]:
+        if self._valid_positions is None:
+            self._valid_positions = [
+                position for position, failed in enumerate(self._failed) if not failed
+            ]
+        return self._valid_positions
 
     @property
     def valid_items(self) -> list[ItemResult]:
-        return [item for item in self._items if not item.failed]
+        views = self._views()
+        return [views[position] for position in self._valid()]
 
     @property
     def failed_items(self) -> list[ItemResult]:
-        return [item for item in self._items if item.failed]
+        views = self._views()
+        return [views[position] for position, failed in enumerate(self._failed) if failed]
 
     @property
     def valid_values(self) -> list:
-        return [item.value for item in self._items if not item.failed]
+        if self._valid_values is None:
+            values = self._values
+            self._valid_values = [values[position] for position in self._valid()]
+        return list(self._valid_values)
 
     @property
     def all_items(self) -> list[ItemResult]:
-        return list(self._items)
+        return list(self._views())
 
     def __len__(self):
-        return len(self._items)
+        return len(self._indices)
 
     def __iter__(self):
         """Iterate over valid values only. For full access, use Inspect."""
         return iter(self.valid_values)
 
     def __repr__(self):
-        valid = len(self.valid_items)
-        failed = len(self.failed_items)
+        valid = len(self._valid())
+        failed = len(self) - valid
         return f"Collection({valid} valid, {failed} failed)"
@@ -8,14 +8,112 @@ normalize_to_none(): Fail handler — resumes with None at fail site.
 from doeff import do
 from doeff.program import Pass, Resume, ResumeThrow
 from doeff.program import handler as _program_handler
-from doeff_traverse.collection import Collection, HistoryEntry, ItemResult
+from doeff_traverse.collection import _NO_HISTORY, Collection
 from doeff_traverse.effects import Fail, Inspect, Reduce, Skip, SortBy, Take, Traverse, Zip
 
 # Sentinel for Skip — traverse handler checks identity
 _SKIPPED = object()
 
 
-def sequential():  # noqa: PLR0915 - baseline cleanup keeps existing control flow unchanged
+def _input_rows(items):
+    """(history log, rows) for a Traverse input.
+
+    Rows are ``(index, value, failed, history_node)``; a plain iterable is
+    consumed lazily and starts without history (log None = fresh log).
+    """
+    if isinstance(items, Collection):
+        return items._log, items._rows()
+    return None, ((i, v, False, _NO_HISTORY) for i, v in enumerate(items))
+
+
+def _add_traverse_result(builder, row, result, label):
+    """Record one Try-wrapped Traverse item: its outcome plus one history event."""
+    from doeff_vm import Ok
+
+    index, value, _failed, node = row
+    if isinstance(result, Ok):
+        if result.value is _SKIPPED:
+            builder.add_event(index, value, True, node, "skipped", stage=label)
+        else:
+            builder.add_event(index, result.value, False, node, "ok", stage=label)
+    else:
+        builder.add_event(
+            index, result.error, True, node, "failed", stage=label, detail=str(result.error)
+        )
+
+
+def _add_ordered_results(builder, outcomes, label):
+    """Add ``(row, result)`` outcomes in item-index order; result None = carried."""
+    outcomes.sort(key=lambda outcome: outcome[0][0])
+    for row, result in outcomes:
+        if result is None:
+            builder.add(*row)
+        else:
+            _add_traverse_result(builder, row, result, label)
+
+
+def _valid_values(collection):
+    if isinstance(collection, Collection):
+        return collection.valid_values
+    return collection
+
+
+def _zip_collections(a, b, *, fail_fast=False):
+    """Item-indexed join; histories are concatenated (a's, then b's)."""
+    a = Collection.from_iterable(a)
+    b = Collection.from_iterable(b)
+    builder = Collection._builder(a._log)
+    log = builder.log
+    for (index, value_a, failed_a, node_a), (_index_b, value_b, failed_b, node_b) in zip(
+        a._rows(), b._rows(), strict=False
+    ):
+        failed = bool(failed_a or failed_b)
+        if failed and fail_fast:
+            cause = value_a if failed_a else value_b
+            raise RuntimeError(f"parallel_fail_fast: zip item failed: {cause}")
+        value = (value_a if failed_a else value_b) if failed else (value_a, value_b)
+        node = log.graft(node_a, b._log, node_b)
+        if failed:
+            node = log.append(node, None, "zip_failed")
+        builder.add(index, value, failed, node)
+    return builder.build()
+
+
+def _reindexed(collection, rows):
+    """New Collection of ``rows`` with fresh indices, sharing their history."""
+    builder = Collection._builder(collection._log)
+    for i, (_index, value, failed, node) in enumerate(rows):
+        builder.add(i, value, failed, node)
+    return builder.build()
+
+
+def _sort_collection(collection, key, reverse, *, fail_fast=False):
+    col = Collection.from_iterable(collection)
+    rows = list(col._rows())
+    valid = [row for row in rows if not row[2]]
+    failed = [row for row in rows if row[2]]
+    if failed and fail_fast:
+        raise RuntimeError(f"parallel_fail_fast: {len(failed)} items failed before sort")
+    valid.sort(key=lambda row: key(row[1]), reverse=reverse)
+    return _reindexed(col, valid + failed)
+
+
+def _take_collection(collection, n, *, fail_fast=False):
+    col = Collection.from_iterable(collection)
+    taken = []
+    count = 0
+    for row in col._rows():
+        if row[2]:
+            if fail_fast:
+                raise RuntimeError(f"parallel_fail_fast: item {row[0]} failed before take")
+            taken.append(row)
+        elif count < n:
+            taken.append(row)
+            count += 1
+    return _reindexed(col, taken)
+
+
+def sequential():
     """Sequential handler for Traverse/Reduce/Zip/Inspect.
 
     Traverse: runs f(item) sequentially for each item.
@@ -27,35 +125,28 @@ def sequential():  # noqa: PLR0915 - baseline cleanup keeps existing control flo
     Unhandled Fail inside Traverse marks the item as failed.
     """
     from doeff_core_effects.effects import Try
-    from doeff_vm import Err, Ok
 
     from doeff.handler_utils import get_inner_handlers
     @do
-    def handler(effect, k):  # noqa: PLR0911, PLR0912, PLR0915 - baseline cleanup keeps existing control flow unchanged
+    def handler(effect, k):  # noqa: PLR0911 - baseline cleanup keeps existing control flow unchanged
         if isinstance(effect, Skip):
             return _SKIPPED
 
         if isinstance(effect, Traverse):
             inner_hs = yield get_inner_handlers(k)
-            results = []
 
             # Iterate: Collection (from previous traverse) or raw iterable/generator
-            if isinstance(effect.items, Collection):
-                items_iter = effect.items.all_items
-            else:
-                items_iter = (
-                    ItemResult(index=i, value=v)
-                    for i, v in enumerate(effect.items)
-                )
-
-            for item in items_iter:
+            log, rows = _input_rows(effect.items)
+            results = Collection._builder(log)
+
+            for row in rows:
                 # Carry forward already-failed items without re-processing
-                if item.failed:
-                    results.append(item)
+                if row[2]:
+                    results.add(*row)
                     continue
 
                 # Build fresh program for this item
-                prog = effect.f(item.value)
+                prog = effect.f(row[1])
                 # Reinstall inner handlers + this handler for nested Traverse
                 for h in inner_hs:
                     prog = _program_handler(h)(prog)
@@ -69,43 +160,15 @@ def sequential():  # noqa: PLR0915 - baseline cleanup keeps existing control flo
                     return value
 
                 result = yield attempt()
-                if isinstance(result, Ok):
-                    if result.value is _SKIPPED:
-                        results.append(ItemResult(
-                            index=item.index,
-                            value=item.value,
-                            failed=True,
-                            history=item.history + [HistoryEntry(stage=effect.label, event="skipped")],
-                        ))
-                    else:
-                        results.append(ItemResult(
-                            index=item.index,
-                            value=result.value,
-                            history=item.history + [HistoryEntry(stage=effect.label, event="ok")],
-                        ))
-                elif isinstance(result, Err):
-                    results.append(ItemResult(
-                        index=item.index,
-                        value=result.error,
-                        failed=True,
-                        history=item.history + [HistoryEntry(
-                            stage=effect.label,
-                            event="failed",
-                            detail=str(result.error),
-                        )],
-                    ))
-
-            return (yield Resume(k, Collection(results)))
+                _add_traverse_result(results, row, result, effect.label)
+
+            return (yield Resume(k, results.build()))
 
         if isinstance(effect, Reduce):
             inner_hs = yield get_inner_handlers(k)
             # Fold over valid items (skip failed)
-            if isinstance(effect.collection, Collection):
-                values_iter = (item.value for item in effect.collection.valid_items)
-            else:
-                values_iter = effect.collection
             acc = effect.init
-            for value in values_iter:
+            for value in _valid_values(effect.collection):
                 prog = effect.f(acc, value)
                 for h in inner_hs:
                     prog = _program_handler(h)(prog)
@@ -114,114 +177,139 @@ def sequential():  # noqa: PLR0915 - baseline cleanup keeps existing control flo
             return (yield Resume(k, acc))
 
         if isinstance(effect, Zip):
-            a = Collection.from_iterable(effect.a)
-            b = Collection.from_iterable(effect.b)
-            results = []
-            for item_a, item_b in zip(a.all_items, b.all_items, strict=False):
-                failed = item_a.failed or item_b.failed
-                value = (item_a.value if item_a.failed else item_b.value) if failed else (item_a.value, item_b.value)
-                history = item_a.history + item_b.history
-                if failed:
-                    history.append(HistoryEntry(event="zip_failed"))
-                results.append(ItemResult(
-                    index=item_a.index,
-                    value=value,
-                    failed=failed,
-                    history=history,
-                ))
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _zip_collections(effect.a, effect.b)))
 
         if isinstance(effect, Inspect):
             col = Collection.from_iterable(effect.collection)
             return (yield Resume(k, col.all_items))
 
         if isinstance(effect, SortBy):
-            col = Collection.from_iterable(effect.collection)
-            valid = list(col.valid_items)
-            failed = list(col.failed_items)
-            valid.sort(key=lambda item: effect.key(item.value), reverse=effect.reverse)
-            # Build new items with fresh indices (don't mutate originals)
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(valid + failed)
-            ]
-            return (yield Resume(k, Collection(results)))
+            # New collection with fresh indices (originals are not mutated)
+            return (yield Resume(k, _sort_collection(effect.collection, effect.key, effect.reverse)))
 
         if isinstance(effect, Take):
-            col = Collection.from_iterable(effect.collection)
-            taken = []
-            count = 0
-            for item in col.all_items:
-                if item.failed:
-                    taken.append(item)
-                elif count < effect.n:
-                    taken.append(item)
-                    count += 1
-            # Build new items with fresh indices
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(taken)
-            ]
-            return (yield Resume(k, Collection(results)))
+            # New collection with fresh indices
+            return (yield Resume(k, _take_collection(effect.collection, effect.n)))
 
         yield Pass(effect, k)
 
     return _program_handler(handler)
 
 
-def parallel(concurrency=10):  # noqa: PLR0915 - baseline cleanup keeps existing control flow unchanged
+def parallel(concurrency=10, *, streaming=False):  # noqa: PLR0915 - baseline cleanup keeps existing control flow unchanged
     """Parallel handler for Traverse/Reduce/Zip/Inspect.
 
     Traverse: spawns up to `concurrency` tasks concurrently via Spawn/Gather.
     Reduce/Zip/Inspect: same as sequential (these are inherently sequential).
 
     Items from generators are materialized before spawning.
+
+    With ``streaming=True``, Traverse instead pulls items from the iterable
+    lazily and keeps at most `concurrency` tasks alive: a new item is spawned
+    only after an in-flight one finishes (Race over the window), and each
+    result is written into its input-ordered slot. Peak task/continuation
+    count scales with `concurrency` rather than with the number of items;
+    the output Collection is identical to the non-streaming mode.
     """
     from doeff_core_effects.effects import Try
     from doeff_core_effects.scheduler import (
         AcquireSemaphore,
         CreateSemaphore,
         Gather,
+        Race,
         ReleaseSemaphore,
         Spawn,
     )
-    from doeff_vm import Err, Ok
 
     from doeff.handler_utils import get_inner_handlers
+
+    if streaming and concurrency < 1:
+        raise ValueError("parallel(streaming=True) requires concurrency >= 1")
+
     @do
-    def handler(effect, k):  # noqa: PLR0911, PLR0912, PLR0915 - baseline cleanup keeps existing control flow unchanged
+    def stream_traverse(effect, inner_hs):
+        """Bounded-window Traverse: at most `concurrency` tasks in flight."""
+        log, rows = _input_rows(effect.items)
+
+        @do
+        def run_item(slot, row):
+            prog = effect.f(row[1])
+            for h in inner_hs:
+                prog = _program_handler(h)(prog)
+            prog = _program_handler(handler)(prog)
+
+            @do
+            def attempt():
+                from doeff_core_effects.handlers import try_handler
+                value = yield try_handler(Try(prog))
+                return value
+
+            result = yield attempt()
+            return (slot, result)
+
+        # Input-ordered output buffer of (row, result); result None = carried
+        # forward as-is (or, transiently, still running).
+        slots = []
+        in_flight = {}   # slot → Task
+
+        @do
+        def retire_one():
+            slot, result = yield Race(*in_flight.values())
+            del in_flight[slot]
+            slots[slot] = (slots[slot][0], result)
+
+        for row in rows:
+            # Carry forward already-failed items without re-processing
+            if row[2]:
+                slots.append((row, None))
+                continue
+            if len(in_flight) >= concurrency:
+                yield retire_one()
+            in_flight[len(slots)] = yield Spawn(run_item(len(slots), row))
+            slots.append((row, None))
+
+        while in_flight:
+            yield retire_one()
+
+        results = Collection._builder(log)
+        _add_ordered_results(results, slots, effect.label)
+        return results.build()
+
+    @do
+    def handler(effect, k):  # noqa: PLR0911 - baseline cleanup keeps existing control flow unchanged
         if isinstance(effect, Skip):
             return _SKIPPED
 
         if isinstance(effect, Traverse):
             inner_hs = yield get_inner_handlers(k)
 
+            if streaming:
+                collection = yield stream_traverse(effect, inner_hs)
+                return (yield Resume(k, collection))
+
             # Collect items (must materialize for parallel dispatch)
-            if isinstance(effect.items, Collection):
-                all_items = effect.items.all_items
-            else:
-                all_items = [
-                    ItemResult(index=i, value=v)
-                    for i, v in enumerate(effect.items)
-                ]
+            log, rows = _input_rows(effect.items)
+            all_rows = list(rows)
 
             # Separate failed (carry forward) from active
-            carry_forward = [item for item in all_items if item.failed]
-            active_items = [item for item in all_items if not item.failed]
+            outcomes = [(row, None) for row in all_rows if row[2]]
+            active_rows = [row for row in all_rows if not row[2]]
 
-            if not active_items:
-                return (yield Resume(k, Collection(carry_forward)))
+            if not active_rows:
+                results = Collection._builder(log)
+                _add_ordered_results(results, outcomes, effect.label)
+                return (yield Resume(k, results.build()))
 
             # Create semaphore for concurrency limiting
             sem = yield CreateSemaphore(concurrency)
 
             # Spawn a task per active item
             tasks = []
-            for item in active_items:
+            for row in active_rows:
                 @do
-                def run_item(item=item):
+                def run_item(row=row):
                     yield AcquireSemaphore(sem)
-                    prog = effect.f(item.value)
+                    prog = effect.f(row[1])
                     for h in inner_hs:
                         prog = _program_handler(h)(prog)
                     prog = _program_handler(handler)(prog)
@@ -234,53 +322,23 @@ def parallel(concurrency=10):  # noqa: PLR0915 - baseline cleanup keeps existing
 
                     result = yield attempt()
                     yield ReleaseSemaphore(sem)
-                    return (item, result)
+                    return (row, result)
 
                 task = yield Spawn(run_item())
                 tasks.append(task)
 
             # Gather all results
-            task_results = yield Gather(*tasks)
+            outcomes.extend((yield Gather(*tasks)))
 
             # Build Collection preserving original index order
-            results = list(carry_forward)
-            for item, result in task_results:
-                if isinstance(result, Ok):
-                    if result.value is _SKIPPED:
-                        results.append(ItemResult(
-                            index=item.index,
-                            value=item.value,
-                            failed=True,
-                            history=item.history + [HistoryEntry(stage=effect.label, event="skipped")],
-                        ))
-                    else:
-                        results.append(ItemResult(
-                            index=item.index,
-                            value=result.value,
-                            history=item.history + [HistoryEntry(stage=effect.label, event="ok")],
-                        ))
-                elif isinstance(result, Err):
-                    results.append(ItemResult(
-                        index=item.index,
-                        value=result.error,
-                        failed=True,
-                        history=item.history + [HistoryEntry(
-                            stage=effect.label,
-                            event="failed",
-                            detail=str(result.error),
-                        )],
-                    ))
-            results.sort(key=lambda r: r.index)
-            return (yield Resume(k, Collection(results)))
+            results = Collection._builder(log)
+            _add_ordered_results(results, outcomes, effect.label)
+            return (yield Resume(k, results.build()))
 
         if isinstance(effect, Reduce):
             inner_hs = yield get_inner_handlers(k)
-            if isinstance(effect.collection, Collection):
-                values_iter = (item.value for item in effect.collection.valid_items)
-            else:
-                values_iter = effect.collection
             acc = effect.init
-            for value in values_iter:
+            for value in _valid_values(effect.collection):
                 prog = effect.f(acc, value)
                 for h in inner_hs:
                     prog = _program_handler(h)(prog)
@@ -289,60 +347,24 @@ def parallel(concurrency=10):  # noqa: PLR0915 - baseline cleanup keeps existing
             return (yield Resume(k, acc))
 
         if isinstance(effect, Zip):
-            a = Collection.from_iterable(effect.a)
-            b = Collection.from_iterable(effect.b)
-            results = []
-            for item_a, item_b in zip(a.all_items, b.all_items, strict=False):
-                failed = item_a.failed or item_b.failed
-                value = (item_a.value if item_a.failed else item_b.value) if failed else (item_a.value, item_b.value)
-                history = item_a.history + item_b.history
-                if failed:
-                    history.append(HistoryEntry(event="zip_failed"))
-                results.append(ItemResult(
-                    index=item_a.index,
-                    value=value,
-                    failed=failed,
-                    history=history,
-                ))
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _zip_collections(effect.a, effect.b)))
 
         if isinstance(effect, Inspect):
             col = Collection.from_iterable(effect.collection)
             return (yield Resume(k, col.all_items))
 
         if isinstance(effect, SortBy):
-            col = Collection.from_iterable(effect.collection)
-            valid = list(col.valid_items)
-            failed = list(col.failed_items)
-            valid.sort(key=lambda item: effect.key(item.value), reverse=effect.reverse)
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(valid + failed)
-            ]
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _sort_collection(effect.collection, effect.key, effect.reverse)))
 
         if isinstance(effect, Take):
-            col = Collection.from_iterable(effect.collection)
-            taken = []
-            count = 0
-            for item in col.all_items:
-                if item.failed:
-                    taken.append(item)
-                elif count < effect.n:
-                    taken.append(item)
-                    count += 1
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(taken)
-            ]
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _take_collection(effect.collection, effect.n)))
 
         yield Pass(effect, k)
 
     return _program_handler(handler)
 
 
-def parallel_fail_fast(concurrency=10):  # noqa: PLR0915 - baseline cleanup keeps existing control flow unchanged
+def parallel_fail_fast(concurrency=10):
     """Parallel handler that aborts on first failure.
 
     Same interface as parallel(), but does NOT wrap items in Try.
@@ -362,82 +384,64 @@ def parallel_fail_fast(concurrency=10):  # noqa: PLR0915 - baseline cleanup keep
 
     from doeff.handler_utils import get_inner_handlers
     @do
-    def handler(effect, k):  # noqa: PLR0911, PLR0912, PLR0915 - baseline cleanup keeps existing control flow unchanged
+    def handler(effect, k):  # noqa: PLR0911, PLR0912 - baseline cleanup keeps existing control flow unchanged
         if isinstance(effect, Skip):
             return _SKIPPED
 
         if isinstance(effect, Traverse):
             inner_hs = yield get_inner_handlers(k)
 
-            if isinstance(effect.items, Collection):
-                all_items = effect.items.all_items
-            else:
-                all_items = [
-                    ItemResult(index=i, value=v)
-                    for i, v in enumerate(effect.items)
-                ]
+            log, rows = _input_rows(effect.items)
+            all_rows = list(rows)
 
-            carry_forward = [item for item in all_items if item.failed]
-            active_items = [item for item in all_items if not item.failed]
+            carry_forward = [row for row in all_rows if row[2]]
+            active_rows = [row for row in all_rows if not row[2]]
 
             # If there are already-failed items, fail fast immediately
             if carry_forward:
-                first_fail = carry_forward[0]
-                cause = first_fail.value if first_fail.value else "previous stage failed"
-                raise RuntimeError(f"parallel_fail_fast: item {first_fail.index} already failed: {cause}")
+                first_index, first_value, _failed, _node = carry_forward[0]
+                cause = first_value if first_value else "previous stage failed"
+                raise RuntimeError(f"parallel_fail_fast: item {first_index} already failed: {cause}")
 
-            if not active_items:
+            if not active_rows:
                 return (yield Resume(k, Collection([])))
 
             sem = yield CreateSemaphore(concurrency)
 
             tasks = []
-            for item in active_items:
+            for row in active_rows:
                 @do
-                def run_item(item=item):
+                def run_item(row=row):
                     yield AcquireSemaphore(sem)
-                    prog = effect.f(item.value)
+                    prog = effect.f(row[1])
                     for h in inner_hs:
                         prog = _program_handler(h)(prog)
                     prog = _program_handler(handler)(prog)
                     # NO Try wrapper — exceptions propagate to Gather
                     result = yield prog
                     yield ReleaseSemaphore(sem)
-                    return (item, result)
+                    return (row, result)
 
                 task = yield Spawn(run_item())
                 tasks.append(task)
 
             # Gather — if any task raised, the exception propagates here
             task_results = yield Gather(*tasks)
+            task_results.sort(key=lambda outcome: outcome[0][0])
 
-            results = []
-            for item, value in task_results:
+            results = Collection._builder(log)
+            for (index, item_value, _failed, node), value in task_results:
                 if value is _SKIPPED:
-                    results.append(ItemResult(
-                        index=item.index,
-                        value=item.value,
-                        failed=True,
-                        history=item.history + [HistoryEntry(stage=effect.label, event="skipped")],
-                    ))
+                    results.add_event(index, item_value, True, node, "skipped", stage=effect.label)
                 else:
-                    results.append(ItemResult(
-                        index=item.index,
-                        value=value,
-                        history=item.history + [HistoryEntry(stage=effect.label, event="ok")],
-                    ))
-            results.sort(key=lambda r: r.index)
-            return (yield Resume(k, Collection(results)))
+                    results.add_event(index, value, False, node, "ok", stage=effect.label)
+            return (yield Resume(k, results.build()))
 
         # Reduce/Zip/Inspect/SortBy/Take — delegate to sequential behavior
         if isinstance(effect, Reduce):
             inner_hs = yield get_inner_handlers(k)
-            if isinstance(effect.collection, Collection):
-                values_iter = (item.value for item in effect.collection.valid_items)
-            else:
-                values_iter = effect.collection
             acc = effect.init
-            for value in values_iter:
+            for value in _valid_values(effect.collection):
                 prog = effect.f(acc, value)
                 for h in inner_hs:
                     prog = _program_handler(h)(prog)
@@ -446,53 +450,19 @@ def parallel_fail_fast(concurrency=10):  # noqa: PLR0915 - baseline cleanup keep
             return (yield Resume(k, acc))
 
         if isinstance(effect, Zip):
-            a = Collection.from_iterable(effect.a)
-            b = Collection.from_iterable(effect.b)
-            results = []
-            for item_a, item_b in zip(a.all_items, b.all_items, strict=False):
-                failed = item_a.failed or item_b.failed
-                if failed:
-                    cause = item_a.value if item_a.failed else item_b.value
-                    raise RuntimeError(f"parallel_fail_fast: zip item failed: {cause}")
-                results.append(ItemResult(
-                    index=item_a.index,
-                    value=(item_a.value, item_b.value),
-                    history=item_a.history + item_b.history,
-                ))
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _zip_collections(effect.a, effect.b, fail_fast=True)))
 
         if isinstance(effect, Inspect):
             col = Collection.from_iterable(effect.collection)
             return (yield Resume(k, col.all_items))
 
         if isinstance(effect, SortBy):
-            col = Collection.from_iterable(effect.collection)
-            valid = list(col.valid_items)
-            failed = list(col.failed_items)
-            if failed:
-                raise RuntimeError(f"parallel_fail_fast: {len(failed)} items failed before sort")
-            valid.sort(key=lambda item: effect.key(item.value), reverse=effect.reverse)
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(valid)
-            ]
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _sort_collection(
+                effect.collection, effect.key, effect.reverse, fail_fast=True,
+            )))
 
         if isinstance(effect, Take):
-            col = Collection.from_iterable(effect.collection)
-            taken = []
-            count = 0
-            for item in col.all_items:
-                if item.failed:
-                    raise RuntimeError(f"parallel_fail_fast: item {item.index} failed before take")
-                if count < effect.n:
-                    taken.append(item)
-                    count += 1
-            results = [
-                ItemResult(index=i, value=item.value, failed=item.failed, history=list(item.history))
-                for i, item in enumerate(taken)
-            ]
-            return (yield Resume(k, Collection(results)))
+            return (yield Resume(k, _take_collection(effect.collection, effect.n, fail_fast=True)))
 
         yield Pass(effect, k)
 
@@ -187,12 +187,14 @@ fn handler_program(cycles: usize, depth: usize, mode: ResumeMode) -> DoCtrl {
         program = DoCtrl::WithHandler {
             handler: callable_value(PassHandler),
             body: Box::new(program),
+            types: None,
         };
     }
 
     DoCtrl::WithHandler {
         handler: callable_value(ContinueHandler::new(mode)),
         body: Box::new(program),
+        types: None,
     }
 }
 
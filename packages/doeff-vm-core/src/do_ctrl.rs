@@ -5,8 +5,11 @@
 //!
 //! The VM is language-agnostic — no Python types here.
 
+use std::sync::Arc;
+
 use crate::continuation::Continuation;
 use crate::ids::VarId;
+use crate::py_shared::PyShared;
 use crate::value::Value;
 
 /// The VM instruction set. 16 explicit operations.
@@ -53,8 +56,14 @@ pub enum DoCtrl {
     /// Install a handler and execute body.
     /// handler: Value::Callable — called with (effect, k) on perform.
     /// body: DoExpr — evaluated under the handler.
+    /// types: optional effect-type filter; dispatch skips the boundary for
+    /// effects outside it (equivalent to the handler yielding Pass).
     /// OCaml 5: `match_with body handler`
-    WithHandler { handler: Value, body: Box<DoCtrl> },
+    WithHandler {
+        handler: Value,
+        body: Box<DoCtrl>,
+        types: Option<Arc<Vec<PyShared>>>,
+    },
 
     /// Current handler doesn't handle this effect. Re-perform at outer handler.
     /// Handler passes back the effect and continuation it received.
@@ -69,7 +69,7 @@ pub use ir_stream::{IRStream, IRStreamRef, StreamSourceLocation, StreamStep};
 #[cfg(feature = "python_bridge")]
 pub use segment::Fiber;
 #[cfg(feature = "python_bridge")]
-pub use value::{Callable, CallableRef, Value};
+pub use value::{Callable, CallableRef, NativeResolution, OuterHandlers, Value};
 #[cfg(feature = "python_bridge")]
 pub use var_store::VarStore;
 #[cfg(feature = "python_bridge")]
@@ -9,7 +9,8 @@
 //! Extensions (intercept, mask) are on the Handler, not the Fiber.
 //! Pending state (effect, error context) is on VM registers, not the Fiber.
 
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
 
 /// Intercept mode (extension — not in OCaml 5 core).
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -48,6 +49,43 @@ pub struct PromptBoundary {
     pub handled_marker: Marker,
     pub handler: CallableRef,
     pub types: Option<Arc<Vec<PyShared>>>,
+    /// Memoized filter verdicts; present iff `types` is.
+    pub type_verdicts: Option<Arc<TypeVerdicts>>,
+}
+
+/// Per-boundary cache of "does effect class C pass this boundary's type filter".
+///
+/// Keyed by the class object's address. The class is retained alongside the
+/// verdict so the address cannot be recycled by a different class while the
+/// entry is live. Shared (Arc) between clones of the boundary, so a verdict
+/// computed during one dispatch serves every later dispatch of that class.
+#[derive(Debug, Default)]
+pub struct TypeVerdicts {
+    entries: Mutex<HashMap<usize, (PyShared, bool)>>,
+}
+
+impl TypeVerdicts {
+    pub fn get(&self, class_key: usize) -> Option<bool> {
+        let entries = self.entries.lock().ok()?;
+        entries.get(&class_key).map(|(_, verdict)| *verdict)
+    }
+
+    pub fn insert(&self, class_key: usize, class: PyShared, verdict: bool) {
+        if let Ok(mut entries) = self.entries.lock() {
+            entries.insert(class_key, (class, verdict));
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.entries
+            .lock()
+            .map(|entries| entries.len())
+            .unwrap_or(0)
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
 }
 
 #[derive(Debug, Clone)]
@@ -71,12 +109,14 @@ impl Handler {
         handler: CallableRef,
         types: Option<Arc<Vec<PyShared>>>,
     ) -> Self {
+        let type_verdicts = types.as_ref().map(|_| Arc::new(TypeVerdicts::default()));
         Self {
             marker,
             prompt: Some(PromptBoundary {
                 handled_marker,
                 handler,
                 types,
+                type_verdicts,
             }),
             intercept: None,
             mask: None,
@@ -42,12 +42,51 @@ pub trait Callable: Send + Sync + std::fmt::Debug + 'static {
         false
     }
 
+    /// Resolve `effect` inside the step loop instead of being called.
+    ///
+    /// Native handlers (reader/state/writer) answer from their own bindings,
+    /// the VM's `VarStore`, or the bindings of a handler in `outer`, and
+    /// return `Some`; the VM then resumes, throws into, or passes on the
+    /// continuation itself, so no handler frame or DoCtrl is built. `None`
+    /// (the default) dispatches through `call_handler`.
+    fn resolve_native(
+        &self,
+        _effect: &Value,
+        _handler_fiber: crate::ids::FiberId,
+        _store: &mut crate::var_store::VarStore,
+        _outer: &OuterHandlers<'_>,
+    ) -> Option<NativeResolution> {
+        None
+    }
+
     /// Downcast support for bridge layer (e.g., extracting PythonCallable).
     fn as_any(&self) -> &dyn std::any::Any;
 }
 
 pub type CallableRef = Arc<dyn Callable>;
 
+/// Outcome of `Callable::resolve_native` for one dispatched effect.
+#[derive(Debug)]
+pub enum NativeResolution {
+    /// Resume the continuation with a value.
+    Resume(Value),
+    /// Throw an exception into the continuation.
+    Throw(Value),
+    /// Not handled here — re-perform at the next outer handler.
+    Pass,
+}
+
+/// The handlers that a resolving native handler's own performs would reach.
+///
+/// A generator handler reads an outer handler's state by performing an
+/// effect from its own position, outside its boundary. A native handler gets
+/// the same view here, without building the effect's dispatch.
+pub struct OuterHandlers<'a> {
+    pub(crate) segments: &'a crate::arena::FiberArena,
+    /// The resolving handler's parent fiber, where such a perform starts.
+    pub(crate) start: Option<crate::ids::FiberId>,
+}
+
 /// A value that flows through the VM.
 ///
 /// Language-agnostic. No Python-specific variants.
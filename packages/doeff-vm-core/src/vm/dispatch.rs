@@ -13,8 +13,9 @@ use crate::continuation::Continuation;
 use crate::driver::{Signal, StepResult};
 use crate::effect::DispatchEffect;
 use crate::ids::FiberId;
-use crate::segment::{Fiber, Handler};
-use crate::value::{CallableRef, Value};
+use crate::py_shared::PyShared;
+use crate::segment::{Fiber, Handler, PromptBoundary};
+use crate::value::{CallableRef, OuterHandlers, Value};
 use crate::vm::VM;
 
 impl VM {
@@ -244,7 +245,13 @@ impl VM {
         None
     }
 
-    /// Find the first prompt (handler) boundary, skipping interceptors.
+    /// Find the first prompt (handler) boundary whose type filter accepts
+    /// `effect`, skipping interceptors.
+    ///
+    /// A skipped typed boundary stays inside the detached chain (perform detaches
+    /// up to the selected boundary), so it sees later effects after resume —
+    /// the same topology a `Pass` from that handler would produce, without the
+    /// handler call.
     pub(crate) fn find_handler_for_effect(
         &self,
         start: FiberId,
@@ -253,9 +260,10 @@ impl VM {
         let mut cursor = Some(start);
         while let Some(fid) = cursor {
             let seg = self.segments.get(fid)?;
-            if seg.is_prompt_boundary() {
-                let parent = seg.parent;
-                return Some((fid, parent));
+            if let Some(prompt) = seg.handler.as_ref().and_then(|h| h.prompt_boundary()) {
+                if prompt_accepts(prompt, effect) {
+                    return Some((fid, seg.parent));
+                }
             }
             cursor = seg.parent;
         }
@@ -280,6 +288,25 @@ impl VM {
     }
 }
 
+impl<'a> OuterHandlers<'a> {
+    /// Handlers whose type filter accepts `effect`, nearest first: the one a
+    /// perform of `effect` by the resolving handler would reach, then the
+    /// ones each `Pass` would reach in turn. Interceptors are skipped, as in
+    /// `find_handler_for_effect`.
+    pub fn handlers_for<'e>(
+        &'e self,
+        effect: &'e DispatchEffect,
+    ) -> impl Iterator<Item = &'a CallableRef> + 'e {
+        let segments = self.segments;
+        std::iter::successors(self.start, move |fid| segments.get(*fid)?.parent).filter_map(
+            move |fid| {
+                let prompt = segments.get(fid)?.handler.as_ref()?.prompt_boundary()?;
+                prompt_accepts(prompt, effect).then_some(&prompt.handler)
+            },
+        )
+    }
+}
+
 // ---------------------------------------------------------------------------
 // Result types
 // ---------------------------------------------------------------------------
@@ -289,3 +316,35 @@ pub struct PerformResult {
     pub handler_fiber_id: FiberId,
     pub handler_callable: CallableRef,
 }
+
+/// Does a prompt boundary's type filter accept `effect`?
+///
+/// Untyped boundaries accept everything without touching Python. Typed
+/// boundaries accept opaque effects whose class is a subclass of one of the
+/// declared types; the verdict is memoized per (boundary, effect class) in
+/// `PromptBoundary::type_verdicts`, so a deep stack of typed handlers costs one
+/// map lookup per boundary once each class has been dispatched.
+fn prompt_accepts(prompt: &PromptBoundary, effect: &DispatchEffect) -> bool {
+    use pyo3::prelude::*;
+
+    let Some(types) = prompt.types.as_ref() else {
+        return true;
+    };
+    let Value::Opaque(obj) = effect else {
+        return false;
+    };
+    Python::attach(|py| {
+        let class = obj.bind(py).get_type();
+        let class_key = class.as_ptr() as usize;
+        if let Some(verdict) = prompt.type_verdicts.as_ref().and_then(|v| v.get(class_key)) {
+            return verdict;
+        }
+        let verdict = types
+            .iter()
+            .any(|ty| class.is_subclass(ty.bind(py)).unwrap_or(false));
+        if let Some(verdicts) = prompt.type_verdicts.as_ref() {
+            verdicts.insert(class_key, PyShared::new(class.into_any().unbind()), verdict);
+        }
+        verdict
+    })
+}
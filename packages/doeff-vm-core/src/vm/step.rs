@@ -8,6 +8,8 @@
 //! The step machine is a simple loop: take Signal, process it, return next Signal.
 //! No implicit behavior. No Python. No trace state.
 
+use std::sync::Arc;
+
 use crate::continuation::Continuation;
 use crate::do_ctrl::DoCtrl;
 use crate::driver::{Signal, SignalAction, StepResult};
@@ -15,8 +17,9 @@ use crate::error::VMError;
 use crate::frame::{EvalReturnContinuation, Frame};
 use crate::ids::FiberId;
 use crate::ir_stream::StreamStep;
+use crate::py_shared::PyShared;
 use crate::segment::Fiber;
-use crate::value::Value;
+use crate::value::{OuterHandlers, Value};
 use crate::vm::VM;
 
 impl VM {
@@ -254,9 +257,11 @@ impl VM {
                 }
             }
 
-            DoCtrl::WithHandler { handler, body } => {
-                self.eval_with_handler(handler, *body, error_context)
-            }
+            DoCtrl::WithHandler {
+                handler,
+                body,
+                types,
+            } => self.eval_with_handler(handler, *body, types, error_context),
 
             DoCtrl::Pass { effect, k } => {
                 // Inner handler doesn't handle — forward (effect, k) to outer handler.
@@ -399,7 +404,8 @@ impl VM {
     /// frame so that BOTH exits of the deferred evaluation consume it: the
     /// value path moves it onto the resulting Program frame, and the raise
     /// path (step_raise popping the ExpandReturn frame) discontinues the
-    /// perform-site chain with the exception (#492).
+    /// perform-site chain with the exception (#492). A Pure Apply is called in
+    /// place and consumes the handle on the same two exits directly.
     fn eval_expand(
         &mut self,
         expr: DoCtrl,
@@ -410,6 +416,21 @@ impl VM {
             DoCtrl::Pure { value } => {
                 self.push_stream_value(value, handler_k_handle, error_context)
             }
+            DoCtrl::Apply { f, args } => {
+                // The @do / DoCall shape: call the factory now and push its
+                // stream, without the ExpandReturn frame round trip. A raise
+                // takes the exit that popping ExpandReturn would.
+                match apply_pure(*f, args) {
+                    Ok(value) => self.push_stream_value(value, handler_k_handle, error_context),
+                    Err(VMError::UncaughtException { exception }) => match handler_k_handle {
+                        Some(handle) => {
+                            self.recover_from_k_handle(handle, exception, error_context)
+                        }
+                        None => continue_raise(exception, error_context),
+                    },
+                    Err(err) => error_result(err, error_context),
+                }
+            }
             other => {
                 // Push ExpandReturn frame so we intercept the result
                 if let Some(seg_id) = self.current_segment {
@@ -462,43 +483,14 @@ impl VM {
         args: Vec<DoCtrl>,
         error_context: Option<Vec<Value>>,
     ) -> StepResult {
-        // Simple case: f and all args are Pure
-        let f_value = match f {
-            DoCtrl::Pure { value } => value,
-            _ => {
-                return error_result(
-                    VMError::internal("Apply: non-pure f not yet implemented"),
-                    error_context,
-                );
-            }
-        };
-
-        let mut arg_values = Vec::with_capacity(args.len());
-        for arg in args {
-            match arg {
-                DoCtrl::Pure { value } => arg_values.push(value),
-                _ => {
-                    return error_result(
-                        VMError::internal("Apply: non-pure arg not yet implemented"),
-                        error_context,
-                    );
-                }
-            }
-        }
-
-        match f_value {
-            Value::Callable(callable) => {
-                match callable.call(arg_values) {
-                    Ok(result) => continue_send(result, error_context),
-                    Err(VMError::UncaughtException { exception }) => {
-                        // Python exception from callable — propagate through
-                        // generator stack so try/except blocks can catch it.
-                        continue_raise(exception, error_context)
-                    }
-                    Err(err) => error_result(err, error_context),
-                }
-            }
-            _ => error_result(VMError::internal("Apply: f is not callable"), error_context),
+        match apply_pure(f, args) {
+            Ok(result) => continue_send(result, error_context),
+            Err(VMError::UncaughtException { exception }) => {
+                // Python exception from callable — propagate through
+                // generator stack so try/except blocks can catch it.
+                continue_raise(exception, error_context)
+            }
+            Err(err) => error_result(err, error_context),
         }
     }
 
@@ -546,6 +538,19 @@ impl VM {
         let k = result.continuation;
         let handler_callable = result.handler_callable;
 
+        let outer = OuterHandlers {
+            segments: &self.segments,
+            start: self.current_segment,
+        };
+        if let Some(resolution) = handler_callable.resolve_native(
+            &effect,
+            result.handler_fiber_id,
+            &mut self.var_store,
+            &outer,
+        ) {
+            return self.eval_native_resolution(resolution, effect, k, error_context);
+        }
+
         if handler_callable.is_generator_handler() {
             // Generator handler path (Python @do generators): wrap k in a
             // PyK Python object. The PyK is the single home for the chain
@@ -616,6 +621,34 @@ impl VM {
         }
     }
 
+    /// Apply a native handler's resolution to the captured continuation.
+    ///
+    /// Native handlers never push a stream frame onto the handler's parent
+    /// fiber, so nothing is popped here: Resume/Throw reattach `k` like the
+    /// non-tail DoCtrls, and Pass re-performs from the current position
+    /// exactly as `eval_pass` does after popping a generator handler.
+    fn eval_native_resolution(
+        &mut self,
+        resolution: crate::value::NativeResolution,
+        effect: Value,
+        mut k: Continuation,
+        error_context: Option<Vec<Value>>,
+    ) -> StepResult {
+        use crate::value::NativeResolution;
+
+        match resolution {
+            NativeResolution::Resume(value) => match self.continue_k(&mut k) {
+                Ok(()) => continue_send(value, error_context),
+                Err(error) => error_result(error, error_context),
+            },
+            NativeResolution::Throw(exception) => match self.continue_k(&mut k) {
+                Ok(()) => continue_raise(exception, error_context),
+                Err(error) => error_result(error, error_context),
+            },
+            NativeResolution::Pass => self.eval_perform_with_k(effect, k, error_context),
+        }
+    }
+
     /// Recover from a handler-body exception by borrowing the PyK handle,
     /// taking the chain (if the handler didn't consume k), reattaching it,
     /// and raising the exception into the resulting stream. This makes the
@@ -802,6 +835,16 @@ impl VM {
         // Switch to outer handler's parent
         self.current_segment = boundary_parent;
 
+        let outer = OuterHandlers {
+            segments: &self.segments,
+            start: self.current_segment,
+        };
+        if let Some(resolution) =
+            handler_callable.resolve_native(&effect, handler_fiber_id, &mut self.var_store, &outer)
+        {
+            return self.eval_native_resolution(resolution, effect, k, error_context);
+        }
+
         if handler_callable.is_generator_handler() {
             // Generator handler path — see eval_perform for rationale.
             let (k_value, handle) = pyo3::Python::attach(|py| {
@@ -858,6 +901,7 @@ impl VM {
         &mut self,
         handler: Value,
         body: DoCtrl,
+        types: Option<Arc<Vec<PyShared>>>,
         error_context: Option<Vec<Value>>,
     ) -> StepResult {
         let handler_callable = match handler {
@@ -875,7 +919,8 @@ impl VM {
 
         // 1. Create boundary fiber with handler
         let marker = crate::ids::Marker::fresh();
-        let handler_obj = crate::segment::Handler::prompt(marker, marker, handler_callable, None);
+        let handler_obj =
+            crate::segment::Handler::prompt(marker, marker, handler_callable, types);
         let boundary_fid = self.match_with(handler_obj);
 
         // 2. Create a SEPARATE body fiber whose parent is the boundary
@@ -925,6 +970,28 @@ impl VM {
     }
 }
 
+/// Call `f(args)` for an Apply whose callee and arguments are all Pure.
+fn apply_pure(f: DoCtrl, args: Vec<DoCtrl>) -> Result<Value, VMError> {
+    // Simple case: f and all args are Pure
+    let f_value = match f {
+        DoCtrl::Pure { value } => value,
+        _ => return Err(VMError::internal("Apply: non-pure f not yet implemented")),
+    };
+
+    let mut arg_values = Vec::with_capacity(args.len());
+    for arg in args {
+        match arg {
+            DoCtrl::Pure { value } => arg_values.push(value),
+            _ => return Err(VMError::internal("Apply: non-pure arg not yet implemented")),
+        }
+    }
+
+    match f_value {
+        Value::Callable(callable) => callable.call(arg_values),
+        _ => Err(VMError::internal("Apply: f is not callable")),
+    }
+}
+
 fn continue_eval(doctrl: DoCtrl, error_context: Option<Vec<Value>>) -> StepResult {
     StepResult::Continue(Signal::eval(doctrl).with_error_context(error_context))
 }
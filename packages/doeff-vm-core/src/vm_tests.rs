@@ -564,6 +564,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.handler.take().unwrap(),
                         body: self.body.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -658,6 +659,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.handler.take().unwrap(),
                         body: self.body.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -772,6 +774,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.handler.take().unwrap(),
                         body: self.body.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -882,6 +885,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.inner_handler.take().unwrap(),
                         body: self.body.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -906,6 +910,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.outer_handler.take().unwrap(),
                         body: self.inner.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -1040,6 +1045,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.h.take().unwrap(),
                         body: self.b.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -1189,6 +1195,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.h.take().unwrap(),
                         body: self.b.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -1316,6 +1323,7 @@ mod tests {
                     StreamStep::Instruction(DoCtrl::WithHandler {
                         handler: self.h.take().unwrap(),
                         body: self.b.take().unwrap(),
+                        types: None,
                     })
                 } else {
                     StreamStep::Done(value)
@@ -1506,6 +1514,7 @@ mod tests {
                         StreamStep::Instruction(DoCtrl::WithHandler {
                             handler: self.h.take().unwrap(),
                             body: self.b.take().unwrap(),
+                            types: None,
                         })
                     }
                     1 => {
@@ -1572,4 +1581,408 @@ mod tests {
             "stale k handle survived the deferred handler-construction failure"
         );
     }
+
+    // -----------------------------------------------------------------------
+    // Test 15: Native handler — resolved in the step loop against VarStore
+    // -----------------------------------------------------------------------
+
+    #[test]
+    fn test_native_handler_resolves_without_call_handler() {
+        use crate::value::{NativeResolution, OuterHandlers};
+        use crate::var_store::VarStore;
+
+        // "tell" appends to the VM writer log, "count" reads its length,
+        // anything else is passed to the outer handler.
+        #[derive(Debug)]
+        struct NativeLog;
+
+        impl Callable for NativeLog {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+                Err(VMError::internal("NativeLog: not callable"))
+            }
+            fn call_handler(&self, _args: Vec<Value>) -> Result<DoCtrl, VMError> {
+                Err(VMError::internal("NativeLog: must resolve natively"))
+            }
+            fn resolve_native(
+                &self,
+                effect: &Value,
+                handler_fiber: FiberId,
+                store: &mut VarStore,
+                _outer: &OuterHandlers<'_>,
+            ) -> Option<NativeResolution> {
+                let Value::String(name) = effect else {
+                    return Some(NativeResolution::Pass);
+                };
+                Some(match name.as_str() {
+                    "tell" => {
+                        store.append_writer_log(handler_fiber, effect.clone());
+                        NativeResolution::Resume(Value::Unit)
+                    }
+                    "count" => {
+                        let count = store.writer_log(handler_fiber).map_or(0, Vec::len);
+                        NativeResolution::Resume(Value::Int(count as i64))
+                    }
+                    _ => NativeResolution::Pass,
+                })
+            }
+        }
+
+        #[derive(Debug)]
+        struct OuterHandler;
+
+        impl Callable for OuterHandler {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+                Err(VMError::internal("OuterHandler: use call_handler"))
+            }
+            fn call_handler(&self, args: Vec<Value>) -> Result<DoCtrl, VMError> {
+                let k = match args.into_iter().nth(1) {
+                    Some(Value::Continuation(k)) => k,
+                    _ => return Err(VMError::internal("expected k")),
+                };
+                Ok(DoCtrl::Resume {
+                    k,
+                    value: Value::Int(777),
+                })
+            }
+        }
+
+        // Body: tell, tell, count, ask — returns [count, ask].
+        #[derive(Debug)]
+        struct BodyStream {
+            state: u8,
+            seen: Vec<Value>,
+        }
+
+        impl IRStream for BodyStream {
+            fn resume(&mut self, value: Value) -> StreamStep {
+                let effect = match self.state {
+                    0 | 1 => "tell",
+                    2 => "count",
+                    3 => {
+                        self.seen.push(value);
+                        "ask"
+                    }
+                    _ => {
+                        self.seen.push(value);
+                        return StreamStep::Done(Value::List(std::mem::take(&mut self.seen)));
+                    }
+                };
+                self.state += 1;
+                StreamStep::Instruction(DoCtrl::Perform {
+                    effect: Value::String(effect.into()),
+                })
+            }
+            fn throw(&mut self, e: Value) -> StreamStep {
+                StreamStep::Error(e)
+            }
+        }
+
+        #[derive(Debug)]
+        struct Root {
+            body: Option<Box<DoCtrl>>,
+        }
+
+        impl IRStream for Root {
+            fn resume(&mut self, value: Value) -> StreamStep {
+                match self.body.take() {
+                    Some(body) => StreamStep::Instruction(DoCtrl::WithHandler {
+                        handler: Value::Callable(Arc::new(OuterHandler) as CallableRef),
+                        body,
+                        types: None,
+                    }),
+                    None => StreamStep::Done(value),
+                }
+            }
+            fn throw(&mut self, e: Value) -> StreamStep {
+                StreamStep::Error(e)
+            }
+        }
+
+        // WithHandler(outer=777, WithHandler(native, body))
+        let mut vm = setup_vm_with_stream(Root {
+            body: Some(Box::new(DoCtrl::WithHandler {
+                handler: Value::Callable(Arc::new(NativeLog) as CallableRef),
+                body: expand_stream(BodyStream {
+                    state: 0,
+                    seen: Vec::new(),
+                }),
+                types: None,
+            })),
+        });
+
+        let result = run_to_completion(&mut vm);
+        match result {
+            Ok(Value::List(values)) => match values.as_slice() {
+                [Value::Int(2), Value::Int(777)] => {}
+                other => panic!("expected [Int(2), Int(777)], got {:?}", other),
+            },
+            Ok(other) => panic!("expected List, got {:?}", other),
+            Err(err) => panic!("expected Ok, got error: {:?}", err),
+        }
+        assert_eq!(vm.var_store.writer_log(FiberId(0)).map_or(0, Vec::len), 2);
+    }
+
+    // -----------------------------------------------------------------------
+    // Test 16: Expand(Apply(Pure(factory), args)) — the DoCall shape runs
+    // the factory's stream in place; a raising factory throws at the site.
+    // -----------------------------------------------------------------------
+
+    #[test]
+    fn test_expand_apply_pushes_factory_stream_in_place() {
+        /// Returns a stream answering `2 * arg`, or raises for a non-Int arg.
+        #[derive(Debug)]
+        struct Doubler;
+
+        impl Callable for Doubler {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, args: Vec<Value>) -> Result<Value, VMError> {
+                match args.as_slice() {
+                    [Value::Int(n)] => Ok(Value::Stream(IRStreamRef::new(Box::new(
+                        ScriptStream::returning(Value::Int(n * 2)),
+                    )))),
+                    _ => Err(VMError::UncaughtException {
+                        exception: Value::String("bad arity".into()),
+                    }),
+                }
+            }
+        }
+
+        fn call(args: Vec<Value>) -> DoCtrl {
+            DoCtrl::Expand {
+                expr: Box::new(DoCtrl::Apply {
+                    f: Box::new(DoCtrl::Pure {
+                        value: Value::Callable(Arc::new(Doubler) as CallableRef),
+                    }),
+                    args: args
+                        .into_iter()
+                        .map(|value| DoCtrl::Pure { value })
+                        .collect(),
+                }),
+            }
+        }
+
+        #[derive(Debug)]
+        struct Main {
+            state: u8,
+            seen: Vec<Value>,
+        }
+
+        impl IRStream for Main {
+            fn resume(&mut self, value: Value) -> StreamStep {
+                self.state += 1;
+                match self.state {
+                    1 => StreamStep::Instruction(call(vec![Value::Int(21)])),
+                    2 => {
+                        self.seen.push(value);
+                        StreamStep::Instruction(call(vec![]))
+                    }
+                    _ => StreamStep::Done(Value::List(std::mem::take(&mut self.seen))),
+                }
+            }
+            fn throw(&mut self, e: Value) -> StreamStep {
+                self.seen.push(e);
+                StreamStep::Done(Value::List(std::mem::take(&mut self.seen)))
+            }
+        }
+
+        let mut vm = setup_vm_with_stream(Main {
+            state: 0,
+            seen: Vec::new(),
+        });
+
+        match run_to_completion(&mut vm) {
+            Ok(Value::List(values)) => match values.as_slice() {
+                [Value::Int(42), Value::String(msg)] if msg == "bad arity" => {}
+                other => panic!("expected [42, 'bad arity'], got {:?}", other),
+            },
+            other => panic!("expected Ok(List), got {:?}", other),
+        }
+        assert!(no_leaked_k_handle(&vm));
+    }
+
+    // -----------------------------------------------------------------------
+    // Test 17: Native handler — resolves against an outer handler's bindings
+    // -----------------------------------------------------------------------
+
+    #[test]
+    fn test_native_handler_updates_the_outer_handler_its_perform_reaches() {
+        use std::sync::atomic::{AtomicI64, Ordering};
+
+        use crate::value::{NativeResolution, OuterHandlers};
+        use crate::var_store::VarStore;
+
+        /// Answers "get" with its cell; passes everything else.
+        #[derive(Debug, Default)]
+        struct Cell(AtomicI64);
+
+        /// Passes everything.
+        #[derive(Debug)]
+        struct Passer;
+
+        /// Resolves "bump" by incrementing the cell of the first `Cell`
+        /// that a "get" performed from its position would reach.
+        #[derive(Debug)]
+        struct Bumper;
+
+        fn unused_call(name: &str) -> Result<Value, VMError> {
+            Err(VMError::internal(format!("{name}: not callable")))
+        }
+
+        impl Callable for Cell {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+                unused_call("Cell")
+            }
+            fn resolve_native(
+                &self,
+                effect: &Value,
+                _handler_fiber: FiberId,
+                _store: &mut VarStore,
+                _outer: &OuterHandlers<'_>,
+            ) -> Option<NativeResolution> {
+                Some(match effect {
+                    Value::String(name) if name == "get" => {
+                        NativeResolution::Resume(Value::Int(self.0.load(Ordering::SeqCst)))
+                    }
+                    _ => NativeResolution::Pass,
+                })
+            }
+        }
+
+        impl Callable for Passer {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+                unused_call("Passer")
+            }
+            fn resolve_native(
+                &self,
+                _effect: &Value,
+                _handler_fiber: FiberId,
+                _store: &mut VarStore,
+                _outer: &OuterHandlers<'_>,
+            ) -> Option<NativeResolution> {
+                Some(NativeResolution::Pass)
+            }
+        }
+
+        impl Callable for Bumper {
+            fn as_any(&self) -> &dyn std::any::Any {
+                self
+            }
+            fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+                unused_call("Bumper")
+            }
+            fn resolve_native(
+                &self,
+                effect: &Value,
+                _handler_fiber: FiberId,
+                _store: &mut VarStore,
+                outer: &OuterHandlers<'_>,
+            ) -> Option<NativeResolution> {
+                let Value::String(name) = effect else {
+                    return Some(NativeResolution::Pass);
+                };
+                if name != "bump" {
+                    return Some(NativeResolution::Pass);
+                }
+                let probe = Value::String("get".into());
+                let cell = outer
+                    .handlers_for(&probe)
+                    .find_map(|handler| handler.as_any().downcast_ref::<Cell>());
+                Some(match cell {
+                    Some(cell) => {
+                        cell.0.fetch_add(1, Ordering::SeqCst);
+                        NativeResolution::Resume(Value::Unit)
+                    }
+                    None => NativeResolution::Throw(Value::String("no cell".into())),
+                })
+            }
+        }
+
+        // Body: bump, bump, get — returns the value of get.
+        #[derive(Debug)]
+        struct BodyStream {
+            state: u8,
+        }
+
+        impl IRStream for BodyStream {
+            fn resume(&mut self, value: Value) -> StreamStep {
+                self.state += 1;
+                let effect = match self.state {
+                    1 | 2 => "bump",
+                    3 => "get",
+                    _ => return StreamStep::Done(value),
+                };
+                StreamStep::Instruction(DoCtrl::Perform {
+                    effect: Value::String(effect.into()),
+                })
+            }
+            fn throw(&mut self, e: Value) -> StreamStep {
+                StreamStep::Error(e)
+            }
+        }
+
+        /// Runs `program` and returns its value.
+        #[derive(Debug)]
+        struct Root {
+            program: Option<Box<DoCtrl>>,
+        }
+
+        impl IRStream for Root {
+            fn resume(&mut self, value: Value) -> StreamStep {
+                match self.program.take() {
+                    Some(program) => StreamStep::Instruction(*program),
+                    None => StreamStep::Done(value),
+                }
+            }
+            fn throw(&mut self, e: Value) -> StreamStep {
+                StreamStep::Error(e)
+            }
+        }
+
+        fn with_handler(handler: CallableRef, body: Box<DoCtrl>) -> Box<DoCtrl> {
+            Box::new(DoCtrl::WithHandler {
+                handler: Value::Callable(handler),
+                body,
+                types: None,
+            })
+        }
+
+        // WithHandler(outer_cell, WithHandler(inner_cell, WithHandler(Passer,
+        //     WithHandler(Bumper, body)))) — the bumps reach inner_cell only.
+        let outer_cell = Arc::new(Cell::default());
+        let inner_cell = Arc::new(Cell::default());
+        let program = with_handler(
+            outer_cell.clone(),
+            with_handler(
+                inner_cell.clone(),
+                with_handler(
+                    Arc::new(Passer),
+                    with_handler(Arc::new(Bumper), expand_stream(BodyStream { state: 0 })),
+                ),
+            ),
+        );
+        let mut vm = setup_vm_with_stream(Root {
+            program: Some(program),
+        });
+
+        match run_to_completion(&mut vm) {
+            Ok(Value::Int(2)) => {}
+            other => panic!("expected Ok(Int(2)), got {:?}", other),
+        }
+        assert_eq!(inner_cell.0.load(Ordering::SeqCst), 2);
+        assert_eq!(outer_cell.0.load(Ordering::SeqCst), 0);
+    }
 }
@@ -12,6 +12,7 @@ IRStream = _ext.IRStream
 UnhandledEffect = _ext.UnhandledEffect
 Ok = _ext.Ok
 Err = _ext.Err
+NativeHandler = _ext.NativeHandler
 
 # DoExpr pyclasses
 Pure = _ext.Pure
@@ -20,6 +21,7 @@ Resume = _ext.Resume
 Transfer = _ext.Transfer
 Apply = _ext.Apply
 Expand = _ext.Expand
+DoCall = _ext.DoCall
 Pass = _ext.Pass
 WithHandler = _ext.WithHandler
 ResumeThrow = _ext.ResumeThrow
@@ -8,7 +8,7 @@ class UnhandledEffect(RuntimeError): ...  # noqa: N818 - public or fixture excep
 
 class PyVM:
     def __init__(self) -> None: ...
-    def run(self, program: Any) -> Any: ...
+    def run(self, program: Any, *, release_gil: bool = False) -> Any: ...
     def arena_stats(self) -> tuple[int, int, int, int]: ...
 
 # --- Continuation ---
@@ -51,6 +51,18 @@ class Err:
     def __repr__(self) -> str: ...
     def __reduce__(self) -> tuple[Any, tuple[Any, Any]]: ...
 
+class NativeHandler:
+    __name__: str
+    __qualname__: str
+    @staticmethod
+    def reader(ask: type, env: Any, missing_key: Any) -> NativeHandler: ...
+    @staticmethod
+    def state(get: type, put: type, store: dict[Any, Any]) -> NativeHandler: ...
+    @staticmethod
+    def writer(tell: type, log_get: Any, some: type, fallback: Any) -> NativeHandler: ...
+    def __call__(self, effect: Any, k: Any) -> Any: ...
+    def __repr__(self) -> str: ...
+
 # --- DoExpr pyclasses ---
 
 class Pure:
@@ -86,6 +98,20 @@ class Expand:
     def __init__(self, expr: Any) -> None: ...
     def __repr__(self) -> str: ...
 
+class DoCall(Expand):
+    func: Any
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any] | None
+    tail_resume_lines: tuple[int, ...]
+    def __init__(
+        self,
+        func: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any] | None = None,
+        tail_resume_lines: Any = None,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+
 class Pass:
     effect: Any
     continuation: K
@@ -95,7 +121,8 @@ class Pass:
 class WithHandler:
     handler: Any
     body: Any
-    def __init__(self, handler: Any, body: Any) -> None: ...
+    types: tuple[type, ...] | None
+    def __init__(self, handler: Any, body: Any, types: Any = None) -> None: ...
     def __repr__(self) -> str: ...
 
 class ResumeThrow:
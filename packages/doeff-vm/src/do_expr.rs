@@ -25,6 +25,7 @@
 use doeff_vm_core::continuation::PyK;
 use pyo3::prelude::*;
 use pyo3::pyclass::{PyTraverseError, PyVisit};
+use pyo3::types::{PyDict, PyTuple, PyType};
 
 /// Pure(value) — return a value immediately.
 #[pyclass(name = "Pure", frozen, dict, module = "doeff_vm.doeff_vm")]
@@ -174,7 +175,7 @@ impl PyApply {
 }
 
 /// Expand(expr) — evaluate inner expr to Stream, then run it.
-#[pyclass(name = "Expand", frozen, dict, module = "doeff_vm.doeff_vm")]
+#[pyclass(name = "Expand", frozen, dict, subclass, module = "doeff_vm.doeff_vm")]
 pub struct PyExpand {
     #[pyo3(get)]
     pub expr: Py<PyAny>,
@@ -201,6 +202,90 @@ impl PyExpand {
     }
 }
 
+/// DoCall(fn, args, kwargs, tail_resume_lines) — call `fn(*args, **kwargs)`
+/// when evaluated and run the generator it returns.
+///
+/// The node `@do` functions and `program()` return: one object per call in
+/// place of the `Expand(Apply(Pure(Callable(thunk)), []))` tree. It is an
+/// `Expand` (whose `expr` is None), so existing `isinstance` checks hold. A
+/// non-generator result becomes the program's value.
+#[pyclass(name = "DoCall", frozen, extends = PyExpand, module = "doeff_vm.doeff_vm")]
+pub struct PyDoCall {
+    #[pyo3(get)]
+    pub func: Py<PyAny>,
+    #[pyo3(get)]
+    pub args: Py<PyTuple>,
+    /// None when called without keyword arguments.
+    #[pyo3(get)]
+    pub kwargs: Option<Py<PyDict>>,
+    pub tail_resume_lines: Vec<u32>,
+}
+
+#[pymethods]
+impl PyDoCall {
+    #[new]
+    #[pyo3(signature = (func, args, kwargs=None, tail_resume_lines=None))]
+    fn new(
+        py: Python<'_>,
+        func: Py<PyAny>,
+        args: Py<PyTuple>,
+        kwargs: Option<Py<PyDict>>,
+        tail_resume_lines: Option<Vec<u32>>,
+    ) -> PyClassInitializer<Self> {
+        PyClassInitializer::from(PyExpand { expr: py.None() }).add_subclass(Self {
+            func,
+            args,
+            kwargs: kwargs.filter(|kwargs| !kwargs.bind(py).is_empty()),
+            tail_resume_lines: tail_resume_lines.unwrap_or_default(),
+        })
+    }
+
+    #[getter]
+    fn tail_resume_lines<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        PyTuple::new(py, &self.tail_resume_lines)
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> String {
+        let name = self
+            .func
+            .bind(py)
+            .getattr("__qualname__")
+            .and_then(|name| name.extract::<String>())
+            .unwrap_or_else(|_| "<callable>".to_string());
+        format!("DoCall({name}, ...)")
+    }
+
+    #[allow(clippy::type_complexity)]
+    fn __reduce__(
+        &self,
+        py: Python<'_>,
+    ) -> PyResult<(
+        Py<PyAny>,
+        (Py<PyAny>, Py<PyTuple>, Option<Py<PyDict>>, Py<PyTuple>),
+    )> {
+        let cls = py.get_type::<Self>().into_any().unbind();
+        let lines = PyTuple::new(py, &self.tail_resume_lines)?.unbind();
+        Ok((
+            cls,
+            (
+                self.func.clone_ref(py),
+                self.args.clone_ref(py),
+                self.kwargs.as_ref().map(|kwargs| kwargs.clone_ref(py)),
+                lines,
+            ),
+        ))
+    }
+
+    fn __traverse__(&self, visit: PyVisit<'_>) -> Result<(), PyTraverseError> {
+        visit.call(&self.func)?;
+        visit.call(&self.args)?;
+        if let Some(kwargs) = &self.kwargs {
+            visit.call(kwargs)?;
+        }
+        Ok(())
+    }
+}
+
 /// Pass(effect, k) — handler doesn't handle, forward to outer.
 #[pyclass(name = "Pass", frozen, dict, module = "doeff_vm.doeff_vm")]
 pub struct PyPass {
@@ -230,19 +315,26 @@ impl PyPass {
     }
 }
 
-/// WithHandler(handler, body) — install handler and run body under it.
+/// WithHandler(handler, body, types=None) — install handler and run body under it.
+///
+/// `types`, when given, is a tuple of effect classes the handler accepts. The VM
+/// skips the boundary during dispatch for effects that are not instances of any
+/// of them, exactly as if the handler had yielded `Pass(effect, k)`.
 #[pyclass(name = "WithHandler", frozen, dict, module = "doeff_vm.doeff_vm")]
 pub struct PyWithHandler {
     #[pyo3(get)]
     pub handler: Py<PyAny>,
     #[pyo3(get)]
     pub body: Py<PyAny>,
+    #[pyo3(get)]
+    pub types: Option<Py<PyTuple>>,
 }
 
 #[pymethods]
 impl PyWithHandler {
     #[new]
-    fn new(handler: Py<PyAny>, body: Py<PyAny>) -> PyResult<Self> {
+    #[pyo3(signature = (handler, body, types=None))]
+    fn new(handler: Py<PyAny>, body: Py<PyAny>, types: Option<Py<PyAny>>) -> PyResult<Self> {
         Python::attach(|py| {
             let h = handler.bind(py);
             if !h.is_callable() {
@@ -256,23 +348,84 @@ impl PyWithHandler {
                     type_name,
                 )));
             }
-            Ok(Self { handler, body })
+            let types = match types {
+                None => None,
+                Some(raw) => Some(effect_type_tuple(py, raw.bind(py))?),
+            };
+            Ok(Self {
+                handler,
+                body,
+                types,
+            })
         })
     }
 
     fn __repr__(&self) -> &'static str {
-        "WithHandler(handler, body)"
+        if self.types.is_some() {
+            "WithHandler(handler, body, types)"
+        } else {
+            "WithHandler(handler, body)"
+        }
     }
 
-    fn __reduce__(&self, py: Python<'_>) -> PyResult<(Py<PyAny>, (Py<PyAny>, Py<PyAny>))> {
+    fn __reduce__(
+        &self,
+        py: Python<'_>,
+    ) -> PyResult<(Py<PyAny>, (Py<PyAny>, Py<PyAny>, Option<Py<PyTuple>>))> {
         let cls = py.get_type::<Self>().into_any().unbind();
-        Ok((cls, (self.handler.clone_ref(py), self.body.clone_ref(py))))
+        Ok((
+            cls,
+            (
+                self.handler.clone_ref(py),
+                self.body.clone_ref(py),
+                self.types.as_ref().map(|t| t.clone_ref(py)),
+            ),
+        ))
     }
 
     fn __traverse__(&self, visit: PyVisit<'_>) -> Result<(), PyTraverseError> {
         visit.call(&self.handler)?;
-        visit.call(&self.body)
+        visit.call(&self.body)?;
+        if let Some(types) = &self.types {
+            visit.call(types)?;
+        }
+        Ok(())
+    }
+}
+
+/// Normalize a WithHandler `types` argument (a class or an iterable of classes)
+/// into a non-empty tuple of classes.
+fn effect_type_tuple(py: Python<'_>, raw: &Bound<'_, PyAny>) -> PyResult<Py<PyTuple>> {
+    let items: Vec<Bound<'_, PyAny>> = if raw.is_instance_of::<PyType>() {
+        vec![raw.clone()]
+    } else {
+        raw.try_iter()
+            .map_err(|_| {
+                pyo3::exceptions::PyTypeError::new_err(
+                    "WithHandler: types must be a class or an iterable of classes",
+                )
+            })?
+            .collect::<PyResult<_>>()?
+    };
+    if items.is_empty() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "WithHandler: types must name at least one effect class",
+        ));
+    }
+    for item in &items {
+        if !item.is_instance_of::<PyType>() {
+            let type_name = item
+                .get_type()
+                .qualname()
+                .map(|s| s.to_string())
+                .unwrap_or_else(|_| "?".to_string());
+            return Err(pyo3::exceptions::PyTypeError::new_err(format!(
+                "WithHandler: types entries must be classes, got {}",
+                type_name,
+            )));
+        }
     }
+    Ok(PyTuple::new(py, items)?.unbind())
 }
 
 /// ResumeThrow(k, exception) — throw exception into continuation (non-tail).
@@ -5,11 +5,14 @@
 //!   - PythonGeneratorStream: Python generator → IRStream adapter
 //!   - classify_yielded: Python object → DoCtrl conversion
 //!   - Value ↔ Python conversion
+//!   - NativeHandler: reader/state/writer resolved inside the VM
+//!   - DoCall: the `@do` call node, expanded straight into a generator frame
 //!   - run() entry point
 
 use pyo3::prelude::*;
 
 pub mod do_expr;
+pub mod native_handler;
 pub mod python_generator_stream;
 pub mod pyvm;
 pub mod result;
@@ -23,7 +26,10 @@ pub use doeff_vm_core::{
     SignalAction, StepResult, StreamStep, VMError, Value, VarId, VarStore, VM,
 };
 
-#[pymodule]
+// All process-global VM state (id counters, memory stats) is atomic and each
+// PyVM is exclusively borrowed for the duration of a run, so the module is
+// safe to import without re-enabling the GIL on free-threaded builds.
+#[pymodule(gil_used = false)]
 fn doeff_vm(m: &Bound<'_, PyModule>) -> PyResult<()> {
     pyvm::register_pyvm(m)?;
 
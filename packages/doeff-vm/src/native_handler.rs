@@ -0,0 +1,321 @@
+//! NativeHandler — reader/state/writer handlers resolved inside the VM.
+//!
+//! `doeff_core_effects.handlers` installs these in place of its Python
+//! generator handlers when the extension provides them. During dispatch the
+//! VM calls `resolve_native` instead of the handler: the effect is classified
+//! with one `isinstance` per handled class, answered from the handler's
+//! bindings, and the continuation is resumed directly. An access builds no
+//! generator, no handler frame, and no Transfer.
+//!
+//! Semantics follow the Python handlers:
+//!   - reader: `Ask(key)` resumes with `env[key]`; a missing key throws the
+//!     exception returned by `missing_key(key)` into the asking program.
+//!   - state: `Get(key)` resumes with `store.get(key)`, `Put(key, value)`
+//!     stores and resumes with None. The store dict belongs to the handler
+//!     instance, so it lives as long as the installer, like the closure dict
+//!     of the Python handler. Every key is an ordinary entry, including the
+//!     one the writer keeps its log under.
+//!   - writer: `Tell(msg)` appends to the `Some(list)` log under the log key
+//!     in the store of the state handler that the writer's own
+//!     `Get(log_key)` would reach, creating it on the first Tell, and resumes
+//!     with None. When that handler is not a native state handler (a custom
+//!     Get handler, or none at all) the Tell goes to the Python generator
+//!     writer instead, which performs the Get/Put itself.
+//!
+//! Other effects are passed to the next outer handler. A Python error raised
+//! while resolving (an unhashable key, say) is thrown into the performing
+//! program, as it would be from a Python handler body.
+
+use pyo3::exceptions::PyTypeError;
+use pyo3::intern;
+use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList, PyType};
+
+use doeff_vm_core::py_shared::PyShared;
+use doeff_vm_core::value::{Callable, CallableRef, NativeResolution, OuterHandlers};
+use doeff_vm_core::{FiberId, VMError, Value, VarStore};
+
+use crate::python_generator_stream::{python_to_value, PythonCallable};
+
+#[derive(Debug)]
+enum NativeKind {
+    Reader {
+        ask: Py<PyType>,
+        env: Py<PyAny>,
+        missing_key: Py<PyAny>,
+    },
+    State {
+        get: Py<PyType>,
+        put: Py<PyType>,
+        store: Py<PyDict>,
+    },
+    Writer {
+        tell: Py<PyType>,
+        /// `Get(log_key)`: finds the owning state handler, and its key is
+        /// the log's key in that handler's store.
+        log_get: PyShared,
+        some: Py<PyType>,
+        fallback: PythonCallable,
+    },
+}
+
+/// The VM-side handler. Shared by every `PyNativeHandler` that wraps it, so
+/// handlers reinstalled from `GetHandlers` (Spawn, Try, Local, ...) keep the
+/// same state.
+#[derive(Debug)]
+pub struct NativeHandler {
+    name: &'static str,
+    kind: NativeKind,
+}
+
+impl NativeHandler {
+    /// `None` hands the effect to `call_handler`.
+    fn resolve(
+        &self,
+        py: Python<'_>,
+        effect: &Bound<'_, PyAny>,
+        outer: &OuterHandlers<'_>,
+    ) -> PyResult<Option<NativeResolution>> {
+        match &self.kind {
+            NativeKind::Reader {
+                ask,
+                env,
+                missing_key,
+            } => {
+                if !effect.is_instance(ask.bind(py).as_any())? {
+                    return Ok(Some(NativeResolution::Pass));
+                }
+                let key = effect.getattr(intern!(py, "key"))?;
+                Ok(Some(match env_lookup(env.bind(py), &key)? {
+                    Some(value) => resume(py, &value),
+                    None => NativeResolution::Throw(opaque(missing_key.bind(py).call1((key,))?)),
+                }))
+            }
+            NativeKind::State { get, put, store } => {
+                if effect.is_instance(get.bind(py).as_any())? {
+                    let key = effect.getattr(intern!(py, "key"))?;
+                    return Ok(Some(match store.bind(py).get_item(&key)? {
+                        Some(value) => resume(py, &value),
+                        None => resume_none(py),
+                    }));
+                }
+                if effect.is_instance(put.bind(py).as_any())? {
+                    let key = effect.getattr(intern!(py, "key"))?;
+                    let value = effect.getattr(intern!(py, "value"))?;
+                    store.bind(py).set_item(key, value)?;
+                    return Ok(Some(resume_none(py)));
+                }
+                Ok(Some(NativeResolution::Pass))
+            }
+            NativeKind::Writer {
+                tell,
+                log_get,
+                some,
+                ..
+            } => {
+                if !effect.is_instance(tell.bind(py).as_any())? {
+                    return Ok(Some(NativeResolution::Pass));
+                }
+                let Some(store) = owning_store(py, log_get, outer)? else {
+                    return Ok(None);
+                };
+                let key = log_get.bind(py).getattr(intern!(py, "key"))?;
+                let msg = effect.getattr(intern!(py, "msg"))?;
+                let some = some.bind(py);
+                match store.get_item(&key)? {
+                    Some(cached) if cached.is_instance(some.as_any())? => {
+                        cached
+                            .getattr(intern!(py, "value"))?
+                            .call_method1(intern!(py, "append"), (msg,))?;
+                    }
+                    _ => store.set_item(key, some.call1((PyList::new(py, [msg])?,))?)?,
+                }
+                Ok(Some(resume_none(py)))
+            }
+        }
+    }
+}
+
+/// The store of the native state handler that answers `log_get` performed
+/// from the writer's position, or None when a non-native handler would see
+/// it first (or nothing would). Native handlers that would pass the Get on
+/// are skipped, as the dispatch would skip them.
+fn owning_store<'py>(
+    py: Python<'py>,
+    log_get: &PyShared,
+    outer: &OuterHandlers<'_>,
+) -> PyResult<Option<Bound<'py, PyDict>>> {
+    let probe = Value::Opaque(log_get.clone());
+    for handler in outer.handlers_for(&probe) {
+        let Some(native) = handler.as_any().downcast_ref::<NativeHandler>() else {
+            return Ok(None);
+        };
+        if let NativeKind::State { get, store, .. } = &native.kind {
+            if log_get.bind(py).is_instance(get.bind(py).as_any())? {
+                return Ok(Some(store.bind(py).clone()));
+            }
+        }
+    }
+    Ok(None)
+}
+
+impl Callable for NativeHandler {
+    fn call(&self, _args: Vec<Value>) -> Result<Value, VMError> {
+        Err(VMError::type_error(format!(
+            "native {} handler is not callable",
+            self.name
+        )))
+    }
+
+    /// Only the writer gets here, for a Tell it could not resolve natively.
+    fn call_handler(&self, args: Vec<Value>) -> Result<doeff_vm_core::DoCtrl, VMError> {
+        match &self.kind {
+            NativeKind::Writer { fallback, .. } => fallback.call_handler(args),
+            _ => Err(VMError::internal(format!(
+                "native {} handler must be resolved by the VM",
+                self.name
+            ))),
+        }
+    }
+
+    fn name(&self) -> Option<String> {
+        Some(self.name.to_string())
+    }
+
+    fn is_generator_handler(&self) -> bool {
+        matches!(self.kind, NativeKind::Writer { .. })
+    }
+
+    fn resolve_native(
+        &self,
+        effect: &Value,
+        _handler_fiber: FiberId,
+        _store: &mut VarStore,
+        outer: &OuterHandlers<'_>,
+    ) -> Option<NativeResolution> {
+        let Value::Opaque(obj) = effect else {
+            return Some(NativeResolution::Pass);
+        };
+        Python::attach(|py| {
+            self.resolve(py, obj.bind(py), outer).unwrap_or_else(|err| {
+                Some(NativeResolution::Throw(opaque(
+                    err.value(py).clone().into_any(),
+                )))
+            })
+        })
+    }
+
+    fn as_any(&self) -> &dyn std::any::Any {
+        self
+    }
+}
+
+fn opaque(obj: Bound<'_, PyAny>) -> Value {
+    Value::Opaque(PyShared::new(obj.unbind()))
+}
+
+fn resume(py: Python<'_>, value: &Bound<'_, PyAny>) -> NativeResolution {
+    NativeResolution::Resume(python_to_value(py, value))
+}
+
+fn resume_none(py: Python<'_>) -> NativeResolution {
+    NativeResolution::Resume(Value::Opaque(PyShared::new(py.None())))
+}
+
+/// `env[key]` if `key in env`, reading a plain dict without `__contains__`.
+fn env_lookup<'py>(
+    env: &Bound<'py, PyAny>,
+    key: &Bound<'py, PyAny>,
+) -> PyResult<Option<Bound<'py, PyAny>>> {
+    if let Ok(dict) = env.downcast_exact::<PyDict>() {
+        return dict.get_item(key);
+    }
+    if env.contains(key)? {
+        return env.get_item(key).map(Some);
+    }
+    Ok(None)
+}
+
+/// Python handle on a native handler. Install it like a raw handler
+/// (`doeff.handler(native, types=...)` or `WithHandler(native, body)`).
+#[pyclass(name = "NativeHandler", module = "doeff_vm.doeff_vm", frozen)]
+#[derive(Debug)]
+pub struct PyNativeHandler {
+    pub handler: CallableRef,
+}
+
+impl PyNativeHandler {
+    fn wrap(name: &'static str, kind: NativeKind) -> Self {
+        Self {
+            handler: std::sync::Arc::new(NativeHandler { name, kind }),
+        }
+    }
+
+    fn native(&self) -> &NativeHandler {
+        self.handler
+            .as_any()
+            .downcast_ref::<NativeHandler>()
+            .expect("PyNativeHandler always wraps a NativeHandler")
+    }
+}
+
+#[pymethods]
+impl PyNativeHandler {
+    /// Resolve `ask` effects from `env`; `missing_key(key)` builds the
+    /// exception thrown for an absent key.
+    #[staticmethod]
+    fn reader(ask: Py<PyType>, env: Py<PyAny>, missing_key: Py<PyAny>) -> Self {
+        Self::wrap(
+            "reader",
+            NativeKind::Reader {
+                ask,
+                env,
+                missing_key,
+            },
+        )
+    }
+
+    /// Resolve `get`/`put` effects against `store`, which the handler owns
+    /// from now on.
+    #[staticmethod]
+    fn state(get: Py<PyType>, put: Py<PyType>, store: Py<PyDict>) -> Self {
+        Self::wrap("state", NativeKind::State { get, put, store })
+    }
+
+    /// Resolve `tell` effects by appending `msg` to the `some(list)` log
+    /// under `log_get.key` in the owning native state handler's store;
+    /// `fallback` handles a Tell whose `log_get` another handler answers.
+    #[staticmethod]
+    fn writer(tell: Py<PyType>, log_get: Py<PyAny>, some: Py<PyType>, fallback: Py<PyAny>) -> Self {
+        Self::wrap(
+            "writer",
+            NativeKind::Writer {
+                tell,
+                log_get: PyShared::new(log_get),
+                some,
+                fallback: PythonCallable::new(fallback),
+            },
+        )
+    }
+
+    #[getter(__name__)]
+    fn name(&self) -> &'static str {
+        self.native().name
+    }
+
+    #[getter(__qualname__)]
+    fn qualname(&self) -> &'static str {
+        self.native().name
+    }
+
+    fn __call__(&self, _effect: Py<PyAny>, _k: Py<PyAny>) -> PyResult<Py<PyAny>> {
+        Err(PyTypeError::new_err(format!(
+            "native {} handler runs inside the VM; install it with WithHandler",
+            self.native().name
+        )))
+    }
+
+    fn __repr__(&self) -> String {
+        format!("NativeHandler({})", self.native().name)
+    }
+}
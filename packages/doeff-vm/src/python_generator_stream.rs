@@ -8,13 +8,17 @@
 use pyo3::exceptions::PyStopIteration;
 use pyo3::prelude::*;
 use pyo3::pyclass::{PyTraverseError, PyVisit};
-use pyo3::types::PyString;
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyString, PyType};
 
 use doeff_vm_core::do_ctrl::DoCtrl;
-use doeff_vm_core::ir_stream::{IRStream, StreamStep};
+use doeff_vm_core::ir_stream::{IRStream, IRStreamRef, StreamStep};
 use doeff_vm_core::py_shared::PyShared;
 use doeff_vm_core::value::Value;
 
+use crate::do_expr::PyDoCall;
+use crate::native_handler::{NativeHandler, PyNativeHandler};
+
 /// Base class for Python effects. Subclass this in Python to define effects.
 /// The Rust side uses `is_instance_of::<PyEffectBase>()` for classification.
 ///
@@ -165,6 +169,87 @@ impl doeff_vm_core::value::Callable for PythonCallable {
     }
 }
 
+/// The callable a `DoCall` node classifies to, as the `f` of
+/// `Expand(Apply(Pure(f), []))`. Calling it runs `fn(*args, **kwargs)` and
+/// wraps the generator as a PythonGeneratorStream directly, with no
+/// intermediate Python thunk or IRStream object.
+#[derive(Debug)]
+pub struct DoCallFactory {
+    call: Py<PyDoCall>,
+}
+
+impl doeff_vm_core::value::Callable for DoCallFactory {
+    fn call(&self, _args: Vec<Value>) -> Result<Value, doeff_vm_core::VMError> {
+        Python::attach(|py| {
+            let call = self.call.get();
+            let kwargs = call.kwargs.as_ref().map(|kwargs| kwargs.bind(py));
+            match call.func.bind(py).call(call.args.bind(py), kwargs) {
+                Ok(result) => do_call_stream(py, result, &call.tail_resume_lines),
+                Err(err) => Err(doeff_vm_core::VMError::uncaught_exception(Value::Opaque(
+                    PyShared::new(err.value(py).clone().into_any().unbind()),
+                ))),
+            }
+        })
+    }
+
+    fn name(&self) -> Option<String> {
+        Python::attach(|py| {
+            let obj = self.call.get().func.bind(py);
+            obj.getattr("__qualname__")
+                .or_else(|_| obj.getattr("__name__"))
+                .ok()
+                .and_then(|n| n.extract::<String>().ok())
+        })
+    }
+
+    fn as_any(&self) -> &dyn std::any::Any {
+        self
+    }
+}
+
+static GENERATOR_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
+
+/// The stream for a DoCall result: the generator itself, or for a plain
+/// return value a stream that finishes with it.
+fn do_call_stream(
+    py: Python<'_>,
+    result: Bound<'_, PyAny>,
+    tail_resume_lines: &[u32],
+) -> Result<Value, doeff_vm_core::VMError> {
+    let generator_type = GENERATOR_TYPE
+        .import(py, "types", "GeneratorType")
+        .map_err(|e| doeff_vm_core::VMError::python_error(format!("{e}")))?;
+    let is_generator = result.is_instance(generator_type.as_any()).unwrap_or(false);
+    let stream: Box<dyn IRStream> = if is_generator {
+        Box::new(PythonGeneratorStream::new(
+            PyShared::new(result.unbind()),
+            tail_resume_lines.to_vec(),
+        ))
+    } else {
+        Box::new(ReturnedValueStream {
+            value: Some(python_to_value(py, &result)),
+        })
+    };
+    Ok(Value::Stream(IRStreamRef::new(stream)))
+}
+
+/// A `@do` function that returned without yielding: done on the first step.
+#[derive(Debug)]
+struct ReturnedValueStream {
+    value: Option<Value>,
+}
+
+impl IRStream for ReturnedValueStream {
+    fn resume(&mut self, _value: Value) -> StreamStep {
+        StreamStep::Done(self.value.take().unwrap_or(Value::Unit))
+    }
+
+    fn throw(&mut self, error: Value) -> StreamStep {
+        self.value = None;
+        StreamStep::Error(error)
+    }
+}
+
 /// Python-visible wrapper: creates a PythonGeneratorStream from a generator.
 /// Recognized by python_to_value → Value::Stream.
 #[pyclass(name = "IRStream", module = "doeff_vm.doeff_vm")]
@@ -556,7 +641,13 @@ fn continuation_boundaries_value(
 }
 
 /// Wrap a handler callable as Value::Callable.
+///
+/// A `NativeHandler` contributes its shared VM-side handler instead of a
+/// Python call wrapper, so the VM resolves its effects natively.
 fn wrap_handler(py: Python<'_>, handler: &Py<PyAny>) -> Value {
+    if let Ok(native) = handler.bind(py).downcast::<PyNativeHandler>() {
+        return Value::Callable(native.get().handler.clone());
+    }
     let callable = PythonCallable::new(handler.clone_ref(py));
     Value::Callable(std::sync::Arc::new(callable) as doeff_vm_core::value::CallableRef)
 }
@@ -612,6 +703,22 @@ pub fn classify_python_object(py: Python<'_>, obj: &Bound<'_, PyAny>) -> Result<
             args,
         });
     }
+    // DoCall is an Expand subclass: classify it before Expand.
+    if let Ok(call) = obj.downcast::<PyDoCall>() {
+        let factory = DoCallFactory {
+            call: call.clone().unbind(),
+        };
+        return Ok(DoCtrl::Expand {
+            expr: Box::new(DoCtrl::Apply {
+                f: Box::new(DoCtrl::Pure {
+                    value: Value::Callable(
+                        std::sync::Arc::new(factory) as doeff_vm_core::value::CallableRef
+                    ),
+                }),
+                args: Vec::new(),
+            }),
+        });
+    }
     if let Ok(e) = obj.downcast::<PyExpand>() {
         let expr_doctrl = classify_python_object(py, &e.get().expr.bind(py))?;
         return Ok(DoCtrl::Expand {
@@ -629,9 +736,19 @@ pub fn classify_python_object(py: Python<'_>, obj: &Bound<'_, PyAny>) -> Result<
         let handler_value = wrap_handler(py, &wh.handler);
         let body_doctrl = classify_python_object(py, &wh.body.bind(py))
             .map_err(|e| format!("WithHandler body: {}", e))?;
+        let types = wh.types.as_ref().map(|types| {
+            std::sync::Arc::new(
+                types
+                    .bind(py)
+                    .iter()
+                    .map(|ty| PyShared::new(ty.unbind()))
+                    .collect::<Vec<_>>(),
+            )
+        });
         return Ok(DoCtrl::WithHandler {
             handler: handler_value,
             body: Box::new(body_doctrl),
+            types,
         });
     }
     if let Ok(rt) = obj.downcast::<PyResumeThrow>() {
@@ -769,10 +886,7 @@ fn classify_tagged_to_doctrl(
             let handler_obj = obj
                 .getattr("handler")
                 .map_err(|_| "WithHandler: missing 'handler' attribute".to_string())?;
-            let handler_callable = PythonCallable::new(handler_obj.unbind());
-            let handler_value = Value::Callable(
-                std::sync::Arc::new(handler_callable) as doeff_vm_core::value::CallableRef
-            );
+            let handler_value = wrap_handler(py, &handler_obj.unbind());
             let body_obj = obj
                 .getattr("body")
                 .map_err(|_| "WithHandler: missing 'body' attribute".to_string())?;
@@ -781,6 +895,7 @@ fn classify_tagged_to_doctrl(
             Ok(DoCtrl::WithHandler {
                 handler: handler_value,
                 body: Box::new(body_doctrl),
+                types: None,
             })
         }
         21 => extract_continuation_and_exception(py, obj, "ResumeThrow")
@@ -962,6 +1077,10 @@ pub fn python_to_value(_py: Python<'_>, obj: &Bound<'_, PyAny>) -> Value {
         let callable = PythonCallable::new(inner);
         return Value::Callable(std::sync::Arc::new(callable) as doeff_vm_core::value::CallableRef);
     }
+    // NativeHandler pyclass → Value::Callable (shared VM-side handler)
+    if let Ok(native) = obj.downcast::<PyNativeHandler>() {
+        return Value::Callable(native.get().handler.clone());
+    }
     // PyK → Value::Continuation
     if let Ok(k) = obj.downcast::<doeff_vm_core::continuation::PyK>() {
         let mut k_borrowed = k.borrow_mut();
@@ -1009,6 +1128,10 @@ pub fn value_to_python(py: Python<'_>, value: Value) -> Bound<'_, PyAny> {
         Value::Callable(c) => {
             if let Some(pc) = c.as_any().downcast_ref::<PythonCallable>() {
                 pc.callable.bind(py).clone().into_any()
+            } else if c.as_any().is::<NativeHandler>() {
+                Bound::new(py, PyNativeHandler { handler: c })
+                    .unwrap()
+                    .into_any()
             } else {
                 "<callable>".into_pyobject(py).unwrap().into_any()
             }
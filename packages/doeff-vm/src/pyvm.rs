@@ -36,9 +36,23 @@ impl PyVM {
 
     /// Run a DoExpr program to completion.
     /// `program` must be a DoExpr (Python object with `tag` attribute).
-    fn run(&mut self, py: Python<'_>, program: Py<PyAny>) -> PyResult<Py<PyAny>> {
+    ///
+    /// With `release_gil=True` the step loop runs detached from the
+    /// interpreter: VM-internal transitions (Pure/Apply/Resume/Transfer,
+    /// fiber and continuation bookkeeping) execute without the GIL, which is
+    /// re-acquired only around calls into Python (generator resumes, Python
+    /// callables, effect conversion). This lets independent programs on
+    /// other threads make progress — and run in parallel on free-threaded
+    /// builds — at the cost of one attach per Python call.
+    #[pyo3(signature = (program, *, release_gil=false))]
+    fn run(
+        &mut self,
+        py: Python<'_>,
+        program: Py<PyAny>,
+        release_gil: bool,
+    ) -> PyResult<Py<PyAny>> {
         let doctrl = classify_program(py, &program)?;
-        self.run_doctrl(py, doctrl)
+        self.run_doctrl(py, doctrl, release_gil)
     }
 
     /// Return arena diagnostics: (live_fibers, slot_count, free_list_len, var_cells).
@@ -54,7 +68,12 @@ impl PyVM {
 
 impl PyVM {
     /// Run a DoCtrl to completion.
-    fn run_doctrl(&mut self, py: Python<'_>, doctrl: DoCtrl) -> PyResult<Py<PyAny>> {
+    fn run_doctrl(
+        &mut self,
+        py: Python<'_>,
+        doctrl: DoCtrl,
+        release_gil: bool,
+    ) -> PyResult<Py<PyAny>> {
         self.vm.begin_run_session();
 
         // Create root fiber
@@ -62,7 +81,14 @@ impl PyVM {
         let root_fid = self.vm.alloc_segment(root_fiber);
         self.vm.current_segment = Some(root_fid);
 
-        let result = self.step_loop(Signal::eval(doctrl))?;
+        let signal = Signal::eval(doctrl);
+        let result = if release_gil {
+            // Every Python touch point inside the VM already goes through
+            // Python::attach, so the loop is sound without the GIL held.
+            py.detach(|| self.step_loop(signal))?
+        } else {
+            self.step_loop(signal)?
+        };
         self.vm.end_active_run_session();
 
         Ok(value_to_python(py, result).unbind())
@@ -385,6 +411,7 @@ pub fn register_pyvm(m: &Bound<'_, pyo3::types::PyModule>) -> PyResult<()> {
     m.add_class::<crate::python_generator_stream::PyIRStream>()?;
     m.add_class::<crate::result::PyResultOk>()?;
     m.add_class::<crate::result::PyResultErr>()?;
+    m.add_class::<crate::native_handler::PyNativeHandler>()?;
     // DoExpr pyclasses
     m.add_class::<crate::do_expr::PyPure>()?;
     m.add_class::<crate::do_expr::PyPerform>()?;
@@ -392,6 +419,7 @@ pub fn register_pyvm(m: &Bound<'_, pyo3::types::PyModule>) -> PyResult<()> {
     m.add_class::<crate::do_expr::PyTransfer>()?;
     m.add_class::<crate::do_expr::PyApply>()?;
     m.add_class::<crate::do_expr::PyExpand>()?;
+    m.add_class::<crate::do_expr::PyDoCall>()?;
     m.add_class::<crate::do_expr::PyPass>()?;
     m.add_class::<crate::do_expr::PyWithHandler>()?;
     m.add_class::<crate::do_expr::PyResumeThrow>()?;
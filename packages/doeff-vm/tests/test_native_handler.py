@@ -0,0 +1,156 @@
+"""NativeHandler: reader/state/writer resolved inside the VM step loop."""
+
+import doeff_vm
+import pytest
+from doeff_core_effects.effects import Listen, Try
+from doeff_core_effects.handlers import (
+    _WRITER_LOG_KEY,
+    listen_handler,
+    reader,
+    state,
+    try_handler,
+    writer,
+    writer_log,
+)
+from doeff_core_effects.scheduler import Gather, Spawn, scheduled
+
+from doeff import Ask, Get, Pass, Put, Tell, Transfer, do, handler, run
+from doeff.result import Some
+
+
+def test_core_handlers_install_native_handlers() -> None:
+    for installer in (reader(env={}), state(), writer):
+        native = installer.__doeff_handler_data__
+        assert isinstance(native, doeff_vm.NativeHandler)
+    with pytest.raises(TypeError, match="runs inside the VM"):
+        state().__doeff_handler_data__(None, None)
+
+
+def test_state_store_belongs_to_the_installer() -> None:
+    @do
+    def bump():
+        missing = yield Get("absent")
+        value = yield Get("counter")
+        stored = yield Put("counter", value + 1)
+        return (missing, stored, (yield Get("counter")))
+
+    counter = state(initial={"counter": 1})
+
+    assert run(counter(bump())) == (None, None, 2)
+    # Like the closure dict of the generator handler, the store outlives a run.
+    assert run(counter(bump())) == (None, None, 3)
+    assert run(state(initial={"counter": 1})(bump())) == (None, None, 2)
+
+
+def test_missing_ask_key_is_thrown_at_the_ask_site() -> None:
+    @do
+    def body():
+        try:
+            yield Ask("missing")
+        except KeyError as exc:
+            return str(exc)
+
+    message = run(reader(env={"present": 1})(body()))
+
+    assert "Ask: key not found: 'missing'" in message
+
+
+def test_writer_log_lives_in_the_state_store() -> None:
+    @do
+    def body(tag):
+        before = yield writer_log()
+        yield Tell(f"{tag}-1")
+        yield Tell(f"{tag}-2")
+        return (before, (yield writer_log()))
+
+    shared = state()
+
+    assert run(shared(writer(body("a")))) == ([], ["a-1", "a-2"])
+    # Like the generator state handler, the log outlives a run of its installer.
+    assert run(shared(writer(body("b")))) == (["a-1", "a-2"], ["a-1", "a-2", "b-1", "b-2"])
+    assert run(state()(writer(body("c")))) == ([], ["c-1", "c-2"])
+
+
+def test_put_replaces_the_writer_log() -> None:
+    @do
+    def body():
+        yield Tell("dropped")
+        yield Put(_WRITER_LOG_KEY, Some(["seeded"]))
+        yield Tell("kept")
+        return (yield writer_log())
+
+    assert run(state()(writer(body()))) == ["seeded", "kept"]
+
+
+def test_tell_appends_to_the_state_its_get_reaches() -> None:
+    @do
+    def body():
+        yield Tell("x")
+        yield Tell("y")
+        return (yield writer_log())
+
+    outer = state()
+    inner = state()
+
+    # The writer's own Get reaches `outer`; `body` reads `inner`.
+    assert run(outer(writer(inner(body())))) == []
+    assert run(outer(writer_log())) == ["x", "y"]
+    assert run(inner(writer_log())) == []
+
+
+def test_tell_falls_back_to_a_generator_state_handler() -> None:
+    store = {}
+
+    @do
+    def dict_state(effect, k):
+        if isinstance(effect, Get):
+            return (yield Transfer(k, store.get(effect.key)))
+        if isinstance(effect, Put):
+            store[effect.key] = effect.value
+            return (yield Transfer(k, None))
+        yield Pass(effect, k)
+
+    @do
+    def body():
+        yield Tell("a")
+        yield Tell("b")
+        return (yield writer_log())
+
+    assert run(handler(dict_state)(writer(body()))) == ["a", "b"]
+    assert store[_WRITER_LOG_KEY].value == ["a", "b"]
+
+
+def test_listen_observes_tells_under_native_state() -> None:
+    @do
+    def inner():
+        yield Tell("seen")
+        return 7
+
+    @do
+    def body():
+        result, collected = yield Listen(inner())
+        return (result, [item.msg for item in collected], (yield writer_log()))
+
+    program = state()(writer(listen_handler(body())))
+
+    assert run(program) == (7, ["seen"], ["seen"])
+
+
+def test_reinstalled_native_handlers_share_state() -> None:
+    @do
+    def child(key):
+        seed = yield Get("seed")
+        yield Put(key, seed * 10)
+        return (yield Ask("name"))
+
+    @do
+    def body():
+        yield Put("seed", 4)
+        tasks = [(yield Spawn(child("left"))), (yield Spawn(child("right")))]
+        names = list((yield Gather(*tasks)))
+        tried = yield Try(child("inside_try"))
+        return (names, (yield Get("left")), (yield Get("right")), tried.value)
+
+    program = scheduled(reader(env={"name": "Ada"})(state()(try_handler(body()))))
+
+    assert run(program) == (["Ada", "Ada"], 40, 40, "Ada")
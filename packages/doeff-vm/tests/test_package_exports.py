@@ -11,12 +11,14 @@ CURRENT_RUNTIME_SYMBOLS = (
     "UnhandledEffect",
     "Ok",
     "Err",
+    "NativeHandler",
     "Pure",
     "Perform",
     "Resume",
     "Transfer",
     "Apply",
     "Expand",
+    "DoCall",
     "Pass",
     "WithHandler",
     "ResumeThrow",
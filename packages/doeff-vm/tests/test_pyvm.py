@@ -230,6 +230,63 @@ def test_vm_live_counts_return_to_baseline_after_run() -> None:
     assert doeff_vm.vm_live_counts() == before
 
 
+def test_release_gil_run_matches_default_run() -> None:
+    @do
+    def body():
+        value = yield Get("counter")
+        yield Put("counter", value + 1)
+        return (yield CustomEffect(value))
+
+    @do
+    def custom_handler(effect, k):
+        if isinstance(effect, CustomEffect):
+            return (yield doeff_vm.Resume(k, effect.value * 10))
+        yield doeff_vm.Pass(effect, k)
+
+    def program():
+        return doeff_vm.WithHandler(custom_handler, state(initial={"counter": 4})(body()))
+
+    assert doeff_vm.PyVM().run(program()) == 40
+    assert doeff_vm.PyVM().run(program(), release_gil=True) == 40
+
+
+def test_release_gil_run_propagates_python_errors() -> None:
+    @do
+    def body():
+        raise ValueError("boom")
+        yield
+
+    with pytest.raises(ValueError, match="boom"):
+        doeff_vm.PyVM().run(body(), release_gil=True)
+
+
+def test_run_many_returns_results_in_input_order() -> None:
+    from doeff import Err, Ok, run_many
+
+    @do
+    def counted(start: int):
+        value = yield Get("counter")
+        yield Put("counter", value + start)
+        return (yield Get("counter"))
+
+    @do
+    def failing():
+        raise RuntimeError("task failed")
+        yield
+
+    programs = [state(initial={"counter": 1})(counted(i)) for i in range(16)]
+    programs.insert(3, failing())
+
+    results = run_many(programs, threads=4)
+
+    assert len(results) == 17
+    assert isinstance(results[3], Err)
+    assert isinstance(results[3].error, RuntimeError)
+    values = [r.value for i, r in enumerate(results) if i != 3]
+    assert all(isinstance(r, Ok) for i, r in enumerate(results) if i != 3)
+    assert values == [1 + i for i in range(16)]
+
+
 class TestGcCycleCollection:
     """Regression tests for #500: Py-holding pyclasses must implement the GC
     protocol (__traverse__) so reference cycles through doeff_vm objects are
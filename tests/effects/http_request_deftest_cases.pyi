@@ -41,12 +41,68 @@ def test_http_production_handler_retries_request_exceptions_with_timeout(
 ) -> None: ...
 
 
+def test_http_production_handler_honours_retry_after_and_429(
+    doeff_interpreter: DeftestInterpreter,
+) -> None: ...
+
+
+def test_http_production_handler_jitters_backoff(
+    doeff_interpreter: DeftestInterpreter,
+) -> None: ...
+
+
+def test_http_production_handler_streams_to_file(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
+def test_http_production_handler_streams_async_iterator(
+    doeff_interpreter: DeftestInterpreter,
+) -> None: ...
+
+
+def test_http_production_handler_caps_requests_per_host(
+    doeff_interpreter: DeftestInterpreter,
+) -> None: ...
+
+
 def test_http_fixture_record_forwards_to_production_handler(
     doeff_interpreter: DeftestInterpreter,
     tmp_path: Path,
 ) -> None: ...
 
 
+def test_http_fixture_record_rejects_streamed_requests_before_sending(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
+def test_http_fixture_record_appends_to_indexed_file(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
+def test_http_fixture_migrates_legacy_pickle(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
+def test_http_fixture_rerecord_ignores_stale_index(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
+def test_http_fixture_recovers_from_torn_index_line(
+    doeff_interpreter: DeftestInterpreter,
+    tmp_path: Path,
+) -> None: ...
+
+
 def test_http_fixture_replay_errors_on_unknown_request(
     doeff_interpreter: DeftestInterpreter,
     tmp_path: Path,
@@ -0,0 +1,125 @@
+"""BlobStorage: content-addressed blob files with mmap reads.
+
+Identical values share one blob file, out-of-band pickle buffers come back as
+read-only views of the mapped file, and collect_garbage() frees unreferenced
+blobs and keeps the total under max_bytes.
+"""
+
+import mmap
+import pickle
+
+import pytest
+from doeff_core_effects.memo_effects import MEMO_MISS, MemoGet, MemoPut
+from doeff_core_effects.memo_handlers import memo_handler
+from doeff_core_effects.storage import BlobStorage, DurableStorage
+
+from doeff import do
+from tests._run_helpers import run_with_defaults
+
+
+class _Payload:
+    """Value pickled with its data as one out-of-band buffer."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        return (_Payload, (pickle.PickleBuffer(self.data),))
+
+
+def _blob_files(storage):
+    return [path for path in (storage.root / "blobs").rglob("*") if path.is_file()]
+
+
+def test_round_trip_and_lookup(tmp_path):
+    storage = BlobStorage(tmp_path)
+    storage.put_sync("dict", {"x": [1, 2, 3]})
+    storage.put_sync("none", None)
+
+    assert isinstance(storage, DurableStorage)
+    assert storage.get_sync("dict") == {"x": [1, 2, 3]}
+    assert storage.lookup_sync("none") is None
+    assert storage.lookup_sync("absent") is MEMO_MISS
+    assert sorted(storage.keys()) == ["dict", "none"]
+
+
+def test_identical_values_share_one_blob(tmp_path):
+    storage = BlobStorage(tmp_path)
+    storage.put_sync("a", {"same": True})
+    storage.put_sync("b", {"same": True})
+
+    assert len(storage) == 2
+    assert len(_blob_files(storage)) == 1
+
+
+def test_out_of_band_buffers_are_mapped_not_copied(tmp_path):
+    storage = BlobStorage(tmp_path)
+    storage.put_sync("big", _Payload(bytearray(b"x" * 100_000)))
+
+    loaded = storage.get_sync("big")
+
+    assert isinstance(loaded.data, memoryview)
+    assert loaded.data.readonly
+    assert loaded.data.nbytes == 100_000
+    assert isinstance(loaded.data.obj, mmap.mmap)
+
+
+def test_numpy_hit_is_a_read_only_view(tmp_path):
+    np = pytest.importorskip("numpy")
+    storage = BlobStorage(tmp_path)
+    array = np.arange(1_000_000, dtype=np.float64)
+    storage.put_sync("array", array)
+
+    loaded = storage.get_sync("array")
+
+    assert np.array_equal(loaded, array)
+    assert not loaded.flags.owndata
+    assert not loaded.flags.writeable
+
+
+def test_put_rewrites_a_missing_blob_file(tmp_path):
+    storage = BlobStorage(tmp_path)
+    storage.put_sync("a", b"payload" * 100)
+    [blob] = _blob_files(storage)
+    blob.unlink()
+
+    assert storage.lookup_sync("a") is MEMO_MISS
+    storage.put_sync("a", b"payload" * 100)
+
+    assert storage.get_sync("a") == b"payload" * 100
+    assert _blob_files(storage) == [blob]
+
+
+def test_garbage_collection_frees_unreferenced_blobs(tmp_path):
+    storage = BlobStorage(tmp_path)
+    storage.put_sync("a", "first")
+    storage.put_sync("a", "second")
+    storage.put_sync("b", "other")
+    storage.delete_sync("b")
+
+    assert len(_blob_files(storage)) == 3
+    assert storage.collect_garbage() > 0
+    assert len(_blob_files(storage)) == 1
+    assert storage.get_sync("a") == "second"
+
+
+def test_size_bound_evicts_least_recently_read(tmp_path):
+    storage = BlobStorage(tmp_path, max_bytes=3_500)
+    for index in range(5):
+        storage.put_sync(f"k{index}", _Payload(bytearray(bytes([index]) * 1_000)))
+
+    assert storage.total_bytes() <= 3_500
+    assert storage.exists_sync("k4")
+    assert storage.lookup_sync("k0") is MEMO_MISS
+
+
+def test_memo_handler_over_blob_storage(tmp_path):
+    storage = BlobStorage(tmp_path)
+
+    @do
+    def body():
+        yield MemoPut("k", {"v": 1})
+        value = yield MemoGet("k")
+        return value
+
+    assert run_with_defaults(memo_handler(storage)(body())).value == {"v": 1}
@@ -0,0 +1,225 @@
+"""Bounded in-memory storage and TTL enforcement in memo storage.
+
+BoundedMemoryStorage evicts least recently used entries past its entry/byte
+limits and never serves an expired entry; SQLiteStorage filters expired rows
+on read and sweeps them lazily. MemoPolicy.ttl reaches storage through MemoPut.
+"""
+
+import sqlite3
+
+import pytest
+from doeff_core_effects.cache import cache
+from doeff_core_effects.memo_effects import MEMO_MISS, MemoGet, MemoHit, MemoLookup
+from doeff_core_effects.memo_handlers import in_memory_memo_handler, memo_handler
+from doeff_core_effects.storage import (
+    BoundedMemoryStorage,
+    InMemoryStorage,
+    SQLiteStorage,
+    accepts_ttl,
+)
+from doeff_core_effects.storage import sqlite as sqlite_module
+
+from doeff import do
+from tests._run_helpers import run_with_defaults
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+def test_lru_eviction_by_entries_keeps_recently_read():
+    storage = BoundedMemoryStorage(max_entries=2)
+    storage.put_sync("a", 1)
+    storage.put_sync("b", 2)
+    assert storage.get_sync("a") == 1
+    storage.put_sync("c", 3)
+
+    assert list(storage.keys()) == ["a", "c"]
+    assert storage.lookup_sync("b") is MEMO_MISS
+    assert storage.stats()["evictions"] == 1
+
+
+def test_byte_limit_evicts_and_rejects_oversize_values():
+    storage = BoundedMemoryStorage(max_bytes=10, sizeof=len)
+    storage.put_sync("a", "xxxx")
+    storage.put_sync("b", "yyyy")
+    storage.put_sync("c", "zzzz")
+
+    assert list(storage.keys()) == ["b", "c"]
+    assert storage.stats()["bytes"] == 8
+
+    storage.put_sync("huge", "x" * 11)
+    assert not storage.exists_sync("huge")
+    assert list(storage.keys()) == ["b", "c"]
+
+
+def test_ttl_enforced_on_read_and_counted():
+    clock = _FakeClock()
+    storage = BoundedMemoryStorage(default_ttl=10, clock=clock)
+    storage.put_sync("default", 1)
+    storage.put_sync("short", 2, ttl=1)
+
+    clock.now += 5
+    assert storage.lookup_sync("short") is MEMO_MISS
+    assert storage.get_sync("default") == 1
+
+    clock.now += 10
+    assert len(storage) == 0
+    stats = storage.stats()
+    assert stats["expirations"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_invalid_limits_rejected():
+    with pytest.raises(ValueError, match="max_entries"):
+        BoundedMemoryStorage(max_entries=0)
+
+
+def test_capability_flag():
+    assert accepts_ttl(BoundedMemoryStorage())
+    assert accepts_ttl(SQLiteStorage(":memory:"))
+    assert not accepts_ttl(InMemoryStorage())
+
+
+def test_cache_ttl_reaches_bounded_storage():
+    clock = _FakeClock()
+    storage = BoundedMemoryStorage(clock=clock)
+    calls = {"count": 0}
+
+    @cache(ttl=30)
+    @do
+    def compute():
+        calls["count"] += 1
+        return calls["count"]
+
+    def run_once():
+        return _unwrap(run_with_defaults(memo_handler(storage)(compute())))
+
+    assert run_once() == 1
+    assert run_once() == 1
+    clock.now += 31
+    assert run_once() == 2
+
+
+def test_lookup_with_ttl_reports_seconds_left(tmp_path, monkeypatch):
+    clock = _FakeClock()
+    bounded = BoundedMemoryStorage(clock=clock)
+    bounded.put_sync("short", 1, ttl=30)
+    bounded.put_sync("forever", 2)
+    clock.now += 10
+
+    assert bounded.lookup_with_ttl_sync("short") == (1, 20)
+    assert bounded.lookup_with_ttl_sync("forever") == (2, None)
+    assert bounded.lookup_with_ttl_sync("absent") is MEMO_MISS
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(sqlite_module.time, "time", lambda: now["t"])
+    sqlite = SQLiteStorage(tmp_path / "memo.db")
+    sqlite.put_sync("short", "s", ttl=30)
+    now["t"] += 10
+
+    assert sqlite.lookup_with_ttl_sync("short") == ("s", 20)
+    assert sqlite.lookup_with_ttl_sync("absent") is MEMO_MISS
+
+
+def test_write_through_and_promotion_keep_the_outer_expiry():
+    clock = _FakeClock()
+    outer = BoundedMemoryStorage(clock=clock)
+    inner_get = BoundedMemoryStorage(clock=clock)
+    inner_lookup = BoundedMemoryStorage(clock=clock)
+    outer.put_sync("k", "v", ttl=30)
+    clock.now += 10
+
+    @do
+    def get():
+        return (yield MemoGet("k"))
+
+    @do
+    def lookup():
+        return (yield MemoLookup("k"))
+
+    def layered(inner, program):
+        return run_with_defaults(
+            memo_handler(outer, name="outer")(memo_handler(inner, name="inner")(program))
+        )
+
+    assert _unwrap(layered(inner_get, get())) == "v"
+    assert _unwrap(layered(inner_lookup, lookup())) == MemoHit("v", "outer", 20)
+    assert inner_get.lookup_with_ttl_sync("k") == ("v", 20)
+    assert inner_lookup.lookup_with_ttl_sync("k") == ("v", 20)
+
+    clock.now += 21
+    assert inner_get.lookup_sync("k") is MEMO_MISS
+    assert inner_lookup.lookup_sync("k") is MEMO_MISS
+
+
+def test_in_memory_memo_handler_is_bounded():
+    @cache()
+    @do
+    def square(value):
+        return value * value
+
+    @do
+    def body():
+        results = []
+        for value in range(5):
+            results.append((yield square(value)))
+        return results
+
+    assert _unwrap(run_with_defaults(in_memory_memo_handler(max_entries=2)(body()))) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
+
+
+def test_sqlite_ttl_hides_expired_rows_and_sweeps(tmp_path, monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr(sqlite_module.time, "time", lambda: now["t"])
+    storage = SQLiteStorage(tmp_path / "memo.db")
+    storage.put_sync("short", "s", ttl=5)
+    storage.put_sync("forever", "f")
+
+    now["t"] += 10
+    assert storage.lookup_sync("short") is MEMO_MISS
+    assert not storage.exists_sync("short")
+    assert list(storage.keys()) == ["forever"]
+    assert len(storage) == 1
+
+    now["t"] += sqlite_module.EXPIRY_SWEEP_INTERVAL_SECONDS
+    storage.put_sync("other", "o")
+    raw = sqlite3.connect(tmp_path / "memo.db")
+    assert [row[0] for row in raw.execute("SELECT key FROM cache ORDER BY key")] == [
+        "forever",
+        "other",
+    ]
+    raw.close()
+
+
+def test_sqlite_migrates_tables_without_expiry_column(tmp_path):
+    path = tmp_path / "old.db"
+    raw = sqlite3.connect(path)
+    raw.execute(
+        "CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB NOT NULL,"
+        " created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+    )
+    raw.commit()
+    raw.close()
+
+    storage = SQLiteStorage(path)
+    storage.put_sync("k", "v", ttl=60)
+
+    assert storage.get_sync("k") == "v"
+    assert storage.purge_expired() == 0
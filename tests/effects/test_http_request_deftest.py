@@ -57,6 +57,35 @@ def test_http_production_handler_retries_request_exceptions_with_timeout() -> No
     )
 
 
+def test_http_production_handler_honours_retry_after_and_429() -> None:
+    http_request_deftest.test_http_production_handler_honours_retry_after_and_429(
+        _deftest_interpreter
+    )
+
+
+def test_http_production_handler_jitters_backoff() -> None:
+    http_request_deftest.test_http_production_handler_jitters_backoff(_deftest_interpreter)
+
+
+def test_http_production_handler_streams_to_file(tmp_path: Path) -> None:
+    http_request_deftest.test_http_production_handler_streams_to_file(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
+def test_http_production_handler_streams_async_iterator() -> None:
+    http_request_deftest.test_http_production_handler_streams_async_iterator(
+        _deftest_interpreter
+    )
+
+
+def test_http_production_handler_caps_requests_per_host() -> None:
+    http_request_deftest.test_http_production_handler_caps_requests_per_host(
+        _deftest_interpreter
+    )
+
+
 def test_http_fixture_record_forwards_to_production_handler(tmp_path: Path) -> None:
     http_request_deftest.test_http_fixture_record_forwards_to_production_handler(
         _deftest_interpreter,
@@ -64,6 +93,41 @@ def test_http_fixture_record_forwards_to_production_handler(tmp_path: Path) -> N
     )
 
 
+def test_http_fixture_record_rejects_streamed_requests_before_sending(tmp_path: Path) -> None:
+    http_request_deftest.test_http_fixture_record_rejects_streamed_requests_before_sending(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
+def test_http_fixture_record_appends_to_indexed_file(tmp_path: Path) -> None:
+    http_request_deftest.test_http_fixture_record_appends_to_indexed_file(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
+def test_http_fixture_migrates_legacy_pickle(tmp_path: Path) -> None:
+    http_request_deftest.test_http_fixture_migrates_legacy_pickle(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
+def test_http_fixture_rerecord_ignores_stale_index(tmp_path: Path) -> None:
+    http_request_deftest.test_http_fixture_rerecord_ignores_stale_index(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
+def test_http_fixture_recovers_from_torn_index_line(tmp_path: Path) -> None:
+    http_request_deftest.test_http_fixture_recovers_from_torn_index_line(
+        _deftest_interpreter,
+        tmp_path,
+    )
+
+
 def test_http_fixture_replay_errors_on_unknown_request(tmp_path: Path) -> None:
     http_request_deftest.test_http_fixture_replay_errors_on_unknown_request(
         _deftest_interpreter,
@@ -0,0 +1,150 @@
+"""Shared memo/cache keying: structural content addresses.
+
+Addresses depend only on content (never on PYTHONHASHSEED or object
+identity), are cached per immutable instance, and stay byte-for-byte stable
+across processes and releases (pinned digests below).
+"""
+
+import dataclasses
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import PurePosixPath
+
+import pytest
+from doeff_core_effects import keying
+from doeff_core_effects.cache_handlers import content_address as cache_content_address
+from doeff_core_effects.keying import content_address, storage_key
+from doeff_core_effects.memo_handlers import content_address as memo_content_address
+
+from doeff import EffectBase
+
+_SAMPLE_SOURCE = """{
+    "set": {"a", "b", 3, (1, 2)},
+    "frozen": frozenset({"x", "y"}),
+    1: "int-key",
+    None: [1.5, True, b"xy"],
+    "path": PurePosixPath("/tmp/x"),
+}"""
+
+# Changing these means every persisted memo key changes: bump deliberately.
+_SAMPLE_SHA256 = "b44a57495aa36a908a1c22e3bd02f975598d9c8c19651d442d65647712eae2ea"
+_SAMPLE_BLAKE2B = "4e99c4fbc728d53785ef2dd3948962c70ae08d575eb7420daa687e595c85172e"
+
+
+class _Prompt(EffectBase):
+    def __init__(self, prompt, messages):
+        super().__init__()
+        self.prompt = prompt
+        self.messages = messages
+
+
+class _FrozenPrompt(_Prompt):
+    __doeff_immutable__ = True
+
+
+@dataclasses.dataclass(frozen=True)
+class _Message:
+    role: str
+    content: str
+
+
+def _sample():
+    return eval(_SAMPLE_SOURCE, {"PurePosixPath": PurePosixPath})
+
+
+def test_handler_modules_share_one_implementation():
+    assert cache_content_address is content_address
+    assert memo_content_address is content_address
+
+
+def test_pinned_digests():
+    assert content_address(_sample()) == _SAMPLE_SHA256
+    assert content_address(_sample(), algorithm="blake2b") == _SAMPLE_BLAKE2B
+
+
+@pytest.mark.parametrize("seed", ["0", "1", "12345"])
+def test_address_is_stable_across_processes(seed):
+    script = textwrap.dedent(
+        f"""
+        from pathlib import PurePosixPath
+        from doeff_core_effects.keying import content_address
+        print(content_address({_SAMPLE_SOURCE}))
+        """
+    )
+    env = {**os.environ, "PYTHONHASHSEED": seed}
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    ).stdout.strip()
+
+    assert output == _SAMPLE_SHA256
+
+
+def test_equal_effects_share_an_address():
+    first = _Prompt("hello", [_Message("user", "hi")])
+    same = _Prompt("hello", [_Message("user", "hi")])
+    other = _Prompt("hello", [_Message("user", "bye")])
+
+    assert content_address(first) == content_address(same)
+    assert content_address(first) != content_address(other)
+
+
+def test_structure_is_part_of_the_address():
+    assert content_address((1, 2)) != content_address([1, 2])
+    assert content_address({"a": 1}) != content_address({"a": 1.0})
+    assert content_address({1: "x"}) != content_address({"1": "x"})
+
+
+def test_immutable_instances_are_hashed_once(monkeypatch):
+    calls = []
+    compute = keying._compute_address
+
+    def counting(value, algorithm):
+        calls.append(algorithm)
+        return compute(value, algorithm)
+
+    monkeypatch.setattr(keying, "_compute_address", counting)
+    effect = _FrozenPrompt("long prompt " * 1000, [])
+    message = _Message("user", "hi")
+    mutable = {"k": "v"}
+
+    for _ in range(3):
+        content_address(effect)
+        content_address(message)
+        content_address(mutable)
+    content_address(effect, algorithm="blake2b")
+
+    # effect and message once each, the mutable dict on every call.
+    assert calls == ["sha256"] * 5 + ["blake2b"]
+
+
+def test_mutated_effect_gets_a_new_address():
+    effect = _Prompt("hello", [_Message("user", "hi")])
+    before = content_address(effect)
+    effect.messages.append(_Message("assistant", "hello"))
+
+    assert content_address(effect) != before
+    assert content_address(effect) == content_address(
+        _Prompt("hello", [_Message("user", "hi"), _Message("assistant", "hello")])
+    )
+
+
+def test_algorithms_and_storage_key():
+    assert content_address("x", algorithm="blake2b") != content_address("x")
+    with pytest.raises(ValueError, match="algorithm"):
+        content_address("x", algorithm="md5")
+    assert storage_key("plain") == "plain"
+    assert storage_key(("k", 1)) == f"sha256:{content_address(('k', 1))}"
+
+
+def test_self_referencing_values_fall_back_to_pickle():
+    loop = []
+    loop.append(loop)
+
+    assert len(content_address(loop)) == 64
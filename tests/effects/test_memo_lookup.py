@@ -0,0 +1,139 @@
+"""MemoLookup: one effect dispatch per lookup, resuming MemoHit or MEMO_MISS.
+
+A hit in an outer layer is promoted into the inner layers the lookup passed
+through (unless promote=False), and @cache / make_memo_rewriter use the
+single lookup instead of MemoExists followed by MemoGet.
+"""
+
+from doeff_core_effects.cache import cache
+from doeff_core_effects.memo_effects import (
+    MEMO_MISS,
+    MemoExistsEffect,
+    MemoGetEffect,
+    MemoHit,
+    MemoLookup,
+    MemoLookupEffect,
+)
+from doeff_core_effects.memo_handlers import memo_handler
+from doeff_core_effects.storage import InMemoryStorage, SQLiteStorage
+
+from doeff import do
+from doeff import handler as program_handler
+from doeff.program import Pass
+from tests._run_helpers import run_with_defaults
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+def _effect_recorder(seen: list):
+    """Pass-through handler recording every memo effect type it sees."""
+
+    @do
+    def handler(effect, k):
+        if isinstance(effect, (MemoLookupEffect, MemoExistsEffect, MemoGetEffect)):
+            seen.append(type(effect).__name__)
+        yield Pass(effect, k)
+
+    return program_handler(handler)
+
+
+@do
+def _lookup(key, promote=True):
+    found = yield MemoLookup(key, promote=promote)
+    return found
+
+
+def test_lookup_hit_and_miss():
+    storage = InMemoryStorage()
+    storage.put_sync("present", "v")
+    storage.put_sync("none-value", None)
+
+    @do
+    def body():
+        hit = yield MemoLookup("present")
+        stored_none = yield MemoLookup("none-value")
+        miss = yield MemoLookup("absent")
+        return (hit, stored_none, miss)
+
+    hit, stored_none, miss = _unwrap(run_with_defaults(memo_handler(storage, name="L1")(body())))
+
+    assert hit == MemoHit("v", "L1")
+    assert stored_none == MemoHit(None, "L1")
+    assert miss is MEMO_MISS
+    assert not miss
+
+
+def test_lookup_sqlite_distinguishes_stored_none(tmp_path):
+    storage = SQLiteStorage(tmp_path / "memo.db")
+    storage.put_sync("none-value", None)
+
+    @do
+    def body():
+        stored_none = yield MemoLookup("none-value")
+        miss = yield MemoLookup("absent")
+        return (stored_none, miss)
+
+    stored_none, miss = _unwrap(run_with_defaults(memo_handler(storage)(body())))
+
+    assert stored_none.value is None
+    assert miss is MEMO_MISS
+
+
+def test_outer_hit_is_promoted_into_inner_layer():
+    inner = InMemoryStorage()
+    outer = InMemoryStorage()
+    outer.put_sync("k", "from-outer")
+
+    found = _unwrap(
+        run_with_defaults(
+            memo_handler(outer, name="outer")(memo_handler(inner, name="inner")(_lookup("k")))
+        )
+    )
+
+    assert found == MemoHit("from-outer", "outer")
+    assert inner.get_sync("k") == "from-outer"
+
+
+def test_promote_false_leaves_inner_layer_untouched():
+    inner = InMemoryStorage()
+    outer = InMemoryStorage()
+    outer.put_sync("k", "from-outer")
+
+    found = _unwrap(
+        run_with_defaults(
+            memo_handler(outer, name="outer")(
+                memo_handler(inner, name="inner")(_lookup("k", promote=False))
+            )
+        )
+    )
+
+    assert found.value == "from-outer"
+    assert not inner.exists_sync("k")
+
+
+def test_cache_decorator_hit_uses_single_lookup():
+    calls = {"count": 0}
+    seen: list = []
+
+    @cache()
+    @do
+    def double(value):
+        calls["count"] += 1
+        return value * 2
+
+    @do
+    def body():
+        first = yield double(21)
+        seen.clear()
+        second = yield double(21)
+        return (first, second)
+
+    storage = InMemoryStorage()
+    value = _unwrap(run_with_defaults(memo_handler(storage)(_effect_recorder(seen)(body()))))
+
+    assert value == (42, 42)
+    assert calls["count"] == 1
+    assert seen == ["MemoLookupEffect"]
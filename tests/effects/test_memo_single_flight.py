@@ -0,0 +1,236 @@
+"""Single-flight memo misses: one delegated computation per key.
+
+Concurrent misses on one key inside a scheduled() run park on the first
+requester's ClaimPromise; runs in separate threads sharing one SQLiteStorage
+are deduplicated through the storage's advisory lease row.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from doeff_core_effects.cache import cache
+from doeff_core_effects.keying import storage_key
+from doeff_core_effects.memo_handlers import make_memo_rewriter, memo_handler
+from doeff_core_effects.storage import InMemoryStorage, SQLiteStorage
+
+from doeff import Await, Cancel, EffectBase, Gather, Spawn, Wait, do
+from doeff import handler as program_handler
+from doeff.program import Pass, Resume
+from tests._run_helpers import run_with_defaults
+
+CONCURRENT_REQUESTERS = 20
+
+
+class _PaidCall(EffectBase):
+    """Effect standing in for a paid call memoized through make_memo_rewriter."""
+
+    def __init__(self, prompt: str):
+        super().__init__()
+        self.prompt = prompt
+
+
+def _paid_call_handler(calls: list):
+    """Terminal handler: records each delegated call and answers after a real await."""
+
+    @do
+    def handler(effect, k):
+        if not isinstance(effect, _PaidCall):
+            yield Pass(effect, k)
+            return None
+        calls.append(effect.prompt)
+        yield Await(asyncio.sleep(0.01))
+        result = yield Resume(k, f"answer:{effect.prompt}")
+        return result
+
+    return program_handler(handler)
+
+
+def _rewriter():
+    return make_memo_rewriter(_PaidCall, key_fn=lambda effect: f"paid:{effect.prompt}")
+
+
+@do
+def _fan_out(make_program, total):
+    tasks = []
+    for _index in range(total):
+        tasks.append((yield Spawn(make_program())))
+    return list((yield Gather(*tasks)))
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+def test_concurrent_rewriter_misses_delegate_once_per_key():
+    calls: list = []
+
+    @do
+    def ask(prompt):
+        answer = yield _PaidCall(prompt)
+        return answer
+
+    @do
+    def body():
+        same = yield _fan_out(lambda: ask("same"), CONCURRENT_REQUESTERS)
+        other = yield _fan_out(lambda: ask("other"), CONCURRENT_REQUESTERS)
+        return same, other
+
+    program = _paid_call_handler(calls)(memo_handler(InMemoryStorage())(_rewriter()(body())))
+    same, other = _unwrap(run_with_defaults(program))
+
+    assert same == ["answer:same"] * CONCURRENT_REQUESTERS
+    assert other == ["answer:other"] * CONCURRENT_REQUESTERS
+    assert calls == ["same", "other"]
+
+
+def test_concurrent_cache_decorator_misses_compute_once():
+    calls = {"count": 0}
+
+    @cache()
+    @do
+    def slow_double(value):
+        calls["count"] += 1
+        yield Await(asyncio.sleep(0.01))
+        return value * 2
+
+    values = _unwrap(
+        run_with_defaults(
+            memo_handler(InMemoryStorage())(
+                _fan_out(lambda: slow_double(21), CONCURRENT_REQUESTERS)
+            )
+        )
+    )
+
+    assert values == [42] * CONCURRENT_REQUESTERS
+    assert calls["count"] == 1
+
+
+def test_owner_failure_reaches_waiters_and_frees_the_key():
+    attempts = {"count": 0}
+
+    @cache()
+    @do
+    def flaky():
+        attempts["count"] += 1
+        yield Await(asyncio.sleep(0.01))
+        if attempts["count"] == 1:
+            raise RuntimeError("first attempt fails")
+        return "ok"
+
+    @do
+    def attempt():
+        try:
+            value = yield flaky()
+        except RuntimeError as exc:
+            return f"error:{exc}"
+        return value
+
+    @do
+    def body():
+        first_wave = yield _fan_out(attempt, 3)
+        retry = yield attempt()
+        return first_wave, retry
+
+    first_wave, retry = _unwrap(run_with_defaults(memo_handler(InMemoryStorage())(body())))
+
+    assert first_wave == ["error:first attempt fails"] * 3
+    assert retry == "ok"
+    assert attempts["count"] == 2
+
+
+@pytest.mark.timeout(30)
+def test_cancelled_owner_hands_the_key_to_a_parked_waiter(tmp_path):
+    storage = SQLiteStorage(tmp_path / "memo.db")
+    attempts = {"count": 0}
+
+    @cache()
+    @do
+    def slow():
+        attempts["count"] += 1
+        yield Await(asyncio.sleep(60 if attempts["count"] == 1 else 0.01))
+        return "value"
+
+    @do
+    def body():
+        owner = yield Spawn(slow())
+        waiter = yield Spawn(slow())
+        yield Await(asyncio.sleep(0.05))
+        yield Cancel(owner)
+        value = yield Wait(waiter)
+        return value
+
+    value = _unwrap(run_with_defaults(memo_handler(storage)(body())))
+
+    assert value == "value"
+    assert attempts["count"] == 2
+
+
+@pytest.mark.timeout(30)
+def test_cancelled_owner_leaves_another_holders_lease(tmp_path):
+    storage = SQLiteStorage(tmp_path / "memo.db")
+    lease_key = storage_key("paid:shared")
+    calls: list = []
+    # Another process is computing the key and holds its lease.
+    assert storage.try_acquire_lease_sync(lease_key) is True
+
+    @do
+    def ask():
+        answer = yield _PaidCall("shared")
+        return answer
+
+    @do
+    def body():
+        owner = yield Spawn(ask())
+        yield Await(asyncio.sleep(0.05))
+        yield Cancel(owner)
+        yield Await(asyncio.sleep(0.05))
+
+    try:
+        _unwrap(
+            run_with_defaults(_paid_call_handler(calls)(memo_handler(storage)(_rewriter()(body()))))
+        )
+        assert storage.try_acquire_lease_sync(lease_key) is False
+    finally:
+        storage.release_lease_sync(lease_key)
+    assert calls == []
+
+
+def test_sqlite_lease_blocks_second_acquirer_until_stored(tmp_path):
+    storage = SQLiteStorage(tmp_path / "memo.db")
+
+    assert storage.try_acquire_lease_sync("k") is True
+    assert storage.try_acquire_lease_sync("k") is False
+    storage.put_sync("k", "v")
+    assert storage.try_acquire_lease_sync("k") is True
+    storage.release_lease_sync("k")
+    assert storage.try_acquire_lease_sync("k", ttl=0) is True
+    assert storage.try_acquire_lease_sync("k") is True, "an expired lease can be taken over"
+
+
+@pytest.mark.timeout(30)
+def test_threads_sharing_sqlite_storage_delegate_once(tmp_path):
+    storage = SQLiteStorage(tmp_path / "memo.db")
+    calls: list = []
+    results: list = []
+    start = threading.Barrier(2)
+
+    @do
+    def ask():
+        answer = yield _PaidCall("shared")
+        return answer
+
+    def worker():
+        start.wait()
+        program = _paid_call_handler(calls)(memo_handler(storage)(_rewriter()(ask())))
+        results.append(_unwrap(run_with_defaults(program)))
+
+    threads = [threading.Thread(target=worker) for _index in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["answer:shared", "answer:shared"]
+    assert calls == ["shared"]
@@ -0,0 +1,128 @@
+"""SQLiteStorage write-behind mode: buffered puts, batched commits, durability.
+
+Buffered writes are readable immediately through the same storage, reach the
+database on flush / batch size / handler exit / interpreter exit, and a hard
+crash loses only the writes that were still buffered.
+"""
+
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+from doeff_core_effects.memo_effects import MemoPut
+from doeff_core_effects.memo_handlers import memo_handler
+from doeff_core_effects.storage import SQLiteStorage, writes_inline
+
+from doeff import do
+from tests._run_helpers import run_with_defaults
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached before timeout")
+        time.sleep(0.01)
+
+
+def test_buffered_writes_are_readable_before_commit(tmp_path):
+    path = tmp_path / "memo.db"
+    storage = SQLiteStorage(path, write_behind=True, flush_interval=60)
+    reader = SQLiteStorage(path)
+
+    storage.put_sync("a", 1)
+    storage.put_sync("b", 2)
+    assert storage.delete_sync("b") is True
+
+    assert storage.get_sync("a") == 1
+    assert not storage.exists_sync("b")
+    assert reader.get_sync("a") is None
+
+    storage.flush_sync()
+    assert reader.get_sync("a") == 1
+    assert not reader.exists_sync("b")
+
+
+def test_batch_size_triggers_commit(tmp_path):
+    path = tmp_path / "memo.db"
+    storage = SQLiteStorage(path, write_behind=True, batch_size=10, flush_interval=60)
+    reader = SQLiteStorage(path)
+
+    for index in range(10):
+        storage.put_sync(f"k{index}", index)
+
+    _wait_until(lambda: len(reader) == 10)
+
+
+def test_flush_interval_triggers_commit(tmp_path):
+    path = tmp_path / "memo.db"
+    storage = SQLiteStorage(path, write_behind=True, flush_interval=0.01)
+    reader = SQLiteStorage(path)
+
+    storage.put_sync("k", "v")
+
+    _wait_until(lambda: reader.get_sync("k") == "v")
+
+
+def test_write_behind_reports_inline_writes_and_rejects_memory_db(tmp_path):
+    assert writes_inline(SQLiteStorage(tmp_path / "memo.db", write_behind=True))
+    assert not writes_inline(SQLiteStorage(":memory:"))
+    with pytest.raises(ValueError, match="database file"):
+        SQLiteStorage(":memory:", write_behind=True)
+
+
+def test_memo_handler_flushes_on_exit(tmp_path):
+    path = tmp_path / "memo.db"
+    storage = SQLiteStorage(path, write_behind=True, flush_interval=60)
+
+    @do
+    def body():
+        for index in range(100):
+            yield MemoPut(f"k{index}", index)
+        return "done"
+
+    assert _unwrap(run_with_defaults(memo_handler(storage)(body()))) == "done"
+    assert len(SQLiteStorage(path)) == 100
+
+
+_CRASH_SCRIPT = textwrap.dedent(
+    """
+    import os
+    import sys
+
+    from doeff_core_effects.storage import SQLiteStorage
+
+    storage = SQLiteStorage(sys.argv[1], write_behind=True, flush_interval=60)
+    for index in range(10):
+        storage.put_sync(f"flushed{index}", index)
+    storage.flush_sync()
+    for index in range(5):
+        storage.put_sync(f"buffered{index}", index)
+    if sys.argv[2] == "kill":
+        os._exit(0)
+    """
+)
+
+
+@pytest.mark.parametrize(
+    ("exit_mode", "expected_rows"),
+    [("kill", 10), ("normal", 15)],
+)
+def test_durability_across_process_exit(tmp_path, exit_mode, expected_rows):
+    path = tmp_path / "memo.db"
+    subprocess.run(
+        [sys.executable, "-c", _CRASH_SCRIPT, str(path), exit_mode],
+        check=True,
+        timeout=60,
+    )
+
+    reopened = SQLiteStorage(path)
+    assert len(reopened) == expected_rows
+    assert reopened.get_sync("flushed9") == 9
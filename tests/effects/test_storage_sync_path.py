@@ -0,0 +1,149 @@
+"""Synchronous storage fast path for cache_handler and memo_handler.
+
+Backends reporting synchronous_reads / synchronous_writes are served through
+their *_sync methods on the calling thread; the Program-returning methods
+(Await via the bridge) must not be touched. Backends without the flags keep
+the bridged path.
+"""
+
+import threading
+
+from doeff_core_effects.cache_effects import CacheExists, CacheGet, CachePut
+from doeff_core_effects.cache_handlers import cache_handler
+from doeff_core_effects.memo_effects import MemoGet, MemoPut
+from doeff_core_effects.memo_handlers import memo_handler
+from doeff_core_effects.memo_policy import MemoPolicy, RecomputeCost
+from doeff_core_effects.storage import (
+    InMemoryStorage,
+    SQLiteStorage,
+    reads_inline,
+    writes_inline,
+)
+
+from doeff import do
+from tests._run_helpers import run_with_defaults
+
+
+class _NoBridgeStorage(InMemoryStorage):
+    """InMemoryStorage whose Program-returning methods must never be used."""
+
+    def get(self, key):
+        raise AssertionError("bridged get used for synchronous storage")
+
+    def put(self, key, value):
+        raise AssertionError("bridged put used for synchronous storage")
+
+    def delete(self, key):
+        raise AssertionError("bridged delete used for synchronous storage")
+
+    def exists(self, key):
+        raise AssertionError("bridged exists used for synchronous storage")
+
+
+class _BridgedOnlyStorage:
+    """Storage without the synchronous flags: every call goes through Await."""
+
+    def __init__(self):
+        self.inner = InMemoryStorage()
+        self.calls = []
+
+    def get(self, key):
+        self.calls.append("get")
+        return self.inner.get(key)
+
+    def put(self, key, value):
+        self.calls.append("put")
+        return self.inner.put(key, value)
+
+    def delete(self, key):
+        self.calls.append("delete")
+        return self.inner.delete(key)
+
+    def exists(self, key):
+        self.calls.append("exists")
+        return self.inner.exists(key)
+
+    def keys(self):
+        return self.inner.keys()
+
+    def items(self):
+        return self.inner.items()
+
+    def clear(self):
+        self.inner.clear()
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+@do
+def _cache_round_trip():
+    yield CachePut("k", {"v": 1})
+    exists = yield CacheExists("k")
+    got = yield CacheGet("k")
+    return (exists, got)
+
+
+@do
+def _memo_round_trip():
+    yield MemoPut("k", "v", policy=MemoPolicy(recompute_cost=RecomputeCost.CHEAP))
+    got = yield MemoGet("k")
+    return got
+
+
+def test_capability_flags():
+    assert reads_inline(InMemoryStorage())
+    assert writes_inline(InMemoryStorage())
+    assert not reads_inline(_BridgedOnlyStorage())
+    assert not writes_inline(_BridgedOnlyStorage())
+    sqlite_default = SQLiteStorage(":memory:")
+    sqlite_opted_in = SQLiteStorage(":memory:", sync_reads=True)
+    assert not reads_inline(sqlite_default)
+    assert reads_inline(sqlite_opted_in)
+    assert not writes_inline(sqlite_opted_in)
+
+
+def test_cache_handler_serves_synchronous_storage_inline():
+    storage = _NoBridgeStorage()
+
+    value = _unwrap(run_with_defaults(cache_handler(storage)(_cache_round_trip())))
+
+    assert value == (True, {"v": 1})
+    assert storage.get_sync("k") == {"v": 1}
+
+
+def test_cache_handler_keeps_bridged_path_for_other_storage():
+    storage = _BridgedOnlyStorage()
+
+    value = _unwrap(run_with_defaults(cache_handler(storage)(_cache_round_trip())))
+
+    assert value == (True, {"v": 1})
+    assert storage.calls == ["put", "exists", "get"]
+
+
+def test_cache_handler_sqlite_sync_reads_run_on_calling_thread(tmp_path):
+    storage = SQLiteStorage(tmp_path / "cache.db", sync_reads=True)
+    read_threads = []
+    get_sync = storage.get_sync
+
+    def recording_get_sync(key):
+        read_threads.append(threading.get_ident())
+        return get_sync(key)
+
+    storage.get_sync = recording_get_sync
+
+    value = _unwrap(run_with_defaults(cache_handler(storage)(_cache_round_trip())))
+
+    assert value == (True, {"v": 1})
+    assert read_threads == [threading.get_ident()]
+
+
+def test_memo_handler_serves_synchronous_storage_inline():
+    storage = _NoBridgeStorage()
+
+    value = _unwrap(run_with_defaults(memo_handler(storage, name="L1")(_memo_round_trip())))
+
+    assert value == "v"
+    assert storage.get_sync("k") == "v"
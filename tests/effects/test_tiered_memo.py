@@ -0,0 +1,216 @@
+"""tiered_memo_handler: several memo layers routed by cost tier in one handler.
+
+Each effect visits only the layers matching its RecomputeCost: lookups stop at
+the first hit and promote inward, puts reach every matching layer, tiers
+without a layer pass through, and per-tier hit ratios are reported.
+"""
+
+import pytest
+from doeff_core_effects.memo_effects import (
+    MEMO_MISS,
+    MemoExistsEffect,
+    MemoGet,
+    MemoGetEffect,
+    MemoHit,
+    MemoLookup,
+    MemoLookupEffect,
+    MemoPut,
+)
+from doeff_core_effects.memo_handlers import MemoLayer, memo_handler, tiered_memo_handler
+from doeff_core_effects.memo_policy import MemoPolicy, RecomputeCost
+from doeff_core_effects.storage import BoundedMemoryStorage, InMemoryStorage
+
+from doeff import do
+from doeff import handler as program_handler
+from doeff.program import Pass
+from tests._run_helpers import run_with_defaults
+
+CHEAP = RecomputeCost.CHEAP
+EXPENSIVE = RecomputeCost.EXPENSIVE
+
+
+def _unwrap(result):
+    assert result.is_ok(), f"program failed: {getattr(result, 'error', result)!r}"
+    return result.value
+
+
+def _effect_recorder(seen: list):
+    """Pass-through handler recording every memo read that escapes inward handlers."""
+
+    @do
+    def handler(effect, k):
+        if isinstance(effect, (MemoLookupEffect, MemoExistsEffect, MemoGetEffect)):
+            seen.append(type(effect).__name__)
+        yield Pass(effect, k)
+
+    return program_handler(handler)
+
+
+def _layers():
+    memory, redis, minio = InMemoryStorage(), InMemoryStorage(), InMemoryStorage()
+    layers = [
+        MemoLayer(memory, name="L1"),
+        MemoLayer(redis, cost=CHEAP, name="redis"),
+        MemoLayer(minio, cost="expensive", name="minio"),
+    ]
+    return layers, memory, redis, minio
+
+
+def test_puts_reach_only_layers_of_the_effect_tier():
+    layers, memory, redis, minio = _layers()
+
+    @do
+    def body():
+        yield MemoPut("cheap", 1)
+        yield MemoPut("paid", 2, policy=MemoPolicy(recompute_cost=EXPENSIVE))
+
+    _unwrap(run_with_defaults(tiered_memo_handler(layers)(body())))
+
+    assert memory.get_sync("cheap") == 1
+    assert redis.get_sync("cheap") == 1
+    assert not minio.exists_sync("cheap")
+    assert memory.get_sync("paid") == 2
+    assert minio.get_sync("paid") == 2
+    assert not redis.exists_sync("paid")
+
+
+def test_lookup_hit_promotes_into_earlier_layers_of_the_tier():
+    layers, memory, redis, minio = _layers()
+    minio.put_sync("k", "from-minio")
+
+    @do
+    def body():
+        found = yield MemoLookup("k", recompute_cost=EXPENSIVE)
+        again = yield MemoLookup("k", recompute_cost=EXPENSIVE)
+        return (found, again)
+
+    found, again = _unwrap(run_with_defaults(tiered_memo_handler(layers)(body())))
+
+    assert found == MemoHit("from-minio", "minio")
+    assert again == MemoHit("from-minio", "L1")
+    assert memory.get_sync("k") == "from-minio"
+    assert not redis.exists_sync("k")
+
+
+def test_hits_never_leave_the_handler_frame():
+    layers, memory, _redis, _minio = _layers()
+    memory.put_sync("k", "v")
+    seen: list[str] = []
+
+    @do
+    def body():
+        found = yield MemoLookup("k")
+        value = yield MemoGet("k")
+        return (found, value)
+
+    found, value = _unwrap(
+        run_with_defaults(_effect_recorder(seen)(tiered_memo_handler(layers)(body())))
+    )
+
+    assert found == MemoHit("v", "L1")
+    assert value == "v"
+    assert seen == []
+
+
+def test_miss_is_re_performed_outward_once_and_written_through():
+    layers, memory, redis, _minio = _layers()
+    outer = InMemoryStorage()
+    outer.put_sync("k", "from-outer")
+
+    @do
+    def body():
+        value = yield MemoGet("k")
+        return value
+
+    value = _unwrap(
+        run_with_defaults(memo_handler(outer, name="outer")(tiered_memo_handler(layers)(body())))
+    )
+
+    assert value == "from-outer"
+    assert memory.get_sync("k") == "from-outer"
+    assert redis.get_sync("k") == "from-outer"
+
+
+def test_copies_keep_the_remaining_ttl():
+    now = [1000.0]
+
+    def clock():
+        return now[0]
+
+    l1, l2, outer = (BoundedMemoryStorage(clock=clock) for _ in range(3))
+    l2.put_sync("promoted", "p", ttl=30)
+    outer.put_sync("written", "w", ttl=30)
+    now[0] += 10
+
+    @do
+    def body():
+        found = yield MemoLookup("promoted")
+        value = yield MemoGet("written")
+        return (found, value)
+
+    layers = [MemoLayer(l1, name="L1"), MemoLayer(l2, name="L2")]
+    found, value = _unwrap(
+        run_with_defaults(memo_handler(outer, name="outer")(tiered_memo_handler(layers)(body())))
+    )
+
+    assert found == MemoHit("p", "L2", 20)
+    assert value == "w"
+    assert l1.lookup_with_ttl_sync("promoted") == ("p", 20)
+    assert l1.lookup_with_ttl_sync("written") == ("w", 20)
+    assert l2.lookup_with_ttl_sync("written") == ("w", 20)
+
+    now[0] += 21
+    assert len(l1) == 0
+    assert l2.lookup_sync("written") is MEMO_MISS
+
+
+def test_tier_without_layers_passes_through():
+    durable = InMemoryStorage()
+    outer = InMemoryStorage()
+    outer.put_sync("k", "cheap-outer")
+
+    @do
+    def body():
+        found = yield MemoLookup("k")
+        missing = yield MemoLookup("absent")
+        return (found, missing)
+
+    found, missing = _unwrap(
+        run_with_defaults(
+            memo_handler(outer, name="outer")(
+                tiered_memo_handler([MemoLayer(durable, cost=EXPENSIVE)])(body())
+            )
+        )
+    )
+
+    assert found == MemoHit("cheap-outer", "outer")
+    assert missing is MEMO_MISS
+    assert not durable.exists_sync("k")
+
+
+def test_stats_report_per_tier_hit_ratios():
+    layers, memory, _redis, minio = _layers()
+    memory.put_sync("hot", 1)
+    minio.put_sync("paid", 2)
+    handler = tiered_memo_handler(layers)
+
+    @do
+    def body():
+        yield MemoLookup("hot")
+        yield MemoLookup("cold")
+        yield MemoLookup("paid", recompute_cost=EXPENSIVE)
+
+    _unwrap(run_with_defaults(handler(body())))
+
+    assert handler.stats.hit_ratios() == {"cheap": 0.5, "expensive": 1.0}
+    snapshot = handler.stats.snapshot()
+    assert snapshot["cheap"]["layers"] == {"L1": 1}
+    assert snapshot["expensive"]["layers"] == {"minio": 1}
+    assert snapshot["cheap"]["misses"] == 1
+
+
+def test_rejects_empty_and_invalid_layers():
+    with pytest.raises(ValueError, match="at least one layer"):
+        tiered_memo_handler([])
+    with pytest.raises(TypeError, match="DurableStorage"):
+        tiered_memo_handler([MemoLayer({"not": "storage"})])
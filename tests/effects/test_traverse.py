@@ -2,9 +2,9 @@
 
 from doeff_core_effects.handlers import try_handler
 from doeff_core_effects.scheduler import scheduled
-from doeff_traverse.collection import Collection
+from doeff_traverse.collection import Collection, HistoryEntry, ItemResult
 from doeff_traverse.effects import Fail, Inspect, Reduce, Skip, SortBy, Take, Traverse, Zip
-from doeff_traverse.handlers import fail_handler, normalize_to_none, sequential
+from doeff_traverse.handlers import fail_handler, normalize_to_none, parallel, sequential
 from doeff_traverse.helpers import try_call
 
 from doeff import do, run
@@ -30,6 +30,13 @@ def run_with(program, handlers=None):
     return run(body)
 
 
+def run_parallel(program, **parallel_kwargs):
+    """Like run_with, with parallel(**parallel_kwargs) in place of sequential."""
+    body = fail_handler(try_handler(program))
+    body = parallel(**parallel_kwargs)(body)
+    return run(scheduled(body))
+
+
 # ---------------------------------------------------------------------------
 # Fail effect
 # ---------------------------------------------------------------------------
@@ -319,6 +326,70 @@ class TestInspect:
         assert items[1].failed is True
         assert items[2].value == 30
 
+    def test_history_accumulates_across_stages(self):
+        """Each Traverse stage appends one labelled event to every item's history."""
+        @do
+        def program():
+            first = yield Traverse(_pure, [1, 2], label="load")
+            second = yield Traverse(_pure, first, label="score")
+            return (yield Inspect(second))
+
+        items = run_with(program())
+        for item in items:
+            assert [(h.stage, h.event) for h in item.history] == [
+                ("load", "ok"), ("score", "ok"),
+            ]
+
+    def test_zip_concatenates_histories(self):
+        """Zip keeps a's history followed by b's history."""
+        @do
+        def program():
+            a = yield Traverse(_pure, [1, 2], label="a")
+            b = yield Traverse(_pure, [3, 4], label="b")
+            zipped = yield Zip(a, b)
+            return (yield Inspect(zipped))
+
+        items = run_with(program())
+        assert [item.value for item in items] == [(1, 3), (2, 4)]
+        assert [h.stage for h in items[0].history] == ["a", "b"]
+
+
+# ---------------------------------------------------------------------------
+# Collection storage
+# ---------------------------------------------------------------------------
+
+class TestCollectionStorage:
+    def test_constructor_round_trips_items(self):
+        """Collection(items) exposes the same items, values and histories."""
+        items = [
+            ItemResult(0, "a", history=[HistoryEntry(stage="s", event="ok")]),
+            ItemResult(1, ValueError("x"), failed=True),
+        ]
+        col = Collection(items)
+        assert col.all_items == items
+        assert col.valid_values == ["a"]
+        assert len(col.failed_items) == 1
+
+    def test_valid_values_returns_a_copy(self):
+        """Mutating the returned list does not change the Collection."""
+        col = Collection.from_values([1, 2, 3])
+        values = col.valid_values
+        values.append(99)
+        assert col.valid_values == [1, 2, 3]
+
+    def test_stages_share_one_history_log(self):
+        """Derived collections append to, rather than copy, the source history."""
+        @do
+        def program():
+            first = yield Traverse(_pure, [1, 2, 3], label="one")
+            second = yield Traverse(_pure, first, label="two")
+            return first, second
+
+        first, second = run_with(program())
+        assert second._log is first._log
+        assert len(second._log) == 6
+        assert [h.stage for h in first.all_items[0].history] == ["one"]
+
 
 # ---------------------------------------------------------------------------
 # Handler composition
@@ -610,6 +681,75 @@ class TestTake:
         assert col.valid_values == [9, 8, 5]
 
 
+# ---------------------------------------------------------------------------
+# parallel(streaming=True)
+# ---------------------------------------------------------------------------
+
+class TestParallelStreaming:
+    def test_streaming_matches_materialized_parallel(self):
+        """Streaming mode yields the same Collection, failures included."""
+        @do
+        def process(x):
+            if x % 4 == 1:
+                raise ValueError(f"bad {x}")
+            if x % 4 == 2:
+                yield Skip()
+            return x * 10
+
+        @do
+        def program():
+            first = yield Traverse(process, range(20), label="a")
+            second = yield Traverse(_pure, first, label="b")
+            return (yield Inspect(second))
+
+        streamed = run_parallel(program(), concurrency=3, streaming=True)
+        materialized = run_parallel(program(), concurrency=3)
+        assert [(i.index, i.failed, i.value if not i.failed else None) for i in streamed] == [
+            (i.index, i.failed, i.value if not i.failed else None) for i in materialized
+        ]
+        assert [[h.event for h in i.history] for i in streamed] == [
+            [h.event for h in i.history] for i in materialized
+        ]
+
+    def test_streaming_pulls_items_lazily_within_window(self):
+        """At most `concurrency` items are pulled ahead of the running one."""
+        from doeff_core_effects.scheduler import Spawn, Wait
+
+        concurrency = 3
+        total = 30
+        pulled = [0]
+        pulled_at_start = []
+        active = [0]
+        peak = [0]
+
+        def source():
+            for i in range(total):
+                pulled[0] += 1
+                yield i
+
+        @do
+        def process(x):
+            pulled_at_start.append(pulled[0])
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            t = yield Spawn(_pure(x))  # let the scheduler interleave items
+            value = yield Wait(t)
+            active[0] -= 1
+            return value
+
+        @do
+        def program():
+            return (yield Traverse(process, source()))
+
+        col = run_parallel(program(), concurrency=concurrency, streaming=True)
+        assert col.valid_values == list(range(total))
+        assert peak[0] <= concurrency
+        assert pulled_at_start[0] < total
+        assert all(
+            seen <= index + 1 + concurrency for index, seen in enumerate(pulled_at_start)
+        )
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -10,8 +10,33 @@ def test_benchmark_runner_smoke_cases_execute() -> None:
         "run_trivial",
         "run_state_get_put_loop",
         "run_reader_ask_loop",
+        "state_get_put_1_native",
+        "state_get_put_1_generator",
+        "do_call_1_docall",
+        "do_call_1_expand",
+        "do_import_1_cold",
+        "do_import_1_warm",
+        "import_doeff_lazy",
+        "import_doeff_full",
         "spawn_gather_1",
+        "scheduler_bytes_per_task_1",
+        "traverse_pipeline_1x2",
+        "events_publish_1_parked",
+        "sim_time_queue_1_wheel",
+        "sim_time_queue_1_heap",
         "await_sleep_0_round_trip",
+        "cache_hit_sync",
+        "cache_hit_bridged",
+        "sqlite_put_1_commit",
+        "sqlite_put_1_write_behind",
+        "http_get_1_buffered",
+        "http_get_1_stream_to_file",
         "python_callable_boundary",
+        "handler_depth_1_pass",
+        "handler_depth_1_typed",
+        "run_many_threads_1",
     }
     assert all(result.runs == 1 for result in results)
+    footprint = next(r for r in results if r.name == "scheduler_bytes_per_task_1")
+    assert footprint.bytes_per_unit is not None
+    assert footprint.bytes_per_unit > 0
@@ -381,6 +381,83 @@ class TestAwait:
         )
         assert results.get("b") == "B-done"
 
+    def test_cancel_propagates_to_bridged_coroutine(self):
+        """Cancelling a task parked on Await cancels the coroutine on the loop."""
+        import asyncio
+        import threading
+
+        from doeff_core_effects import Await, await_handler
+        from doeff_core_effects.scheduler import Cancel, Spawn, scheduled
+
+        started = threading.Event()
+        cancelled = threading.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        ah = await_handler()
+
+        @do
+        def task():
+            return (yield Await(slow()))
+
+        @do
+        def body():
+            t = yield Spawn(ah(task()))
+            assert started.wait(timeout=5.0)
+            yield Cancel(t)
+            return "cancelled"
+
+        assert doeff_run(scheduled(body())) == "cancelled"
+        assert cancelled.wait(timeout=5.0), "bridged coroutine kept running after Cancel"
+
+    def test_bridge_pool_pins_each_handler_to_one_loop(self):
+        """With a pool, handler instances spread over loops but never switch loops."""
+        import asyncio
+        import threading
+
+        from doeff_core_effects import (
+            Await,
+            await_bridge_metrics,
+            await_handler,
+            configure_await_bridge,
+        )
+        from doeff_core_effects.scheduler import Gather, Spawn, scheduled
+
+        async def loop_thread_name():
+            await asyncio.sleep(0.05)
+            return threading.current_thread().name
+
+        @do
+        def task():
+            first = yield Await(loop_thread_name())
+            second = yield Await(loop_thread_name())
+            return first, second
+
+        @do
+        def body():
+            a = yield Spawn(await_handler()(task()))
+            b = yield Spawn(await_handler()(task()))
+            return (yield Gather(a, b))
+
+        configure_await_bridge(2)
+        try:
+            (a_first, a_second), (b_first, b_second) = doeff_run(scheduled(body()))
+        finally:
+            configure_await_bridge(1)
+        assert a_first == a_second
+        assert b_first == b_second
+        assert a_first != b_first
+        metrics = await_bridge_metrics()
+        assert len(metrics) >= 2
+        assert all(m["alive"] and m["submitted"] >= m["completed"] for m in metrics)
+        assert all(m["lag_max_ms"] >= m["lag_mean_ms"] >= 0.0 for m in metrics)
+
 
 class TestGetExecutionContext:
     def test_get_execution_context(self):
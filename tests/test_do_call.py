@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from doeff import DoCall, Expand, do, program, run
+
+
+@do
+def _add(a: int, b: int = 0):
+    if False:  # pragma: no cover
+        yield
+    return a + b
+
+
+@do
+def _plain(value: int) -> int:
+    return value * 2
+
+
+def _gen(value: int):
+    if False:  # pragma: no cover
+        yield
+    return value - 1
+
+
+def test_do_call_returns_a_do_call_node() -> None:
+    node = _add(1, b=2)
+
+    assert isinstance(node, DoCall)
+    assert isinstance(node, Expand)
+    assert node.args == (1,)
+    assert node.kwargs == {"b": 2}
+    assert _add(1).kwargs is None
+    assert repr(node).startswith("DoCall(")
+    assert run(node) == 3
+
+
+def test_do_call_defers_the_call_until_evaluated() -> None:
+    calls = []
+
+    @do
+    def record(value: int):
+        calls.append(value)
+        if False:  # pragma: no cover
+            yield
+        return value
+
+    node = record(7)
+    assert calls == []
+    assert run(node) == 7
+    assert run(node) == 7
+    assert calls == [7, 7]
+
+
+def test_non_generator_result_is_the_program_value() -> None:
+    assert run(_plain(21)) == 42
+
+
+def test_program_builds_a_do_call() -> None:
+    node = program(_gen, 5)
+
+    assert isinstance(node, DoCall)
+    assert run(node) == 4
+
+
+def test_call_errors_raise_at_the_yield_site() -> None:
+    @do
+    def body():
+        try:
+            yield _add(1, 2, 3)
+        except TypeError:
+            return "caught"
+
+    assert run(body()) == "caught"
+
+
+def test_do_call_pickles_by_function_reference() -> None:
+    node = pickle.loads(pickle.dumps(program(_gen, 5)))
+
+    assert isinstance(node, DoCall)
+    assert run(node) == 4
+
+
+def test_do_call_rejects_non_tuple_args() -> None:
+    with pytest.raises(TypeError):
+        DoCall(_gen, [1])
@@ -0,0 +1,86 @@
+"""`import doeff` stays within its import budget.
+
+The package root imports only the VM, the program constructors, `@do` and
+`run`. Effects, the scheduler, MCP helpers and the CLI run services load on
+first attribute access, so short-lived workers do not pay for them.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import doeff
+
+# Top-level packages `import doeff` may load besides the standard library.
+IMPORT_BUDGET = frozenset({"doeff", "doeff_vm"})
+DEFERRED_MODULES = (
+    "doeff_core_effects",
+    "doeff.cli.run_services",
+    "doeff.mcp",
+    "hy",
+)
+
+
+def _imported_modules(statement: str) -> list[str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or line.rstrip().endswith("imported package"):
+            continue
+        modules.append(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_import_doeff_stays_within_budget() -> None:
+    # Interpreter startup (site, .pth hooks) is not part of the budget.
+    startup = set(_imported_modules("pass"))
+    modules = [module for module in _imported_modules("import doeff") if module not in startup]
+
+    assert "doeff" in modules
+    over_budget = sorted(
+        {
+            module.split(".")[0]
+            for module in modules
+            if module.split(".")[0] not in IMPORT_BUDGET
+            and module.split(".")[0] not in sys.stdlib_module_names
+        }
+    )
+    assert over_budget == []
+    assert [module for module in modules if module.startswith(DEFERRED_MODULES)] == []
+
+
+def test_first_access_loads_the_deferred_module() -> None:
+    modules = _imported_modules("import doeff; doeff.Spawn")
+
+    assert "doeff_core_effects.scheduler" in modules
+
+
+@pytest.mark.parametrize(
+    ("name", "module_name", "attr"),
+    [
+        ("Ask", "doeff_core_effects.effects", "Ask"),
+        ("AskEffect", "doeff_core_effects.effects", "Ask"),
+        ("race", "doeff_core_effects.scheduler", "Race"),
+        ("McpToolDef", "doeff.mcp", "McpToolDef"),
+        ("DoeffRunContext", "doeff.cli.run_services", "DoeffRunContext"),
+    ],
+)
+def test_lazy_exports_resolve_to_their_module(name: str, module_name: str, attr: str) -> None:
+    module = __import__(module_name, fromlist=[attr])
+
+    assert getattr(doeff, name) is getattr(module, attr)
+    assert name in vars(doeff)
+    assert name in dir(doeff)
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no attribute 'NotAnExport'"):
+        doeff.NotAnExport  # noqa: B018
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import json
+import sys
+import types
+import warnings
+from pathlib import Path
+
+import pytest
+
+from doeff import Resume, do, resume_cache
+
+_HANDLERS = """\
+from doeff import Resume, do
+
+
+@do
+def tail(effect, k):
+    return (yield Resume(k, effect))
+
+
+@do
+def non_tail(effect, k):
+    value = yield Resume(k, effect)
+    return value + 1
+
+
+@do
+def plain(value):
+    return value
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_records(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    monkeypatch.delenv("DOEFF_RESUME_CACHE", raising=False)
+    resume_cache.clear()
+    yield
+    resume_cache.clear()
+
+
+def _write_module(tmp_path: Path) -> Path:
+    path = tmp_path / "resume_cache_handlers.py"
+    path.write_text(_HANDLERS, encoding="utf-8")
+    return path
+
+
+def _import(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        spec.loader.exec_module(module)
+    messages = [str(w.message) for w in caught if "non-tail Resume/ResumeThrow" in str(w.message)]
+    return module, messages
+
+
+def _cache_file(path: Path) -> Path:
+    cache_path = resume_cache._cache_path(str(path))
+    assert cache_path is not None
+    return Path(cache_path)
+
+
+def test_analysis_round_trips_through_pycache(tmp_path: Path) -> None:
+    path = _write_module(tmp_path)
+    module, messages = _import(path)
+    resume_cache.flush()
+
+    cache_file = _cache_file(path)
+    assert cache_file.parent.name == "__pycache__"
+    payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert sorted(key.split(":")[0] for key in payload["functions"]) == ["non_tail", "tail"]
+    assert len(messages) == 1
+
+    resume_cache.clear()
+    code = inspect.unwrap(module.tail).__code__
+    assert resume_cache.lookup(code) == ((6,), ())
+
+
+def test_warm_cache_skips_source_and_still_warns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _write_module(tmp_path)
+    _import(path)
+    resume_cache.flush()
+    resume_cache.clear()
+
+    def no_source(fn):
+        raise AssertionError(f"source read for {fn.__name__}")
+
+    monkeypatch.setattr(inspect, "getsourcelines", no_source)
+    _module, messages = _import(path)
+
+    assert len(messages) == 1
+    assert "line(s): 11" in messages[0]
+
+
+def test_edited_source_invalidates_the_cache(tmp_path: Path) -> None:
+    path = _write_module(tmp_path)
+    _import(path)
+    resume_cache.flush()
+    resume_cache.clear()
+
+    path.write_text(_HANDLERS.replace("value + 1", "value + 10"), encoding="utf-8")
+    module, _messages = _import(path)
+
+    assert resume_cache.lookup(inspect.unwrap(module.tail).__code__) is not None
+    resume_cache.clear()
+    assert resume_cache.lookup(inspect.unwrap(module.tail).__code__) is None
+
+
+def test_functions_without_resume_are_not_analysed(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(_effect: object, k: object):
+        return (yield Resume(k, "value"))
+
+    def no_source(fn):
+        raise AssertionError(f"source read for {fn.__name__}")
+
+    monkeypatch.setattr(inspect, "getsourcelines", no_source)
+
+    @do
+    def plain(value: int):
+        return value
+
+    assert callable(plain)
+    assert resume_cache.references_resume(handler.__code__)
+    assert not resume_cache.references_resume(inspect.unwrap(plain).__code__)
+
+
+def test_non_tail_marker_defers_analysis_to_first_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    analysed = []
+    real_getsourcelines = inspect.getsourcelines
+
+    def recording_getsourcelines(fn):
+        analysed.append(fn.__name__)
+        return real_getsourcelines(fn)
+
+    monkeypatch.setattr(inspect, "getsourcelines", recording_getsourcelines)
+    # A warm on-disk entry for this test file would skip the source read.
+    monkeypatch.setenv("DOEFF_RESUME_CACHE", "0")
+
+    @do(non_tail=True)
+    def deferred(_effect: object, k: object):
+        value = yield Resume(k, "value")
+        return value
+
+    assert analysed == []
+    deferred(None, None)
+    deferred(None, None)
+    assert analysed == ["deferred"]
+
+
+def test_precompute_matches_import_analysis(tmp_path: Path) -> None:
+    path = _write_module(tmp_path)
+
+    assert resume_cache.precompute_resume_cache(path) == 2
+    resume_cache.clear()
+
+    module, messages = _import(path)
+    assert len(messages) == 1
+    assert resume_cache.lookup(inspect.unwrap(module.non_tail).__code__) == ((), (11,))
+
+
+def test_precompute_walks_the_tree_without_indexer_support(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _OldIndexer:
+        @classmethod
+        def for_root(cls, _root: str) -> _OldIndexer:
+            return cls()
+
+    monkeypatch.setitem(sys.modules, "doeff_indexer", types.SimpleNamespace(Indexer=_OldIndexer))
+    _write_module(tmp_path)
+
+    assert resume_cache.precompute_resume_cache(tmp_path) == 2
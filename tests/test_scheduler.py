@@ -673,6 +673,125 @@ class TestPromise:
 
         assert doeff_run(scheduled(body())) == 99
 
+    def test_complete_promises_wakes_every_waiter(self):
+        """CompletePromises resolves a batch; all waiters run before the completer."""
+        from doeff_core_effects.scheduler import CompletePromises, CreatePromise
+
+        @do
+        def body():
+            order = []
+
+            @do
+            def waiter(i, p):
+                yield Wait(p.future)
+                order.append(i)
+
+            ps, tasks = [], []
+            for i in range(3):
+                p = yield CreatePromise()
+                ps.append(p)
+                tasks.append((yield Spawn(waiter(i, p))))
+            yield CompletePromises(ps, "tick")
+            order.append("completer")
+            yield Gather(*tasks)
+            values = []
+            for p in ps:
+                values.append((yield Wait(p.future)))
+            return order, values
+
+        order, values = doeff_run(scheduled(body()))
+        assert order == [0, 1, 2, "completer"]
+        assert values == ["tick"] * 3
+
+    def test_complete_promises_rejects_whole_batch(self):
+        """One already-resolved promise rejects the batch without resolving the rest."""
+        from doeff_core_effects.scheduler import CompletePromises, CreatePromise
+
+        @do
+        def body():
+            done = yield CreatePromise()
+            pending = yield CreatePromise()
+            yield CompletePromise(done, 1)
+            message = None
+            try:
+                yield CompletePromises([pending, done])
+            except RuntimeError as e:
+                message = str(e)
+            yield CompletePromise(pending, "still pending")
+            return message, (yield Wait(pending.future))
+
+        message, value = doeff_run(scheduled(body()))
+        assert "already completed" in message
+        assert value == "still pending"
+
+    def test_claim_promise_single_flight(self):
+        """Later claims of a pending key join the owner's promise; resolution frees the key."""
+        from doeff_core_effects.scheduler import ClaimPromise, Promise
+
+        @do
+        def body():
+            first, first_owner = yield ClaimPromise("k")
+
+            @do
+            def joiner():
+                claim, owner = yield ClaimPromise("k")
+                return owner, (yield Wait(claim))
+
+            t = yield Spawn(joiner())
+            yield CompletePromise(first, "shared")
+            joined = yield Wait(t)
+            again, again_owner = yield ClaimPromise("k")
+            return first, first_owner, joined, again, again_owner
+
+        first, first_owner, joined, again, again_owner = doeff_run(scheduled(body()))
+        assert isinstance(first, Promise)
+        assert first_owner is True
+        assert joined == (False, "shared")
+        assert isinstance(again, Promise)
+        assert again_owner is True
+        assert again.promise_id != first.promise_id
+
+    def test_claim_promise_abandoned_by_cancelled_owner(self):
+        """Cancelling the owner fails its claim, runs on_abandon and frees the key."""
+        from doeff_core_effects.scheduler import ClaimAbandonedError, ClaimPromise
+
+        cleaned = []
+
+        @do
+        def cleanup():
+            cleaned.append("k")
+
+        @do
+        def body():
+            gate = yield CreatePromise()
+
+            @do
+            def owner():
+                _claim, is_owner = yield ClaimPromise("k", on_abandon=cleanup())
+                assert is_owner
+                yield Wait(gate.future)
+
+            @do
+            def joiner():
+                claim, is_owner = yield ClaimPromise("k")
+                try:
+                    yield Wait(claim)
+                except ClaimAbandonedError as exc:
+                    return is_owner, exc.key
+                return is_owner, None
+
+            owner_task = yield Spawn(owner())
+            joiner_task = yield Spawn(joiner())
+            yield Cancel(owner_task)
+            joined = yield Wait(joiner_task)
+            _again, again_owner = yield ClaimPromise("k")
+            return joined, list(cleaned), again_owner
+
+        joined, cleaned_in_run, again_owner = doeff_run(scheduled(body()))
+        assert joined == (False, "k")
+        assert cleaned_in_run == ["k"]
+        assert again_owner is True
+
 
 # ---------------------------------------------------------------------------
 # ExternalPromise
@@ -712,6 +831,33 @@ class TestExternalPromise:
 
         assert doeff_run(scheduled(body())) == "external_value"
 
+    def test_on_cancel_hook_runs_only_for_cancelled_waiters(self):
+        """ExternalPromise.on_cancel fires when its last waiter is cancelled,
+        and never for a promise that resolved first."""
+        fired = []
+
+        @do
+        def waiter(ep):
+            return (yield Wait(ep.future))
+
+        @do
+        def body():
+            cancelled_ep = yield CreateExternalPromise()
+            cancelled_ep.on_cancel(lambda: fired.append("cancelled"))
+            resolved_ep = yield CreateExternalPromise()
+            resolved_ep.on_cancel(lambda: fired.append("resolved"))
+
+            t_cancel = yield Spawn(waiter(cancelled_ep))
+            t_resolve = yield Spawn(waiter(resolved_ep))
+            resolved_ep.complete("done")
+            value = yield Wait(t_resolve)
+            yield Cancel(t_cancel)
+            cancelled_ep.complete("late")
+            return value
+
+        assert doeff_run(scheduled(body())) == "done"
+        assert fired == ["cancelled"]
+
     def test_100_threads_concurrent(self):
         """100 tasks each sleeping 0.1s in threads. Must finish in <2s, not 10s."""
         import threading
@@ -1989,6 +2135,93 @@ class TestTerminalEntrySweep:
         with pytest.raises(KeyError, match="swept"):
             doeff_run(scheduled(body()))
 
+    def test_gather_and_race_release_sweep_protection(self):
+        """Gather/Race pin their keys only while a waiter entry is parked;
+        once resolved the keys must be sweepable again."""
+        from doeff_core_effects.scheduler import _SchedulerIntrospection
+
+        @do
+        def child(i: int):
+            return i
+
+        @do
+        def body():
+            tasks = []
+            for i in range(8):
+                tasks.append((yield Spawn(child(i))))
+            results = yield Gather(*tasks)
+            racers = []
+            for i in range(4):
+                racers.append((yield Spawn(child(i))))
+            _ = yield Race(*racers)
+            _ = yield Gather(*racers)
+            counts = yield _SchedulerIntrospection()
+            return results, counts
+
+        results, counts = doeff_run(scheduled(body()))
+        assert results == list(range(8))
+        assert counts["protected_keys"] == 0, counts
+
+
+# ---------------------------------------------------------------------------
+# Ready-heap bookkeeping
+# ---------------------------------------------------------------------------
+
+class TestReadyHeapBookkeeping:
+    """Ready-heap liveness is tracked by counters; entries owned by cancelled
+    tasks are tombstones, deleted lazily and compacted in bulk."""
+
+    def test_cancelled_fanout_is_compacted_out_of_ready_heap(self):
+        from doeff_core_effects.scheduler import (
+            READY_COMPACT_MIN,
+            _SchedulerIntrospection,
+        )
+
+        fanout = 20 * READY_COMPACT_MIN
+
+        @do
+        def child():
+            return None
+
+        @do
+        def body():
+            handles = []
+            for _ in range(fanout):
+                handles.append((yield Spawn(child())))
+            for t in handles:
+                yield Cancel(t)
+            return (yield _SchedulerIntrospection())
+
+        counts = doeff_run(scheduled(body()))
+        # Without compaction all `fanout` dead "new" entries stay queued.
+        assert counts["ready"] < 2 * READY_COMPACT_MIN, counts
+        assert counts["ready_tombstones"] < READY_COMPACT_MIN, counts
+        assert counts["ready_live"] <= counts["ready"], counts
+
+    def test_state_bytes_per_queued_task_stays_compact(self):
+        """Task/promise records are slotted, so a queued task costs a few
+        hundred bytes of scheduler bookkeeping, not a handful of dicts."""
+        from doeff_core_effects.scheduler import _SchedulerIntrospection
+
+        fanout = 2000
+
+        @do
+        def child():
+            return None
+
+        @do
+        def body():
+            handles = []
+            for _ in range(fanout):
+                handles.append((yield Spawn(child())))
+            counts = yield _SchedulerIntrospection()
+            _ = yield Gather(*handles)
+            return counts
+
+        counts = doeff_run(scheduled(body()))
+        assert counts["tasks"] >= fanout, counts
+        assert counts["state_bytes"] / fanout < 1024, counts
+
 
 # ---------------------------------------------------------------------------
 # Promise resolution guards (#507)
@@ -13,9 +13,10 @@ type-filtered inner handler stops being dispatched.
 from dataclasses import dataclass
 
 import doeff_vm
+import pytest
 from doeff_vm import WithHandler
 
-from doeff import Effect, EffectBase, EffectGenerator, do
+from doeff import Effect, EffectBase, EffectGenerator, do, handler
 from tests._run_helpers import run_with_defaults
 
 
@@ -147,3 +148,61 @@ class TestTypedHandler:
         result = run_with_defaults(_wrap(alpha_handler_typed, prog_alpha_alpha()))
         assert result.is_ok(), result.error
         assert result.value == ("alpha:1", "alpha:2")
+
+
+# -- WithHandler(types=...) (VM skips the boundary, handler never sees Beta) --
+
+
+def _wrap_vm_typed(program):
+    return WithHandler(catch_all, WithHandler(alpha_handler_typed, program, (Alpha,)))
+
+
+class TestVmTypeFilter:
+    def test_alpha(self):
+        result = run_with_defaults(_wrap_vm_typed(prog_alpha()))
+        assert result.is_ok(), result.error
+        assert result.value == "alpha:1"
+
+    def test_beta_beta(self):
+        result = run_with_defaults(_wrap_vm_typed(prog_beta_beta()))
+        assert result.is_ok(), result.error
+        assert result.value == ("fallback_beta:1", "fallback_beta:2")
+
+    def test_beta_alpha(self):
+        result = run_with_defaults(_wrap_vm_typed(prog_beta_alpha()))
+        assert result.is_ok(), result.error
+        assert result.value == ("fallback_beta:1", "alpha:2")
+
+    def test_alpha_beta_alpha(self):
+        result = run_with_defaults(_wrap_vm_typed(prog_alpha_beta_alpha()))
+        assert result.is_ok(), result.error
+        assert result.value == ("alpha:1", "fallback_beta:2", "alpha:3")
+
+    def test_subclass_matches(self):
+        @dataclass(frozen=True)
+        class LoudAlpha(Alpha):
+            pass
+
+        @do
+        def prog():
+            return (yield LoudAlpha(value="x"))
+
+        result = run_with_defaults(_wrap_vm_typed(prog()))
+        assert result.is_ok(), result.error
+        assert result.value == "alpha:x"
+
+    def test_handler_helper_accepts_types(self):
+        typed_alpha = handler(alpha_handler_typed, types=Alpha)
+        program = WithHandler(catch_all, typed_alpha(prog_beta_alpha()))
+        result = run_with_defaults(program)
+        assert result.is_ok(), result.error
+        assert result.value == ("fallback_beta:1", "alpha:2")
+
+    def test_types_are_normalized_to_tuple(self):
+        node = WithHandler(alpha_handler_typed, prog_alpha(), Alpha)
+        assert node.types == (Alpha,)
+        assert WithHandler(alpha_handler_typed, prog_alpha()).types is None
+
+    def test_non_class_types_rejected(self):
+        with pytest.raises(TypeError, match="types entries must be classes"):
+            WithHandler(alpha_handler_typed, prog_alpha(), ("Alpha",))